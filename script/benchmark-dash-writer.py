@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+
+from __future__ import annotations
+
+import argparse
+import copy
+import logging
+import timeit
+from datetime import timedelta
+from io import BytesIO
+from itertools import count
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+from streamlink import logger
+from streamlink.session import Streamlink
+from streamlink.stream.dash.dash import DASHStream, DASHStreamReader, DASHStreamWriter
+from streamlink.stream.dash.manifest import MPD, DASHSegment
+from streamlink.utils.parse import parse_xml
+from streamlink.utils.times import now
+
+
+log = logging.getLogger("benchmark-dash-writer")
+
+
+MANIFEST = """
+<MPD
+  xmlns="urn:mpeg:dash:schema:mpd:2011"
+  profiles="urn:mpeg:dash:profile:isoff-live:2011"
+  type="static"
+  mediaPresentationDuration="PT1H"
+  minBufferTime="PT2S"
+>
+  <Period id="0" start="PT0S">
+    <AdaptationSet id="0" mimeType="video/mp4">
+      <Representation id="video" bandwidth="1000000" width="1280" height="720" codecs="avc1.64001f">
+        <SegmentTemplate media="$Number$.m4s" startNumber="1" duration="1" timescale="1"/>
+      </Representation>
+    </AdaptationSet>
+  </Period>
+</MPD>
+"""
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the per-segment overhead of DASH segment requests, without any network I/O",
+    )
+
+    parser.add_argument(
+        "-n",
+        "--number",
+        type=int,
+        default=10000,
+        metavar="NUMBER",
+        help="The number of segments per run",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        metavar="REPEAT",
+        help="The number of runs",
+    )
+    parser.add_argument(
+        "--streams",
+        type=int,
+        default=100,
+        metavar="STREAMS",
+        help="The number of concurrent streams of the load estimation",
+    )
+    parser.add_argument(
+        "--segment-duration",
+        type=float,
+        default=1.0,
+        metavar="SECONDS",
+        help="The segment duration of the load estimation",
+    )
+    parser.add_argument(
+        "--segment-size",
+        type=int,
+        default=1024,
+        metavar="BYTES",
+        help="The size of each segment response",
+    )
+
+    return parser.parse_args()
+
+
+class OfflineAdapter(BaseAdapter):
+    """A transport adapter which responds to each request with the same segment data"""
+
+    def __init__(self, content: bytes):
+        super().__init__()
+        self.content = content
+
+    def send(self, request: PreparedRequest, *args, **kwargs) -> Response:
+        res = Response()
+        res.status_code = 200
+        res.url = request.url or ""
+        res.request = request
+        res.elapsed = timedelta()
+        res.headers["Content-Length"] = str(len(self.content))
+        res.raw = BytesIO(self.content)
+
+        return res
+
+    def close(self):
+        pass
+
+
+def get_writer(session: Streamlink) -> DASHStreamWriter:
+    mpd = MPD(parse_xml(MANIFEST, ignore_ns=True), base_url="https://benchmark/", url="https://benchmark/manifest.mpd")
+    representation = mpd.periods[0].adaptationSets[0].representations[0]
+    stream = DASHStream(
+        session,
+        mpd,
+        video_representation=representation,
+        headers={"User-Agent": "benchmark", "Referer": "https://benchmark/"},
+        params={"token": "abcdef0123456789"},
+        cookies={"session": "0123456789abcdef"},
+    )
+    reader = DASHStreamReader(stream, representation, now())
+
+    return DASHStreamWriter(reader)
+
+
+def main(args: argparse.Namespace):
+    logger.root.propagate = False
+    logger.root.setLevel("info")
+
+    session = Streamlink(plugins_builtin=False)
+    session.http.mount("https://benchmark/", OfflineAdapter(b"\x00" * args.segment_size))
+    writer = get_writer(session)
+    stream = writer.stream
+    nums = count()
+
+    # the request arguments of each segment, like before they were resolved only once
+    def request_args_deepcopy():
+        for _ in range(args.number):
+            request_args = copy.deepcopy(stream.args)
+            request_args.pop("headers", {})
+
+    def request_args_resolved():
+        for _ in range(args.number):
+            dict(writer.request_headers)
+
+    def fetch():
+        for _ in range(args.number):
+            num = next(nums)
+            segment = DASHSegment(num=num, uri=f"https://benchmark/{num}.m4s", duration=args.segment_duration)
+            result = writer.fetch(segment)
+            assert result is not None
+            assert len(result.content) == args.segment_size
+
+    def bench(name: str, func) -> float:
+        per_segment = min(timeit.repeat(func, number=1, repeat=args.repeat)) / args.number
+        log.info("%s: %.2f us", name, per_segment * 1e6)
+        return per_segment
+
+    log.info("Time per segment:")
+    bench("request args, copied per segment", request_args_deepcopy)
+    bench("request args, resolved once", request_args_resolved)
+    per_segment = bench("segment request", fetch)
+
+    segments = args.streams / args.segment_duration
+    log.info(
+        "%d streams with %gs segments: %.0f segments/s, %.1f%% of one CPU core",
+        args.streams,
+        args.segment_duration,
+        segments,
+        per_segment * segments * 100,
+    )
+
+    writer.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main(parse_arguments())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+from __future__ import annotations
+
+import argparse
+import io
+import logging
+import time
+import timeit
+from itertools import repeat
+
+from streamlink import logger
+from streamlink.logger import ALL, QueueHandler, StringFormatter
+
+
+log = logging.getLogger("benchmark-logging")
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the logging overhead of HLS segments and HLS playlist lines in the stream's threads",
+    )
+
+    parser.add_argument(
+        "-n",
+        "--number",
+        type=int,
+        default=10000,
+        metavar="NUMBER",
+        help="The number of segments per run",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        metavar="REPEAT",
+        help="The number of runs",
+    )
+    parser.add_argument(
+        "--write-delay",
+        type=float,
+        default=0.0001,
+        metavar="SECONDS",
+        help="The time each write call of the slow log output blocks",
+    )
+
+    return parser.parse_args()
+
+
+class Output(io.StringIO):
+    """A log output which discards everything and which optionally blocks on each write, e.g. like a slow terminal"""
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__()
+        self.delay = delay
+
+    def write(self, s: str) -> int:
+        if self.delay:
+            time.sleep(self.delay)
+        return len(s)
+
+
+def main(args: argparse.Namespace):
+    streamlog = logger.getLogger("streamlink.stream.hls")
+    num = 123
+    lines = list(repeat("#EXTINF:2.000,", 1000))
+
+    # the debug messages which get logged for each HLS segment
+    def segments_eager():
+        for _ in range(args.number):
+            streamlog.debug(f"Writing segment {num} to output")
+            streamlog.debug(f"Segment {num} complete")
+
+    def segments_lazy():
+        for _ in range(args.number):
+            streamlog.debug("Writing segment %d to output", num)
+            streamlog.debug("Segment %d complete", num)
+
+    def playlist_lines():
+        for _ in range(args.number // len(lines) or 1):
+            for _line in streamlog.iter(ALL, iter(lines)):
+                pass
+
+    def bench(name: str, func, number: int):
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        log.info("%s: %.3f us", name, best / number * 1e6)
+
+    logger.root.propagate = False
+
+    log.info("Log level info, time per segment / playlist line:")
+    logger.root.setLevel("info")
+    bench("segment, f-string messages", segments_eager, args.number)
+    bench("segment, lazy message arguments", segments_lazy, args.number)
+    bench("playlist line", playlist_lines, max(args.number, len(lines)))
+
+    log.info("Log level debug, time per segment spent in the logging thread:")
+    logger.root.setLevel("debug")
+    for name, delay in ("fast output", 0.0), ("slow output", args.write_delay):
+        handler = logging.StreamHandler(Output(delay))
+        handler.setFormatter(StringFormatter(fmt="[{name}][{levelname}] {message}", style="{"))
+
+        logger.root.addHandler(handler)
+        bench(f"{name}, synchronous", segments_lazy, args.number)
+        logger.root.removeHandler(handler)
+
+        queuehandler = QueueHandler(handler)
+        logger.root.addHandler(queuehandler)
+        bench(f"{name}, queued", segments_lazy, args.number)
+        logger.root.removeHandler(queuehandler)
+        # emit the remaining log records
+        queuehandler.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main(parse_arguments())
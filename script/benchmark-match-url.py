@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import logging
+import pkgutil
+import sys
+import timeit
+from pathlib import Path
+
+from streamlink.plugin.plugin import NO_PRIORITY
+from streamlink.session.plugins import StreamlinkPlugins
+
+
+# add root dir to sys path, so the "tests" package can be imported
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+import tests.plugins
+from tests.plugins import PluginCanHandleUrl
+
+
+log = logging.getLogger("benchmark-match-url")
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark resolving plugins from the URLs of the plugin tests",
+    )
+
+    parser.add_argument(
+        "-n",
+        "--number",
+        type=int,
+        default=10,
+        metavar="NUMBER",
+        help="The number of times all URLs get resolved per run",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        metavar="REPEAT",
+        help="The number of runs",
+    )
+
+    return parser.parse_args()
+
+
+def get_urls() -> list[str]:
+    urls: list[str] = []
+    for _finder, name, _ispkg in pkgutil.iter_modules(tests.plugins.__path__):
+        if not name.startswith("test_"):
+            continue
+        module = importlib.import_module(f"tests.plugins.{name}")
+        for obj in vars(module).values():
+            if isinstance(obj, type) and issubclass(obj, PluginCanHandleUrl) and obj is not PluginCanHandleUrl:
+                urls.extend(obj.urls_unnamed())
+                urls.extend(url for _name, url in obj.urls_named())
+                urls.extend(obj.urls_negative())
+
+    return urls
+
+
+def main(args: argparse.Namespace):
+    plugins = StreamlinkPlugins(builtin=True, lazy=False)
+    urls = get_urls()
+
+    def full_scan():
+        for url in urls:
+            priority = NO_PRIORITY
+            for _name, matchers in plugins.iter_matchers():
+                for matcher in matchers:
+                    if matcher.priority > priority and matcher.pattern.match(url) is not None:
+                        priority = matcher.priority
+
+    def match_url():
+        for url in urls:
+            plugins.match_url(url)
+
+    index = plugins._get_index()
+    log.info("URLs: %d", len(urls))
+    log.info("Matchers: %d (%d unindexed)", len(index.entries), len(index.fallback))
+
+    for name, func in ("full scan", full_scan), ("match_url", match_url):
+        best = min(timeit.repeat(func, number=args.number, repeat=args.repeat))
+        per_url = best / (args.number * len(urls))
+        log.info("%s: %.2f us per URL (%.0f URLs/s)", name, per_url * 1e6, len(urls) * args.number / best)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main(parse_arguments())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import timeit
+from functools import partial
+
+from streamlink.plugins.soop import Soop
+from streamlink.plugins.ustreamtv import UStreamTVWsClient
+from streamlink.validate import validate
+
+# noinspection PyProtectedMember
+from streamlink.validate._validate import compile_schema  # ruff: ignore[import-private-name]
+
+
+log = logging.getLogger("benchmark-validate")
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark interpreted and compiled validation schemas of plugins",
+    )
+
+    parser.add_argument(
+        "-n",
+        "--number",
+        type=int,
+        default=10000,
+        metavar="NUMBER",
+        help="The number of validations per run",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        metavar="REPEAT",
+        help="The number of runs",
+    )
+
+    return parser.parse_args()
+
+
+def get_schemas() -> list[tuple[str, object, object]]:
+    stream_formats = {
+        "streams": [
+            *(
+                {
+                    "contentType": "video/mp4",
+                    "sourceStreamVersion": 1,
+                    "initUrl": f"{height}/init.mp4",
+                    "segmentUrl": f"{height}/%d.mp4",
+                    "bitrate": height * 1000,
+                    "height": height,
+                }
+                for height in (360, 480, 720, 1080)
+            ),
+            {
+                "contentType": "audio/mp4",
+                "sourceStreamVersion": 1,
+                "initUrl": "audio/init.mp4",
+                "segmentUrl": "audio/%d.mp4",
+                "bitrate": 128000,
+                "language": "en",
+            },
+        ],
+    }
+    stream_segments = {
+        "chunkId": 100,
+        "chunkTime": 5000,
+        "contentAccess": {"accessList": [{"data": {"path": "/path"}}]},
+        "hashes": {str(idx): f"hash{idx}" for idx in range(100, 110)},
+    }
+    channel = json.dumps({
+        "CHANNEL": {
+            "RESULT": "1",
+            "BNO": "123",
+            "BJNICK": "nick",
+            "TITLE": "title",
+            "RMD": "https://rmd",
+            "CDN": "gcp_cdn",
+            "BPWD": "N",
+            "VIEWPRESET": [{"label": label, "name": label} for label in ("auto", "hd", "sd")],
+        },
+    })
+
+    return [
+        ("ustreamtv cmd", UStreamTVWsClient._schema_cmd, {"cmd": "moduleInfo", "args": [{"stream": stream_formats}]}),
+        ("ustreamtv formats", UStreamTVWsClient._schema_stream_formats, stream_formats),
+        ("ustreamtv segments", UStreamTVWsClient._schema_stream_segments, stream_segments),
+        ("soop channel", Soop._schema_channel, channel),
+    ]
+
+
+def main(args: argparse.Namespace):
+    for name, schema, data in get_schemas():
+        compiled = compile_schema(schema)
+        assert compiled(data) == validate(schema, data)
+
+        interpreted = min(timeit.repeat(partial(validate, schema, data), number=args.number, repeat=args.repeat))
+        result = min(timeit.repeat(partial(compiled, data), number=args.number, repeat=args.repeat))
+        log.info(
+            "%s: interpreted %.2f us, compiled %.2f us (%.1fx)",
+            name,
+            interpreted / args.number * 1e6,
+            result / args.number * 1e6,
+            interpreted / result,
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main(parse_arguments())
@@ -11,13 +11,14 @@ from functools import wraps
 from pathlib import Path
 from threading import RLock, Timer
 from time import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 from streamlink.compat import is_win32
 from streamlink.logger import getLogger
 
 
 if TYPE_CHECKING:
+    import sqlite3
     from datetime import datetime
 
 
@@ -31,6 +32,9 @@ CACHE_DIR = xdg_cache / "streamlink"
 
 WRITE_DEBOUNCE_TIME = 3.0
 
+# The time in seconds to wait for other processes which are writing to the same SQLite cache database
+SQLITE_TIMEOUT = 10.0
+
 
 log = getLogger(__name__)
 
@@ -44,6 +48,101 @@ def _atomic(fn):
     return inner
 
 
+class SQLiteCacheStorage:
+    """
+    Stores cache entries in an SQLite database in WAL mode, which can be shared by multiple processes.
+
+    Unlike the JSON cache file, which gets loaded and rewritten as a whole, entries get read and upserted individually
+    and atomically, so entries stored by concurrent processes don't get lost. Expired entries are ignored when reading
+    and get removed when writing.
+    """
+
+    def __init__(self, filename: Path, migrate: Path | None = None):
+        """
+        :param filename: The path of the SQLite database
+        :param migrate: An optional path of a JSON cache file whose entries get imported when creating the database
+        """
+
+        self.filename = filename
+        self.migrate = migrate
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+
+        import sqlite3  # ruff: ignore[import-outside-top-level]
+
+        log.trace("Opening cache database: %s", self.filename)
+
+        self.filename.parent.mkdir(exist_ok=True, parents=True)
+        exists = self.filename.exists()
+        conn = sqlite3.connect(self.filename, timeout=SQLITE_TIMEOUT, isolation_level=None, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_expires ON cache (expires)")
+            if not exists and self.migrate:
+                self._migrate(conn, self.migrate)
+        except BaseException:
+            conn.close()
+            raise
+
+        self._conn = conn
+
+        return conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection, filename: Path) -> None:
+        try:
+            with filename.open("r", encoding="utf-8") as fd:
+                data = json.load(fd)
+        except FileNotFoundError:
+            return
+        except Exception as err:
+            log.warning("Failed importing cache file: %s", err)
+            return
+
+        log.trace("Importing cache file: %s", filename)
+        conn.executemany(
+            "INSERT OR IGNORE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+            [
+                (key, json.dumps(item["value"]), float(item["expires"]))
+                for key, item in data.items()
+                if isinstance(item, dict) and "value" in item and "expires" in item
+            ],
+        )
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        cursor = self._connect().execute("SELECT value FROM cache WHERE key = ? AND expires > ?", (key, time()))
+        row = cursor.fetchone()
+
+        return (True, json.loads(row[0])) if row else (False, None)
+
+    def get_all(self, prefix: str) -> dict[str, Any]:
+        rows = self._connect().execute(
+            "SELECT key, value FROM cache WHERE substr(key, 1, ?) = ? AND expires > ?",
+            (len(prefix), prefix, time()),
+        )
+
+        return {key[len(prefix) :]: json.loads(value) for key, value in rows}
+
+    def set(self, key: str, value: Any, expires: float) -> None:
+        data = json.dumps(value)
+        conn = self._connect()
+        conn.execute("DELETE FROM cache WHERE expires <= ?", (time(),))
+        conn.execute(
+            "INSERT INTO cache (key, value, expires) VALUES (?, ?, ?)"
+            + " ON CONFLICT (key) DO UPDATE SET value = excluded.value, expires = excluded.expires",
+            (key, data, expires),
+        )
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
 # TODO: rewrite data structure
 #  - replace prefix logic with namespaces
 #  - change timestamps from (timezoned) epoch values to ISO8601 strings (UTC)
@@ -55,17 +154,27 @@ class Cache:
         filename: str | Path,
         key_prefix: str = "",
         disabled: bool = False,
+        storage: Literal["json", "sqlite"] = "json",
     ):
         """
         Caches Python values as JSON and prunes expired entries.
 
         :param filename: A file name or :class:`Path` object, relative to the cache directory
         :param key_prefix: Optional prefix for each key to be retrieved from or stored in the cache
+        :param disabled: Don't load or store any data, and only keep it in memory
+        :param storage: The storage engine. ``"json"`` loads and rewrites the whole JSON file.
+                        ``"sqlite"`` stores each entry individually in an SQLite database next to the JSON file,
+                        with the same name and the ``.sqlite3`` file extension, which is safe to be shared by
+                        multiple processes. Existing entries of the JSON file get imported when creating the database.
         """
 
         self.key_prefix = key_prefix
         self.filename = CACHE_DIR / Path(filename)
 
+        self._sqlite: SQLiteCacheStorage | None = None
+        if storage == "sqlite" and not disabled:
+            self._sqlite = SQLiteCacheStorage(self.filename.with_suffix(".sqlite3"), migrate=self.filename)
+
         self._cache_orig: dict[str, dict[str, Any]] = {}
         self._cache: dict[str, dict[str, Any]] = {}
 
@@ -170,9 +279,6 @@ class Cache:
         :param expires_at: Optional expiration date, which overrides the expiration time
         """
 
-        self._load()
-        self._prune()
-
         if self.key_prefix:
             key = f"{self.key_prefix}:{key}"
 
@@ -184,6 +290,16 @@ class Cache:
             except OverflowError:
                 expires = 0
 
+        if self._sqlite is not None:
+            try:
+                self._sqlite.set(key, value, expires)
+            except Exception as err:
+                log.error("Error while writing to cache database: %s", err)
+            return
+
+        self._load()
+        self._prune()
+
         self._cache[key] = dict(value=value, expires=expires)
         self._schedule_save()
 
@@ -203,6 +319,14 @@ class Cache:
         :return: The retrieved value or optional default value
         """
 
+        if self._sqlite is not None:
+            try:
+                found, value = self._sqlite.get(f"{self.key_prefix}:{key}" if self.key_prefix else key)
+            except Exception as err:
+                log.warning("Failed reading from cache database, continuing without cache: %s", err)
+                return default
+            return value if found else default
+
         self._load()
         self._prune()
         self._schedule_save()
@@ -225,6 +349,13 @@ class Cache:
         :return: A dictionary of all cached key-value pairs.
         """
 
+        if self._sqlite is not None:
+            try:
+                return self._sqlite.get_all(f"{self.key_prefix}:" if self.key_prefix else "")
+            except Exception as err:
+                log.warning("Failed reading from cache database, continuing without cache: %s", err)
+                return {}
+
         ret = {}
 
         self._load()
@@ -243,4 +374,4 @@ class Cache:
         return ret
 
 
-__all__ = ["Cache"]
+__all__ = ["Cache", "SQLiteCacheStorage"]
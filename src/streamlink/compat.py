@@ -63,7 +63,12 @@ def deprecated(items: Mapping[str, tuple[str | None, Any, Any]]) -> None:
                   3. a custom warning message
     """
 
-    mod_globals = inspect.stack()[1].frame.f_globals
+    # don't use inspect.stack(), as it reads the source code context of every frame, which is slow
+    frame = inspect.currentframe()
+    assert frame is not None
+    assert frame.f_back is not None
+    mod_globals = frame.f_back.f_globals
+    del frame
     orig_getattr: Callable[[str], Any] | None = mod_globals.get("__getattr__", None)
 
     def __getattr__(name: str) -> Any:
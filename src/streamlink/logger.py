@@ -3,8 +3,11 @@ from __future__ import annotations
 import logging
 import sys
 import warnings
+from copy import copy
 from logging import CRITICAL, DEBUG, ERROR, INFO, WARNING
+from logging.handlers import QueueHandler as _QueueHandler, QueueListener
 from pathlib import Path
+from queue import SimpleQueue
 from sys import version_info
 from threading import Lock
 from typing import IO, TYPE_CHECKING, Literal, TextIO
@@ -89,11 +92,16 @@ class StreamlinkLogger(_BaseLoggerClass):
     def iter(self, level: int, messages: Iterator[str], *args, **kwargs) -> Iterator[str]:
         """
         Iterator wrapper for logging multiple items in a single call and checking log level only once
+
+        Returns the original iterator if the log level is disabled.
         """
 
         if not self.isEnabledFor(level):
-            yield from messages
+            return iter(messages)
+
+        return self._iter(level, messages, args, kwargs)
 
+    def _iter(self, level: int, messages: Iterator[str], args: tuple, kwargs: dict) -> Iterator[str]:
         for message in messages:
             self._log(level, message, args, **kwargs)
             yield message
@@ -181,6 +189,38 @@ class StreamHandler(logging.StreamHandler):
         self.stream.reconfigure(errors="backslashreplace")
 
 
+class QueueHandler(_QueueHandler):
+    """
+    Hands log records over to a listener thread which emits them via the wrapped handler,
+    so that writing log messages doesn't block the threads which are logging.
+    """
+
+    def __init__(self, handler: logging.Handler):
+        super().__init__(SimpleQueue())
+        self.handler = handler
+        self.listener: QueueListener | None = QueueListener(self.queue, handler, respect_handler_level=True)
+        self.listener.start()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge the message arguments on the logging thread, as mutable arguments could change in the meantime.
+        # Unlike the default implementation, keep the record's type and its exception info for the wrapped handler.
+        if record.args:
+            record = copy(record)
+            record.msg = record.getMessage()
+            record.args = None
+
+        return record
+
+    def close(self) -> None:
+        # emit all remaining log records and stop the listener thread
+        with self.lock:  # type: ignore[union-attr]
+            listener, self.listener = self.listener, None
+        if listener is not None:
+            listener.stop()
+        self.handler.close()
+        super().close()
+
+
 class WarningLogRecord(logging.LogRecord):
     msg: WarningMessage
 
@@ -252,6 +292,7 @@ def basicConfig(
     stream: IO | None = None,
     remove_base: list[str] | None = None,
     capture_warnings: bool = False,
+    queue: bool = False,
 ) -> logging.StreamHandler | None:
     with _config_lock:
         handler: logging.StreamHandler | None = None
@@ -269,7 +310,7 @@ def basicConfig(
             )
             handler.setFormatter(formatter)
 
-            root.addHandler(handler)
+            root.addHandler(QueueHandler(handler) if queue else handler)
 
         if level is not None:
             root.setLevel(level)
@@ -306,6 +347,7 @@ __all__ = [
     "ALL",
     "getLogger",
     "StreamlinkLogger",
+    "QueueHandler",
     "basicConfig",
     "root",
     "levels",
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from threading import Lock, Thread
+from time import time
+from typing import TYPE_CHECKING, Any
+
+from streamlink.logger import getLogger
+from streamlink.utils.times import fromtimestamp
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from streamlink.cache import Cache
+
+
+log = getLogger(__name__)
+
+
+class CachedToken:
+    """
+    Lifecycle helper for tokens which expire, e.g. access tokens or client-integrity tokens.
+
+    Tokens get stored in the :class:`Cache <streamlink.cache.Cache>` alongside their expiration time,
+    and they are shared with other processes if the cache uses the SQLite storage.
+
+    Tokens which are about to expire get refreshed in a background thread while the still valid token keeps being returned,
+    so callers only have to wait for a token to be acquired if there's no valid token at all.
+
+    The background thread is not a daemon thread, so that processes launched by the ``acquire`` callback,
+    e.g. a web browser, don't get orphaned. Interpreter exit therefore waits for the refresh to finish.
+    Short-lived callers should thus call :meth:`get()` with ``background_refresh=False`` and call :meth:`refresh_if_expiring()`
+    once it's known that the process keeps running for a while, e.g. when a stream gets played.
+    """
+
+    def __init__(
+        self,
+        cache: Cache,
+        key: str,
+        acquire: Callable[[], tuple[Any, float] | None],
+        refresh_before: float = 300.0,
+        name: str = "token",
+    ):
+        """
+        :param cache: The cache where the token gets stored
+        :param key: The cache key of the token
+        :param acquire: A callback which acquires a new token and which returns it alongside its expiration time
+                        as a POSIX timestamp, or ``None`` if no token could be acquired.
+                        The token must be JSON-serializable.
+        :param refresh_before: The number of seconds before the token's expiration when it gets refreshed in the background
+        :param name: The name of the token used in log messages
+        """
+
+        self.cache = cache
+        self.key = key
+        self.acquire = acquire
+        self.refresh_before = refresh_before
+        self.name = name
+        self._lock = Lock()
+        self._thread: Thread | None = None
+
+    def _load(self) -> tuple[Any, float] | None:
+        data = self.cache.get(self.key)
+        if not isinstance(data, dict) or "token" not in data or not isinstance(data.get("expires"), int | float):
+            return None
+
+        return data["token"], data["expires"]
+
+    def get(self, background_refresh: bool = True) -> Any | None:
+        """
+        Get the cached token, or acquire a new one if there's no valid cached token.
+
+        :param background_refresh: Start refreshing the cached token in the background if it's about to expire
+        :return: The token, or ``None`` if no token could be acquired
+        """
+
+        cached = self._load()
+        if cached is None:
+            return self.refresh()
+
+        token, expires = cached
+        log.info(f"Using cached {self.name}")
+        if background_refresh and self._is_expiring(expires):
+            self._refresh_in_background()
+
+        return token
+
+    def refresh_if_expiring(self) -> None:
+        """
+        Start refreshing the cached token in the background if it's about to expire.
+        """
+
+        cached = self._load()
+        if cached is not None and self._is_expiring(cached[1]):
+            self._refresh_in_background()
+
+    def refresh(self) -> Any | None:
+        """
+        Acquire a new token and store it in the cache.
+
+        :return: The new token, or ``None`` if no token could be acquired
+        """
+
+        result = self.acquire()
+        if result is None:
+            return None
+
+        token, expires = result
+        self.cache.set(self.key, {"token": token, "expires": expires}, expires_at=fromtimestamp(expires))
+
+        return token
+
+    def purge(self) -> None:
+        """
+        Remove the token from the cache.
+        """
+
+        self.cache.set(self.key, None, 0)
+
+    def wait(self, timeout: float | None = None) -> None:
+        """
+        Wait for the background refresh to finish.
+        """
+
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _is_expiring(self, expires: float) -> bool:
+        return expires - time() <= self.refresh_before
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            log.debug(f"Refreshing {self.name} in the background")
+            # not a daemon thread, so that processes launched by the callback don't get orphaned on interpreter exit
+            self._thread = Thread(target=self._task_refresh, name="TokenRefreshThread")
+            self._thread.start()
+
+    def _task_refresh(self) -> None:
+        # another process sharing the cache may have already refreshed the token in the meantime
+        cached = self._load()
+        if cached is not None and not self._is_expiring(cached[1]):
+            return
+
+        try:
+            token = self.refresh()
+        except Exception as err:
+            log.error(f"Failed refreshing {self.name}: {err}")
+            return
+
+        if token is None:
+            log.warning(f"Failed refreshing {self.name}")
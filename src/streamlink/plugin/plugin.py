@@ -303,6 +303,10 @@ class Plugin(abc.ABC, metaclass=_PluginMeta):
     #: Metadata 'category' attribute: name of a game being played, a music genre, etc.
     category: str | None = None
 
+    #: The number of seconds for which the resolved streams can be reused, e.g. the lifetime of an access token,
+    #: or ``None`` if unknown. Can be set while resolving streams.
+    streams_ttl: float | None = None
+
     _url: str = ""
 
     def __init__(self, session: Streamlink, url: str, options: Mapping[str, Any] | Options | None = None):
@@ -322,6 +326,7 @@ class Plugin(abc.ABC, metaclass=_PluginMeta):
             filename="plugin-cache.json",
             key_prefix=self.module,
             disabled=session.options.get("no-plugin-cache"),
+            storage=session.options.get("plugin-cache-storage"),
         )
 
         self.session: Streamlink = session
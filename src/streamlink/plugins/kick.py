@@ -180,7 +180,7 @@ class Kick(Plugin):
     def _get_cookies_from_webbrowser(self) -> bool:
         # ruff: disable[import-outside-top-level]
         from streamlink.compat import BaseExceptionGroup
-        from streamlink.webbrowser.cdp import CDPClient, CDPClientSession
+        from streamlink.webbrowser.cdp import CDPClient, CDPClientSession, ResourceFilter
         from streamlink.webbrowser.cdp.devtools import fetch  # ruff: ignore[typing-only-first-party-import]
         # ruff: enable[import-outside-top-level]
 
@@ -191,7 +191,8 @@ class Kick(Plugin):
             await client_session.continue_request(request)
 
         async def get_challenge_cookies(client: CDPClient):
-            async with client.session() as client_session:
+            # the JS challenge doesn't require any images, fonts, stylesheets or media
+            async with client.session(resource_filter=ResourceFilter()) as client_session:
                 client_session.add_request_handler(on_main, url_pattern=self.url, on_request=True)
                 async with client_session.navigate(self.url) as frame_id:
                     await client_session.loaded(frame_id)
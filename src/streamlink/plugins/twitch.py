@@ -35,6 +35,7 @@ from streamlink.exceptions import NoStreamsError, PluginError
 from streamlink.logger import getLogger
 from streamlink.plugin import Plugin, pluginargument, pluginmatcher
 from streamlink.plugin.api import validate
+from streamlink.plugin.api.tokens import CachedToken
 from streamlink.session import http_useragents
 from streamlink.stream.hls import (
     M3U8,
@@ -51,7 +52,7 @@ from streamlink.stream.hls import (
 from streamlink.stream.http import HTTPStream
 from streamlink.utils.parse import parse_json, parse_qsd
 from streamlink.utils.random import CHOICES_ALPHA_NUM, random_token
-from streamlink.utils.times import fromtimestamp, hours_minutes_seconds_float
+from streamlink.utils.times import hours_minutes_seconds_float
 from streamlink.utils.url import update_qsd
 
 
@@ -285,9 +286,18 @@ class TwitchHLSStream(HLSStream):
     __reader__ = TwitchHLSStreamReader
     __parser__ = TwitchM3U8Parser
 
-    def __init__(self, *args, low_latency: bool = False, **kwargs):
+    def __init__(self, *args, low_latency: bool = False, client_integrity: CachedToken | None = None, **kwargs):
         super().__init__(*args, **kwargs)
         self.low_latency = low_latency
+        self.client_integrity = client_integrity
+
+    def open(self):
+        # only refresh the client-integrity token in the background when actually playing the stream,
+        # as interpreter exit has to wait for the refresh, which launches a web browser, to finish
+        if self.client_integrity is not None:
+            self.client_integrity.refresh_if_expiring()
+
+        return super().open()
 
 
 class UsherService:
@@ -869,6 +879,7 @@ class Twitch(Plugin):
             supported_codecs=self.get_option("supported-codecs"),
         )
 
+        self._client_integrity: CachedToken | None = None
         self._checked_metadata = False
 
         def method_factory(parent_method):
@@ -898,15 +909,7 @@ class Twitch(Plugin):
             self.id, self.author, self.category, self.title = data
 
     def _client_integrity_token(self, channel: str) -> tuple[str, str] | None:
-        if self.options.get("purge-client-integrity"):
-            log.info("Removing cached client-integrity token...")
-            self.cache.set(self._CACHE_KEY_CLIENT_INTEGRITY, None, 0)
-
-        client_integrity = self.cache.get(self._CACHE_KEY_CLIENT_INTEGRITY)
-        if client_integrity and isinstance(client_integrity, list) and len(client_integrity) == 2:
-            log.info("Using cached client-integrity token")
-            device_id, token = client_integrity
-        else:
+        def acquire() -> tuple[list[str], float] | None:
             log.info("Acquiring new client-integrity token...")
             device_id = random_token(32, CHOICES_ALPHA_NUM)
             client_integrity = TwitchClientIntegrity.acquire(
@@ -920,7 +923,21 @@ class Twitch(Plugin):
                 return None
 
             token, expiration = client_integrity
-            self.cache.set(self._CACHE_KEY_CLIENT_INTEGRITY, [device_id, token], expires_at=fromtimestamp(expiration))
+
+            return [device_id, token], expiration
+
+        cached_token = CachedToken(self.cache, self._CACHE_KEY_CLIENT_INTEGRITY, acquire, name="client-integrity token")
+        self._client_integrity = cached_token
+
+        if self.options.get("purge-client-integrity"):
+            log.info("Removing cached client-integrity token...")
+            cached_token.purge()
+
+        client_integrity = cached_token.get(background_refresh=False)
+        if not client_integrity or not isinstance(client_integrity, list) or len(client_integrity) != 2:
+            return None
+
+        device_id, token = client_integrity
 
         return device_id, token
 
@@ -937,6 +954,11 @@ class Twitch(Plugin):
         if is_live and response != "token":
             client_integrity = self._client_integrity_token(channel_or_vod)
             response, *data = self.api.access_token(is_live, channel_or_vod, client_integrity)
+            # the client-integrity token got rejected: remove it, so that a new one gets acquired next time
+            if client_integrity and response != "token" and self._client_integrity is not None:
+                log.info("Removing rejected client-integrity token...")
+                self._client_integrity.purge()
+                self._client_integrity = None
 
         # unknown API response error: abort
         if response != "token":
@@ -986,6 +1008,7 @@ class Twitch(Plugin):
                 # which can be delayed by up to a minute.
                 check_streams=True,
                 low_latency=self.get_option("low-latency"),
+                client_integrity=self._client_integrity,
                 **extra_params,
             )
         except OSError as err:
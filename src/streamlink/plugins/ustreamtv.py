@@ -79,7 +79,7 @@ class UStreamTVWsClient(WebsocketClient):
     _schema_cmd = validate.Schema({
         "cmd": str,
         "args": [{str: object}],
-    })
+    }).compile()
     _schema_stream_formats = validate.Schema({
         "streams": [
             validate.any(
@@ -108,7 +108,7 @@ class UStreamTVWsClient(WebsocketClient):
                 object,
             ),
         ],
-    })
+    }).compile()
     _schema_stream_segments = validate.Schema({
         "chunkId": int,
         "chunkTime": int,
@@ -125,7 +125,7 @@ class UStreamTVWsClient(WebsocketClient):
             validate.get(("accessList", 0, "data", "path")),
         ),
         "hashes": {validate.transform(int): str},
-    })
+    }).compile()
 
     stream_cdn: str | None = None
     stream_formats_video: list[StreamFormatVideo] | None = None
@@ -109,6 +109,7 @@ class Zattoo(Plugin):
         self._session_attributes = Cache(
             filename="plugin-cache.json",
             key_prefix=f"zattoo:attributes:{self.domain}",
+            storage=self.session.options.get("plugin-cache-storage"),
         )
         self._uuid = self._session_attributes.get("uuid")
         self._authed = (
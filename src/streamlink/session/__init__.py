@@ -1 +1 @@
-from streamlink.session.session import Streamlink
+from streamlink.session.session import Streamlink, StreamsResult
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import codecs
+import json
+import random
 import socket
 import ssl
 import time
@@ -7,12 +10,22 @@ import warnings
 from http.cookiejar import MozillaCookieJar
 from ipaddress import ip_address
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Protocol, TypeVar, cast, runtime_checkable
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol, TypeVar, cast, runtime_checkable
+from urllib.parse import urlparse
 
 import urllib3
 import urllib3.util.connection as urllib3_util_connection
-from requests import Request, Session
-from requests.adapters import HTTPAdapter
+from requests import (
+    ConnectionError,  # ruff: ignore[builtin-import-shadowing]
+    HTTPError,
+    Request,
+    RequestException,
+    Session,
+    Timeout,
+)
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from requests.utils import select_proxy
 from urllib3.connection import HTTPConnection
 from urllib3.util import create_urllib3_context
 
@@ -21,20 +34,25 @@ from streamlink.compat import is_darwin, is_linux, is_win32
 from streamlink.exceptions import PluginError, StreamlinkDeprecationWarning
 from streamlink.logger import getLogger
 from streamlink.packages.requests_file import FileAdapter
+from streamlink.session.http_cache import HTTPResponseCache
+from streamlink.session.http_timings import HTTPTimingsRecorder, record_timing
 from streamlink.utils.parse import parse_json, parse_xml
 
 
 if TYPE_CHECKING:
     import re
-    from collections.abc import Iterable, Iterator, Mapping, Sequence
+    from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
     from typing import TypeAlias
 
     # noinspection PyProtectedMember
     import requests._types as _rq_t
-    from requests import PreparedRequest
+    from requests import PreparedRequest, Response
     from requests.adapters import BaseAdapter
     from requests.cookies import CookieJar, RequestsCookieJar
+    from typing_extensions import Self
 
+    from streamlink.session.http_timings import HTTPTimings
+    from streamlink.utils.ratelimit import TokenBucket
     from streamlink.validate import Schema
 
     _TYPE_SOCKET_OPTION: TypeAlias = tuple[int, int, int | bytes]
@@ -63,6 +81,68 @@ def allowed_gai_family_inet6() -> socket.AddressFamily:
     return socket.AF_INET6
 
 
+_original_create_connection = urllib3_util_connection.create_connection
+
+
+class DNSCache:
+    """
+    Caches the resolved addresses of hosts which urllib3 connects to.
+
+    :func:`socket.getaddrinfo` doesn't expose the TTL values of DNS records, so resolved addresses are kept
+    for a fixed amount of time instead. Addresses of hosts which can't be connected to get removed early.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._cache: dict[tuple[str, int, int], tuple[float, list[tuple[Any, ...]]]] = {}
+        self._lock = Lock()
+
+    def getaddrinfo(self, host: str, port: int, family: int) -> list[tuple[Any, ...]]:
+        key = host, port, family
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached and cached[0] > now:
+                return cached[1]
+
+        with record_timing("dns"):
+            addresses = socket.getaddrinfo(host, port, family, socket.SOCK_STREAM)
+
+        with self._lock:
+            for item in [item for item, (expires, _addresses) in self._cache.items() if expires <= now]:
+                del self._cache[item]
+            self._cache[key] = now + self.ttl, addresses
+
+        return addresses
+
+    def remove(self, host: str, port: int, family: int) -> None:
+        with self._lock:
+            self._cache.pop((host, port, family), None)
+
+    def create_connection(self, address: tuple[str, int], *args, **kwargs) -> socket.socket:
+        host, port = address
+        host = host.strip("[]")
+        family = urllib3_util_connection.allowed_gai_family()
+
+        try:
+            addresses = self.getaddrinfo(host, port, family)
+        except UnicodeError:
+            # let urllib3 raise its LocationParseError
+            return _original_create_connection(address, *args, **kwargs)
+
+        err: OSError | None = None
+        for *_, sockaddr in addresses:
+            try:
+                return _original_create_connection(sockaddr[:2], *args, **kwargs)
+            except OSError as exc:
+                err = exc
+
+        self.remove(host, port, family)
+        if err is not None:
+            raise err
+        raise OSError("getaddrinfo returns an empty list")
+
+
 # Never convert percent-encoded characters to uppercase in urllib3>=2.0.0.
 # This is required for sites which compare request URLs byte by byte and return different responses depending on that.
 #
@@ -112,12 +192,111 @@ def _filter_socket_options(sock: socket.socket, options: list[_TYPE_SOCKET_OPTIO
 urllib3.util.connection._set_socket_options = urllib3_set_socket_options  # type: ignore[ty:invalid-assignment]
 
 
+# Monkey-patch urllib3's connection setup and TLS handshake, so that the timings of new connections can be recorded.
+# Both are no-ops unless request timings are recorded by the current thread.
+_original_new_conn = HTTPConnection._new_conn
+_original_ssl_wrap_socket_and_match_hostname = urllib3.connection._ssl_wrap_socket_and_match_hostname
+
+
+def urllib3_new_conn(self: HTTPConnection) -> socket.socket:
+    with record_timing("connect"):
+        return _original_new_conn(self)
+
+
+def urllib3_ssl_wrap_socket_and_match_hostname(*args, **kwargs):
+    with record_timing("tls"):
+        return _original_ssl_wrap_socket_and_match_hostname(*args, **kwargs)
+
+
+HTTPConnection._new_conn = urllib3_new_conn  # type: ignore[method-assign]
+urllib3.connection._ssl_wrap_socket_and_match_hostname = urllib3_ssl_wrap_socket_and_match_hostname
+
+
 # requests.Request.__init__ keywords, except for "hooks"
 _VALID_REQUEST_ARGS = {"method", "url", "headers", "files", "data", "params", "auth", "cookies", "json"}
 
 
+class HTTPCircuitOpenError(RequestException):
+    """Raised when requests to a host get rejected by the :class:`HTTPCircuitBreaker`"""
+
+
+class HTTPCircuitBreaker:
+    """
+    Tracks consecutive request failures per host and rejects requests to hosts which are known to be failing.
+
+    After ``threshold`` consecutive failures, requests to the host get rejected for ``reset_timeout`` seconds.
+    After that, requests are allowed again, but a single failure rejects the host's requests again right away.
+    """
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self._failures: dict[str, int] = {}
+        self._opened: dict[str, float] = {}
+        self._lock = Lock()
+
+    def allow(self, host: str) -> bool:
+        with self._lock:
+            opened = self._opened.get(host)
+            return opened is None or time.monotonic() - opened >= self.reset_timeout
+
+    def check(self, host: str) -> None:
+        """
+        :raises HTTPCircuitOpenError: If requests to the host get rejected
+        """
+
+        if not self.allow(host):
+            raise HTTPCircuitOpenError(f"Too many failed requests to {host}")
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened.pop(host, None)
+
+    def record_failure(self, host: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            failures = self._failures[host] = self._failures.get(host, 0) + 1
+            opened = self._opened.get(host)
+            if opened is None and failures < self.threshold:
+                return
+            if opened is None or now - opened >= self.reset_timeout:
+                log.warning(f"Rejecting requests to {host} for {self.reset_timeout:.1f}s after {failures} failed requests")
+            self._opened[host] = now
+
+
+class HTTPPoolStats(NamedTuple):
+    """Connection pool statistics of a single host"""
+
+    connections: int
+    """Number of new connections"""
+
+    requests: int
+    """Number of requests"""
+
+    connections_per_minute: float
+    """Number of new connections per minute since the creation of the :class:`HTTPSession`"""
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Ratio of requests which were sent on an already established connection"""
+        if not self.requests:
+            return 0.0
+        return max(0.0, 1.0 - self.connections / self.requests)
+
+
 class HTTPSession(Session):
     def __init__(self):
+        self.pool_maxsize: int = DEFAULT_POOLSIZE
+        self.pool_block: bool = DEFAULT_POOLBLOCK
+        self.circuit_breaker: HTTPCircuitBreaker | None = None
+        self.response_cache = HTTPResponseCache()
+        self.bandwidth_limiter: TokenBucket | None = None
+        #: Callables which receive the :class:`HTTPTimings <streamlink.session.http_timings.HTTPTimings>`
+        #: of each request attempt.
+        self.timings_sinks: list[Callable[[HTTPTimings], None]] = []
+        self._time_created = time.monotonic()
+
         super().__init__()
 
         self.headers["User-Agent"] = useragents.DEFAULT
@@ -151,12 +330,22 @@ class HTTPSession(Session):
         else:
             return "UTF-8"
 
+    @staticmethod
+    def _is_utf8(encoding: str) -> bool:
+        try:
+            return codecs.lookup(encoding).name == "utf-8"
+        except LookupError:
+            return False
+
     @classmethod
     def json(cls, res, *args, **kwargs):
         """Parses JSON from a response."""
         if res.encoding is None:
             # encoding is unknown: let ``json.loads`` figure it out from the bytes data via ``json.detect_encoding``
             return parse_json(res.content, *args, **kwargs)
+        elif cls._is_utf8(res.encoding) and res.content.isascii() and json.detect_encoding(res.content) == "utf-8":
+            # ASCII content of UTF-8 responses: parse the bytes data directly instead of decoding it first
+            return parse_json(res.content, *args, **kwargs)
         else:
             # encoding is explicitly set: get the decoded string value and let ``json.loads`` parse it
             return parse_json(res.text, *args, **kwargs)
@@ -214,6 +403,8 @@ class HTTPSession(Session):
             adapter.poolmanager.connection_pool_kw.update(connection_pool_kw)
 
     def mount(self, prefix: str, adapter: BaseAdapter) -> None:
+        if isinstance(adapter, HTTPAdapter):
+            self._set_adapter_pool_size(adapter)
         # Update poolmanager connection kwargs for HTTPAdapters mounted after interface options were set
         if (
             isinstance(adapter, HTTPAdapter)
@@ -228,6 +419,141 @@ class HTTPSession(Session):
             })
         super().mount(prefix, adapter)
 
+    def fork(self) -> Self:
+        """
+        Create a copy of this session which shares its connection pools, circuit breaker, response cache, etc.,
+        but which has its own copy of the request state, i.e. headers, cookies, query string parameters, proxies and hooks,
+        so that the request state of the copy can be modified without affecting this session and vice versa.
+        """
+
+        # don't use copy.copy(), as requests.Session's pickling state only includes its own attributes
+        forked = object.__new__(type(self))
+        forked.__dict__.update(self.__dict__)
+        forked.headers = self.headers.copy()
+        forked.cookies = self.cookies.copy()
+        forked.params = dict(self.params)
+        forked.proxies = dict(self.proxies)
+        forked.hooks = {event: list(hooks) for event, hooks in self.hooks.items()}
+        # share the mounted adapters and their connection pools, but don't share newly mounted adapters
+        forked.adapters = self.adapters.copy()
+
+        return forked
+
+    def set_pool_size(self, maxsize: int, block: bool = DEFAULT_POOLBLOCK) -> None:
+        """
+        Set the connection pool size of all mounted and future :class:`HTTPAdapter` instances.
+
+        :param maxsize: The maximum number of connections per host which are kept alive for reuse
+        :param block: Whether to block requests until a connection becomes available when the pool is exhausted,
+                      instead of opening new connections which get discarded afterwards
+        """
+
+        self.pool_maxsize = maxsize
+        self.pool_block = block
+        for adapter in self.adapters.values():
+            if isinstance(adapter, HTTPAdapter):
+                self._set_adapter_pool_size(adapter)
+
+    def _set_adapter_pool_size(self, adapter: HTTPAdapter) -> None:
+        poolmanager = adapter.poolmanager
+        if (
+            poolmanager.connection_pool_kw.get("maxsize") == self.pool_maxsize
+            and poolmanager.connection_pool_kw.get("block") == self.pool_block
+        ):
+            return
+
+        # also used by the adapter when creating proxy managers
+        adapter._pool_maxsize = self.pool_maxsize  # type: ignore[attr-defined]
+        adapter._pool_block = self.pool_block  # type: ignore[attr-defined]
+        for manager in (poolmanager, *adapter.proxy_manager.values()):
+            manager.connection_pool_kw.update(maxsize=self.pool_maxsize, block=self.pool_block)
+            # existing connection pools keep their size, so they need to be re-created
+            manager.clear()
+
+    def pool_stats(self) -> dict[str, HTTPPoolStats]:
+        """
+        Get the connection pool statistics of all mounted :class:`HTTPAdapter` instances, for checking connection reuse.
+
+        :return: A dictionary of ``scheme://host:port`` keys and their :class:`HTTPPoolStats` values
+        """
+
+        counts: dict[str, tuple[int, int]] = {}
+        for adapter in self.adapters.values():
+            if not isinstance(adapter, HTTPAdapter):
+                continue
+            for manager in (adapter.poolmanager, *adapter.proxy_manager.values()):
+                for key in manager.pools.keys():
+                    if not (pool := manager.pools.get(key)):
+                        continue
+                    name = f"{pool.scheme}://{pool.host}:{pool.port}"
+                    num_connections, num_requests = counts.get(name, (0, 0))
+                    counts[name] = num_connections + pool.num_connections, num_requests + pool.num_requests
+
+        minutes = max(time.monotonic() - self._time_created, 1.0) / 60
+        return {
+            name: HTTPPoolStats(num_connections, num_requests, num_connections / minutes)
+            for name, (num_connections, num_requests) in counts.items()
+        }
+
+    # noinspection PyMethodMayBeStatic
+    def set_dns_cache(self, ttl: float | None = None) -> None:
+        """
+        Cache resolved host addresses of new connections.
+
+        :param ttl: The time in seconds for which resolved addresses are kept, or ``None`` or ``0`` for disabling the cache
+        """
+
+        if not ttl:
+            urllib3_util_connection.create_connection = _original_create_connection
+        else:
+            urllib3_util_connection.create_connection = DNSCache(ttl).create_connection  # type: ignore[assignment]
+
+    def prewarm(self, *urls: str) -> None:
+        """
+        Establish connections to the hosts of the given URLs in background threads, so that subsequent requests
+        don't have to wait for name resolution and the TCP and TLS handshakes.
+
+        Hosts which already have pooled connections and hosts which are accessed via proxies are ignored.
+
+        :param urls: The URLs of the hosts which are about to be requested
+        """
+
+        origins: dict[tuple[str, str], str] = {}
+        for url in urls:
+            parsed = urlparse(url)
+            if parsed.scheme in ("http", "https") and parsed.netloc:
+                origins.setdefault((parsed.scheme, parsed.netloc), url)
+
+        for url in origins.values():
+            Thread(target=self._prewarm, args=(url,), name="HTTPSessionPrewarm", daemon=True).start()
+
+    def _prewarm(self, url: str) -> None:
+        settings = self.merge_environment_settings(url, {}, None, None, None)
+        if select_proxy(url, settings["proxies"]):
+            return
+
+        adapter = self.get_adapter(url)
+        if not isinstance(adapter, HTTPAdapter):
+            return
+
+        pool = adapter.poolmanager.connection_from_url(url)
+        if pool.num_connections:
+            return
+        adapter.cert_verify(pool, url, settings["verify"], settings["cert"])
+
+        log.trace(f"Prewarming connection: {pool.scheme}://{pool.host}:{pool.port}")
+        # noinspection PyProtectedMember
+        conn = pool._get_conn()
+        try:
+            conn.timeout = self.timeout
+            conn.connect()
+        except Exception as err:
+            log.trace(f"Failed prewarming connection: {err}")
+            conn.close()
+        finally:
+            # noinspection PyProtectedMember
+            pool._put_conn(conn)
+
     # noinspection PyMethodMayBeStatic
     def set_address_family(self, family: socket.AddressFamily | None = None) -> None:
         if family is None:
@@ -295,8 +621,10 @@ class HTTPSession(Session):
         json: _rq_t.JsonType = None,
         # streamlink options
         acceptable_status: Sequence[int] | None = None,
+        cache: bool | float = False,
         encoding: str | None = None,
         exception: type[Exception] | None = None,
+        purpose: str = "api",
         raise_for_status: bool = True,
         retries: int = 0,
         retry_backoff: float = 0.3,
@@ -317,41 +645,75 @@ class HTTPSession(Session):
             else:
                 params = session.params
 
-        attempt = 0
-        while True:
-            try:
-                res = super().request(
-                    method,
-                    url,
+        host = urlparse(str(url)).netloc
+        cache_key: str | None = None
+        if cache and not stream and not files:
+            request = self.prepare_request(
+                Request(
+                    method=method.upper(),
+                    url=url,
                     params=params,
                     data=data,
+                    json=json,
                     headers=headers,
                     cookies=cookies,
-                    files=files,
                     auth=auth,
-                    timeout=timeout,
-                    allow_redirects=allow_redirects,
-                    proxies=proxies,
-                    hooks=hooks,
-                    stream=stream,
-                    verify=verify,
-                    cert=cert,
-                    json=json,
-                )
-                if raise_for_status and res.status_code not in acceptable_status:
-                    res.raise_for_status()
-                break
-            except KeyboardInterrupt:
-                raise
-            except Exception as rerr:
-                if attempt >= retries:
-                    err = exception(f"Unable to open URL: {url} ({rerr})")
-                    err.err = rerr  # ty:ignore[unresolved-attribute]
-                    raise err from rerr
-                attempt += 1
-                # back off retrying, but only to a maximum sleep time
-                delay = min(retry_max_backoff, retry_backoff * (2 ** (attempt - 1)))
-                time.sleep(delay)
+                ),
+            )
+            cache_key = self.response_cache.get_key(request)
+
+        if cache_key and (cached := self.response_cache.get(cache_key)) is not None:
+            log.trace(f"Using cached response: {cached.url}")
+            res = cached
+        else:
+            attempt = 0
+            delay = retry_backoff
+            while True:
+                try:
+                    res = self._request_attempt(
+                        host,
+                        purpose,
+                        method,
+                        url,
+                        params=params,
+                        data=data,
+                        headers=headers,
+                        cookies=cookies,
+                        files=files,
+                        auth=auth,
+                        timeout=timeout,
+                        allow_redirects=allow_redirects,
+                        proxies=proxies,
+                        hooks=hooks,
+                        stream=stream,
+                        verify=verify,
+                        cert=cert,
+                        json=json,
+                    )
+                    if raise_for_status and res.status_code not in acceptable_status:
+                        res.raise_for_status()
+                    break
+                except KeyboardInterrupt:
+                    raise
+                except Exception as rerr:
+                    if self.circuit_breaker and self._is_host_failure(rerr):
+                        self.circuit_breaker.record_failure(host)
+                    if attempt >= retries or isinstance(rerr, HTTPCircuitOpenError):
+                        err = exception(f"Unable to open URL: {url} ({rerr})")
+                        err.err = rerr  # ty:ignore[unresolved-attribute]
+                        raise err from rerr
+                    attempt += 1
+                    # back off retrying with decorrelated jitter, so that failed requests of different streams don't get retried
+                    # at the same time, but only to a maximum sleep time
+                    delay = min(retry_max_backoff, random.uniform(retry_backoff, delay * 3))
+                    time.sleep(delay)
+
+            # don't cache error responses which were accepted via `raise_for_status` or `acceptable_status`
+            if cache_key and res.ok:
+                self.response_cache.set(cache_key, res, cache)
+
+            if self.circuit_breaker:
+                self.circuit_breaker.record_success(host)
 
         if encoding is not None:
             res.encoding = encoding
@@ -361,6 +723,24 @@ class HTTPSession(Session):
 
         return res
 
+    def _request_attempt(self, host: str, purpose: str, method: str, url: _rq_t.UriType, **kwargs) -> Response:
+        if self.circuit_breaker:
+            self.circuit_breaker.check(host)
+
+        with HTTPTimingsRecorder(self.timings_sinks, purpose, method, str(url)) as timings:
+            timings.response = res = super().request(method, url, **kwargs)
+
+        return res
+
+    @staticmethod
+    def _is_host_failure(err: Exception) -> bool:
+        if isinstance(err, HTTPCircuitOpenError):
+            return False
+        if isinstance(err, HTTPError):
+            return err.response is not None and err.response.status_code >= 500
+        # client-side errors like invalid URLs or too many redirects don't indicate an unhealthy host
+        return isinstance(err, (ConnectionError, Timeout))
+
 
 class SSLContextAdapter(HTTPAdapter):
     # noinspection PyMethodMayBeStatic
@@ -416,4 +796,12 @@ class TLSSecLevel1Adapter(SSLContextAdapter):
         return ctx
 
 
-__all__ = ["HTTPSession", "SSLContextAdapter", "TLSNoDHAdapter", "TLSSecLevel1Adapter"]
+__all__ = [
+    "HTTPCircuitBreaker",
+    "HTTPCircuitOpenError",
+    "HTTPPoolStats",
+    "HTTPSession",
+    "SSLContextAdapter",
+    "TLSNoDHAdapter",
+    "TLSSecLevel1Adapter",
+]
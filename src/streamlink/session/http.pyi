@@ -1,22 +1,27 @@
 import socket
 import ssl
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
-from typing import Any, TypedDict, overload
+from typing import Any, NamedTuple, TypedDict, overload
 
 # noinspection PyProtectedMember
 import requests._types as _requeststypes  # ruff: ignore[import-private-name]
-from requests import PreparedRequest, Response, Session
+from requests import PreparedRequest, RequestException, Response, Session
 from requests.adapters import HTTPAdapter
 from requests.cookies import CookieJar, RequestsCookieJar
-from typing_extensions import Unpack
+from typing_extensions import Self, Unpack
 
 from streamlink.plugin.api.validate import Schema
+from streamlink.session.http_cache import HTTPResponseCache
+from streamlink.session.http_timings import HTTPTimings
+from streamlink.utils.ratelimit import TokenBucket
 
 class _StreamlinkKwargs(TypedDict, total=False):
     acceptable_status: Sequence[int] | None
+    cache: bool | float
     encoding: str | None
     exception: type[Exception]
+    purpose: str
     raise_for_status: bool
     retries: float
     retry_backoff: float
@@ -59,10 +64,33 @@ class SSLContextAdapter(HTTPAdapter):
 
 class TLSNoDHAdapter(SSLContextAdapter): ...
 class TLSSecLevel1Adapter(SSLContextAdapter): ...
+class HTTPCircuitOpenError(RequestException): ...
+
+class HTTPCircuitBreaker:
+    threshold: int
+    reset_timeout: float
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0) -> None: ...
+    def allow(self, host: str) -> bool: ...
+    def check(self, host: str) -> None: ...
+    def record_success(self, host: str) -> None: ...
+    def record_failure(self, host: str) -> None: ...
+
+class HTTPPoolStats(NamedTuple):
+    connections: int
+    requests: int
+    connections_per_minute: float
+    @property
+    def reuse_ratio(self) -> float: ...
 
 class HTTPSession(Session):
     params: dict
     timeout: float
+    pool_maxsize: int
+    pool_block: bool
+    circuit_breaker: HTTPCircuitBreaker | None
+    response_cache: HTTPResponseCache
+    bandwidth_limiter: TokenBucket | None
+    timings_sinks: list[Callable[[HTTPTimings], None]]
 
     @classmethod
     def determine_json_encoding(cls, sample: bytes) -> str: ...
@@ -89,6 +117,11 @@ class HTTPSession(Session):
         **kwargs,
     ) -> Any: ...
     def set_interface(self, interface: str | None) -> None: ...
+    def fork(self) -> Self: ...
+    def set_pool_size(self, maxsize: int, block: bool = ...) -> None: ...
+    def pool_stats(self) -> dict[str, HTTPPoolStats]: ...
+    def set_dns_cache(self, ttl: float | None = None) -> None: ...
+    def prewarm(self, *urls: str) -> None: ...
     def set_address_family(self, family: socket.AddressFamily | None = None) -> None: ...
     def disable_dh(self, disable: bool = True) -> None: ...
     def set_cookies_from_file(self, path: Path | str) -> None: ...
@@ -117,8 +150,10 @@ class HTTPSession(Session):
         json: _requeststypes.JsonType = None,
         # streamlink options
         acceptable_status: Sequence[int] | None = None,
+        cache: bool | float = False,
         encoding: str | None = None,
         exception: type[Exception] | None = None,
+        purpose: str = "api",
         raise_for_status: bool = True,
         retries: int = 0,
         retry_backoff: float = 0.3,
@@ -146,8 +181,10 @@ class HTTPSession(Session):
         json: _requeststypes.JsonType = None,
         # streamlink options
         acceptable_status: Sequence[int] | None = None,
+        cache: bool | float = False,
         encoding: str | None = None,
         exception: type[Exception] | None = None,
+        purpose: str = "api",
         raise_for_status: bool = True,
         retries: int = 0,
         retry_backoff: float = 0.3,
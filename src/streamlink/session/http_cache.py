@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import re
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from streamlink.cache import Cache
+from streamlink.logger import getLogger
+from streamlink.utils.cache import LRUCache
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from requests import PreparedRequest
+
+
+log = getLogger(__name__)
+
+# request headers with credentials, which are part of the cache key, so that responses don't get shared between credentials
+_re_credential_header = re.compile(r"auth|cookie|token|key|session|secret|credential|client-id|signature", re.IGNORECASE)
+
+
+class HTTPResponseCache:
+    """
+    Caches the responses of HTTP requests which were explicitly marked as cacheable.
+
+    Responses are kept in memory, with the least recently used ones being removed first,
+    and they can optionally be persisted in a :class:`Cache <streamlink.cache.Cache>` file.
+    """
+
+    def __init__(self, maxsize: int = 128, filename: str | Path | None = None):
+        """
+        :param maxsize: The maximum number of responses kept in memory
+        :param filename: Optional cache file name for persisting responses, relative to the cache directory
+        """
+
+        self._memory: LRUCache[str, tuple[float, dict[str, Any]]] = LRUCache(maxsize)
+        self._storage: Cache | None = Cache(filename=filename, key_prefix="response") if filename else None
+        self._lock = Lock()
+
+    @staticmethod
+    def get_key(request: PreparedRequest) -> str:
+        """Get the cache key of a request from its method, URL, credential headers (including cookies) and body"""
+
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode()
+
+        sha256 = hashlib.sha256()
+        sha256.update(f"{request.method} {request.url}\n".encode())
+        for name, value in sorted((name.lower(), value) for name, value in request.headers.items()):
+            if _re_credential_header.search(name):
+                value = value if isinstance(value, bytes) else str(value).encode()
+                sha256.update(name.encode() + b": " + value + b"\n")
+        sha256.update(b"\n")
+        sha256.update(body)
+
+        return sha256.hexdigest()
+
+    @staticmethod
+    def get_ttl(res: Response, ttl: bool | float) -> float:
+        """
+        Get the amount of time in seconds for which a response can be cached.
+
+        :param res: The response
+        :param ttl: ``True`` for reading the ``Cache-Control`` and ``Expires`` headers of the response,
+                    or a fixed time in seconds
+        """
+
+        if ttl is not True:
+            return max(0.0, float(ttl))
+
+        directives = {}
+        for directive in res.headers.get("Cache-Control", "").split(","):
+            name, _, value = directive.strip().partition("=")
+            directives[name.lower()] = value.strip('"')
+
+        if "no-store" in directives or "no-cache" in directives:
+            return 0.0
+
+        if "max-age" in directives:
+            try:
+                max_age = float(directives["max-age"])
+                age = float(res.headers.get("Age", 0))
+            except ValueError:
+                return 0.0
+            return max(0.0, max_age - age)
+
+        if expires := res.headers.get("Expires"):
+            try:
+                date = res.headers.get("Date")
+                now = parsedate_to_datetime(date) if date else datetime.now(tz=timezone.utc)
+                return max(0.0, (parsedate_to_datetime(expires) - now).total_seconds())
+            except (TypeError, ValueError):
+                return 0.0
+
+        return 0.0
+
+    def get(self, key: str) -> Response | None:
+        now = time.time()
+        with self._lock:
+            item = self._memory.get(key)
+            if item and item[0] > now:
+                return self._deserialize(item[1])
+
+        if self._storage and (data := self._storage.get(key)):
+            return self._deserialize(data)
+
+        return None
+
+    def set(self, key: str, res: Response, ttl: bool | float) -> None:
+        expires = self.get_ttl(res, ttl)
+        if not expires:
+            return
+
+        data = self._serialize(res)
+        with self._lock:
+            self._memory.set(key, (time.time() + expires, data))
+
+        if self._storage:
+            self._storage.set(key, data, expires=expires)
+
+    @staticmethod
+    def _serialize(res: Response) -> dict[str, Any]:
+        return {
+            "url": res.url,
+            "status_code": res.status_code,
+            "reason": res.reason,
+            "headers": list(res.headers.items()),
+            "encoding": res.encoding,
+            "content": base64.b64encode(res.content).decode(),
+        }
+
+    @staticmethod
+    def _deserialize(data: dict[str, Any]) -> Response:
+        res = Response()
+        res.url = data["url"]
+        res.status_code = data["status_code"]
+        res.reason = data["reason"]
+        res.headers = CaseInsensitiveDict(data["headers"])
+        res.encoding = data["encoding"]
+        res._content = base64.b64decode(data["content"])
+
+        return res
+
+
+__all__ = ["HTTPResponseCache"]
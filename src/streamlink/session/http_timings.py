@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+from urllib.parse import urlparse
+
+from streamlink.logger import getLogger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, MutableSequence
+
+    from requests import Response
+
+
+log = getLogger(__name__)
+
+
+_local = threading.local()
+
+
+class HTTPTimings(NamedTuple):
+    """
+    The timings of a single HTTP request attempt in seconds.
+
+    Connection timings are ``None`` if the request was sent on an already established connection.
+    """
+
+    purpose: str
+    """The purpose of the request, e.g. ``playlist``, ``segment``, ``key`` or ``api``"""
+
+    method: str
+    """The request method"""
+
+    url: str
+    """The request URL"""
+
+    status_code: int | None
+    """The response status code, or ``None`` if no response was received"""
+
+    dns: float | None
+    """Time spent resolving the host name (only measured separately if the DNS cache is enabled)"""
+
+    connect: float | None
+    """Time spent establishing the TCP connection"""
+
+    tls: float | None
+    """Time spent on the TLS handshake"""
+
+    ttfb: float | None
+    """Time between sending the request and receiving the response headers"""
+
+    transfer: float | None
+    """Time spent downloading the response body, or ``None`` if the body gets streamed by the caller"""
+
+    total: float
+    """Total time of the request attempt"""
+
+    error: str | None = None
+    """The error message of a failed request attempt"""
+
+
+class HTTPTimingsRecorder:
+    """
+    Records the timings of a request attempt made by the current thread.
+    """
+
+    def __init__(self, sinks: MutableSequence[Callable[[HTTPTimings], None]], purpose: str, method: str, url: str):
+        self.sinks = sinks
+        self.purpose = purpose
+        self.method = method.upper()
+        self.url = url
+        self.response: Response | None = None
+        self._timings: dict[str, float] = {}
+        self._start = 0.0
+
+    @staticmethod
+    def current() -> HTTPTimingsRecorder | None:
+        return getattr(_local, "recorder", None)
+
+    def add(self, name: str, value: float) -> None:
+        self._timings[name] = self._timings.get(name, 0.0) + value
+
+    def __enter__(self) -> HTTPTimingsRecorder:
+        if self.sinks:
+            _local.recorder = self
+            self._start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if not self.sinks:
+            return
+
+        total = time.perf_counter() - self._start
+        _local.recorder = None
+
+        dns = self._timings.get("dns")
+        connect = self._timings.get("connect")
+        if connect is not None and dns is not None:
+            connect = max(0.0, connect - dns)
+        tls = self._timings.get("tls")
+
+        res = self.response if self.response is not None else getattr(exc_val, "response", None)
+        ttfb: float | None = None
+        transfer: float | None = None
+        if self.response is not None:
+            elapsed = self.response.elapsed.total_seconds()
+            ttfb = max(0.0, elapsed - sum(value or 0.0 for value in (dns, connect, tls)))
+            if self.response._content_consumed:
+                transfer = max(0.0, total - elapsed)
+
+        timings = HTTPTimings(
+            purpose=self.purpose,
+            method=self.method,
+            url=res.url if res is not None and res.url else self.url,
+            status_code=res.status_code if res is not None else None,
+            dns=dns,
+            connect=connect,
+            tls=tls,
+            ttfb=ttfb,
+            transfer=transfer,
+            total=total,
+            error=str(exc_val) if exc_val is not None else None,
+        )
+        for sink in self.sinks:
+            sink(timings)
+
+
+@contextmanager
+def record_timing(name: str) -> Iterator[None]:
+    """
+    Add the time spent in the context to the request attempt timings of the current thread, if any are being recorded.
+    """
+
+    recorder = HTTPTimingsRecorder.current()
+    if recorder is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.add(name, time.perf_counter() - start)
+
+
+def _format_timing(value: float | None) -> str:
+    return "-" if value is None else f"{value * 1000:.1f}ms"
+
+
+class HTTPTimingsLogSink:
+    """
+    Logs the timings of HTTP requests at the debug log level.
+    """
+
+    def __call__(self, timings: HTTPTimings) -> None:
+        log.debug(
+            f"{timings.method} {timings.url} ({timings.purpose}, {timings.status_code or timings.error}): "
+            + ", ".join(
+                f"{name}={_format_timing(getattr(timings, name))}"
+                for name in ("dns", "connect", "tls", "ttfb", "transfer", "total")
+            ),
+        )
+
+
+class HTTPTimingsJSONSink:
+    """
+    Appends the timings of HTTP requests to a file in the JSON lines format.
+    """
+
+    def __init__(self, filename: str | Path):
+        self.filename = Path(filename)
+        self._lock = threading.Lock()
+
+    def __call__(self, timings: HTTPTimings) -> None:
+        data = json.dumps({"time": time.time(), **timings._asdict()})
+        with self._lock:
+            try:
+                with self.filename.open("a", encoding="utf-8") as fd:
+                    fd.write(f"{data}\n")
+            except OSError as err:
+                log.error(f"Failed to write HTTP request timings: {err}")
+
+
+class HTTPTimingsAggregator:
+    """
+    Aggregates the timings of HTTP requests in memory, grouped by the request purpose and host.
+    """
+
+    _FIELDS = ("dns", "connect", "tls", "ttfb", "transfer", "total")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: dict[tuple[str, str], dict[str, Any]] = {}
+
+    def __call__(self, timings: HTTPTimings) -> None:
+        key = timings.purpose, urlparse(timings.url).netloc
+        with self._lock:
+            stats = self._stats.setdefault(key, {"requests": 0, "errors": 0, **{name: [0, 0.0, 0.0] for name in self._FIELDS}})
+            stats["requests"] += 1
+            if timings.error is not None:
+                stats["errors"] += 1
+            for name in self._FIELDS:
+                value = getattr(timings, name)
+                if value is not None:
+                    item = stats[name]
+                    item[0] += 1
+                    item[1] += value
+                    item[2] = max(item[2], value)
+
+    def summary(self) -> dict[tuple[str, str], dict[str, Any]]:
+        """
+        The number of requests and errors, and the mean and maximum timings of each request purpose and host.
+        Timings which were never measured are ``None``.
+        """
+
+        def mean_max(count: int, total: float, maximum: float) -> tuple[float, float] | None:
+            return (total / count, maximum) if count else None
+
+        with self._lock:
+            return {
+                key: {
+                    "requests": stats["requests"],
+                    "errors": stats["errors"],
+                    **{name: mean_max(*stats[name]) for name in self._FIELDS},
+                }
+                for key, stats in self._stats.items()
+            }
+
+
+__all__ = [
+    "HTTPTimings",
+    "HTTPTimingsAggregator",
+    "HTTPTimingsJSONSink",
+    "HTTPTimingsLogSink",
+    "HTTPTimingsRecorder",
+    "record_timing",
+]
@@ -5,8 +5,14 @@ from pathlib import Path
 from socket import AF_INET, AF_INET6
 from typing import TYPE_CHECKING, Any, ClassVar
 
+from requests.adapters import DEFAULT_POOLSIZE
+
 from streamlink.exceptions import StreamlinkDeprecationWarning
 from streamlink.options import Options
+from streamlink.session.http import HTTPCircuitBreaker
+from streamlink.session.http_cache import HTTPResponseCache
+from streamlink.session.http_timings import HTTPTimingsJSONSink, HTTPTimingsLogSink
+from streamlink.utils.ratelimit import TokenBucket
 from streamlink.utils.url import update_scheme
 
 
@@ -60,6 +66,11 @@ class StreamlinkOptions(Options):
           - ``bool``
           - ``False``
           - Disable the plugin key-value store
+        * - plugin-cache-storage
+          - ``str``
+          - ``"json"``
+          - The storage engine of the plugin key-value store: ``"json"`` or ``"sqlite"``.
+            The SQLite database is safe to be shared by multiple concurrent processes.
         * - locale
           - ``str``
           - *system locale*
@@ -125,6 +136,32 @@ class StreamlinkOptions(Options):
           - ``float``
           - ``20.0``
           - General timeout used by all HTTP/HTTPS requests, except the ones covered by other options
+        * - http-dns-cache-ttl
+          - ``float``
+          - ``0.0``
+          - Cache resolved host addresses for the given number of seconds. ``0.0`` disables the cache.
+        * - http-circuit-breaker
+          - ``bool``
+          - ``False``
+          - Reject HTTP/HTTPS requests to hosts right away for some time after too many consecutive failed requests
+        * - http-response-cache-persistent
+          - ``bool``
+          - ``False``
+          - Persist the cached responses of HTTP/HTTPS requests which were marked as cacheable by plugins
+            in the ``http-responses.json`` cache file
+        * - http-prewarm
+          - ``bool``
+          - ``False``
+          - Establish connections to the hosts of the media playlists of HLS streams in the background,
+            while the streams are still being resolved
+        * - http-timings-log
+          - ``bool``
+          - ``False``
+          - Log the DNS, connect, TLS, time-to-first-byte and transfer timings of each HTTP/HTTPS request
+        * - http-timings-file
+          - ``str | pathlib.Path | None``
+          - ``None``
+          - Append the timings of each HTTP/HTTPS request to a file in the JSON lines format
         * - ringbuffer-size
           - ``int``
           - ``16777216`` (16 MiB)
@@ -133,6 +170,20 @@ class StreamlinkOptions(Options):
           - ``bool``
           - ``False``
           - Make supported plugins mux available subtitles into the output stream
+        * - mux-fmp4
+          - ``bool``
+          - ``False``
+          - Mux fragmented MP4 video and audio streams in-process without FFmpeg (DASH streams only)
+        * - stream-bandwidth-limit
+          - ``int``
+          - ``0``
+          - Limit the combined download rate of all segmented streams of the session in bytes per second.
+            Live streams get priority over other streams. ``0`` disables the limit.
+        * - stream-bandwidth-limit-per-stream
+          - ``int``
+          - ``0``
+          - Limit the download rate of each individual segmented (sub)stream in bytes per second.
+            ``0`` disables the limit.
         * - stream-segment-attempts
           - ``int``
           - ``3``
@@ -140,7 +191,8 @@ class StreamlinkOptions(Options):
         * - stream-segment-threads
           - ``int``
           - ``1``
-          - The size of the thread pool used to download segments in parallel
+          - The size of the thread pool used to download segments in parallel.
+            The size of the HTTP connection pools gets increased accordingly.
         * - stream-segment-timeout
           - ``float``
           - ``10.0``
@@ -290,18 +342,32 @@ class StreamlinkOptions(Options):
           - ``bool``
           - ``False``
           - Whether to launch the webbrowser in headless mode or not
+        * - webbrowser-persistent
+          - ``bool``
+          - ``False``
+          - Whether to keep the webbrowser running and to reuse it for subsequent webbrowser API calls
     """
 
     def __init__(self, session: Streamlink) -> None:
         super().__init__({
             "user-input-requester": None,
             "no-plugin-cache": False,
+            "plugin-cache-storage": "json",
             "locale": None,
             "interface": None,
             "ipv4": False,
             "ipv6": False,
+            "http-dns-cache-ttl": 0.0,
+            "http-circuit-breaker": False,
+            "http-response-cache-persistent": False,
+            "http-prewarm": False,
+            "http-timings-log": False,
+            "http-timings-file": None,
             "ringbuffer-size": 1024 * 1024 * 16,  # 16 MB
             "mux-subtitles": False,
+            "mux-fmp4": False,
+            "stream-bandwidth-limit": 0,
+            "stream-bandwidth-limit-per-stream": 0,
             "stream-segment-attempts": 3,
             "stream-segment-threads": 1,
             "stream-segment-timeout": 10.0,
@@ -337,6 +403,7 @@ class StreamlinkOptions(Options):
             "webbrowser-cdp-port": None,
             "webbrowser-cdp-timeout": 2.0,
             "webbrowser-headless": False,
+            "webbrowser-persistent": False,
         })
         self.session = session
 
@@ -408,6 +475,42 @@ class StreamlinkOptions(Options):
         self.session.http.disable_dh(disable=bool(value))
         self.set_explicit(key, value)
 
+    def _set_http_dns_cache_ttl(self, key, value):
+        self.session.http.set_dns_cache(ttl=value)
+        self.set_explicit(key, value)
+
+    def _set_http_circuit_breaker(self, key, value):
+        self.session.http.circuit_breaker = HTTPCircuitBreaker() if value else None
+        self.set_explicit(key, value)
+
+    def _set_http_response_cache_persistent(self, key, value):
+        self.session.http.response_cache = HTTPResponseCache(filename="http-responses.json" if value else None)
+        self.set_explicit(key, value)
+
+    def _set_http_timings_log(self, key, value):
+        sinks = self.session.http.timings_sinks
+        sinks[:] = [sink for sink in sinks if not isinstance(sink, HTTPTimingsLogSink)]
+        if value:
+            sinks.append(HTTPTimingsLogSink())
+        self.set_explicit(key, value)
+
+    def _set_http_timings_file(self, key, value):
+        sinks = self.session.http.timings_sinks
+        sinks[:] = [sink for sink in sinks if not isinstance(sink, HTTPTimingsJSONSink)]
+        if value:
+            sinks.append(HTTPTimingsJSONSink(value))
+        self.set_explicit(key, value)
+
+    def _set_stream_bandwidth_limit(self, key, value):
+        self.session.http.bandwidth_limiter = TokenBucket(value) if value else None
+        self.set_explicit(key, value)
+
+    def _set_stream_segment_threads(self, key, value):
+        self.set_explicit(key, value)
+        # the segments of muxed substreams get fetched concurrently from the same host in most cases,
+        # alongside the playlist/manifest requests of each substream's worker
+        self.session.http.set_pool_size(max(DEFAULT_POOLSIZE, (value + 1) * 2))
+
     @staticmethod
     def _factory_set_http_attr_key_equals_value(delimiter: str) -> Callable[[StreamlinkOptions, str, Any], None]:
         def inner(self: StreamlinkOptions, key: str, value: Any) -> None:
@@ -468,6 +571,13 @@ class StreamlinkOptions(Options):
         "http-ssl-verify": _set_http_attr,
         "http-trust-env": _set_http_attr,
         "http-timeout": _set_http_attr,
+        "http-dns-cache-ttl": _set_http_dns_cache_ttl,
+        "http-circuit-breaker": _set_http_circuit_breaker,
+        "http-response-cache-persistent": _set_http_response_cache_persistent,
+        "http-timings-log": _set_http_timings_log,
+        "http-timings-file": _set_http_timings_file,
+        "stream-bandwidth-limit": _set_stream_bandwidth_limit,
+        "stream-segment-threads": _set_stream_segment_threads,
         "hls-duration": _factory_set_deprecated("stream-segmented-duration", float),
         "hls-segment-queue-threshold": _factory_set_deprecated("stream-segmented-queue-deadline", float),
     }
@@ -16,6 +16,7 @@ from streamlink.options import Argument, Arguments
 
 # noinspection PyProtectedMember
 from streamlink.plugin.plugin import _PLUGINARGUMENT_TYPE_REGISTRY, NO_PRIORITY, NORMAL_PRIORITY, Matcher, Matchers, Plugin
+from streamlink.session.plugins_index import MatchersIndex
 from streamlink.utils.module import exec_module, get_finder
 
 
@@ -62,6 +63,10 @@ class StreamlinkPlugins:
         self._matchers: dict[str, Matchers] = {}
         self._arguments: dict[str, Arguments] = {}
 
+        # Index of all matchers by the domain names of their URL patterns, built when resolving URLs
+        self._index: MatchersIndex | None = None
+        self._index_key: tuple[int, int] | None = None
+
         # Attempt to load built-in plugins lazily first
         if builtin and lazy:
             data = StreamlinkPluginsData.load()
@@ -81,10 +86,12 @@ class StreamlinkPlugins:
     def __setitem__(self, key: str, value: type[Plugin]) -> None:
         """Add/override a plugin class by name"""
         self._plugins[key] = value
+        self._index = None
 
     def __delitem__(self, key: str) -> None:
         """Remove a loaded plugin by name"""
         self._plugins.pop(key, None)
+        self._index = None
 
     def __contains__(self, item: str) -> bool:
         """Check if a plugin is loaded"""
@@ -112,10 +119,12 @@ class StreamlinkPlugins:
     def update(self, plugins: Mapping[str, type[Plugin]]):
         """Add/override loaded plugins"""
         self._plugins.update(plugins)
+        self._index = None
 
     def clear(self):
         """Remove all loaded plugins from the session"""
         self._plugins.clear()
+        self._index = None
 
     def iter_arguments(self) -> Iterator[tuple[str, Arguments]]:
         """Iterate through all plugins and their :class:`Arguments <streamlink.options.Arguments>`"""
@@ -143,16 +152,26 @@ class StreamlinkPlugins:
             if matchers and name not in self._plugins
         )  # fmt: skip
 
+    def _get_index(self) -> MatchersIndex:
+        # the data of lazily loaded plugins is not supposed to be modified, but rebuild the index if plugins were added anyway
+        key = len(self._plugins), len(self._matchers)
+        if self._index is None or self._index_key != key:
+            self._index = MatchersIndex(self.iter_matchers())
+            self._index_key = key
+
+        return self._index
+
     def match_url(self, url: str) -> tuple[str, type[Plugin]] | None:
         """Find a matching plugin by URL and load plugins which haven't been loaded yet"""
         match: str | None = None
         priority: int = NO_PRIORITY
 
-        for name, matchers in self.iter_matchers():
-            for matcher in matchers:
-                if matcher.priority > priority and matcher.pattern.match(url) is not None:
-                    match = name
-                    priority = matcher.priority
+        # only check the matchers of the URL's domain names and the matchers without a known domain name,
+        # in the same order as all matchers get iterated
+        for name, matcher in self._get_index().candidates(url):
+            if matcher.priority > priority and matcher.pattern.match(url) is not None:
+                match = name
+                priority = matcher.priority
 
         if match is None:
             return None
@@ -165,6 +184,7 @@ class StreamlinkPlugins:
             if not lookup:
                 return None
             self._plugins[match] = lookup[1]
+            self._index = None
 
         return match, self._plugins[match]
 
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+
+try:
+    # noinspection PyUnresolvedReferences,PyProtectedMember
+    from re import _constants as sre_constants, _parser as sre_parse  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover
+    # Python 3.10
+    import sre_constants  # type: ignore[no-redef]
+    import sre_parse  # type: ignore[no-redef]
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from streamlink.plugin.plugin import Matcher, Matchers
+
+
+# characters which are allowed in the host name part of an indexable URL pattern
+_HOST_CHARS = frozenset(map(ord, "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-._"))
+_HOST_CATEGORIES = frozenset((sre_constants.CATEGORY_WORD, sre_constants.CATEGORY_DIGIT))
+# characters which end the host name part of a URL
+_TERMINATORS = frozenset(map(ord, "/?#"))
+_REPEATS = frozenset((sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT))
+
+
+def _ops(subpattern) -> list:
+    return list(subpattern)
+
+
+def _is_host_safe(ops: list) -> bool:
+    for op, av in ops:
+        if op is sre_constants.LITERAL:
+            if av not in _HOST_CHARS:
+                return False
+        elif op is sre_constants.IN:
+            for item_op, item_av in av:
+                if item_op is sre_constants.LITERAL:
+                    if item_av not in _HOST_CHARS:
+                        return False
+                elif item_op is sre_constants.RANGE:
+                    if not all(chr(char).isascii() and chr(char).isalnum() for char in item_av):
+                        return False
+                elif item_op is not sre_constants.CATEGORY or item_av not in _HOST_CATEGORIES:
+                    return False
+        elif op in _REPEATS:
+            if not _is_host_safe(_ops(av[2])):
+                return False
+        elif op is sre_constants.SUBPATTERN:
+            if not _is_host_safe(_ops(av[-1])):
+                return False
+        elif op is sre_constants.BRANCH:
+            if not all(_is_host_safe(_ops(branch)) for branch in av[1]):
+                return False
+        else:
+            return False
+
+    return True
+
+
+def _ends_with_dot(ops: list) -> bool:
+    """Whether every string matched by the ops is either empty or ends with a dot"""
+    if not ops:
+        return True
+
+    op, av = ops[-1]
+    if op is sre_constants.LITERAL:
+        return av == ord(".")
+    if op is sre_constants.SUBPATTERN:
+        return _ends_with_dot(ops[:-1] + _ops(av[-1]))
+    if op is sre_constants.BRANCH:
+        return all(_ends_with_dot(ops[:-1] + _ops(branch)) for branch in av[1])
+    if op in _REPEATS:
+        if not _ends_with_dot(_ops(av[2])):
+            return False
+        return av[0] > 0 or _ends_with_dot(ops[:-1])
+
+    return False
+
+
+def _starts_with_terminator(ops: list) -> bool:
+    """Whether every string matched by the ops starts with a character which terminates the host name, or is at the end"""
+    if not ops:
+        # no terminator: the pattern matches any URL with the same prefix
+        return False
+
+    op, av = ops[0]
+    if op is sre_constants.LITERAL:
+        return av in _TERMINATORS
+    if op is sre_constants.AT:
+        return av in (sre_constants.AT_END, sre_constants.AT_END_STRING)
+    if op is sre_constants.SUBPATTERN:
+        return _starts_with_terminator(_ops(av[-1]) + ops[1:])
+    if op is sre_constants.BRANCH:
+        return all(_starts_with_terminator(_ops(branch) + ops[1:]) for branch in av[1])
+    if op in _REPEATS:
+        if not _starts_with_terminator(_ops(av[2]) + ops[1:]):
+            return False
+        return av[0] > 0 or _starts_with_terminator(ops[1:])
+
+    return False
+
+
+def _get_hosts(ops: list) -> set[str] | None:
+    """Get the domain names which all host names matched by the ops are equal to or subdomains of"""
+    if not ops:
+        return None
+
+    op, av = ops[-1]
+    if op is sre_constants.LITERAL:
+        idx = len(ops)
+        while idx > 0 and ops[idx - 1][0] is sre_constants.LITERAL:
+            idx -= 1
+        rest, domain = ops[:idx], "".join(chr(char) for _, char in ops[idx:]).lower()
+        if domain.startswith("."):
+            domain = domain[1:]
+        elif not _ends_with_dot(rest):
+            return None
+        return {domain} if domain and not domain.startswith(".") else None
+
+    if op is sre_constants.SUBPATTERN:
+        return _get_hosts(ops[:-1] + _ops(av[-1]))
+
+    if op is sre_constants.BRANCH:
+        hosts = set()
+        for branch in av[1]:
+            branch_hosts = _get_hosts(ops[:-1] + _ops(branch))
+            if branch_hosts is None:
+                return None
+            hosts.update(branch_hosts)
+        return hosts
+
+    return None
+
+
+def _split_scheme(ops: list) -> list | None:
+    """Remove the leading ``http://``, ``https://`` or ``https?://`` from the ops"""
+    if ops and ops[0][0] is sre_constants.AT and ops[0][1] in (sre_constants.AT_BEGINNING, sre_constants.AT_BEGINNING_STRING):
+        ops = ops[1:]
+    literals = [ord(char) for char in "http"]
+    if [av for op, av in ops[:4] if op is sre_constants.LITERAL] != literals:
+        return None
+    ops = ops[4:]
+    if ops and ops[0] == (sre_constants.LITERAL, ord("s")):
+        ops = ops[1:]
+    elif ops and ops[0][0] is sre_constants.MAX_REPEAT:
+        minimum, maximum, subpattern = ops[0][1]
+        if (minimum, maximum) != (0, 1) or _ops(subpattern) != [(sre_constants.LITERAL, ord("s"))]:
+            return None
+        ops = ops[1:]
+    if [(op, av) for op, av in ops[:3]] != [(sre_constants.LITERAL, ord(char)) for char in "://"]:
+        return None
+
+    return ops[3:]
+
+
+@lru_cache(maxsize=1024)
+def get_pattern_hosts(pattern: str, flags: int) -> frozenset[str] | None:
+    """
+    Get the domain names of a URL pattern.
+
+    Every URL matched by the pattern has a host name which is either equal to or a subdomain of one of the returned
+    domain names. ``None`` is returned if the host names can't be determined from the pattern.
+    """
+
+    try:
+        ops = _split_scheme(_ops(sre_parse.parse(pattern, flags)))
+    except (re.error, TypeError, ValueError):  # pragma: no cover
+        return None
+    if not ops:
+        return None
+
+    for idx in range(len(ops)):
+        if _starts_with_terminator(ops[idx:]):
+            host_ops = ops[:idx]
+            break
+    else:
+        return None
+
+    if not _is_host_safe(host_ops):
+        return None
+
+    hosts = _get_hosts(host_ops)
+
+    return frozenset(hosts) if hosts else None
+
+
+class MatchersIndex:
+    """
+    An index of plugin matchers by the domain names of their URL patterns.
+
+    Candidate matchers of a URL are the matchers of the URL's host name and its parent domains,
+    plus all matchers without a known domain name, in their original order.
+    """
+
+    def __init__(self, matchers: Iterable[tuple[str, Matchers]]):
+        self.entries: list[tuple[str, Matcher]] = []
+        self.hosts: dict[str, list[int]] = {}
+        self.fallback: list[int] = []
+
+        for name, plugin_matchers in matchers:
+            for matcher in plugin_matchers:
+                idx = len(self.entries)
+                self.entries.append((name, matcher))
+                hosts = get_pattern_hosts(matcher.pattern.pattern, matcher.pattern.flags)
+                if hosts is None:
+                    self.fallback.append(idx)
+                else:
+                    for host in hosts:
+                        self.hosts.setdefault(host, []).append(idx)
+
+    def candidates(self, url: str) -> Sequence[tuple[str, Matcher]]:
+        try:
+            hostname = urlparse(url).hostname
+        except ValueError:
+            hostname = None
+
+        # non-ASCII host names could be matched by case-insensitive patterns of different ASCII host names
+        if not hostname or not hostname.isascii():
+            return self.entries
+
+        indices = set(self.fallback)
+        parts = hostname.split(".")
+        for idx in range(len(parts)):
+            indices.update(self.hosts.get(".".join(parts[idx:]), ()))
+
+        return [self.entries[idx] for idx in sorted(indices)]
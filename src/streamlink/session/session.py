@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from copy import copy
 from functools import lru_cache
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import streamlink.compat  # ruff: ignore[unused-import]
 from streamlink import __version__
@@ -16,15 +18,31 @@ from streamlink.utils.url import update_scheme
 
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Iterable, Iterator, Mapping
 
     from streamlink.options import Options
     from streamlink.plugin.plugin import Plugin
+    from streamlink.stream.stream import Stream
 
 
 log = getLogger(".".join(__name__.split(".")[:-1]))
 
 
+class StreamsResult(NamedTuple):
+    """
+    The result of resolving the streams of a single URL via :meth:`Streamlink.streams_many()`.
+    """
+
+    #: The input URL
+    url: str
+    #: The plugin instance, or ``None`` if no plugin could be found
+    plugin: Plugin | None
+    #: The resolved streams, or ``None`` if an error was raised
+    streams: dict[str, Stream] | None
+    #: The error which was raised while resolving the URL or its streams
+    error: Exception | None
+
+
 class Streamlink:
     """
     The Streamlink session is used to load and resolve plugins, and to store options used by plugins and stream implementations.
@@ -85,6 +103,21 @@ class Streamlink:
 
         return self.options.get(key)
 
+    def _fork(self) -> Streamlink:
+        """
+        Create a shallow copy of this session with its own HTTP request state and its own options,
+        while sharing the loaded plugins and the HTTP session's connection pools.
+        """
+
+        forked = copy(self)
+        forked.http = self.http.fork()
+        forked.options = StreamlinkOptions(forked)
+        # copy the stored values as they are, without calling any setters which would modify the HTTP session again
+        for key, value in dict.items(self.options):
+            forked.options.set_explicit(key, value)
+
+        return forked
+
     @lru_cache(maxsize=128)  # ruff: ignore[cached-instance-method]
     def resolve_url(
         self,
@@ -153,6 +186,53 @@ class Streamlink:
 
         return plugin.streams(**params)
 
+    def streams_many(
+        self,
+        urls: Iterable[str],
+        concurrency: int = 8,
+        options: Options | Callable[[str, type[Plugin]], Options | None] | None = None,
+        **params,
+    ) -> Iterator[StreamsResult]:
+        """
+        Resolves the streams of multiple URLs concurrently, using this session's plugins and HTTP connection pool.
+
+        Each plugin gets instantiated with its own copy of this session, so that HTTP headers, cookies and session options
+        which get modified by one plugin don't affect the plugins and resolved streams of other URLs.
+
+        Unlike :meth:`streams()`, errors don't get raised and are instead returned as part of each URL's result.
+
+        :param urls: The URLs to match against loaded plugins
+        :param concurrency: The max number of URLs which get resolved at the same time
+        :param options: Optional options instance passed to each resolved plugin,
+                        or a callback which returns the options instance of a specific plugin name and plugin class
+        :param params: Additional keyword arguments passed to :meth:`Plugin.streams() <streamlink.plugin.Plugin.streams>`
+        :return: An iterator of :class:`StreamsResult` items, in the order of completion
+        """
+
+        if concurrency < 1:
+            raise ValueError("concurrency must be a positive integer")
+
+        def resolve(url: str) -> StreamsResult:
+            plugin: Plugin | None = None
+            try:
+                pluginname, pluginclass, resolved_url = self.resolve_url(url)
+                plugin_options = options(pluginname, pluginclass) if callable(options) else options
+                plugin = pluginclass(self._fork(), resolved_url, plugin_options)
+                streams = plugin.streams(**params)
+            except Exception as err:
+                return StreamsResult(url, plugin, None, err)
+
+            return StreamsResult(url, plugin, streams, None)
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="StreamsResolver") as executor:
+            futures = [executor.submit(resolve, url) for url in urls]
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
     def get_plugins(self):
         """
         Returns the loaded plugins of this session.
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import copy
 import itertools
 from collections import defaultdict
 from contextlib import contextmanager, suppress
@@ -14,7 +13,9 @@ from streamlink.logger import getLogger
 from streamlink.stream.dash.manifest import MPD, freeze_timeline
 from streamlink.stream.dash.segment import DASHSegment
 from streamlink.stream.ffmpegmux import FFMPEGMuxer
+from streamlink.stream.fmp4mux import FMP4Muxer
 from streamlink.stream.segmented import SegmentedStreamReader, SegmentedStreamWorker, SegmentedStreamWriter
+from streamlink.stream.segmented.mirrors import MirrorSelector
 from streamlink.stream.stream import Stream
 from streamlink.utils.l10n import Language
 from streamlink.utils.parse import parse_xml
@@ -38,6 +39,20 @@ class DASHStreamWriter(SegmentedStreamWriter[DASHSegment, Response]):
     reader: DASHStreamReader
     stream: DASHStream
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        # Resolve the stream's request arguments only once instead of copying them for each segment request.
+        # Only the request headers need to be copied per segment, as they might receive an additional Range header.
+        request_params = dict(self.stream.args)
+        self.request_headers: dict[str, str] = dict(request_params.pop("headers", None) or {})
+        self.request_params: dict[str, Any] = request_params
+
+        self.mirrors = MirrorSelector()
+
+    def is_live(self) -> bool:
+        return self.stream.mpd.type == "dynamic"
+
     def fetch(self, segment: DASHSegment):
         if self.closed:
             return
@@ -45,40 +60,61 @@ class DASHStreamWriter(SegmentedStreamWriter[DASHSegment, Response]):
         name = segment.name
         available_in = segment.available_in
         if available_in > 0:
-            log.debug(f"{self.reader.mime_type} segment {name}: waiting {available_in:.01f}s ({segment.availability})")
+            log.debug("%s segment %s: waiting %.01fs (%s)", self.reader.mime_type, name, available_in, segment.availability)
             if not self.wait(available_in):
-                log.debug(f"{self.reader.mime_type} segment {name}: cancelled")
+                log.debug("%s segment %s: cancelled", self.reader.mime_type, name)
                 return
-        log.debug(f"{self.reader.mime_type} segment {name}: downloading ({segment.availability})")
+        log.debug("%s segment %s: downloading (%s)", self.reader.mime_type, name, segment.availability)
 
-        request_args = copy.deepcopy(self.reader.stream.args)
-        headers = request_args.pop("headers", {})
+        headers = dict(self.request_headers)
 
         if segment.byterange:
             start, length = segment.byterange
             end = str(start + length - 1) if length else ""
             headers["Range"] = f"bytes={start}-{end}"
 
-        try:
-            return self.session.http.get(
-                segment.uri,
-                timeout=self.timeout,
-                exception=StreamError,
-                headers=headers,
-                retries=self.retries,
-                **request_args,
-            )
-        except StreamError as err:
-            log.error(f"{self.reader.mime_type} segment {name}: failed ({err})")
+        if not segment.mirrors:
+            try:
+                return self._fetch(segment.uri, headers, self.retries)
+            except StreamError as err:
+                log.error("%s segment %s: failed (%s)", self.reader.mime_type, name, err)
+                return None
+
+        # Try the mirrors in the order of their origins' latency and error rate.
+        # Only retry the last mirror, so that failed requests get retried on a different mirror right away.
+        urls = self.mirrors.order([segment.uri, *segment.mirrors])
+        for num, url in enumerate(urls, start=1):
+            try:
+                res = self._fetch(url, headers, self.retries if num == len(urls) else 0)
+            except StreamError as err:
+                self.mirrors.record_failure(url)
+                if num == len(urls) or self.closed:
+                    log.error("%s segment %s: failed (%s)", self.reader.mime_type, name, err)
+                    return None
+                log.warning("%s segment %s: failed (%s), trying mirror %s", self.reader.mime_type, name, err, urls[num])
+            else:
+                self.mirrors.record_success(url, res.elapsed.total_seconds())
+                return res
+
+    def _fetch(self, url: str, headers: dict[str, str], retries: int) -> Response:
+        return self.session.http.get(
+            url,
+            purpose="segment",
+            timeout=self.timeout,
+            exception=StreamError,
+            headers=headers,
+            retries=retries,
+            **self.request_params,
+        )
 
     def write(self, segment: DASHSegment, result: Response, *data):
         for chunk in result.iter_content(self.WRITE_CHUNK_SIZE):
-            if self.closed:
-                log.warning(f"{self.reader.mime_type} segment {segment.name}: aborted")
+            if self.closed or not self.throttle(len(chunk)):
+                log.warning("%s segment %s: aborted", self.reader.mime_type, segment.name)
                 return
             self.reader.buffer.write(chunk)
 
-        log.debug(f"{self.reader.mime_type} segment {segment.name}: completed")
+        log.debug("%s segment %s: completed", self.reader.mime_type, segment.name)
 
 
 class DASHStreamWorker(SegmentedStreamWorker[DASHSegment, Response]):
@@ -110,10 +146,12 @@ class DASHStreamWorker(SegmentedStreamWorker[DASHSegment, Response]):
 
     def iter_segments(self):
         init = True
+        timestamp: datetime | None = self.reader.timestamp
+        current = self.reader.ident, self.reader.period_start
         back_off_factor = 1
         while not self.closed:
             # find the representation by ID
-            representation = self.mpd.get_representation(self.reader.ident)
+            representation = self.get_representation(self.mpd)
 
             if self.mpd.type == "static":
                 refresh_wait = 5
@@ -131,17 +169,36 @@ class DASHStreamWorker(SegmentedStreamWorker[DASHSegment, Response]):
                     continue
 
                 queued = False
-                iter_segments = representation.segments(
-                    sequence=self.sequence,
-                    init=init,
-                    # sync initial timeline generation between audio and video threads
-                    timestamp=self.reader.timestamp if init else None,
-                )
-                for segment in iter_segments:
-                    if init and not segment.init:
-                        self.sequence = segment.num
-                        init = False
-                    queued |= yield segment
+                while representation:
+                    # start with a new initialization segment after switching to a different period,
+                    # and start at the period's first segment, so that the timelines of all substreams remain in sync
+                    if (representation.ident, representation.period.availabilityStartTime) != current:
+                        current = representation.ident, representation.period.availabilityStartTime
+                        init = True
+                        timestamp = representation.period.availabilityStartTime
+                        self.sequence = representation.start_number
+
+                    next_representation = self.get_next_period_representation(self.mpd, representation)
+                    period_end = next_representation.period.availabilityStartTime if next_representation else None
+
+                    iter_segments = representation.segments(
+                        sequence=self.sequence,
+                        init=init,
+                        # sync initial timeline generation between audio and video threads
+                        timestamp=timestamp if init else None,
+                    )
+                    representation = None
+                    for segment in iter_segments:
+                        # follow the period transition without reloading the manifest
+                        # once the segments of the current period have reached the start of the next period
+                        if next_representation and period_end and not segment.init and segment.available_at >= period_end:
+                            self.switch_representation(next_representation)
+                            representation = next_representation
+                            break
+                        if init and not segment.init:
+                            self.sequence = segment.num
+                            init = False
+                        queued |= yield segment
 
                 # close worker if type is not dynamic (all segments were put into writer queue)
                 if self.mpd.type != "dynamic":
@@ -157,6 +214,48 @@ class DASHStreamWorker(SegmentedStreamWorker[DASHSegment, Response]):
                 else:
                     back_off_factor = 1
 
+    @staticmethod
+    def get_next_period_representation(mpd: MPD, representation: Representation) -> Representation | None:
+        """
+        Find the equivalent representation of the period which follows the representation's period in dynamic manifests.
+        If the representation's period has already been removed from the manifest, use the most recent period instead.
+        """
+
+        current_period = representation.period
+        if mpd.type != "dynamic":
+            return None
+
+        for idx, period in enumerate(mpd.periods):
+            if period.is_same_period(current_period):
+                periods = [
+                    next_period
+                    for next_period in mpd.periods[idx + 1 : idx + 2]
+                    # periods without an id can only be told apart by their start time
+                    if next_period.availabilityStartTime > current_period.availabilityStartTime
+                ]
+                break
+        else:
+            current_time = now()
+            periods = [period for period in mpd.periods if period.availabilityStartTime <= current_time][-1:]
+
+        for period in periods:
+            return period.get_equivalent_representation(representation)
+
+        return None
+
+    def switch_representation(self, representation: Representation) -> None:
+        log.info(
+            "%s period transition: %r -> %r",
+            self.reader.mime_type,
+            self.reader.ident,
+            representation.ident,
+        )
+        self.reader.ident = representation.ident
+        self.reader.period_start = representation.period.availabilityStartTime
+
+    def get_representation(self, mpd: MPD) -> Representation | None:
+        return mpd.get_representation(self.reader.ident, period_start=self.reader.period_start)
+
     def reload(self):
         if self.closed:
             return
@@ -166,6 +265,7 @@ class DASHStreamWorker(SegmentedStreamWorker[DASHSegment, Response]):
         res = self.session.http.get(
             cast("str", self.mpd.url),
             exception=StreamError,
+            purpose="playlist",
             retries=self.manifest_reload_retries,
             **self.stream.args,
         )
@@ -177,15 +277,28 @@ class DASHStreamWorker(SegmentedStreamWorker[DASHSegment, Response]):
             timelines=self.mpd.timelines,
         )
 
-        new_rep = new_mpd.get_representation(self.reader.ident)
+        new_rep = self.get_representation(new_mpd)
+        if not new_rep and (representation := self.get_representation(self.mpd)):
+            # the current period has been removed from the manifest
+            if new_rep := self.get_next_period_representation(new_mpd, representation):
+                self.switch_representation(new_rep)
         if not new_rep:
-            log.error(f"Failed to find matching DASH representation: {self.reader.ident!r}")
+            log.error("Failed to find matching DASH representation: %r", self.reader.ident)
             self.close()
             return False
 
         with freeze_timeline(new_mpd):
             changed = len(list(itertools.islice(new_rep.segments(), 1))) > 0
 
+        # the current period doesn't have any new segments: switch to the next period once it has started
+        if (
+            not changed
+            and (next_rep := self.get_next_period_representation(new_mpd, new_rep))
+            and next_rep.period.availabilityStartTime <= now()
+        ):
+            self.switch_representation(next_rep)
+            changed = True
+
         if changed:
             self.mpd = new_mpd
 
@@ -209,6 +322,7 @@ class DASHStreamReader(SegmentedStreamReader[DASHSegment, Response]):
     ):
         super().__init__(stream, name=name)
         self.ident = representation.ident
+        self.period_start = representation.period.availabilityStartTime
         self.mime_type = representation.mimeType
         self.timestamp = timestamp
 
@@ -274,7 +388,7 @@ class DASHStream(Stream):
 
         retries = session.options.get("dash-manifest-reload-attempts")
         args = session.http.valid_request_args(**request_args)
-        res = session.http.get(url_or_manifest, retries=retries, **args)
+        res = session.http.get(url_or_manifest, purpose="playlist", retries=retries, **args)
         manifest: str = res.text
         url: str = res.url
 
@@ -320,7 +434,7 @@ class DASHStream(Stream):
         audio: list[Representation | None] = [None] if with_video_only else []
 
         available_periods = [f"{idx}{f' (id={p.id!r})' if p.id is not None else ''}" for idx, p in enumerate(mpd.periods)]
-        log.debug(f"Available DASH periods: {', '.join(available_periods)}")
+        log.debug("Available DASH periods: %s", ", ".join(available_periods))
 
         try:
             if isinstance(period, int):
@@ -350,7 +464,7 @@ class DASHStream(Stream):
                 for aset in period_selection.adaptationSets
             )
             if is_encrypted:  # pragma: no branch
-                log.warning(f"{source} is protected by DRM and won't be decrypted")
+                log.warning("%s is protected by DRM and won't be decrypted", source)
 
         if not video:
             video.append(None)
@@ -375,7 +489,9 @@ class DASHStream(Stream):
             lang = audio[0].lang if audio[0] else None
 
         log.debug(
-            f"Available languages for DASH audio streams: {', '.join(available_languages) or 'NONE'} (using: {lang or 'n/a'})",
+            "Available languages for DASH audio streams: %s (using: %s)",
+            ", ".join(available_languages) or "NONE",
+            lang or "n/a",
         )
 
         # if the language is given by the stream, filter out other languages that do not match
@@ -425,6 +541,10 @@ class DASHStream(Stream):
 
         return ret_new
 
+    @staticmethod
+    def is_fmp4(representation: Representation | None) -> bool:
+        return representation is not None and representation.mimeType in ("video/mp4", "audio/mp4")
+
     def open(self):
         video, audio = None, None
         rep_video, rep_audio = self.video_representation, self.audio_representation
@@ -439,7 +559,11 @@ class DASHStream(Stream):
             audio = DASHStreamReader(self, rep_audio, timestamp, name="audio")
             log.debug("Opening DASH reader for: %r - %s", rep_audio.ident, rep_audio.mimeType)
 
-        if video and audio and FFMPEGMuxer.is_usable(self.session):
+        if video and audio and self.session.options.get("mux-fmp4") and self.is_fmp4(rep_video) and self.is_fmp4(rep_audio):
+            video.open()
+            audio.open()
+            return FMP4Muxer(self.session, video, audio).open()
+        elif video and audio and FFMPEGMuxer.is_usable(self.session):
             video.open()
             audio.open()
             return FFMPEGMuxer(self.session, video, audio, copyts=True).open()
@@ -320,6 +320,29 @@ class MPDNode:
 
         return self._base_url
 
+    @property
+    def base_urls(self) -> list[str]:
+        """
+        The base URL, followed by the alternative base URLs of mirrors,
+        resolved from multiple ``BaseURL`` elements of this node and its ancestors.
+        """
+
+        parent_urls = [self._base_url, *(self.parent.base_urls[1:] if self.parent is not None else [])]
+        if not hasattr(self, "baseURLs") or not self.baseURLs or not self.baseURLs[0].url:
+            return parent_urls
+
+        urls = [self.base_url]
+        for parent_url in parent_urls:
+            base_scheme = urlparse(parent_url).scheme
+            for baseurl in self.baseURLs:
+                if not baseurl.url or is_insecure_scheme(base_scheme, urlparse(baseurl.url).scheme):
+                    continue
+                url = urljoin(parent_url, baseurl.url)
+                if url not in urls:
+                    urls.append(url)
+
+        return urls
+
 
 class MPD(MPDNode):
     """
@@ -418,13 +441,16 @@ class MPD(MPDNode):
         self.periods_map = {period.id: period for period in self.periods if period.id is not None}
         self.programInformation = self.children(ProgramInformation)
 
-    def get_representation(self, ident: TTimelineIdent) -> Representation | None:
+    def get_representation(self, ident: TTimelineIdent, period_start: datetime | None = None) -> Representation | None:
         """
         Find the first Representation instance with a matching ident
+
+        Periods without an id attribute can't be told apart by the ident, so if set, they get matched by the
+        availability start time instead, which is their position on the presentation timeline of dynamic manifests.
         """
         p, a, r = ident
         for period in self.periods:
-            if p != period.id:
+            if p != period.id or (p is None and period_start is not None and period_start != period.availabilityStartTime):
                 continue
             for adaptationset in period.adaptationSets:
                 if a != adaptationset.id:
@@ -490,6 +516,45 @@ class Period(MPDNode):
         self.eventStream = self.children(EventStream)
         self.subset = self.children(Subset)
 
+    def is_same_period(self, period: Period) -> bool:
+        """
+        Check whether a Period instance, e.g. of a reloaded manifest, refers to the same period.
+        Periods get matched by their id attribute, or by their availability start time if they don't have an id.
+        """
+        if self.id is not None or period.id is not None:
+            return self.id == period.id
+
+        return self.availabilityStartTime == period.availabilityStartTime
+
+    def get_equivalent_representation(self, representation: Representation) -> Representation | None:
+        """
+        Find the Representation instance which is the most similar one to a Representation of a different Period.
+
+        Candidates must have the same mimeType and, if available, the same language.
+        Matching resolutions and codecs are preferred, followed by the closest bandwidth.
+        """
+        candidates = [
+            rep
+            for adaptationset in self.adaptationSets
+            for rep in adaptationset.representations
+            if rep.mimeType == representation.mimeType
+        ]
+        if representation.lang:
+            candidates = [rep for rep in candidates if rep.lang == representation.lang] or candidates
+
+        if not candidates:
+            return None
+
+        return min(
+            candidates,
+            key=lambda rep: (
+                rep.height != representation.height,
+                rep.width != representation.width,
+                rep.codecs != representation.codecs,
+                abs(rep.bandwidth - representation.bandwidth),
+            ),
+        )
+
 
 class AssetIdentifier(MPDNode):
     __tag__ = "AssetIdentifier"
@@ -635,6 +700,20 @@ class Representation(_RepresentationBaseType):
     def lang(self):
         return self.parent.lang
 
+    @property
+    def start_number(self) -> int:
+        """
+        The number of the first segment of the representation's segment list or segment template, or -1 if it has neither
+        """
+        segment_info = (
+            self.segmentList
+            or self.walk_back_get_attr("segmentList")
+            or self.segmentTemplate
+            or self.walk_back_get_attr("segmentTemplate")
+        )
+
+        return segment_info.startNumber if segment_info else -1
+
     @property
     def bandwidth_rounded(self) -> float:
         return round(self.bandwidth, 1 - int(math.log10(self.bandwidth)))
@@ -659,6 +738,21 @@ class Representation(_RepresentationBaseType):
         :return: yields Segments
         """
 
+        base_url, *mirrors = self.base_urls
+        for segment in self._segments(sequence, init, timestamp, **kwargs):
+            # segments of mirrors share the same path relative to the mirrors' base URLs
+            if mirrors and segment.uri.startswith(base_url):
+                path = segment.uri[len(base_url) :]
+                segment.mirrors = tuple(f"{mirror}{path}" for mirror in mirrors)
+            yield segment
+
+    def _segments(
+        self,
+        sequence: int,
+        init: bool,
+        timestamp: datetime | None,
+        **kwargs,
+    ) -> Iterator[DASHSegment]:
         # segmentBase = self.segmentBase or self.walk_back_get_attr("segmentBase")
         segmentList = self.segmentList or self.walk_back_get_attr("segmentList")
         segmentTemplate = self.segmentTemplate or self.walk_back_get_attr("segmentTemplate")
@@ -843,13 +937,13 @@ class SegmentList(_MultipleSegmentBaseType):
         suggested_delay = self.root.suggestedPresentationDelay
 
         if not self.duration:
-            log.info(f"Unknown segment duration. Falling back to an offset of {MPD.DEFAULT_LIVE_EDGE_SEGMENTS} segments.")
+            log.info("Unknown segment duration. Falling back to an offset of %d segments.", MPD.DEFAULT_LIVE_EDGE_SEGMENTS)
             offset = MPD.DEFAULT_LIVE_EDGE_SEGMENTS
         else:
             offset = max(0, math.ceil(suggested_delay.total_seconds() / self.duration_seconds))
 
         start = self.startNumber + len(self.segmentURLs) - offset
-        log.debug(f"Calculated optimal offset is {offset} segments. First segment is {start}.")
+        log.debug("Calculated optimal offset is %s segments. First segment is %s.", offset, start)
 
         return start
 
@@ -946,9 +1040,9 @@ class SegmentTemplate(_MultipleSegmentBaseType):
                 timedelta(seconds=self.duration_seconds),
             )
 
-            log.debug(f"Stream start: {self.period.availabilityStartTime}")
-            log.debug(f"Current time: {current_time}")
-            log.debug(f"Availability: {available_start}")
+            log.debug("Stream start: %s", self.period.availabilityStartTime)
+            log.debug("Current time: %s", current_time)
+            log.debug("Availability: %s", available_start)
             log.debug(
                 "; ".join([
                     f"presentationTimeOffset: {self.presentationTimeOffset}",
@@ -966,7 +1060,11 @@ class SegmentTemplate(_MultipleSegmentBaseType):
 
         yield from zip(number_iter, available_iter, strict=False)
 
-    def segment_timeline(self, ident: TTimelineIdent) -> Iterator[tuple[int, TimelineSegment, datetime]]:
+    def segment_timeline(
+        self,
+        ident: TTimelineIdent,
+        timestamp: datetime | None = None,
+    ) -> Iterator[tuple[int, TimelineSegment, datetime]]:
         if not self.segmentTimeline:  # pragma: no cover
             raise MPDParsingError("Missing SegmentTimeline in SegmentTemplate")
 
@@ -977,6 +1075,9 @@ class SegmentTemplate(_MultipleSegmentBaseType):
             is_initial = time == -1
 
             threshold = self.root.publishTime - self.root.suggestedPresentationDelay
+            # include earlier segments of the initial timeline if a timestamp was set, e.g. the start of a new period
+            if timestamp is not None:
+                threshold = min(threshold, timestamp)
 
             # transform the timeline into a segment list
             timeline = []
@@ -1021,7 +1122,7 @@ class SegmentTemplate(_MultipleSegmentBaseType):
                 yield url, number, duration, available_at
         else:
             log.debug("Generating segment timeline for %s playlist: %r", self.root.type, ident)
-            for number, segment, available_at in self.segment_timeline(ident):
+            for number, segment, available_at in self.segment_timeline(ident, timestamp=timestamp):
                 url = self.make_url(base_url, self.fmt_media(Time=segment.t, Number=number, **kwargs))
                 duration = segment.d / self.timescale
                 yield url, number, duration, available_at
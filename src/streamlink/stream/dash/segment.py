@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
@@ -28,6 +28,7 @@ class TimelineSegment:
 class DASHSegment(Segment):
     available_at: datetime = EPOCH_START
     byterange: tuple[int, int | None] | None = None
+    mirrors: tuple[str, ...] = field(default=(), repr=False)
 
     @property
     def name(self) -> str:
@@ -12,9 +12,10 @@ from shutil import which
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, TextIO, TypeVar
 
 from streamlink import StreamError
+from streamlink.cache import Cache
 from streamlink.logger import getLogger
 from streamlink.stream.stream import Stream, StreamIO
-from streamlink.utils.named_pipe import NamedPipe
+from streamlink.utils.named_pipe import AnonymousPipe, AnonymousPipePosix, NamedPipe
 from streamlink.utils.processoutput import ProcessOutput
 
 
@@ -97,6 +98,10 @@ class FFMPEGMuxer(StreamIO):
 
     FFMPEG_VERSION: str | None = None
     FFMPEG_VERSION_TIMEOUT = 4.0
+    FFMPEG_VERSION_CACHE_FILENAME = "ffmpeg.json"
+    FFMPEG_VERSION_CACHE_EXPIRES = 60 * 60 * 24 * 30
+
+    PIPE_CHUNK_SIZE = 65536
 
     errorlog: int | TextIO
 
@@ -134,15 +139,34 @@ class FFMPEGMuxer(StreamIO):
                     break
 
         if resolved and validate:
-            log.trace("Querying FFmpeg version: %r", [resolved, "-version"])
-            versionoutput = FFmpegVersionOutput([resolved, "-version"], timeout=timeout)
-            if not versionoutput.run():
+            cache = Cache(filename=cls.FFMPEG_VERSION_CACHE_FILENAME)
+            cache_key = cls._version_cache_key(resolved)
+            cached = cls._version_cache_value(cache.get(cache_key)) if cache_key else None
+
+            if cached:
+                log.trace(f"Using cached FFmpeg version output of {resolved}")
+                version, output = cached
+            else:
+                log.trace("Querying FFmpeg version: %r", [resolved, "-version"])
+                versionoutput = FFmpegVersionOutput([resolved, "-version"], timeout=timeout)
+                if versionoutput.run():
+                    version, output = versionoutput.version, versionoutput.output
+                    if cache_key:
+                        cache.set(
+                            cache_key,
+                            {"version": version, "output": output},
+                            expires=cls.FFMPEG_VERSION_CACHE_EXPIRES,
+                        )
+                else:
+                    version, output = None, []
+
+            if not version:
                 log.error("Could not validate FFmpeg!")
                 log.error("Unexpected FFmpeg version output while running %r", [resolved, "-version"])
                 resolved = None
             else:
-                cls.FFMPEG_VERSION = versionoutput.version
-                for i, line in enumerate(versionoutput.output):
+                cls.FFMPEG_VERSION = version
+                for i, line in enumerate(output):
                     log.debug(f" {line}" if i > 0 else line)
 
         if not resolved:
@@ -151,6 +175,30 @@ class FFMPEGMuxer(StreamIO):
 
         return resolved
 
+    @staticmethod
+    def _version_cache_key(resolved: str) -> str | None:
+        # invalidate cached version output when the executable gets replaced or updated
+        try:
+            stat = Path(resolved).stat()
+        except OSError:
+            return None
+
+        return f"{resolved}:{stat.st_mtime_ns}:{stat.st_size}"
+
+    @staticmethod
+    def _version_cache_value(cached: Any) -> tuple[str, list[str]] | None:
+        # ignore invalid cache entries, e.g. from older versions or from manual edits, and query the version again
+        if (
+            not isinstance(cached, dict)
+            or not isinstance(version := cached.get("version"), str)
+            or not version
+            or not isinstance(output := cached.get("output"), list)
+            or not all(isinstance(line, str) for line in output)
+        ):
+            return None
+
+        return version, output
+
     @staticmethod
     def copy_to_pipe(muxer: FFMPEGMuxer, stream: StreamIO, pipe: NamedPipeBase):
         log.debug(f"Starting copy to pipe: {pipe.path}")
@@ -160,7 +208,7 @@ class FFMPEGMuxer(StreamIO):
         data = b""
         while True:
             try:
-                data = stream.read(8192)
+                data = stream.read(muxer.PIPE_CHUNK_SIZE)
             except (OSError, ValueError) as err:
                 log.error(f"Error while reading from substream: {err}")
                 break
@@ -190,7 +238,9 @@ class FFMPEGMuxer(StreamIO):
             raise StreamError("Cannot use FFmpeg")
 
         self.streams = streams
-        self.pipes = [NamedPipe() for _ in self.streams]
+        # prefer anonymous pipes which get passed to the FFmpeg process over named pipes (FIFOs) on the filesystem
+        pipe_class = AnonymousPipe or NamedPipe
+        self.pipes = [pipe_class() for _ in self.streams]
         self.pipe_threads = [
             threading.Thread(
                 target=self.copy_to_pipe,
@@ -245,10 +295,26 @@ class FFMPEGMuxer(StreamIO):
             self.errorlog = sys.stderr
 
     def open(self):
+        popen_kwargs: dict[str, Any] = {}
+        anonymous_pipes = [pipe for pipe in self.pipes if isinstance(pipe, AnonymousPipePosix)]
+        if anonymous_pipes:
+            popen_kwargs["pass_fds"] = [pipe.fd_read for pipe in anonymous_pipes]
+
+        self.process = subprocess.Popen(
+            self._cmd,
+            stdout=subprocess.PIPE,
+            stdin=subprocess.PIPE,
+            stderr=self.errorlog,
+            **popen_kwargs,
+        )
+
+        # the read ends of the anonymous pipes are now owned by the FFmpeg process
+        for pipe in anonymous_pipes:
+            pipe.close_read()
+
         for t in self.pipe_threads:
             t.daemon = True
             t.start()
-        self.process = subprocess.Popen(self._cmd, stdout=subprocess.PIPE, stdin=subprocess.PIPE, stderr=self.errorlog)
 
         return self
 
@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import struct
+import threading
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+from streamlink.buffers import RingBuffer
+from streamlink.logger import getLogger
+from streamlink.stream.stream import StreamIO
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+log = getLogger(__name__)
+
+
+_BOX_HEADER = struct.Struct(">I4s")
+_BOX_LARGESIZE = struct.Struct(">Q")
+_UINT32 = struct.Struct(">I")
+_UINT64 = struct.Struct(">Q")
+
+# track_ID offsets in the tkhd box payload (after the box header), by box version
+_TKHD_TRACK_ID_OFFSET = {0: 12, 1: 20}
+# timescale offsets in the mdhd box payload (after the box header), by box version
+_MDHD_TIMESCALE_OFFSET = {0: 12, 1: 20}
+
+
+def iter_boxes(data: bytes | bytearray, start: int = 0, end: int | None = None) -> Iterator[tuple[bytes, int, int, int]]:
+    """
+    Iterate over the ISO BMFF boxes of a byte sequence.
+    Yields the box type, the box start offset, the payload start offset and the box end offset.
+    """
+
+    end = len(data) if end is None else end
+    pos = start
+    while pos + _BOX_HEADER.size <= end:
+        size, boxtype = _BOX_HEADER.unpack_from(data, pos)
+        header = _BOX_HEADER.size
+        if size == 1:
+            (size,) = _BOX_LARGESIZE.unpack_from(data, pos + header)
+            header += _BOX_LARGESIZE.size
+        elif size == 0:
+            size = end - pos
+        if size < header or pos + size > end:
+            raise ValueError(f"Invalid {boxtype!r} box size")
+        yield boxtype, pos, pos + header, pos + size
+        pos += size
+
+
+def _box(boxtype: bytes, *payload: bytes | bytearray) -> bytes:
+    data = b"".join(payload)
+    return _BOX_HEADER.pack(_BOX_HEADER.size + len(data), boxtype) + data
+
+
+class FMP4Track:
+    """
+    A single fragmented MP4 input stream.
+    Reads the initialization section and the movie fragments box by box.
+    """
+
+    def __init__(self, stream: StreamIO, name: str):
+        self.stream = stream
+        self.name = name
+        self.ftyp: bytes = b""
+        self.moov: bytes = b""
+        # maps the input track IDs to the output track IDs
+        self.track_ids: dict[int, int] = {}
+        # the timescales of the input track IDs
+        self.timescales: dict[int, int] = {}
+        self.time: float = 0.0
+        # the number of changes of the initialization section, e.g. after DASH period transitions
+        self.generation: int = 0
+
+    def _read(self, size: int) -> bytes:
+        data = b""
+        while len(data) < size:
+            chunk = self.stream.read(size - len(data))
+            if not chunk:
+                if data:
+                    raise ValueError(f"Unexpected end of {self.name}")
+                return b""
+            data += chunk
+
+        return data
+
+    def read_box(self) -> tuple[bytes, bytes] | None:
+        header = self._read(_BOX_HEADER.size)
+        if not header:
+            return None
+
+        size, boxtype = _BOX_HEADER.unpack(header)
+        if size == 1:
+            largesize = self._read(_BOX_LARGESIZE.size)
+            header += largesize
+            (size,) = _BOX_LARGESIZE.unpack(largesize)
+        elif size == 0:
+            raise ValueError(f"Unsupported {boxtype!r} box size in {self.name}")
+        if size < len(header):
+            raise ValueError(f"Invalid {boxtype!r} box size in {self.name}")
+
+        return boxtype, header + self._read(size - len(header))
+
+    def read_init(self) -> bool:
+        while box := self.read_box():
+            boxtype, data = box
+            if boxtype == b"ftyp":
+                self.ftyp = data
+            elif boxtype == b"moov":
+                self.set_moov(data)
+                return True
+
+        return False
+
+    def set_moov(self, moov: bytes) -> None:
+        self.moov = moov
+        self.timescales.clear()
+        _boxtype, _start, payload, end = next(iter_boxes(moov))
+        for boxtype, _start, trak_payload, trak_end in iter_boxes(moov, payload, end):
+            if boxtype != b"trak":
+                continue
+            track_id = timescale = None
+            for child, _start, child_payload, child_end in iter_boxes(moov, trak_payload, trak_end):
+                if child == b"tkhd":
+                    track_id = _UINT32.unpack_from(moov, child_payload + _TKHD_TRACK_ID_OFFSET[moov[child_payload]])[0]
+                elif child == b"mdia":
+                    for mdia_child, _start, mdhd_payload, _end in iter_boxes(moov, child_payload, child_end):
+                        if mdia_child == b"mdhd":
+                            timescale = _UINT32.unpack_from(moov, mdhd_payload + _MDHD_TIMESCALE_OFFSET[moov[mdhd_payload]])[0]
+            if track_id is not None and timescale is not None:
+                self.timescales[track_id] = timescale
+
+    def read_fragment(self) -> bytearray | None:
+        """
+        Read the next movie fragment (``moof`` box and the following boxes up to and including the ``mdat`` box).
+        Other top-level boxes in between fragments, like ``styp``, ``sidx``, ``emsg`` or ``prft``, are discarded.
+        """
+
+        fragment: bytearray | None = None
+        while box := self.read_box():
+            boxtype, data = box
+            if boxtype == b"moof":
+                fragment = bytearray(data)
+                self._update_time(fragment)
+            elif fragment is None:
+                if boxtype == b"ftyp":
+                    self.ftyp = data
+                elif boxtype == b"moov" and data != self.moov:
+                    log.info(f"Encountered a changed initialization section in {self.name}")
+                    self.set_moov(data)
+                    self.generation += 1
+                continue
+            else:
+                fragment += data
+                if boxtype == b"mdat":
+                    return fragment
+
+        return None
+
+    def _update_time(self, moof: bytearray) -> None:
+        _boxtype, _start, payload, end = next(iter_boxes(moof))
+        for boxtype, _start, traf_payload, traf_end in iter_boxes(moof, payload, end):
+            if boxtype != b"traf":
+                continue
+            track_id = None
+            for child, _start, child_payload, _end in iter_boxes(moof, traf_payload, traf_end):
+                if child == b"tfhd":
+                    track_id = _UINT32.unpack_from(moof, child_payload + 4)[0]
+                elif child == b"tfdt" and track_id is not None:
+                    version = moof[child_payload]
+                    struct_time = _UINT64 if version == 1 else _UINT32
+                    (decode_time,) = struct_time.unpack_from(moof, child_payload + 4)
+                    self.time = decode_time / (self.timescales.get(track_id) or 1)
+
+
+class FMP4Muxer(StreamIO):
+    """
+    Muxes fragmented MP4 streams in-process, without FFmpeg.
+
+    The initialization sections of all input streams get merged into a single one with unique track IDs,
+    and the input streams' movie fragments get interleaved in the order of their decode timestamps.
+    If the initialization sections of the input streams change, e.g. after a DASH period transition, then all
+    remaining movie fragments of the previous initialization sections get written first, followed by a new merged
+    initialization section, as the decode timestamps of the new movie fragments may have been reset.
+    """
+
+    def __init__(self, session, *streams: StreamIO):
+        super().__init__()
+
+        self.session = session
+        self.streams = streams
+        self.tracks = [FMP4Track(stream, f"substream {idx}") for idx, stream in enumerate(streams)]
+        self.sequence = 0
+        self.generation = 0
+
+        self.timeout = session.options.get("stream-timeout")
+        self.buffer = RingBuffer(session.options.get("ringbuffer-size"))
+        self.thread = threading.Thread(target=self.run, name="FMP4Muxer", daemon=True)
+
+    def open(self):
+        self.thread.start()
+
+        return self
+
+    def read(self, size=-1):
+        return self.buffer.read(
+            size,
+            block=self.thread.is_alive(),
+            timeout=self.timeout,
+        )
+
+    def close(self):
+        if self.closed:
+            return
+
+        log.debug("Closing fMP4 muxer thread")
+        for stream in self.streams:
+            with suppress(OSError):
+                stream.close()
+        self.buffer.close()
+
+        if threading.current_thread() is not self.thread and self.thread.is_alive():
+            self.thread.join(timeout=self.timeout)
+
+        super().close()
+
+    def merge_init(self) -> bytes:
+        """
+        Merge the initialization sections of all tracks and assign unique track IDs.
+        """
+
+        mvhd: bytearray | None = None
+        mehd: bytes = b""
+        traks: list[bytes] = []
+        trexs: list[bytes] = []
+        other: list[bytes] = []
+        track_id = 0
+
+        for track in self.tracks:
+            moov = track.moov
+            track.track_ids.clear()
+            _boxtype, _start, payload, end = next(iter_boxes(moov))
+            for boxtype, start, box_payload, box_end in iter_boxes(moov, payload, end):
+                if boxtype == b"mvhd":
+                    if mvhd is None:
+                        mvhd = bytearray(moov[start:box_end])
+                elif boxtype == b"trak":
+                    track_id += 1
+                    traks.append(self._update_trak(track, moov[start:box_end], track_id))
+                elif boxtype == b"mvex":
+                    for child, child_start, child_payload, child_end in iter_boxes(moov, box_payload, box_end):
+                        if child == b"mehd":
+                            mehd = mehd or moov[child_start:child_end]
+                        elif child == b"trex":
+                            trex = bytearray(moov[child_start:child_end])
+                            old_track_id = _UINT32.unpack_from(moov, child_payload + 4)[0]
+                            _UINT32.pack_into(trex, child_payload - child_start + 4, track.track_ids.get(old_track_id, 0))
+                            trexs.append(bytes(trex))
+                else:
+                    data = moov[start:box_end]
+                    if data not in other:
+                        other.append(data)
+
+        if mvhd is None:
+            raise ValueError("Missing mvhd box")
+
+        # next_track_ID is the last field of the mvhd box
+        _UINT32.pack_into(mvhd, len(mvhd) - _UINT32.size, track_id + 1)
+
+        moov = _box(b"moov", mvhd, *traks, _box(b"mvex", mehd, *trexs), *other)
+
+        return self.tracks[0].ftyp + moov
+
+    @staticmethod
+    def _update_trak(track: FMP4Track, data: bytes, track_id: int) -> bytes:
+        trak = bytearray(data)
+        _boxtype, _start, payload, end = next(iter_boxes(trak))
+        for boxtype, _start, box_payload, _end in iter_boxes(trak, payload, end):
+            if boxtype == b"tkhd":
+                offset = box_payload + _TKHD_TRACK_ID_OFFSET[trak[box_payload]]
+                old_track_id = _UINT32.unpack_from(trak, offset)[0]
+                track.track_ids[old_track_id] = track_id
+                _UINT32.pack_into(trak, offset, track_id)
+
+        return bytes(trak)
+
+    def write_fragment(self, track: FMP4Track, fragment: bytearray) -> None:
+        self.sequence += 1
+        _boxtype, _start, payload, end = next(iter_boxes(fragment))
+        for boxtype, _start, box_payload, box_end in iter_boxes(fragment, payload, end):
+            # the mfhd box's sequence_number field follows the version and flags fields
+            if boxtype == b"mfhd":
+                _UINT32.pack_into(fragment, box_payload + 4, self.sequence)
+            elif boxtype == b"traf":
+                for child, _start, child_payload, _end in iter_boxes(fragment, box_payload, box_end):
+                    # the tfhd box's track_ID field follows the version and flags fields
+                    if child == b"tfhd":
+                        old_track_id = _UINT32.unpack_from(fragment, child_payload + 4)[0]
+                        _UINT32.pack_into(fragment, child_payload + 4, track.track_ids.get(old_track_id, old_track_id))
+
+        self.buffer.write(fragment)
+
+    def mux(self) -> None:
+        for track in self.tracks:
+            if not track.read_init():
+                log.error(f"Missing initialization section in {track.name}")
+                return
+
+        self.buffer.write(self.merge_init())
+
+        pending = {idx: fragment for idx, track in enumerate(self.tracks) if (fragment := track.read_fragment())}
+        while pending and not self.closed:
+            # write the fragment with the lowest decode time of the oldest initialization section first
+            idx = min(pending, key=lambda i: (self.tracks[i].generation, self.tracks[i].time, i))
+            track = self.tracks[idx]
+            if track.generation > self.generation:
+                self.generation = track.generation
+                log.debug("Writing changed initialization section")
+                self.buffer.write(self.merge_init())
+            self.write_fragment(track, pending.pop(idx))
+            if fragment := track.read_fragment():
+                pending[idx] = fragment
+
+    def run(self) -> None:
+        try:
+            self.mux()
+        except (OSError, ValueError, struct.error, KeyError) as err:
+            if not self.closed:
+                log.error(f"Error while muxing fMP4 streams: {err}")
+        finally:
+            self.buffer.close()
@@ -4,6 +4,7 @@ import math
 import re
 import struct
 import warnings
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, TypeVar
 from urllib.parse import urlparse
@@ -25,7 +26,6 @@ from streamlink.stream.hls.segment import HLSSegment, StreamInfo
 from streamlink.stream.http import HTTPStream
 from streamlink.stream.segmented import SegmentedStreamReader, SegmentedStreamWorker, SegmentedStreamWriter
 from streamlink.utils.cache import LRUCache
-from streamlink.utils.crypto import AES, unpad
 from streamlink.utils.formatter import Formatter
 from streamlink.utils.l10n import Language
 from streamlink.utils.num import to_float
@@ -33,7 +33,7 @@ from streamlink.utils.times import now
 
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Collection, Mapping
     from concurrent.futures import Future
     from datetime import datetime
 
@@ -103,6 +103,9 @@ class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
             self.ignore_names = re.compile(segments, re.IGNORECASE)
         self.passthrough_encrypted = options.get("stream-passthrough-encrypted")
 
+    def is_live(self) -> bool:
+        return self.reader.worker.playlist_end is None
+
     @staticmethod
     def num_to_iv(n: int) -> bytes:
         return struct.pack(">8xq", n)
@@ -132,6 +135,7 @@ class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
                 res = self.session.http.get(
                     key_uri,
                     exception=StreamError,
+                    purpose="key",
                     retries=self.retries,
                     **self.reader.request_params,
                 )
@@ -149,11 +153,15 @@ class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
         # Pad IV if needed
         iv = b"\x00" * (16 - len(iv)) + iv
 
+        # pycryptodome is imported lazily, as most HLS streams are not encrypted
+        from streamlink.utils.crypto import AES  # ruff: ignore[import-outside-top-level]
+
         return AES.new(self.key_data, AES.MODE_CBC, iv)
 
     def create_request_params(self, num: int, segment: HLSSegment | Map, is_map: bool):
         request_params = dict(self.reader.request_params)
-        headers = request_params.pop("headers", {})
+        # don't modify the reader's request headers
+        headers = dict(request_params.pop("headers", None) or {})
 
         if segment.byterange:
             if is_map:
@@ -199,7 +207,7 @@ class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
                 **self.create_request_params(segment.num, segment, False),
             )
         except StreamError as err:
-            log.error(f"Failed to fetch segment {segment.num}: {err}")
+            log.error("Failed to fetch segment %d: %s", segment.num, err)
 
     def fetch_map(self, segment: HLSSegment) -> Response | None:
         segment_map: Map = segment.map  # type: ignore[assignment, ty:invalid-assignment]  # map is not None
@@ -210,7 +218,7 @@ class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
                 **self.create_request_params(segment.num, segment_map, True),
             )
         except StreamError as err:
-            log.error(f"Failed to fetch map for segment {segment.num}: {err}")
+            log.error("Failed to fetch map for segment %d: %s", segment.num, err)
 
     def _fetch(self, url: str, **request_params) -> Response | None:
         if self.closed or not self.retries:  # pragma: no cover
@@ -218,6 +226,7 @@ class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
 
         return self.session.http.get(
             url,
+            purpose="segment",
             timeout=self.timeout,
             retries=self.retries,
             exception=StreamError,
@@ -229,7 +238,7 @@ class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
 
     def write(self, segment: HLSSegment, result: Response, *data):
         if not self.should_filter_segment(segment):
-            log.debug(f"Writing segment {segment.num} to output")
+            log.debug("Writing segment %d to output", segment.num)
 
             written_once = self.reader.buffer.written_once
             try:
@@ -250,7 +259,7 @@ class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
                     self.reader.resume()
 
         else:
-            log.debug(f"Discarding segment {segment.num}")
+            log.debug("Discarding segment %d", segment.num)
 
             # Read and discard any remaining HTTP response data in the response connection.
             # Unread data in the HTTPResponse connection blocks the connection from being released back to the pool.
@@ -270,10 +279,12 @@ class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
             try:
                 decryptor = self.create_decryptor(key, segment.num)
             except (StreamError, ValueError) as err:
-                log.error(f"Failed to create decryptor: {err}")
+                log.error("Failed to create decryptor: %s", err)
                 self.close()
                 return
 
+            from streamlink.utils.crypto import AES, unpad  # ruff: ignore[import-outside-top-level]
+
             try:
                 # Unlike plaintext segments, encrypted segments can't be written to the buffer in small chunks
                 # because of the byte padding at the end of the decrypted data, which means that decrypting in
@@ -282,26 +293,30 @@ class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
                 encrypted_chunk = result.content
                 decrypted_chunk = decryptor.decrypt(encrypted_chunk)
                 chunk = unpad(decrypted_chunk, AES.block_size, style="pkcs7")
+                if not self.throttle(len(encrypted_chunk)):
+                    return
                 self.reader.buffer.write(chunk)
             except (ChunkedEncodingError, ContentDecodingError, ConnectionError) as err:
-                log.error(f"Download of segment {segment.num} failed: {err}")
+                log.error("Download of segment %d failed: %s", segment.num, err)
                 return
             except ValueError as err:
-                log.error(f"Error while decrypting segment {segment.num}: {err}")
+                log.error("Error while decrypting segment %d: %s", segment.num, err)
                 return
 
         else:
             try:
                 for chunk in result.iter_content(self.WRITE_CHUNK_SIZE):
+                    if not self.throttle(len(chunk)):
+                        return
                     self.reader.buffer.write(chunk)
             except (ChunkedEncodingError, ContentDecodingError, ConnectionError) as err:
-                log.error(f"Download of segment {segment.num} failed: {err}")
+                log.error("Download of segment %d failed: %s", segment.num, err)
                 return
 
         if is_map:
-            log.debug(f"Segment initialization {segment.num} complete")
+            log.debug("Segment initialization %d complete", segment.num)
         else:
-            log.debug(f"Segment {segment.num} complete")
+            log.debug("Segment %d complete", segment.num)
 
 
 class HLSStreamWorker(SegmentedStreamWorker[HLSSegment, Response]):
@@ -339,7 +354,7 @@ class HLSStreamWorker(SegmentedStreamWorker[HLSSegment, Response]):
                 if self.reload_time < self._RELOAD_TIME_MIN:
                     self.reload_time = 0.0
             except Exception as err:
-                log.error(f"Failed parsing hls-playlist-reload-time value: {err}")
+                log.error("Failed parsing hls-playlist-reload-time value: %s", err)
                 self.reload_time = 0.0
         self._reload_time: float = self._RELOAD_TIME_DEFAULT
         self._reload_last: datetime = now()
@@ -367,6 +382,7 @@ class HLSStreamWorker(SegmentedStreamWorker[HLSSegment, Response]):
         res = self.session.http.get(
             self.stream.url,
             exception=StreamError,
+            purpose="playlist",
             retries=self.reload_attempts,
             **self.reader.request_params,
         )
@@ -480,7 +496,7 @@ class HLSStreamWorker(SegmentedStreamWorker[HLSSegment, Response]):
             try:
                 self.reload()
             except StreamError as err:
-                log.warning(f"Reloading failed: {err}")
+                log.warning("Reloading failed: %s", err)
 
     def iter_segments(self):
         self._reload_last = now()
@@ -488,13 +504,13 @@ class HLSStreamWorker(SegmentedStreamWorker[HLSSegment, Response]):
         try:
             self.reload()
         except StreamError as err:
-            log.error(f"{err}")
+            log.error("%s", err)
             self.reader.close()
             return
 
         if self.playlist_end is None:
             if self.duration_offset_start > 0.0:
-                log.debug(f"Time offsets negative for live streams, skipping back {self.duration_offset_start} seconds")
+                log.debug("Time offsets negative for live streams, skipping back %s seconds", self.duration_offset_start)
             # live playlist, force offset durations back to None
             self.duration_offset_start = -self.duration_offset_start
 
@@ -503,18 +519,16 @@ class HLSStreamWorker(SegmentedStreamWorker[HLSSegment, Response]):
 
         if self.playlist_segments:
             log.debug(
-                "; ".join([
-                    f"First Sequence: {self.playlist_segments[0].num}",
-                    f"Last Sequence: {self.playlist_segments[-1].num}",
-                ]),
+                "First Sequence: %s; Last Sequence: %s",
+                self.playlist_segments[0].num,
+                self.playlist_segments[-1].num,
             )
             log.debug(
-                "; ".join([
-                    f"Start offset: {self.duration_offset_start}",
-                    f"Duration: {self.duration_limit}",
-                    f"Start Sequence: {self.sequence}",
-                    f"End Sequence: {self.playlist_end}",
-                ]),
+                "Start offset: %s; Duration: %s; Start Sequence: %s; End Sequence: %s",
+                self.duration_offset_start,
+                self.duration_limit,
+                self.sequence,
+                self.playlist_end,
             )
 
         while not self.closed:
@@ -632,6 +646,9 @@ class HLSStream(HTTPStream):
     __reader__: ClassVar[type[HLSStreamReader]] = HLSStreamReader
     __parser__: ClassVar[type[M3U8Parser[M3U8[HLSSegment, HLSPlaylist], HLSSegment, HLSPlaylist]]] = M3U8Parser
 
+    #: The max number of media playlists which get checked concurrently by :meth:`parse_variant_playlist()`
+    CHECK_STREAMS_MAX_WORKERS: ClassVar[int] = 8
+
     def __init__(
         self,
         session: Streamlink,
@@ -693,16 +710,124 @@ class HLSStream(HTTPStream):
 
     @classmethod
     def _fetch_playlist(cls, session: Streamlink, url: str, **request_args) -> Response:
-        res = session.http.get(url, exception=OSError, **request_args)
+        res = session.http.get(url, exception=OSError, purpose="playlist", **request_args)
         res.encoding = "utf-8"
 
         return res
 
+    @classmethod
+    def _check_playlist(cls, session: Streamlink, url: str, request_args: dict) -> M3U8 | None:
+        # noinspection PyBroadException
+        try:
+            # don't retry failed checks: a failed check just drops the stream, and the shared deadline of the concurrent
+            # checks in _check_playlists() only accounts for a single request per media playlist
+            res = cls._fetch_playlist(session, url, **request_args, retries=0)
+            media_playlist = parse_m3u8(res, parser=cls.__parser__)
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except Exception:
+            return None
+
+        if media_playlist.is_master or not media_playlist.segments:
+            return None
+
+        return media_playlist
+
+    @classmethod
+    def _check_playlists(cls, session: Streamlink, urls: list[str], request_args: dict) -> dict[str, M3U8 | None]:
+        urls = list(dict.fromkeys(urls))
+        if len(urls) <= 1:
+            return {url: cls._check_playlist(session, url, request_args) for url in urls}
+
+        max_workers = min(cls.CHECK_STREAMS_MAX_WORKERS, len(urls))
+
+        # shared deadline of all checks: the max time each batch of requests can take in the worst case,
+        # which is a single request per check, as _check_playlist() doesn't retry
+        deadline: float | None = None
+        timeout = session.http.timeout
+        if isinstance(timeout, tuple):
+            timeout = None if None in timeout else sum(timeout)
+        if timeout is not None:
+            deadline = timeout * math.ceil(len(urls) / max_workers)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="HLSStream-check")
+        try:
+            futures = {url: executor.submit(cls._check_playlist, session, url, request_args) for url in urls}
+            done, _not_done = wait(futures.values(), timeout=deadline)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return {url: future.result() if future in done else None for url, future in futures.items()}
+
+    @staticmethod
+    def _get_stream_name(
+        playlist: HLSPlaylist,
+        name_key: str,
+        name_prefix: str,
+        name_fmt: str | None,
+    ) -> str | None:
+        names: dict[str, str | None] = dict(name=None, pixels=None, bitrate=None)
+
+        for media in playlist.media:
+            if media.type == "VIDEO" and media.name:
+                names["name"] = media.name
+
+        if playlist.stream_info.resolution and playlist.stream_info.resolution.height:
+            if (
+                isinstance(playlist.stream_info, StreamInfo)
+                and playlist.stream_info.framerate is not None
+                and playlist.stream_info.framerate > 30.0
+            ):
+                names["pixels"] = f"{playlist.stream_info.resolution.height}p{math.ceil(playlist.stream_info.framerate)}"
+            else:
+                names["pixels"] = f"{playlist.stream_info.resolution.height}p"
+
+        if playlist.stream_info.bandwidth:
+            bw = playlist.stream_info.bandwidth
+            if bw >= 1000:
+                names["bitrate"] = f"{int(bw / 1000.0)}k"
+            else:
+                names["bitrate"] = f"{bw / 1000.0}k"
+
+        if name_fmt:
+            stream_name = name_fmt.format(**names)
+        else:
+            stream_name = (
+                names.get(name_key)
+                or names.get("name")
+                or names.get("pixels")
+                or names.get("bitrate")
+            )  # fmt: skip
+
+        if not stream_name:
+            return None
+        if name_prefix:
+            stream_name = f"{name_prefix}{stream_name}"
+
+        return stream_name
+
+    @staticmethod
+    def _get_unique_stream_name(stream_name: str, existing: Collection[str]) -> str | None:
+        if stream_name not in existing:
+            return stream_name
+
+        # rename duplicate streams
+        stream_name = f"{stream_name}_alt"
+        num_alts = len([k for k in existing if k.startswith(stream_name)])
+
+        # We shouldn't need more than 2 alt streams
+        if num_alts >= 2:
+            return None
+        elif num_alts > 0:
+            stream_name = f"{stream_name}{num_alts + 1}"
+
+        return stream_name
+
     @classmethod
     def _check_streams(
         cls,
         session: Streamlink,
-        playlist: HLSPlaylist,
+        media_playlist: M3U8 | None,
         request_args: dict,
         check_streams: bool | Literal["playlists", "segments"],
         check_streams_segment_status: bool | None,
@@ -711,15 +836,7 @@ class HLSStream(HTTPStream):
         if check_streams_segment_status is False:
             return False, check_streams_segment_status
 
-        # noinspection PyBroadException
-        try:
-            res = cls._fetch_playlist(session, playlist.uri, **request_args)
-            media_playlist = parse_m3u8(res, parser=cls.__parser__)
-            if media_playlist.is_master or not media_playlist.segments:
-                raise ValueError
-        except KeyboardInterrupt:  # pragma: no cover
-            raise
-        except Exception:
+        if media_playlist is None:
             return False, check_streams_segment_status
 
         if check_streams != "segments" or check_streams_segment_status is not None:
@@ -759,7 +876,10 @@ class HLSStream(HTTPStream):
         :param check_streams: Only return streams which are accessible.
                               Set to ``True`` or ``"playlists"`` to check whether media playlists are accessible,
                               or set to ``"segments"`` to check segment accessibility as well.
+                              Media playlists of all named streams are checked concurrently.
                               Only one segment of the first available media playlist is checked to optimize loading times.
+                              If this segment check fails, all remaining streams are dropped without checking them,
+                              but their media playlists have already been requested at this point.
         :param force_restart: Start at the first segment even for a live stream
         :param name_fmt: A format string for the name, allowed format keys are: name, pixels, bitrate
         :param start_offset: Number of seconds to be skipped from the beginning
@@ -794,25 +914,35 @@ class HLSStream(HTTPStream):
         stream_name: str | None
         stream: Self | MuxedHLSStream[Self]
         streams: dict[str, Self | MuxedHLSStream[Self]] = {}
+        prewarm_urls: list[str] = []
 
         check_streams_segment_status: bool | None = None
+        media_playlists: dict[str, M3U8 | None] = {}
+        if check_streams in (True, "playlists", "segments"):
+            # only prefetch the media playlists of streams which will be checked, assuming that all checks succeed:
+            # if a check fails, a later duplicate stream may not get dropped anymore and its playlist will be checked on its own
+            check_names: set[str] = set()
+            check_urls: list[str] = []
+            for playlist in multivariant.playlists:
+                if playlist.is_iframe:
+                    continue
+                stream_name = cls._get_stream_name(playlist, name_key, name_prefix, name_fmt)
+                if stream_name is None or (stream_name := cls._get_unique_stream_name(stream_name, check_names)) is None:
+                    continue
+                check_names.add(stream_name)
+                check_urls.append(playlist.uri)
+
+            media_playlists = cls._check_playlists(session, check_urls, request_args)
 
         for playlist in multivariant.playlists:
             if playlist.is_iframe:
                 continue
 
-            names: dict[str, str | None] = dict(name=None, pixels=None, bitrate=None)
-            audio_streams = []
+            audio_streams = [media for media in playlist.media if media.type == "AUDIO"]
             fallback_audio: list[Media] = []
             default_audio: list[Media] = []
             preferred_audio: list[Media] = []
 
-            for media in playlist.media:
-                if media.type == "VIDEO" and media.name:
-                    names["name"] = media.name
-                elif media.type == "AUDIO":
-                    audio_streams.append(media)
-
             for media in audio_streams:
                 # Media without a URI is not relevant as external audio
                 if not media.uri:
@@ -858,52 +988,17 @@ class HLSStream(HTTPStream):
             if not fallback_audio and audio_streams and audio_streams[0].uri:
                 fallback_audio = [audio_streams[0]]
 
-            if playlist.stream_info.resolution and playlist.stream_info.resolution.height:
-                if (
-                    isinstance(playlist.stream_info, StreamInfo)
-                    and playlist.stream_info.framerate is not None
-                    and playlist.stream_info.framerate > 30.0
-                ):
-                    names["pixels"] = f"{playlist.stream_info.resolution.height}p{math.ceil(playlist.stream_info.framerate)}"
-                else:
-                    names["pixels"] = f"{playlist.stream_info.resolution.height}p"
-
-            if playlist.stream_info.bandwidth:
-                bw = playlist.stream_info.bandwidth
-                if bw >= 1000:
-                    names["bitrate"] = f"{int(bw / 1000.0)}k"
-                else:
-                    names["bitrate"] = f"{bw / 1000.0}k"
-
-            if name_fmt:
-                stream_name = name_fmt.format(**names)
-            else:
-                stream_name = (
-                    names.get(name_key)
-                    or names.get("name")
-                    or names.get("pixels")
-                    or names.get("bitrate")
-                )  # fmt: skip
-
-            if not stream_name:
+            stream_name = cls._get_stream_name(playlist, name_key, name_prefix, name_fmt)
+            if stream_name is None or (stream_name := cls._get_unique_stream_name(stream_name, streams)) is None:
                 continue
-            if name_prefix:
-                stream_name = f"{name_prefix}{stream_name}"
-
-            if stream_name in streams:  # rename duplicate streams
-                stream_name = f"{stream_name}_alt"
-                num_alts = len([k for k in streams.keys() if k.startswith(stream_name)])
-
-                # We shouldn't need more than 2 alt streams
-                if num_alts >= 2:
-                    continue
-                elif num_alts > 0:
-                    stream_name = f"{stream_name}{num_alts + 1}"
 
             if check_streams in (True, "playlists", "segments"):
+                # the segment check short-circuits the remaining checks after a failure, even if already prefetched
+                if playlist.uri not in media_playlists and check_streams_segment_status is not False:
+                    media_playlists[playlist.uri] = cls._check_playlist(session, playlist.uri, request_args)
                 check_streams_success, check_streams_segment_status = cls._check_streams(
                     session,
-                    playlist,
+                    media_playlists.get(playlist.uri),
                     request_args,
                     check_streams,
                     check_streams_segment_status,
@@ -918,7 +1013,7 @@ class HLSStream(HTTPStream):
                     f"(language={x.language}, name={x.name or 'N/A'})"
                     for x in external_audio
                 ])  # fmt: skip
-                log.debug(f"Using external audio tracks for stream {stream_name} {external_audio_msg}")
+                log.debug("Using external audio tracks for stream %s %s", stream_name, external_audio_msg)
 
                 stream = MuxedHLSStream(
                     session,
@@ -943,5 +1038,11 @@ class HLSStream(HTTPStream):
                 )
 
             streams[stream_name] = stream
+            prewarm_urls.append(playlist.uri)
+            if isinstance(stream, MuxedHLSStream):
+                prewarm_urls.extend(x.uri for x in external_audio if x.uri)
+
+        if prewarm_urls and session.options.get("http-prewarm"):
+            session.http.prewarm(*prewarm_urls)
 
         return streams
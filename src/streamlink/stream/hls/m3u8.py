@@ -7,7 +7,6 @@ from datetime import timedelta
 from typing import TYPE_CHECKING, ClassVar, Generic, TypeVar, cast
 from urllib.parse import urljoin, urlparse
 
-from isodate import ISO8601Error, parse_datetime  # type: ignore[import]
 from requests import Response
 
 from streamlink.logger import ALL, getLogger
@@ -25,6 +24,7 @@ from streamlink.stream.hls.segment import (
     Start,
     StreamInfo,
 )
+from streamlink.utils.times import parse_datetime
 from streamlink.utils.url import is_insecure_scheme
 
 
@@ -282,7 +282,7 @@ class M3U8Parser(Generic[TM3U8_co, THLSSegment_co, THLSPlaylist_co], metaclass=M
     def parse_iso8601(value: str | None) -> datetime | None:
         try:
             return None if value is None else parse_datetime(value)
-        except (ISO8601Error, ValueError):
+        except ValueError:  # isodate.ISO8601Error is a subclass of ValueError
             log.warning("Discarded invalid ISO8601 attribute value")
             return None
 
@@ -605,7 +605,7 @@ class M3U8Parser(Generic[TM3U8_co, THLSSegment_co, THLSPlaylist_co], metaclass=M
             return self.m3u8
         else:
             if not line.startswith("#EXTM3U"):
-                log.warning(f"Malformed HLS Playlist. Expected #EXTM3U, but got {line[:250]}")
+                log.warning("Malformed HLS Playlist. Expected #EXTM3U, but got %s", line[:250])
                 raise ValueError("Missing #EXTM3U header")
 
         lines = log.iter(ALL, lines)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import Lock
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+@dataclass
+class OriginStats:
+    latency: float | None = None
+    """Exponentially weighted moving average of the response latency in seconds"""
+
+    error_rate: float = 0.0
+    """Exponentially weighted moving average of failed requests"""
+
+
+class MirrorSelector:
+    """
+    Tracks the latency and error rate of the origins of mirrored segment URLs,
+    and orders mirrored URLs so that the fastest healthy origin gets requested first.
+
+    Healthy origins are ordered by their latency, followed by origins which haven't been requested yet
+    in their original order, followed by unhealthy origins, ordered by their error rate.
+    Origins therefore only get switched when they are faster or when the current origin fails.
+    """
+
+    def __init__(self, smoothing: float = 0.3, max_error_rate: float = 0.5):
+        """
+        :param smoothing: The weight of new samples in the moving averages
+        :param max_error_rate: The error rate at which an origin is considered unhealthy
+        """
+
+        self.smoothing = smoothing
+        self.max_error_rate = max_error_rate
+        self._stats: dict[str, OriginStats] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def origin(url: str) -> str:
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def stats(self, url: str) -> OriginStats | None:
+        with self._lock:
+            return self._stats.get(self.origin(url))
+
+    def order(self, urls: Sequence[str]) -> list[str]:
+        def key(url: str) -> tuple[int, float]:
+            stats = self._stats.get(self.origin(url))
+            if stats is None:
+                return 1, 0.0
+            if stats.error_rate >= self.max_error_rate or stats.latency is None:
+                return 2, stats.error_rate
+            return 0, stats.latency
+
+        with self._lock:
+            return sorted(urls, key=key)
+
+    def record_success(self, url: str, latency: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(self.origin(url), OriginStats())
+            stats.latency = latency if stats.latency is None else self._average(stats.latency, latency)
+            stats.error_rate = self._average(stats.error_rate, 0.0)
+
+    def record_failure(self, url: str) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(self.origin(url), OriginStats())
+            stats.error_rate = self._average(stats.error_rate, 1.0)
+
+    def _average(self, average: float, value: float) -> float:
+        return self.smoothing * value + (1 - self.smoothing) * average
@@ -11,6 +11,7 @@ from streamlink.buffers import RingBuffer
 from streamlink.logger import getLogger
 from streamlink.stream.segmented.segment import Segment
 from streamlink.stream.stream import StreamIO
+from streamlink.utils.ratelimit import TokenBucket
 from streamlink.utils.thread import NamedThread
 from streamlink.utils.times import now
 
@@ -80,6 +81,16 @@ class SegmentedStreamWriter(AwaitableMixin, NamedThread, Generic[TSegment, TResu
         self.executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix=f"{self.name}-executor")
         self._queue: queue.Queue[TQueueItem | None] = queue.Queue(size)
 
+        bandwidth_limit = self.session.options.get("stream-bandwidth-limit-per-stream")
+        self._bandwidth_limiters: list[TokenBucket] = [
+            limiter
+            for limiter in (
+                TokenBucket(bandwidth_limit) if bandwidth_limit else None,
+                self.session.http.bandwidth_limiter,
+            )
+            if limiter is not None
+        ]
+
     def close(self) -> None:
         """
         Shuts down the thread, its executor and closes the reader (worker thread and buffer).
@@ -96,6 +107,26 @@ class SegmentedStreamWriter(AwaitableMixin, NamedThread, Generic[TSegment, TResu
         self.reader.close()
         self.executor.shutdown(wait=True, cancel_futures=True)
 
+    def is_live(self) -> bool:
+        """
+        Whether the stream is a live stream. Live streams get priority over other streams when the bandwidth is limited.
+        """
+
+        return False
+
+    def throttle(self, size: int) -> bool:
+        """
+        Wait until the specified amount of data may be written, according to the per-stream and session-wide bandwidth limits.
+        Return False if interrupted by closing the writer.
+        """
+
+        if not self._bandwidth_limiters:
+            return True
+
+        priority = self.is_live()
+
+        return all(limiter.consume(size, priority=priority, abort=self._wait) for limiter in self._bandwidth_limiters)
+
     def put(self, segment: TSegment | None) -> None:
         """
         Adds a segment to the download pool and write queue.
@@ -245,18 +276,17 @@ class SegmentedStreamWorker(AwaitableMixin, NamedThread, Generic[TSegment, TResu
         if now() <= self._queue_last + timedelta(seconds=deadline):
             return False
 
-        log.warning(f"No new segments for more than {deadline:.2f}s. Stopping...")
+        log.warning("No new segments for more than %.2fs. Stopping...", deadline)
         return True
 
     def check_sequence_gap(self, segment: TSegment) -> None:
         size = segment.num - self.sequence
         if size > 0:
+            warning = "This is unsupported and will result in incoherent output data."
             if size > 1:
-                msg = f"Sequence gap of {size} segments at position {self.sequence}. "
+                log.warning("Sequence gap of %d segments at position %d. %s", size, self.sequence, warning)
             else:
-                msg = f"Sequence gap of 1 segment at position {self.sequence}. "
-            warning = "This is unsupported and will result in incoherent output data."
-            log.warning(f"{msg}{warning}")
+                log.warning("Sequence gap of 1 segment at position %d. %s", self.sequence, warning)
 
     def iter_segments(self) -> Generator[TSegment, bool, None]:
         """
@@ -295,7 +325,7 @@ class SegmentedStreamWorker(AwaitableMixin, NamedThread, Generic[TSegment, TResu
                 queued = True
 
                 if self.duration >= self.duration_limit > 0.0:
-                    log.info(f"Stopping stream early after {self.duration_limit:.2f}s")
+                    log.info("Stopping stream early after %.2fs", self.duration_limit)
                     break
         except StopIteration:
             pass
@@ -8,7 +8,7 @@ import threading
 from contextlib import suppress
 from pathlib import Path
 
-from streamlink.compat import is_win32
+from streamlink.compat import is_darwin, is_linux, is_win32
 from streamlink.logger import getLogger
 
 
@@ -17,6 +17,11 @@ try:
 except ImportError:
     pass
 
+try:
+    import fcntl
+except ImportError:
+    pass
+
 
 log = getLogger(__name__)
 
@@ -79,6 +84,53 @@ class NamedPipePosix(NamedPipeBase):
             self.fifo = None
 
 
+class AnonymousPipePosix(NamedPipeBase):
+    """
+    An anonymous pipe which doesn't require a filesystem entry.
+    Its read end needs to be passed to the child process (see :attr:`fd_read`) and is accessible there via :attr:`path`.
+    """
+
+    # Linux's default max pipe size for unprivileged users (/proc/sys/fs/pipe-max-size)
+    pipe_size = 1024 * 1024
+
+    fd_read: int | None = None
+    fd_write: int | None = None
+
+    def _create(self):
+        self.fd_read, self.fd_write = os.pipe()
+        self.path = Path("/dev/fd", str(self.fd_read))
+        if is_linux:
+            with suppress(OSError, AttributeError):
+                fcntl.fcntl(self.fd_write, fcntl.F_SETPIPE_SZ, self.pipe_size)  # type: ignore[attr-defined]
+
+    def open(self):
+        pass
+
+    def write(self, data):
+        # write all data at once, like the buffered writes of the other pipe implementations
+        view = memoryview(data)
+        while view:
+            written = os.write(self.fd_write, view)  # type: ignore[arg-type]
+            view = view[written:]
+
+        return len(data)
+
+    def close_read(self) -> None:
+        """Close the read end of the pipe after it was passed to the child process"""
+        fd_read, self.fd_read = self.fd_read, None
+        if fd_read is not None:
+            os.close(fd_read)
+
+    def close(self):
+        fd_write, self.fd_write = self.fd_write, None
+        try:
+            if fd_write is not None:
+                os.close(fd_write)
+        finally:
+            with suppress(OSError):
+                self.close_read()
+
+
 class NamedPipeWindows(NamedPipeBase):
     bufsize = 8192
     pipe = None
@@ -140,3 +192,6 @@ if not is_win32:
     NamedPipe = NamedPipePosix
 else:
     NamedPipe = NamedPipeWindows
+
+# anonymous pipes are accessible via the /dev/fd filesystem in the child process on Linux and macOS
+AnonymousPipe: type[AnonymousPipePosix] | None = AnonymousPipePosix if is_linux or is_darwin else None
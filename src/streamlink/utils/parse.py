@@ -3,12 +3,20 @@ import re
 from typing import Any
 from urllib.parse import parse_qsl
 
-from lxml.etree import HTML, XML
-
 from streamlink.compat import detect_encoding
 from streamlink.exceptions import PluginError
 
 
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:  # pragma: no cover
+    _orjson_loads = None  # type: ignore[assignment]
+
+# orjson returns floats instead of ints for integers exceeding 64 bits, so find runs of 19 or more digits first
+_JSON_DIGITS = bytes(0x30 if 0x30 <= char <= 0x39 else 0x20 for char in range(256))
+_JSON_DIGITS_BIGINT = b"0" * 19
+
+
 def _parse(parser, data, name, exception, schema, *args, **kwargs):
     try:
         parsed = parser(data, *args, **kwargs)
@@ -25,6 +33,25 @@ def _parse(parser, data, name, exception, schema, *args, **kwargs):
     return parsed
 
 
+def json_loads(data, *args, **kwargs) -> Any:
+    """
+    Wrapper around :func:`json.loads` which uses the faster orjson library if it is installed.
+
+    orjson is only used without any additional :func:`json.loads` arguments and only if it returns the same result.
+    Otherwise, e.g. on parsing errors, the data gets parsed by :func:`json.loads`.
+    """
+
+    if _orjson_loads is not None and not args and not kwargs and isinstance(data, (str, bytes, bytearray)):
+        digits = (data.encode("utf-8", "surrogatepass") if isinstance(data, str) else data).translate(_JSON_DIGITS)
+        if _JSON_DIGITS_BIGINT not in digits:
+            try:
+                return _orjson_loads(data)
+            except ValueError:
+                pass
+
+    return json.loads(data, *args, **kwargs)
+
+
 def parse_json(
     data,
     name="JSON",
@@ -36,9 +63,10 @@ def parse_json(
     """Wrapper around json.loads.
 
     Provides these extra features:
+     - Uses the orjson library if it is installed (see :func:`json_loads`)
      - Wraps errors in custom exception with a snippet of the data in the message
     """
-    return _parse(json.loads, data, name, exception, schema, *args, **kwargs)
+    return _parse(json_loads, data, name, exception, schema, *args, **kwargs)
 
 
 def parse_html(
@@ -55,6 +83,9 @@ def parse_html(
      - Removes XML declarations of invalid XHTML5 documents
      - Wraps errors in custom exception with a snippet of the data in the message
     """
+    # lxml is imported lazily, as it's not required by every plugin and slows down the startup time
+    from lxml.etree import HTML  # ruff: ignore[import-outside-top-level]
+
     # strip XML text declarations from XHTML5 documents which were incorrectly defined as HTML5
     is_bytes = isinstance(data, bytes)
     if data and data.lstrip()[:5].lower() == (b"<?xml" if is_bytes else "<?xml"):
@@ -94,6 +125,8 @@ def parse_xml(
      - Allows stripping namespace information
      - Wraps errors in custom exception with a snippet of the data in the message
     """
+    from lxml.etree import XML  # ruff: ignore[import-outside-top-level]
+
     if isinstance(data, str):
         data = bytes(data, "utf8")
     if ignore_ns:
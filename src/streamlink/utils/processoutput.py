@@ -7,18 +7,19 @@ from functools import partial
 from subprocess import PIPE
 from typing import TYPE_CHECKING, BinaryIO, TypedDict
 
-import trio
-
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, Callable
 
+    import trio
     from typing_extensions import Unpack
 
     class TRunArgs(TypedDict, total=False):
         stdin: int | bytes | BinaryIO | None
 
 
+# trio is imported lazily in the methods which require it, as it slows down the startup time,
+# and because processes are not spawned by most of the modules importing ProcessOutput subclasses
 class ProcessOutput:
     _send_channel: trio.MemorySendChannel[bool]
     _receive_channel: trio.MemoryReceiveChannel[bool]
@@ -34,13 +35,20 @@ class ProcessOutput:
         self.timeout = timeout
         self.wait_terminate = wait_terminate
         self.stdin = stdin
+
+        import trio  # ruff: ignore[import-outside-top-level]
+
         self._send_channel, self._receive_channel = trio.open_memory_channel(1)
         self._receive_max_bytes: int | None = None
 
     def run(self, **kwargs: Unpack[TRunArgs]) -> bool:  # pragma: no cover
+        import trio  # ruff: ignore[import-outside-top-level]
+
         return trio.run(partial(self.arun, **kwargs))
 
     async def arun(self, **kwargs: Unpack[TRunArgs]) -> bool:
+        import trio  # ruff: ignore[import-outside-top-level]
+
         stdin = kwargs.get("stdin")
         with trio.move_on_after(self.timeout):
             async with trio.open_nursery() as nursery:
@@ -71,6 +79,8 @@ class ProcessOutput:
         return False
 
     async def _deliver_cancel(self, proc: trio.Process):
+        import trio  # ruff: ignore[import-outside-top-level]
+
         with suppress(OSError):
             proc.terminate()
             await trio.sleep(self.wait_terminate)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import time
+from threading import Condition
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from threading import Event
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket for limiting the rate at which data gets consumed.
+
+    Consumers with priority get served first while waiting, which means that consumers without priority
+    are only allowed to consume tokens if no consumer with priority is currently waiting for tokens.
+    """
+
+    # maximum time to wait at once, so that aborted consumers get noticed in time
+    _MAX_WAIT = 0.5
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """
+        :param rate: The number of tokens added per second
+        :param capacity: The maximum number of tokens in the bucket, defaults to the rate (one second of burst)
+        """
+
+        if rate <= 0:
+            raise ValueError("rate must be greater than zero")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity or rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._cond = Condition()
+        self._waiting_priority = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def consume(self, amount: int, priority: bool = False, abort: Event | None = None) -> bool:
+        """
+        Block until the requested amount of tokens can be consumed.
+
+        Amounts larger than the bucket's capacity get consumed as soon as the bucket is full, leaving a debt
+        which subsequent consumers have to wait for.
+
+        :param amount: The number of tokens to consume
+        :param priority: Whether to serve this consumer before consumers without priority
+        :param abort: An optional event which aborts waiting when set
+        :return: ``False`` if waiting was aborted, ``True`` otherwise
+        """
+
+        required = min(float(amount), self.capacity)
+
+        with self._cond:
+            if priority:
+                self._waiting_priority += 1
+            try:
+                while True:
+                    if abort is not None and abort.is_set():
+                        return False
+
+                    self._refill()
+                    if priority or not self._waiting_priority:
+                        if self._tokens >= required:
+                            self._tokens -= amount
+                            return True
+                        timeout = (required - self._tokens) / self.rate
+                    else:
+                        timeout = self._MAX_WAIT
+
+                    self._cond.wait(min(timeout, self._MAX_WAIT))
+            finally:
+                if priority:
+                    self._waiting_priority -= 1
+                    self._cond.notify_all()
+
+
+__all__ = ["TokenBucket"]
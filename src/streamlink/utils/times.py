@@ -2,9 +2,7 @@ from __future__ import annotations
 
 import re
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Generic, TypeVar
-
-from isodate import LOCAL, parse_datetime  # type: ignore[import]
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 
 if TYPE_CHECKING:
@@ -15,12 +13,34 @@ if TYPE_CHECKING:
 UTC = timezone.utc
 
 
+# isodate is imported lazily, as it's not required for most invocations and slows down the startup time
+def __getattr__(name: str) -> Any:
+    if name == "LOCAL":
+        from isodate import LOCAL  # type: ignore[import]  # ruff: ignore[import-outside-top-level]
+
+        globals()["LOCAL"] = LOCAL
+
+        return LOCAL
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _local() -> tzinfo:
+    return globals().get("LOCAL") or __getattr__("LOCAL")
+
+
+def parse_datetime(value: str) -> datetime:
+    from isodate import parse_datetime  # type: ignore[import]  # ruff: ignore[import-outside-top-level]
+
+    return parse_datetime(value)
+
+
 def now(tz: tzinfo = UTC) -> datetime:
     return datetime.now(tz=tz)
 
 
 def localnow() -> datetime:
-    return datetime.now(tz=LOCAL)
+    return datetime.now(tz=_local())
 
 
 def fromtimestamp(timestamp: float, tz: tzinfo = UTC) -> datetime:
@@ -28,7 +48,7 @@ def fromtimestamp(timestamp: float, tz: tzinfo = UTC) -> datetime:
 
 
 def fromlocaltimestamp(timestamp: float) -> datetime:
-    return datetime.fromtimestamp(timestamp, tz=LOCAL)
+    return datetime.fromtimestamp(timestamp, tz=_local())
 
 
 _THMS = TypeVar("_THMS", int, float)
@@ -137,7 +157,7 @@ def seconds_to_hhmmss(seconds):
 
 __all__ = [
     "UTC",
-    "LOCAL",
+    "LOCAL",  # ruff: ignore[undefined-export]  # lazily imported
     "parse_datetime",
     "now",
     "localnow",
@@ -1,6 +1,13 @@
+import re
 from urllib.parse import parse_qsl, quote_plus, urlencode, urljoin, urlparse, urlunparse
 
 
+# query string parameters of signed URLs which contain the URL's expiration time as a POSIX timestamp
+_URL_EXPIRES_PARAMS = frozenset(("expires", "expire", "expiry", "expiration", "exp"))
+# token query string parameters with expiration times, e.g. Akamai's `hdnts=st=...~exp=...~acl=...~hmac=...`
+_re_url_expires_token = re.compile(r"(?:^|[~&:,;])exp(?:ires)?=(\d+)")
+
+
 def absolute_url(baseurl, url):
     parsed = urlparse(url)
     if not parsed.scheme:
@@ -156,3 +163,24 @@ def update_qsd(url, qsd=None, remove=None, keep_blank_values=True, safe="", quot
     query = urlencode(query=current_qsd, safe=safe, quote_via=quote_via)
 
     return parsed._replace(query=query).geturl()
+
+
+def url_expires(url: str) -> float | None:
+    """
+    Find the expiration time of a signed URL in its query string parameters
+
+    :param url: the URL
+    :return: the earliest expiration time as a POSIX timestamp, or None if no expiration time could be found
+    """
+
+    expires = []
+    for key, value in parse_qsl(urlparse(url).query):
+        if key.lower() in _URL_EXPIRES_PARAMS and value.isdecimal():
+            expires.append(int(value))
+        else:
+            expires.extend(int(match[1]) for match in _re_url_expires_token.finditer(value))
+
+    # ignore relative durations and convert millisecond timestamps
+    timestamps = [timestamp / 1000 if timestamp >= 10**11 else timestamp for timestamp in expires if timestamp >= 10**9]
+
+    return min(timestamps, default=None)
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
+import sys
 from collections import abc
 from copy import copy, deepcopy
 from functools import singledispatch
 from re import Pattern
-from typing import Any
-
-from lxml.etree import Element, iselement
+from typing import TYPE_CHECKING, Any
 
 from streamlink.exceptions import PluginError
 from streamlink.validate._exception import ValidationError
@@ -26,6 +25,25 @@ from streamlink.validate._schemas import (
 )
 
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def iselement(value: Any) -> bool:
+    """
+    Check whether the value is an :class:`lxml.etree.Element`.
+
+    lxml is imported lazily, as it slows down the startup time. Elements can't exist before lxml has been imported.
+    """
+
+    if "lxml.etree" not in sys.modules:
+        return False
+
+    from lxml.etree import iselement  # ruff: ignore[import-outside-top-level]
+
+    return iselement(value)
+
+
 class Schema(AllSchema):
     """
     The base class for creating validation schemas.
@@ -34,9 +52,28 @@ class Schema(AllSchema):
     which by default raises :class:`PluginError <streamlink.exceptions.PluginError>` on error.
     """
 
+    _compiled: Callable[[Any], Any] | None = None
+
+    def compile(self) -> Schema:
+        """
+        Compile the schema, so that the schema tree doesn't have to be traversed on each :meth:`validate` call.
+
+        Useful for schemas which get validated repeatedly, e.g. class attributes. Validation results and errors
+        are the same. The schema gets compiled only once, and it must not be modified afterwards.
+
+        :return: The schema itself
+        """
+
+        if self._compiled is None:
+            self._compiled = compile_schema(self)
+
+        return self
+
     # TODO: replace default PluginError exception
     def validate(self, value: Any, name: str = "result", exception: type[Exception] = PluginError) -> Any:
         try:
+            if self._compiled is not None:
+                return self._compiled(value)
             return validate(self, value)
         except ValidationError as err:
             raise exception(f"Unable to validate {name}: {err}") from None
@@ -342,6 +379,8 @@ def _validate_xmlelementschema(schema: XmlElementSchema, value):
         except ValidationError as err:
             raise ValidationError("Unable to validate XML tail", schema=XmlElementSchema) from err
 
+    from lxml.etree import Element  # ruff: ignore[import-outside-top-level]
+
     new = Element(tag, attrib)
     new.text = text
     new.tail = tail
@@ -406,3 +445,498 @@ def _validate_union_dict(schema: dict, value):
 @validate_union.register(frozenset)
 def _validate_union_sequence(schemas: list | tuple | set | frozenset, value):
     return type(schemas)(validate(schema, value) for schema in schemas)
+
+
+# ----
+
+
+def compile_schema(schema) -> Callable[[Any], Any]:
+    """
+    Compile a schema into a validation function.
+
+    The returned function is equivalent to ``functools.partial(validate, schema)``, including its return values and
+    :class:`ValidationError` messages, but the schema tree gets traversed and dispatched only once, when compiling.
+    Schemas without a specialized compiler, e.g. schemas of custom :func:`validate` registrations, get validated by
+    :func:`validate` as usual.
+
+    Schemas must not be modified after they have been compiled.
+    """
+
+    return _compile(schema)
+
+
+def _compile(schema) -> Callable[[Any], Any]:
+    # look up the implementation of validate(), so that custom registrations of schema types take precedence
+    impl = validate.dispatch(type(schema))
+    compiler = _COMPILERS.get(impl)
+    if compiler is None:
+        return lambda value: impl(schema, value)
+
+    return compiler(schema)
+
+
+def _compile_union(schema) -> Callable[[Any], Any]:
+    impl = validate_union.dispatch(type(schema))
+    compiler = _COMPILERS_UNION.get(impl)
+    if compiler is None:
+        return lambda value: impl(schema, value)
+
+    return compiler(schema)
+
+
+def _compile_equality(schema) -> Callable[[Any], Any]:
+    def validate_equality(value):
+        if schema != value:
+            raise ValidationError(
+                "{value} does not equal {expected}",
+                value=repr(value),
+                expected=repr(schema),
+                schema="equality",
+            )
+
+        return value
+
+    return validate_equality
+
+
+def _compile_type(schema: type) -> Callable[[Any], Any]:
+    def validate_type(value):
+        if not isinstance(value, schema):
+            raise ValidationError(
+                "Type of {value} should be {expected}, but is {actual}",
+                value=repr(value),
+                expected=schema.__name__,
+                actual=type(value).__name__,
+                schema=type,
+            )
+
+        return value
+
+    return validate_type
+
+
+def _compile_sequence(schema: list | tuple | set | frozenset) -> Callable[[Any], Any]:
+    cls = type(schema)
+    validate_cls = _compile(cls)
+    validate_item = _compile(AnySchema(*schema))
+
+    def validate_sequence(value):
+        validate_cls(value)
+
+        return cls(validate_item(v) for v in value)
+
+    return validate_sequence
+
+
+def _compile_dict(schema: dict) -> Callable[[Any], Any]:
+    cls = type(schema)
+    validate_cls = _compile(cls)
+    items = []
+    for key, subschema in schema.items():
+        optional = isinstance(key, OptionalSchema)
+        if optional:
+            key = key.key
+        if type(key) in (type, AllSchema, AnySchema, TransformSchema, UnionSchema):
+            items.append((key, optional, _compile(key), _compile(subschema)))
+        else:
+            items.append((key, optional, None, _compile(subschema)))
+
+    def validate_dict(value):
+        validate_cls(value)
+        new = cls()
+
+        for key, optional, validate_key, validate_value in items:
+            if optional and key not in value:
+                continue
+
+            if validate_key is not None:
+                for subkey, subvalue in value.items():
+                    try:
+                        newkey = validate_key(subkey)
+                    except ValidationError as err:
+                        raise ValidationError("Unable to validate key", schema=dict) from err
+                    try:
+                        newvalue = validate_value(subvalue)
+                    except ValidationError as err:
+                        raise ValidationError("Unable to validate value", schema=dict) from err
+                    new[newkey] = newvalue
+                break
+
+            if key not in value:
+                raise ValidationError(
+                    "Key {key} not found in {value}",
+                    key=repr(key),
+                    value=repr(value),
+                    schema=dict,
+                )
+
+            try:
+                new[key] = validate_value(value[key])
+            except ValidationError as err:
+                raise ValidationError("Unable to validate value of key {key}", key=repr(key), schema=dict) from err
+
+        return new
+
+    return validate_dict
+
+
+def _compile_callable(schema: abc.Callable) -> Callable[[Any], Any]:
+    def validate_callable(value):
+        if not schema(value):
+            raise ValidationError(
+                "{callable} is not true",
+                callable=f"{getattr(schema, '__name__', schema.__class__.__name__)}({value!r})",
+                schema=abc.Callable,
+            )
+
+        return value
+
+    return validate_callable
+
+
+def _compile_pattern(schema: Pattern) -> Callable[[Any], Any]:
+    search = schema.search
+
+    def validate_pattern(value):
+        if not isinstance(value, (str, bytes)):
+            raise ValidationError(
+                "Type of {value} should be str or bytes, but is {actual}",
+                value=repr(value),
+                actual=type(value).__name__,
+                schema=Pattern,
+            )
+
+        try:
+            result = search(value)
+        except TypeError as err:
+            raise ValidationError(err, schema=Pattern) from None
+
+        return result
+
+    return validate_pattern
+
+
+def _compile_allschema(schema: AllSchema) -> Callable[[Any], Any]:
+    # re-use already compiled schemas
+    if isinstance(schema, Schema) and schema._compiled is not None:
+        return schema._compiled
+
+    subschemas = tuple(_compile(subschema) for subschema in schema.schema)
+    if len(subschemas) == 1:
+        return subschemas[0]
+
+    def validate_allschema(value):
+        for subschema in subschemas:
+            value = subschema(value)
+
+        return value
+
+    return validate_allschema
+
+
+def _compile_anyschema(schema: AnySchema) -> Callable[[Any], Any]:
+    subschemas = tuple(_compile(subschema) for subschema in schema.schema)
+
+    def validate_anyschema(value):
+        errors = []
+        for subschema in subschemas:
+            try:
+                return subschema(value)
+            except ValidationError as err:
+                errors.append(err)
+
+        raise ValidationError(*errors, schema=AnySchema)
+
+    return validate_anyschema
+
+
+def _compile_noneorallschema(schema: NoneOrAllSchema) -> Callable[[Any], Any]:
+    subschemas = tuple(_compile(subschema) for subschema in schema.schema)
+
+    def validate_noneorallschema(value):
+        if value is not None:
+            try:
+                for subschema in subschemas:
+                    value = subschema(value)
+            except ValidationError as err:
+                raise ValidationError(err, schema=NoneOrAllSchema) from None
+
+        return value
+
+    return validate_noneorallschema
+
+
+def _compile_listschema(schema: ListSchema) -> Callable[[Any], Any]:
+    subschemas = tuple(_compile(subschema) for subschema in schema.schema)
+    length = len(subschemas)
+
+    def validate_listschema(value):
+        if not isinstance(value, list):
+            raise ValidationError(
+                "Type of {value} should be list, but is {actual}",
+                value=repr(value),
+                actual=type(value).__name__,
+                schema=ListSchema,
+            )
+        if len(value) != length:
+            raise ValidationError(
+                "Length of list ({length}) does not match expectation ({expected})",
+                length=len(value),
+                expected=length,
+                schema=ListSchema,
+            )
+
+        new = []
+        errors = []
+        for subschema, v in zip(subschemas, value, strict=True):
+            try:
+                new.append(subschema(v))
+            except ValidationError as err:
+                errors.append(err)
+
+        if errors:
+            raise ValidationError(*errors, schema=ListSchema)
+
+        return new
+
+    return validate_listschema
+
+
+def _compile_regexschema(schema: RegexSchema) -> Callable[[Any], Any]:
+    pattern = schema.pattern
+    method = getattr(pattern, schema.method)
+
+    def validate_regexschema(value):
+        if not isinstance(value, (str, bytes)):
+            raise ValidationError(
+                "Type of {value} should be str or bytes, but is {actual}",
+                value=repr(value),
+                actual=type(value).__name__,
+                schema=RegexSchema,
+            )
+
+        try:
+            result = method(value)
+        except TypeError as err:
+            raise ValidationError(err, schema=RegexSchema) from None
+
+        if result is None:
+            raise ValidationError(
+                "Pattern {pattern} did not match {value}",
+                pattern=repr(pattern.pattern),
+                value=repr(value),
+                schema=RegexSchema,
+            )
+
+        return result
+
+    return validate_regexschema
+
+
+def _compile_transformschema(schema: TransformSchema) -> Callable[[Any], Any]:
+    func, args, kwargs = schema.func, schema.args, schema.kwargs
+    if not isinstance(func, abc.Callable):
+        # raise the validation error when validating
+        return lambda value: _validate_transformschema(schema, value)
+    if not args and not kwargs:
+        return func
+
+    return lambda value: func(value, *args, **kwargs)
+
+
+def _compile_getitemschema(schema: GetItemSchema) -> Callable[[Any], Any]:
+    item = schema.item if type(schema.item) is tuple and not schema.strict else (schema.item,)
+    default = schema.default
+    last = len(item) - 1
+
+    def validate_getitemschema(value):
+        idx = 0
+        key = None
+        try:
+            for key in item:
+                if iselement(value):
+                    value = value.attrib[key]
+                else:
+                    value = value[key]
+                idx += 1
+            return value
+        except (KeyError, IndexError):
+            # only return default value on last item in nested lookup
+            if idx < last:
+                raise ValidationError(
+                    "Item {key} was not found in object {value}",
+                    key=repr(key),
+                    value=repr(value),
+                    schema=GetItemSchema,
+                ) from None
+            return default
+        except (TypeError, AttributeError) as err:
+            raise ValidationError(
+                "Could not get key {key} from object {value}",
+                key=repr(key),
+                value=repr(value),
+                schema=GetItemSchema,
+            ) from err
+
+    return validate_getitemschema
+
+
+def _compile_attrschema(schema: AttrSchema) -> Callable[[Any], Any]:
+    items = tuple((key, _compile(subschema)) for key, subschema in schema.schema.items())
+
+    def validate_attrschema(value):
+        new = copy(value)
+
+        for key, subschema in items:
+            if not hasattr(value, key):
+                raise ValidationError(
+                    "Attribute {key} not found on object {value}",
+                    key=repr(key),
+                    value=repr(value),
+                    schema=AttrSchema,
+                )
+
+            try:
+                value = subschema(getattr(value, key))
+            except ValidationError as err:
+                raise ValidationError(
+                    "Could not validate attribute {key}",
+                    key=repr(key),
+                    schema=AttrSchema,
+                ) from err
+
+            setattr(new, key, value)
+
+        return new
+
+    return validate_attrschema
+
+
+def _compile_xmlelementschema(schema: XmlElementSchema) -> Callable[[Any], Any]:
+    validate_element = _compile(iselement)
+    validate_tag = None if schema.tag is None else _compile(schema.tag)
+    validate_attrib = None if schema.attrib is None else _compile(schema.attrib)
+    validate_text = None if schema.text is None else _compile(schema.text)
+    validate_tail = None if schema.tail is None else _compile(schema.tail)
+
+    def validate_xmlelementschema(value):
+        validate_element(value)
+        tag = value.tag
+        attrib = value.attrib
+        text = value.text
+        tail = value.tail
+
+        if validate_tag is not None:
+            try:
+                tag = validate_tag(value.tag)
+            except ValidationError as err:
+                raise ValidationError("Unable to validate XML tag", schema=XmlElementSchema) from err
+
+        if validate_attrib is not None:
+            try:
+                attrib = validate_attrib(dict(value.attrib))
+            except ValidationError as err:
+                raise ValidationError("Unable to validate XML attributes", schema=XmlElementSchema) from err
+
+        if validate_text is not None:
+            try:
+                text = validate_text(value.text)
+            except ValidationError as err:
+                raise ValidationError("Unable to validate XML text", schema=XmlElementSchema) from err
+
+        if validate_tail is not None:
+            try:
+                tail = validate_tail(value.tail)
+            except ValidationError as err:
+                raise ValidationError("Unable to validate XML tail", schema=XmlElementSchema) from err
+
+        from lxml.etree import Element  # ruff: ignore[import-outside-top-level]
+
+        new = Element(tag, attrib)
+        new.text = text
+        new.tail = tail
+        for child in value:
+            new.append(deepcopy(child))
+
+        return new
+
+    return validate_xmlelementschema
+
+
+def _compile_uniongetschema(schema: UnionGetSchema) -> Callable[[Any], Any]:
+    getters = tuple(_compile(getter) for getter in schema.getters)
+    seq = schema.seq
+
+    return lambda value: seq(getter(value) for getter in getters)
+
+
+def _compile_unionschema(schema: UnionSchema) -> Callable[[Any], Any]:
+    validate_schema = _compile_union(schema.schema)
+
+    def validate_unionschema(value):
+        try:
+            return validate_schema(value)
+        except ValidationError as err:
+            raise ValidationError("Could not validate union", schema=UnionSchema) from err
+
+    return validate_unionschema
+
+
+def _compile_union_dict(schema: dict) -> Callable[[Any], Any]:
+    cls = type(schema)
+    items = []
+    for key, subschema in schema.items():
+        is_optional = isinstance(key, OptionalSchema)
+        items.append((key.key if is_optional else key, is_optional, _compile(subschema)))
+
+    def validate_union_dict(value):
+        new = cls()
+        for key, is_optional, subschema in items:
+            try:
+                new[key] = subschema(value)
+            except ValidationError as err:
+                if is_optional:
+                    continue
+
+                raise ValidationError(
+                    "Unable to validate union {key}",
+                    key=repr(key),
+                    schema=dict,
+                ) from err
+
+        return new
+
+    return validate_union_dict
+
+
+def _compile_union_sequence(schemas: list | tuple | set | frozenset) -> Callable[[Any], Any]:
+    cls = type(schemas)
+    subschemas = tuple(_compile(schema) for schema in schemas)
+
+    return lambda value: cls(subschema(value) for subschema in subschemas)
+
+
+_COMPILERS: dict[Callable, Callable[[Any], Callable[[Any], Any]]] = {
+    validate.dispatch(object): _compile_equality,
+    _validate_type: _compile_type,
+    _validate_sequence: _compile_sequence,
+    _validate_dict: _compile_dict,
+    _validate_callable: _compile_callable,
+    _validate_pattern: _compile_pattern,
+    _validate_allschema: _compile_allschema,
+    _validate_anyschema: _compile_anyschema,
+    _validate_noneorallschema: _compile_noneorallschema,
+    _validate_listschema: _compile_listschema,
+    _validate_regexschema: _compile_regexschema,
+    _validate_transformschema: _compile_transformschema,
+    _validate_getitemschema: _compile_getitemschema,
+    _validate_attrschema: _compile_attrschema,
+    _validate_xmlelementschema: _compile_xmlelementschema,
+    _validate_uniongetschema: _compile_uniongetschema,
+    _validate_unionschema: _compile_unionschema,
+}
+
+_COMPILERS_UNION: dict[Callable, Callable[[Any], Callable[[Any], Any]]] = {
+    _validate_union_dict: _compile_union_dict,
+    _validate_union_sequence: _compile_union_sequence,
+}
@@ -5,8 +5,6 @@ from collections.abc import Container
 from typing import TYPE_CHECKING, Any, Literal
 from urllib.parse import urlparse
 
-from lxml.etree import XPathError, iselement
-
 from streamlink.utils.parse import (
     parse_html as _parse_html,
     parse_json as _parse_json,
@@ -15,7 +13,7 @@ from streamlink.utils.parse import (
 )
 from streamlink.validate._exception import ValidationError
 from streamlink.validate._schemas import AllSchema, AnySchema, TransformSchema
-from streamlink.validate._validate import validate
+from streamlink.validate._validate import iselement, validate
 
 
 if TYPE_CHECKING:
@@ -532,6 +530,9 @@ def validator_xml_xpath(
 
     def transform_xpath(value):
         validate(iselement, value)
+
+        from lxml.etree import XPathError  # ruff: ignore[import-outside-top-level]
+
         try:
             result = value.xpath(
                 xpath,
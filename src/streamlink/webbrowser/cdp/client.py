@@ -2,20 +2,24 @@ from __future__ import annotations
 
 import base64
 import re
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Any, TypeAlias
+from urllib.parse import urlparse
 
 import trio
 
+from streamlink.logger import getLogger
 from streamlink.webbrowser.cdp.connection import CDPConnection
 from streamlink.webbrowser.cdp.devtools import fetch, network, page, runtime, target
 from streamlink.webbrowser.cdp.exceptions import CDPError
 from streamlink.webbrowser.chromium import ChromiumWebbrowser
+from streamlink.webbrowser.persistent import PersistentChromiumWebbrowser
 
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Mapping, MutableMapping
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Collection, Coroutine, Mapping, MutableMapping
 
     from streamlink.session import Streamlink
     from streamlink.webbrowser.cdp.connection import CDPSession
@@ -23,6 +27,8 @@ if TYPE_CHECKING:
     TRequestHandlerCallable: TypeAlias = "Callable[[CDPClientSession, fetch.RequestPaused], Awaitable]"
 
 
+log = getLogger(__name__)
+
 _re_url_pattern_wildcard = re.compile(r"(.+?)?(\\+)?([*?])")
 
 
@@ -62,6 +68,39 @@ class RequestPausedHandler:
         return re.compile(f"^{regex}$")
 
 
+@dataclass
+class ResourceFilter:
+    """
+    Declarative filter for blocking network requests which are not needed when navigating a website,
+    e.g. images, fonts, stylesheets, media or requests to third-party hosts.
+
+    Blocked requests get failed before any request handlers get called. See :meth:`CDPClient.session()`.
+    """
+
+    resource_types: Collection[network.ResourceType] = (
+        network.ResourceType.IMAGE,
+        network.ResourceType.MEDIA,
+        network.ResourceType.FONT,
+        network.ResourceType.STYLESHEET,
+    )
+    """Resource types of requests which get blocked"""
+
+    hosts: Collection[str] | None = None
+    """Optional host names which requests are allowed to be made to, including their subdomains"""
+
+    def blocks(self, request: fetch.RequestPaused) -> bool:
+        if request.response_status_code is not None or request.response_error_reason is not None:
+            return False
+        if request.resource_type in self.resource_types:
+            return True
+        if self.hosts is None:
+            return False
+
+        host = urlparse(request.request.url).hostname or ""
+
+        return not any(host == allowed or host.endswith(f".{allowed}") for allowed in self.hosts)
+
+
 @dataclass
 class CMRequestProxy:
     body: str
@@ -87,11 +126,19 @@ class CDPClient:
     ``streamlink.webbrowser.cdp.devtools`` package, but be aware that only a subset of the available domains is supported.
     """
 
-    def __init__(self, session: Streamlink, cdp_connection: CDPConnection, nursery: trio.Nursery, headless: bool):
+    def __init__(
+        self,
+        session: Streamlink,
+        cdp_connection: CDPConnection,
+        nursery: trio.Nursery,
+        headless: bool,
+        persistent: bool = False,
+    ):
         self.streamlink = session
         self.cdp_connection = cdp_connection
         self.nursery = nursery
         self.headless = headless
+        self.persistent = persistent
 
     @classmethod
     def launch(
@@ -104,11 +151,14 @@ class CDPClient:
         cdp_port: int | None = None,
         cdp_timeout: float | None = None,
         headless: bool | None = None,
+        persistent: bool | None = None,
     ) -> Any:
         """
         Start a new :mod:`trio` runloop and do the following things:
 
-        1. Launch the Chromium-based web browser using the provided parameters or respective session options
+        1. Launch the Chromium-based web browser using the provided parameters or respective session options,
+           or reuse the already running persistent web browser (see :class:`PersistentChromiumWebbrowser
+           <streamlink.webbrowser.persistent.PersistentChromiumWebbrowser>`)
         2. Initialize a new :class:`CDPConnection <streamlink.webbrowser.cdp.connection.CDPConnection>`
            and connect to the browser's remote debugging interface
         3. Create a new :class:`CDPClient` instance
@@ -153,6 +203,9 @@ class CDPClient:
                             If unset, falls back to the ``webbrowser-cdp-timeout`` session option.
         :param headless:    Optional boolean flag whether to launch the web browser in headless mode or not.
                             If unset, falls back to the ``webbrowser-headless`` session option.
+        :param persistent:  Optional boolean flag whether to keep the web browser running for subsequent calls or not.
+                            Each :class:`CDPClientSession` of a persistent web browser gets its own isolated browser context.
+                            If unset, falls back to the ``webbrowser-persistent`` session option.
         """
         if not session.get_option("webbrowser"):
             raise CDPError("The webbrowser API has been disabled by the user")
@@ -166,6 +219,7 @@ class CDPClient:
                 cdp_port=session.get_option("webbrowser-cdp-port") if cdp_port is None else cdp_port,
                 cdp_timeout=session.get_option("webbrowser-cdp-timeout") if cdp_timeout is None else cdp_timeout,
                 headless=session.get_option("webbrowser-headless") if headless is None else headless,
+                persistent=session.get_option("webbrowser-persistent") if persistent is None else persistent,
             ) as cdp_client:
                 return await runner(cdp_client)
 
@@ -182,27 +236,76 @@ class CDPClient:
         cdp_port: int | None = None,
         cdp_timeout: float | None = None,
         headless: bool = False,
+        persistent: bool = False,
     ) -> AsyncGenerator[CDPClient, None]:
+        if persistent:
+            run_persistent = cls._run_persistent(session, executable, timeout, cdp_host, cdp_port, cdp_timeout, headless)
+            async with run_persistent as cdp_client:
+                yield cdp_client
+            return
+
         webbrowser = ChromiumWebbrowser(executable=executable, host=cdp_host, port=cdp_port)
         async with webbrowser.launch(headless=headless, timeout=timeout) as nursery:
             websocket_url = webbrowser.get_websocket_url(session)
             async with CDPConnection.create(websocket_url, timeout=cdp_timeout) as cdp_connection:
                 yield cls(session, cdp_connection, nursery, headless)
 
+    @classmethod
+    @asynccontextmanager
+    async def _run_persistent(
+        cls,
+        session: Streamlink,
+        executable: str | None,
+        timeout: float | None,
+        cdp_host: str | None,
+        cdp_port: int | None,
+        cdp_timeout: float | None,
+        headless: bool,
+    ) -> AsyncGenerator[CDPClient, None]:
+        webbrowser = PersistentChromiumWebbrowser.get(executable=executable, host=cdp_host, port=cdp_port, headless=headless)
+        if timeout is None:
+            timeout = webbrowser.webbrowser.TIMEOUT
+        # launching the web browser and waiting for its remote debugging interface blocks, so don't block the event loop
+        websocket_url = await trio.to_thread.run_sync(partial(webbrowser.start, timeout=timeout))
+        async with trio.open_nursery() as nursery:
+            with trio.move_on_after(timeout) as cancel_scope:
+                async with CDPConnection.create(websocket_url, timeout=cdp_timeout) as cdp_connection:
+                    yield cls(session, cdp_connection, nursery, headless, persistent=True)
+            if cancel_scope.cancelled_caught:
+                log.warning("Web browser task group has timed out")
+            nursery.cancel_scope.cancel()
+
     @asynccontextmanager
     async def session(
         self,
         fail_unhandled_requests: bool = False,
         max_buffer_size: int | None = None,
+        resource_filter: ResourceFilter | None = None,
     ) -> AsyncGenerator[CDPClientSession, None]:
         """
         Create a new CDP session on an empty target (browser tab).
 
+        Targets of a persistent web browser get created in a new browser context, which is similar to an incognito profile
+        and which isolates cookies and other site data from concurrent and previous sessions.
+        The browser context and its targets get closed when leaving the context manager.
+
         :param fail_unhandled_requests: Whether network requests which are not matched by any request handlers should fail.
         :param max_buffer_size: Optional size of the send/receive memory channel for paused HTTP requests/responses.
+        :param resource_filter: Optional :class:`ResourceFilter` for blocking unneeded network requests.
         """
-        cdp_session = await self.cdp_connection.new_target()
-        yield CDPClientSession(self, cdp_session, fail_unhandled_requests, max_buffer_size)
+        if not self.persistent:
+            cdp_session = await self.cdp_connection.new_target()
+            yield CDPClientSession(self, cdp_session, fail_unhandled_requests, max_buffer_size, resource_filter)
+            return
+
+        browser_context_id = await self.cdp_connection.send(target.create_browser_context(dispose_on_detach=True))
+        try:
+            cdp_session = await self.cdp_connection.new_target(browser_context_id=browser_context_id)
+            yield CDPClientSession(self, cdp_session, fail_unhandled_requests, max_buffer_size, resource_filter)
+        finally:
+            # the browser context also gets disposed by the web browser itself if the CDP connection has already been closed
+            with trio.CancelScope(shield=True), suppress(CDPError):
+                await self.cdp_connection.send(target.dispose_browser_context(browser_context_id))
 
 
 class CDPClientSession:
@@ -219,6 +322,7 @@ class CDPClientSession:
         cdp_session: CDPSession,
         fail_unhandled_requests: bool = False,
         max_buffer_size: int | None = None,
+        resource_filter: ResourceFilter | None = None,
     ):
         self.cdp_client = cdp_client
         self.cdp_session = cdp_session
@@ -226,6 +330,7 @@ class CDPClientSession:
         self._request_handlers: list[RequestPausedHandler] = []
         self._requests_handled: set[str] = set()
         self._max_buffer_size = max_buffer_size
+        self._resource_filter = resource_filter
 
     def add_request_handler(
         self,
@@ -263,14 +368,15 @@ class CDPClientSession:
         :return: Yields the ``FrameID`` that can be passed to the :meth:`loaded()` call.
         """
 
+        patterns = {(request_handler.url_pattern, request_handler.on_request) for request_handler in self._request_handlers}
+        if self._resource_filter is not None:
+            patterns.add(("*", True))
         request_patterns = [
             fetch.RequestPattern(
                 url_pattern=url_pattern,
                 request_stage=fetch.RequestStage.REQUEST if on_request else fetch.RequestStage.RESPONSE,
             )
-            for url_pattern, on_request in sorted(
-                {(request_handler.url_pattern, request_handler.on_request) for request_handler in self._request_handlers},
-            )
+            for url_pattern, on_request in sorted(patterns)
         ]
 
         async with trio.open_nursery() as nursery:
@@ -429,14 +535,20 @@ class CDPClientSession:
     async def _on_fetch_request_paused(self) -> None:
         request: fetch.RequestPaused
         async for request in self.cdp_session.listen(fetch.RequestPaused, max_buffer_size=self._max_buffer_size):
+            if self._resource_filter is not None and self._resource_filter.blocks(request):
+                await self.fail_request(request)
+                continue
+            matched = False
             for handler in self._request_handlers:
                 if not handler.matches(request):
                     continue
+                matched = True
                 await handler.async_handler(self, request)
                 if request.request_id in self._requests_handled:
                     break
             else:
-                if self._fail_unhandled:
+                # requests which were only paused by the resource filter's request pattern must not be failed
+                if self._fail_unhandled and (matched or self._resource_filter is None):
                     await self.fail_request(request)
                 else:
                     await self.continue_request(request)
@@ -22,6 +22,7 @@ if TYPE_CHECKING:
     from trio_websocket import WebSocketConnection
     from typing_extensions import Self
 
+    from streamlink.webbrowser.cdp.devtools.browser import BrowserContextID
     from streamlink.webbrowser.cdp.devtools.target import TargetID
     from streamlink.webbrowser.cdp.devtools.util import T_JSON_DICT
 
@@ -324,15 +325,16 @@ class CDPConnection(CDPBase, trio.abc.AsyncResource):
             inst.event_channels.clear()
         self.sessions.clear()
 
-    async def new_target(self, url: str = "") -> CDPSession:
+    async def new_target(self, url: str = "", browser_context_id: BrowserContextID | None = None) -> CDPSession:
         """
         Create a new target (browser tab) and return a new :class:`CDPSession` instance.
 
         :param url: Optional URL. Leave empty for a blank target (preferred for proper navigation handling).
+        :param browser_context_id: Optional browser context in which the target gets created.
         :return:
         """
 
-        target_id = await self.send(create_target(url))
+        target_id = await self.send(create_target(url, browser_context_id=browser_context_id))
 
         return await self.get_session(target_id)
 
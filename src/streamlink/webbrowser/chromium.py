@@ -162,6 +162,18 @@ class ChromiumWebbrowser(Webbrowser):
         self.host = host or "127.0.0.1"
         self.port = port
 
+    def get_arguments(self, headless: bool, port: int, user_data_dir: str) -> list[str]:
+        arguments = self.arguments.copy()
+        if headless:
+            arguments.append("--headless=new")
+        arguments.extend([
+            f"--remote-debugging-host={self.host}",
+            f"--remote-debugging-port={port}",
+            f"--user-data-dir={user_data_dir}",
+        ])
+
+        return arguments
+
     @asynccontextmanager
     async def launch(self, headless: bool = False, timeout: float | None = None) -> AsyncGenerator[trio.Nursery, None]:
         if self.port is None:
@@ -172,14 +184,7 @@ class ChromiumWebbrowser(Webbrowser):
 
         # no async rmtree
         with self._create_temp_dir() as user_data_dir:
-            arguments = self.arguments.copy()
-            if headless:
-                arguments.append("--headless=new")
-            arguments.extend([
-                f"--remote-debugging-host={self.host}",
-                f"--remote-debugging-port={self.port}",
-                f"--user-data-dir={user_data_dir}",
-            ])
+            arguments = self.get_arguments(headless, self.port, user_data_dir)
 
             async with super()._launch(self.executable, arguments, headless=headless, timeout=timeout) as nursery:
                 yield nursery
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import atexit
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from subprocess import DEVNULL
+from threading import Lock
+from typing import TYPE_CHECKING, ClassVar
+
+from streamlink.logger import getLogger
+from streamlink.webbrowser.chromium import ChromiumWebbrowser
+from streamlink.webbrowser.exceptions import WebbrowserError
+
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+log = getLogger(__name__)
+
+
+class PersistentChromiumWebbrowser:
+    """
+    A long-lived Chromium-based web browser process which gets shared by subsequent webbrowser API calls.
+
+    Unlike :meth:`ChromiumWebbrowser.launch() <streamlink.webbrowser.chromium.ChromiumWebbrowser.launch>`,
+    the process isn't tied to a :mod:`trio` runloop. It gets launched on the first :meth:`start()` call,
+    it gets restarted by subsequent calls if it has ended in the meantime, and it gets terminated on interpreter exit.
+
+    Don't instantiate this class yourself, use the :meth:`get()` classmethod.
+    """
+
+    #: Name of the file in the user data directory where Chromium writes the remote debugging port and websocket path to
+    DEVTOOLS_ACTIVE_PORT = "DevToolsActivePort"
+
+    TERMINATE_TIMEOUT = 5.0
+
+    _instances: ClassVar[dict[tuple[str | None, str | None, int | None, bool], PersistentChromiumWebbrowser]] = {}
+    _instances_lock: ClassVar[Lock] = Lock()
+
+    @classmethod
+    def get(
+        cls,
+        executable: str | None = None,
+        host: str | None = None,
+        port: int | None = None,
+        headless: bool = False,
+    ) -> Self:
+        """
+        Get the shared web browser instance of the given launch parameters, or create a new one.
+        """
+
+        key = executable, host, port, headless
+        with cls._instances_lock:
+            if not cls._instances:
+                atexit.register(cls.stop_all)
+            if key not in cls._instances:
+                webbrowser = ChromiumWebbrowser(executable=executable, host=host, port=port)
+                cls._instances[key] = cls(webbrowser, headless)
+
+            return cls._instances[key]  # type: ignore[return-value]
+
+    @classmethod
+    def stop_all(cls) -> None:
+        with cls._instances_lock:
+            instances = list(cls._instances.values())
+            cls._instances.clear()
+        for instance in instances:
+            instance.stop()
+
+    def __init__(self, webbrowser: ChromiumWebbrowser, headless: bool = False):
+        self.webbrowser = webbrowser
+        self.headless = headless
+        self.process: subprocess.Popen | None = None
+        self.websocket_url: str | None = None
+        self._user_data_dir: tempfile.TemporaryDirectory | None = None
+        self._lock = Lock()
+
+    def start(self, timeout: float | None = None) -> str:
+        """
+        Launch the web browser if it's not running yet and return the websocket URL of its remote debugging interface.
+
+        :param timeout: The max amount of time the web browser can take to launch
+        :raise WebbrowserError: If the web browser has ended early or if launching it has timed out
+        """
+
+        with self._lock:
+            if self.process is not None and self.websocket_url is not None:
+                if self.process.poll() is None:
+                    return self.websocket_url
+                log.warning(f"Persistent web browser process has ended (exit code {self.process.returncode}), restarting")
+                self._stop()
+
+            return self._start(self.webbrowser.TIMEOUT if timeout is None else timeout)
+
+    def stop(self) -> None:
+        """
+        Terminate the web browser process and remove its temporary user data directory.
+        """
+
+        with self._lock:
+            self._stop()
+
+    def _start(self, timeout: float) -> str:
+        self._user_data_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        # let Chromium choose a free port if none was set and read it from the DevToolsActivePort file afterwards
+        port = self.webbrowser.port or 0
+        arguments = self.webbrowser.get_arguments(self.headless, port, self._user_data_dir.name)
+
+        log.info(f"Launching persistent web browser: {self.webbrowser.executable} (headless={self.headless})")
+        self.process = subprocess.Popen(
+            [self.webbrowser.executable, *arguments],
+            stdin=DEVNULL,
+            stdout=DEVNULL,
+            stderr=DEVNULL,
+        )
+
+        devtools_active_port = Path(self._user_data_dir.name) / self.DEVTOOLS_ACTIVE_PORT
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                port_str, path = devtools_active_port.read_text(encoding="utf-8").splitlines()[:2]
+                port = int(port_str)
+            except (OSError, ValueError):
+                pass
+            else:
+                host = self.webbrowser.host
+                self.websocket_url = f"ws://{f'[{host}]' if ':' in host else host}:{port}{path}"
+                return self.websocket_url
+
+            if self.process.poll() is not None:
+                self._stop()
+                raise WebbrowserError("Persistent web browser process ended early")
+            if time.monotonic() > deadline:
+                self._stop()
+                raise WebbrowserError("Launching the persistent web browser has timed out")
+
+            time.sleep(0.05)
+
+    def _stop(self) -> None:
+        process, self.process = self.process, None
+        user_data_dir, self._user_data_dir = self._user_data_dir, None
+        self.websocket_url = None
+
+        if process is not None and process.poll() is None:
+            log.debug("Waiting for persistent web browser process to terminate")
+            process.terminate()
+            try:
+                process.wait(self.TERMINATE_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+        if user_data_dir is not None:
+            user_data_dir.cleanup()
@@ -367,6 +367,16 @@ def build_parser():
               ${XDG_STATE_HOME:-${HOME}/.local/state}/streamlink/logs
         """,
     )
+    logging.add_argument(
+        "--logqueue",
+        action="store_true",
+        help="""
+            Write log messages from a separate thread.
+
+            Writing log messages then won't block the threads which are logging, e.g. the stream's segment workers,
+            which is useful with verbose log levels or slow log outputs.
+        """,
+    )
     logging.add_argument(
         "-Q",
         "--quiet",
@@ -421,6 +431,33 @@ def build_parser():
             Same as --can-handle-url, but without following redirects when looking up the URL.
         """,
     )
+    plugin.add_argument(
+        "--batch",
+        metavar="FILENAME",
+        help="""
+            Resolve the streams of multiple URLs, read line by line from a file, or from stdin if FILENAME is `-`.
+            Empty lines and lines starting with `#` are ignored.
+
+            All URLs get resolved using the same session, so that HTTP connections and plugin data can be reused.
+            Each result gets written as a single line of JSON to the console output once it's available,
+            consisting of the input URL and either the plugin name, metadata and streams, or an error message.
+
+            Status code is `0` if all URLs returned streams, `1` otherwise.
+
+            Useful for external scripting.
+        """,
+    )
+    plugin.add_argument(
+        "--batch-concurrency",
+        metavar="NUMBER",
+        type=num(int, ge=1),
+        default=8,
+        help="""
+            The max number of URLs which get resolved at the same time when using --batch.
+
+            Default is 8.
+        """,
+    )
     plugin.add_argument(
         "--no-plugin-cache",
         action="store_true",
@@ -432,6 +469,20 @@ def build_parser():
             The data which is loaded or stored depends on each plugin implementation.
         """,
     )
+    plugin.add_argument(
+        "--plugin-cache-storage",
+        choices=["json", "sqlite"],
+        metavar="STORAGE",
+        help="""
+            The storage engine of the plugin key-value store.
+
+            `json` loads and rewrites the whole JSON file, so concurrent Streamlink processes can overwrite each other's data.
+            `sqlite` stores each value individually in an SQLite database, which is safe to be shared by multiple processes.
+            Existing data of the JSON file gets imported when the database is created.
+
+            Default is json.
+        """,
+    )
     plugin.add_argument(
         "--no-plugin-sideloading",
         action="store_true",
@@ -891,6 +942,22 @@ def build_parser():
             If --retry-streams is unset, then the default delay between fetching available streams is 1 second.
         """,
     )
+    stream.add_argument(
+        "--reuse-streams",
+        metavar="SECONDS",
+        type=num(float, gt=0),
+        help="""
+            Reuse the already resolved streams for up to `SECONDS` second(s) when a stream needs to be opened again,
+            instead of fetching the list of available streams again.
+
+            Streams are reused for a shorter amount of time if the plugin sets a shorter lifetime of its streams,
+            or if the stream URLs are signed and contain an expiration time that comes earlier.
+            If a reused stream fails to open, the list of available streams gets fetched again.
+
+            This currently only applies to the player's reconnects when using --player-continuous-http
+            or --player-external-http.
+        """,
+    )
     stream.add_argument(
         "--retry-open",
         metavar="ATTEMPTS",
@@ -976,6 +1043,33 @@ def build_parser():
             Default is "16M".
         """,
     )
+    transport.add_argument(
+        "--stream-bandwidth-limit",
+        metavar="RATE",
+        type=filesize,
+        help="""
+            Limit the combined download rate of all segmented streams, like HLS and DASH, in bytes per second.
+
+            Mebibytes or kibibytes (base 2) can be specified via the M or K suffix respectively.
+
+            Live streams get priority over other streams when sharing the limited bandwidth.
+
+            By default, the download rate is not limited.
+        """,
+    )
+    transport.add_argument(
+        "--stream-bandwidth-limit-per-stream",
+        metavar="RATE",
+        type=filesize,
+        help="""
+            Limit the download rate of each individual segmented stream, like HLS and DASH, in bytes per second.
+            Muxed streams are limited per substream.
+
+            Mebibytes or kibibytes (base 2) can be specified via the M or K suffix respectively.
+
+            By default, the download rate is not limited.
+        """,
+    )
     transport.add_argument(
         "--stream-segment-attempts",
         type=num(int, ge=1),
@@ -1079,6 +1173,21 @@ def build_parser():
             Needs to be supported by the used plugin.
         """,
     )
+    transport.add_argument(
+        "--mux-fmp4",
+        action="store_true",
+        default=None,
+        help="""
+            Mux separate video and audio streams in the fragmented MP4 format (fMP4) without FFmpeg,
+            by interleaving the streams' movie fragments.
+
+            This currently only applies to DASH streams with MP4 video and audio representations,
+            and the output format will be fragmented MP4, regardless of --ffmpeg-fout.
+
+            On period transitions of multi-period DASH streams, a new initialization section gets written
+            into the output, which needs to be supported by the player.
+        """,
+    )
 
     transport_hls.add_argument(
         "--hls-live-edge",
@@ -1459,6 +1568,68 @@ def build_parser():
             Default is 20.0.
         """,
     )
+    http.add_argument(
+        "--http-dns-cache-ttl",
+        metavar="SECONDS",
+        type=num(float, ge=0),
+        help="""
+            Cache the resolved addresses of hosts for the given number of seconds,
+            so that new connections to the same hosts don't have to wait for name resolution.
+
+            Default is 0.0 (disabled).
+        """,
+    )
+    http.add_argument(
+        "--http-circuit-breaker",
+        action="store_true",
+        default=None,
+        help="""
+            Reject HTTP requests to a host right away for 30 seconds after five consecutive failed requests
+            (connection errors, timeouts and server errors),
+            instead of retrying requests to a host which is known to be failing.
+        """,
+    )
+    http.add_argument(
+        "--http-response-cache-persistent",
+        action="store_true",
+        default=None,
+        help="""
+            Persist the cached responses of HTTP requests which plugins have marked as cacheable,
+            so that they can be reused by subsequent Streamlink runs.
+        """,
+    )
+    http.add_argument(
+        "--http-prewarm",
+        action="store_true",
+        default=None,
+        help="""
+            Establish connections to the hosts of HLS media playlists in the background,
+            while the available streams are still being resolved.
+
+            This reduces the time to the first downloaded segment if the media playlists are hosted on a different host
+            than the multivariant playlist.
+        """,
+    )
+    http.add_argument(
+        "--http-timings-log",
+        action="store_true",
+        default=None,
+        help="""
+            Log the timings of each HTTP request at the debug log level:
+            DNS resolution, TCP connect, TLS handshake, time to first byte, body transfer and total time,
+            as well as the request's purpose, like playlist, segment, key or API requests.
+
+            DNS resolution timings are only measured separately if --http-dns-cache-ttl is set,
+            otherwise they are included in the TCP connect timings.
+        """,
+    )
+    http.add_argument(
+        "--http-timings-file",
+        metavar="FILE",
+        help="""
+            Append the timings of each HTTP request to `FILE` in the JSON lines format. See --http-timings-log.
+        """,
+    )
 
     webbrowser = parser.add_argument_group("Web browser options")
     webbrowser.add_argument(
@@ -1540,6 +1711,24 @@ def build_parser():
             Default is false.
         """,
     )
+    webbrowser.add_argument(
+        "--webbrowser-persistent",
+        type=boolean,
+        metavar="{yes,true,1,on,no,false,0,off}",
+        default=None,
+        help="""
+            Whether to keep the web browser running after it has been launched, so it can be reused by subsequent webbrowser
+            API calls of plugins, instead of launching a new web browser process each time.
+
+            Each webbrowser API call gets its own isolated browser context, similar to an incognito profile.
+            The web browser gets restarted if it has ended in the meantime, and it gets terminated when Streamlink exits.
+
+            The web browser's inter-process communication interface uses the --webbrowser-cdp-host and
+            --webbrowser-cdp-port values. If no port is set, a free port gets chosen by the web browser.
+
+            Default is false.
+        """,
+    )
 
     return parser
 
@@ -1549,6 +1738,7 @@ def build_parser():
 _ARGUMENT_TO_SESSIONOPTION: list[tuple[str, str, Callable[[Any], Any] | type | None]] = [
     # generic arguments
     ("no_plugin_cache", "no-plugin-cache", None),
+    ("plugin_cache_storage", "plugin-cache-storage", None),
     ("locale", "locale", None),
     # network arguments
     ("interface", "interface", None),
@@ -1567,11 +1757,20 @@ _ARGUMENT_TO_SESSIONOPTION: list[tuple[str, str, Callable[[Any], Any] | type | N
     ("http_ssl_cert", "http-ssl-cert", None),
     ("http_ssl_cert_crt_key", "http-ssl-cert", tuple),
     ("http_timeout", "http-timeout", None),
+    ("http_dns_cache_ttl", "http-dns-cache-ttl", None),
+    ("http_circuit_breaker", "http-circuit-breaker", None),
+    ("http_response_cache_persistent", "http-response-cache-persistent", None),
+    ("http_prewarm", "http-prewarm", None),
+    ("http_timings_log", "http-timings-log", None),
+    ("http_timings_file", "http-timings-file", None),
     # stream transport arguments
     ("hls_duration", "hls-duration", None),  # deprecated options must come first
     ("hls_segment_queue_threshold", "hls-segment-queue-threshold", None),  # deprecated options must come first
     ("ringbuffer_size", "ringbuffer-size", None),
     ("mux_subtitles", "mux-subtitles", None),
+    ("mux_fmp4", "mux-fmp4", None),
+    ("stream_bandwidth_limit", "stream-bandwidth-limit", None),
+    ("stream_bandwidth_limit_per_stream", "stream-bandwidth-limit-per-stream", None),
     ("stream_segment_attempts", "stream-segment-attempts", None),
     ("stream_segment_threads", "stream-segment-threads", None),
     ("stream_segment_timeout", "stream-segment-timeout", None),
@@ -1607,6 +1806,7 @@ _ARGUMENT_TO_SESSIONOPTION: list[tuple[str, str, Callable[[Any], Any] | type | N
     ("webbrowser_cdp_port", "webbrowser-cdp-port", None),
     ("webbrowser_cdp_timeout", "webbrowser-cdp-timeout", None),
     ("webbrowser_headless", "webbrowser-headless", None),
+    ("webbrowser_persistent", "webbrowser-persistent", None),
     ("ffmpeg_validation_timeout", "ffmpeg-validation-timeout", None),
 ]
 
@@ -114,6 +114,16 @@ class ConsoleOutput:
         if not self.json:
             return
 
+        self._write_json(self._build_json(objs, keywords), indent=2)
+
+    def msg_json_line(self, *objs: Any, **keywords: Any) -> None:
+        if not self.json:
+            return
+
+        self._write_json(self._build_json(objs, keywords), indent=None)
+
+    @staticmethod
+    def _build_json(objs: tuple[Any, ...], keywords: dict[str, Any]) -> list | dict:
         out: list | dict
         if objs and isinstance(objs[0], list):
             out = []
@@ -136,12 +146,15 @@ class ConsoleOutput:
                 out.update(**obj)
             out.update(**keywords)
 
+        return out
+
+    def _write_json(self, out: list | dict, indent: int | None) -> None:
         if self._console_output is not None:
             # don't escape Unicode characters outside the ASCII range if the output encoding is UTF-8
             ensure_ascii = self._console_output.encoding != "utf-8"
-            msg = dumps(out, cls=JSONEncoder, ensure_ascii=ensure_ascii, indent=2)
+            msg = dumps(out, cls=JSONEncoder, ensure_ascii=ensure_ascii, indent=indent)
             self._write_console(f"{msg}\n")
 
         if self._file_output is not None:
-            msg = dumps(out, cls=JSONEncoder, ensure_ascii=False, indent=2)
+            msg = dumps(out, cls=JSONEncoder, ensure_ascii=False, indent=indent)
             self._write(self._file_output, f"{msg}\n")
@@ -14,15 +14,16 @@ from atexit import register as _atexit_register
 from contextlib import closing, suppress
 from gettext import gettext
 from pathlib import Path
+from threading import Lock
 from time import sleep
 from typing import TYPE_CHECKING, Any
 
 import streamlink.logger as logger
+import streamlink.utils.times as times
 from streamlink import NoPluginError, PluginError, StreamError, Streamlink, __version__ as streamlink_version
 from streamlink.exceptions import FatalPluginError, StreamlinkDeprecationWarning
 from streamlink.logger import getLogger
 from streamlink.utils.named_pipe import NamedPipe
-from streamlink.utils.times import LOCAL as LOCALTIMEZONE
 from streamlink_cli.argparser import (
     build_parser,
     setup_plugin_args,
@@ -44,6 +45,7 @@ from streamlink_cli.exceptions import StreamlinkCLIError
 from streamlink_cli.output import FileOutput, HTTPOutput, PlayerOutput
 from streamlink_cli.show_matchers import show_matchers
 from streamlink_cli.streamrunner import StreamRunner
+from streamlink_cli.streams_cache import StreamsCache
 from streamlink_cli.utils import Formatter, datetime
 from streamlink_cli.utils.versioncheck import check_version
 
@@ -52,12 +54,13 @@ if TYPE_CHECKING:
     import argparse
     from collections.abc import Mapping
 
+    from streamlink.options import Options
     from streamlink.plugin import Plugin
     from streamlink.stream.stream import Stream, StreamIO
     from streamlink_cli.argparser import ArgumentParser
 
 
-QUIET_OPTIONS = ("json", "stream_url", "quiet")
+QUIET_OPTIONS = ("json", "batch", "stream_url", "quiet")
 
 
 args: argparse.Namespace = None  # type: ignore[assignment, ty:invalid-assignment]
@@ -80,7 +83,7 @@ def get_formatter(plugin: Plugin):
             "category": plugin.get_category,
             "game": plugin.get_category,
             "title": plugin.get_title,
-            "time": lambda: datetime.now(tz=LOCALTIMEZONE),
+            "time": lambda: datetime.now(tz=times.LOCAL),
         },
         {
             "time": lambda dt, fmt: dt.strftime(fmt),
@@ -254,6 +257,10 @@ def output_stream_http(
         for url in server.urls:
             log.info(f" {url}")
 
+    streams_cache = StreamsCache(args.reuse_streams) if args.reuse_streams else None
+    if streams_cache:
+        streams_cache.set(plugin, initial_streams)
+
     initial_streams_used = False
     while not player or player.running:
         try:
@@ -271,8 +278,13 @@ def output_stream_http(
                 if not initial_streams_used:
                     streams = initial_streams
                     initial_streams_used = True
+                elif streams_cache and (cached_streams := streams_cache.get(plugin)):
+                    log.info("Reusing resolved streams")
+                    streams = cached_streams
                 else:
                     streams = fetch_streams(plugin)
+                    if streams_cache:
+                        streams_cache.set(plugin, streams)
 
                 for stream_name in (resolve_stream_name(streams, s) for s in args.stream):
                     if stream_name in streams:
@@ -280,6 +292,8 @@ def output_stream_http(
                         break
                 else:
                     log.info("Stream not available, will re-fetch streams in 10 sec")
+                    if streams_cache:
+                        streams_cache.invalidate(plugin)
                     sleep(10)
                     continue
             except PluginError as err:
@@ -291,6 +305,9 @@ def output_stream_http(
                 stream_fd, prebuffer = open_stream(stream)
             except StreamError as err:
                 log.error(err)
+                # resolve the streams again on the next attempt
+                if streams_cache:
+                    streams_cache.invalidate(plugin)
 
         if stream_fd and prebuffer:
             log.debug("Writing stream to player")
@@ -688,6 +705,84 @@ def handle_url():
         console.msg(f"Available streams: {validstreams}")
 
 
+def read_batch_urls(filename: str) -> list[str]:
+    """Reads the non-empty and non-comment lines of a file, or stdin."""
+
+    try:
+        if filename == "-":
+            lines = sys.stdin.read().splitlines() if sys.stdin else []
+        else:
+            lines = Path(filename).expanduser().read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError) as err:
+        raise StreamlinkCLIError(f"Failed to read URLs: {err}") from err
+
+    return [line for line in map(str.strip, lines) if line and not line.startswith("#")]
+
+
+def handle_batch() -> int:
+    """Resolves the streams of multiple URLs and outputs one JSON object per line for each URL."""
+
+    urls = read_batch_urls(args.batch)
+    log.info(f"Resolving streams of {len(urls)} URL(s)")
+
+    # set up the options of each plugin only once, as missing required plugin arguments may prompt for user input
+    plugin_options: dict[str, Options] = {}
+    plugin_options_lock = Lock()
+
+    def get_plugin_options(pluginname: str, pluginclass: type[Plugin]) -> Options:
+        with plugin_options_lock:
+            if pluginname not in plugin_options:
+                try:
+                    plugin_options[pluginname] = setup_plugin_options(streamlink, args, pluginname, pluginclass)
+                except StreamlinkCLIError as err:
+                    if args.batch != "-":
+                        raise
+                    raise StreamlinkCLIError(
+                        f"Can't prompt for the required arguments of the {pluginname} plugin while reading URLs from stdin",
+                    ) from err
+            return plugin_options[pluginname]
+
+    # prompt for required plugin arguments on the main thread before resolving the URLs concurrently
+    for url in urls:
+        with suppress(NoPluginError):
+            pluginname, pluginclass, _resolved_url = streamlink.resolve_url_no_redirect(url)
+            get_plugin_options(pluginname, pluginclass)
+
+    exit_code = 0
+    results = streamlink.streams_many(
+        urls,
+        concurrency=args.batch_concurrency,
+        options=get_plugin_options,
+        stream_types=args.stream_types,
+        sorting_excludes=args.stream_sorting_excludes,
+    )
+    for result in results:
+        plugin = result.plugin
+        if isinstance(result.error, NoPluginError):
+            error = f"No plugin can handle URL: {result.url}"
+        elif result.error is not None:
+            log.debug(f"Failed resolving streams of URL: {result.url}", exc_info=result.error)
+            error = str(result.error) or type(result.error).__name__
+        elif not result.streams:
+            error = f"No playable streams found on this URL: {result.url}"
+        else:
+            console.msg_json_line(
+                url=result.url,
+                plugin=plugin.module,
+                metadata=plugin.get_metadata(),
+                streams=result.streams,
+            )
+            continue
+
+        exit_code = 1
+        if plugin is None:
+            console.msg_json_line(url=result.url, error=error)
+        else:
+            console.msg_json_line(url=result.url, plugin=plugin.module, error=error)
+
+    return exit_code
+
+
 def check_version_wrapper() -> int:
     force = args.version_check
 
@@ -916,7 +1011,7 @@ def setup_console() -> None:
         # Default console output is stdout (if it exists)
         console_output = ConsoleOutputStream.wrap(sys, "stdout")
 
-    console = ConsoleOutput(console_output=console_output, json=args.json)
+    console = ConsoleOutput(console_output=console_output, json=args.json or bool(args.batch))
 
     # flush+close console and file streams on exit, and remove stream wrapper
     _atexit_register(console.close)
@@ -941,7 +1036,7 @@ def setup_logger() -> None:
             datefmt = "%H:%M:%S"
 
     if file == "-":
-        filename = LOG_DIR / f"{datetime.now(tz=LOCALTIMEZONE)}.log"
+        filename = LOG_DIR / f"{datetime.now(tz=times.LOCAL)}.log"
     elif file:
         filename = Path(file).expanduser().resolve()
     else:
@@ -959,6 +1054,7 @@ def setup_logger() -> None:
             level=level,
             stream=console.console_output,
             capture_warnings=True,
+            queue=args.logqueue,
         )
     except Exception as err:
         raise StreamlinkCLIError(f"Logging setup error: {err}") from err
@@ -1015,6 +1111,8 @@ def run(parser: ArgumentParser) -> int:
         show_matchers(streamlink, console, args.show_matchers)
     elif args.can_handle_url or args.can_handle_url_no_redirect:
         exit_code = can_handle_url()
+    elif args.batch:
+        exit_code = handle_batch()
     elif args.url:
         exit_code = handle_url_wrapper()
     else:
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from time import time
+from typing import TYPE_CHECKING, Any
+
+from streamlink.logger import getLogger
+from streamlink.utils.url import url_expires
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    from streamlink.plugin import Plugin
+    from streamlink.stream.stream import Stream
+
+
+log = getLogger("streamlink.cli")
+
+
+class StreamsCache:
+    """
+    Keeps the resolved streams of plugins, so that they can be re-opened without resolving them again.
+
+    Cached streams expire after the max TTL, after the plugin's :attr:`streams_ttl <streamlink.plugin.Plugin.streams_ttl>`,
+    or shortly before the expiration time of any of their signed URLs, whichever comes first.
+    """
+
+    #: Number of seconds before the expiration time of a signed URL when the cached streams expire
+    EXPIRES_MARGIN = 30.0
+
+    def __init__(self, ttl: float):
+        """
+        :param ttl: The max number of seconds for which resolved streams get cached
+        """
+
+        self.ttl = ttl
+        self._cache: dict[tuple[str, str], tuple[Mapping[str, Stream], float]] = {}
+
+    @staticmethod
+    def _key(plugin: Plugin) -> tuple[str, str]:
+        return plugin.module, plugin.url
+
+    def get(self, plugin: Plugin) -> Mapping[str, Stream] | None:
+        """
+        Get the cached streams of a plugin if they haven't expired yet.
+        """
+
+        key = self._key(plugin)
+        if key not in self._cache:
+            return None
+
+        streams, expires = self._cache[key]
+        if expires <= time():
+            log.debug("Cached streams have expired")
+            del self._cache[key]
+            return None
+
+        return streams
+
+    def set(self, plugin: Plugin, streams: Mapping[str, Stream]) -> None:
+        """
+        Cache the resolved streams of a plugin.
+        """
+
+        key = self._key(plugin)
+        if not streams:
+            self._cache.pop(key, None)
+            return
+
+        now = time()
+        expires = now + self.ttl
+        if plugin.streams_ttl is not None:
+            expires = min(expires, now + plugin.streams_ttl)
+        urls_expires = [timestamp for timestamp in map(url_expires, self._get_urls(streams)) if timestamp is not None]
+        if urls_expires:
+            expires = min(expires, min(urls_expires) - self.EXPIRES_MARGIN)
+
+        if expires <= now:
+            self._cache.pop(key, None)
+            return
+
+        log.debug(f"Caching resolved streams for {expires - now:.0f}s")
+        self._cache[key] = streams, expires
+
+    def invalidate(self, plugin: Plugin) -> None:
+        """
+        Remove the cached streams of a plugin, e.g. after one of them has failed to open.
+        """
+
+        self._cache.pop(self._key(plugin), None)
+
+    @classmethod
+    def _get_urls(cls, streams: Mapping[str, Stream]) -> Iterator[str]:
+        for stream in streams.values():
+            yield from cls._get_stream_urls(stream)
+
+    @classmethod
+    def _get_stream_urls(cls, stream: Stream) -> Iterator[str]:
+        yield from cls._find_urls(stream.__json__())
+        # muxed streams don't include their substreams in their JSON data
+        for substream in getattr(stream, "substreams", None) or ():
+            yield from cls._get_stream_urls(substream)
+
+    @classmethod
+    def _find_urls(cls, data: Any) -> Iterator[str]:
+        if isinstance(data, dict):
+            for key, value in data.items():
+                # ignore request headers, e.g. the referer
+                if key != "headers":
+                    yield from cls._find_urls(value)
+        elif isinstance(data, list):
+            for item in data:
+                yield from cls._find_urls(item)
+        elif isinstance(data, str) and data.startswith(("http://", "https://")):
+            yield data
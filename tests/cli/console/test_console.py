@@ -272,6 +272,16 @@ class TestMessages:
         )
         assert test_list1 == ["foo", "bar"]
 
+    def test_msg_json_line(self, console_output: ConsoleOutputStream):
+        console = ConsoleOutput(console_output=console_output, json=True)
+        console.msg_json_line({"foo": 1}, Mock(__json__=Mock(return_value={"bar": [2, 3]})), baz="qux")
+        console.msg_json_line(["foo"], bar="baz")
+        assert getvalue(console_output) == '{"foo": 1, "bar": [2, 3], "baz": "qux"}\n["foo", {"bar": "baz"}]\n'
+
+        console = ConsoleOutput(console_output=console_output, json=False)
+        console.msg_json_line({"foo": 1})
+        assert getvalue(console_output) == '{"foo": 1, "bar": [2, 3], "baz": "qux"}\n["foo", {"bar": "baz"}]\n'
+
     @pytest.mark.parametrize(
         ("json", "supports_status_messages", "expected"),
         [
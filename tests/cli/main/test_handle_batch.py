@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import json
+import re
+from io import StringIO
+from typing import TYPE_CHECKING
+
+import pytest
+
+import streamlink_cli.main
+from streamlink.exceptions import PluginError
+from streamlink.plugin import Plugin, pluginargument, pluginmatcher
+from streamlink.stream.http import HTTPStream
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from unittest.mock import Mock
+
+    from streamlink.session import Streamlink
+
+
+@pytest.fixture(autouse=True)
+def plugin(session: Streamlink):
+    @pluginmatcher(re.compile(r"https?://plugin/(?P<name>\w+)"))
+    @pluginargument("foo", prompt="Enter foo", required=True)
+    class FakePlugin(Plugin):
+        __module__ = "streamlink.plugins.plugin"
+
+        id = "ID"
+        title = "TITLE"
+
+        def _get_streams(self):
+            name = self.match["name"]
+            if name == "error":
+                raise PluginError("Error while fetching streams")
+            if name == "empty":
+                return {}
+
+            return {"live": HTTPStream(self.session, f"https://{self.options.get('foo')}/{name}")}
+
+    session.plugins.update({"plugin": FakePlugin})
+
+
+@pytest.fixture()
+def user_input_requester(user_input_requester: Mock):
+    user_input_requester.ask.return_value = "bar"
+
+    return user_input_requester
+
+
+def parse_output(out: str) -> list[dict]:
+    items = [json.loads(line) for line in out.splitlines()]
+    for item in items:
+        if "streams" in item:
+            item["streams"] = {name: stream["url"] for name, stream in item["streams"].items()}
+
+    return items
+
+
+URLS = """
+# comment
+plugin/one
+
+doesnotexist
+plugin/error
+plugin/empty
+plugin/two
+"""
+
+EXPECTED = [
+    {
+        "url": "plugin/one",
+        "plugin": "plugin",
+        "metadata": {"id": "ID", "author": None, "category": None, "title": "TITLE"},
+        "streams": {"live": "https://bar/one", "worst": "https://bar/one", "best": "https://bar/one"},
+    },
+    {
+        "url": "doesnotexist",
+        "error": "No plugin can handle URL: doesnotexist",
+    },
+    {
+        "url": "plugin/error",
+        "plugin": "plugin",
+        "error": "Error while fetching streams",
+    },
+    {
+        "url": "plugin/empty",
+        "plugin": "plugin",
+        "error": "No playable streams found on this URL: plugin/empty",
+    },
+    {
+        "url": "plugin/two",
+        "plugin": "plugin",
+        "metadata": {"id": "ID", "author": None, "category": None, "title": "TITLE"},
+        "streams": {"live": "https://bar/two", "worst": "https://bar/two", "best": "https://bar/two"},
+    },
+]
+
+
+@pytest.mark.parametrize("argv", [["--batch-concurrency", "1", "--batch", "-"]], indirect=True)
+def test_batch_stdin(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    requests_mock: Mock,
+    user_input_requester: Mock,
+    argv: list,
+):
+    requests_mock.head("https://doesnotexist", status_code=404)
+    monkeypatch.setattr("sys.stdin", StringIO(URLS))
+
+    with pytest.raises(SystemExit) as excinfo:
+        streamlink_cli.main.main()
+    assert excinfo.value.code == 1
+
+    out, err = capsys.readouterr()
+    assert parse_output(out) == EXPECTED
+    assert err == ""
+    # plugin options are only set up once
+    assert user_input_requester.ask.call_count == 1
+
+
+@pytest.mark.parametrize("argv", [["--batch", "urls.txt"]], indirect=True)
+def test_batch_file(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "urls.txt").write_text("plugin/one\nplugin/two\n", encoding="utf-8")
+
+    with pytest.raises(SystemExit) as excinfo:
+        streamlink_cli.main.main()
+    assert excinfo.value.code == 0
+
+    out, err = capsys.readouterr()
+    assert sorted(item["url"] for item in parse_output(out)) == ["plugin/one", "plugin/two"]
+    assert err == ""
+
+
+@pytest.mark.parametrize("argv", [["--batch", "doesnotexist.txt"]], indirect=True)
+def test_batch_file_missing(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(SystemExit) as excinfo:
+        streamlink_cli.main.main()
+    assert excinfo.value.code == 1
+
+    out, err = capsys.readouterr()
+    assert json.loads(out)["error"].startswith("Failed to read URLs: [Errno 2] No such file or directory")
+    assert err == ""
+
+
+@pytest.mark.parametrize("argv", [["--batch", "-"]], indirect=True)
+def test_batch_stdin_prompt(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    user_input_requester: Mock,
+    argv: list,
+):
+    user_input_requester.ask.side_effect = OSError("No input TTY available")
+    monkeypatch.setattr("sys.stdin", StringIO("plugin/one\nplugin/two\n"))
+
+    with pytest.raises(SystemExit) as excinfo:
+        streamlink_cli.main.main()
+    assert excinfo.value.code == 1
+
+    out, err = capsys.readouterr()
+    assert json.loads(out) == {
+        "error": "Can't prompt for the required arguments of the plugin plugin while reading URLs from stdin",
+    }
+    assert err == ""
+    # prompted only once on the main thread, before resolving any URLs
+    assert user_input_requester.ask.call_count == 1
+
+
+@pytest.mark.parametrize("argv", [["--batch", "-"]], indirect=True)
+def test_batch_stdin_prompt_redirect(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    requests_mock: Mock,
+    user_input_requester: Mock,
+    argv: list,
+):
+    # the plugin can only be found after following the redirect when resolving the URL on a worker thread
+    requests_mock.head("https://redirect/", status_code=301, headers={"Location": "https://plugin/one"})
+    requests_mock.head("https://plugin/one")
+    user_input_requester.ask.side_effect = OSError("No input TTY available")
+    monkeypatch.setattr("sys.stdin", StringIO("https://redirect/\n"))
+
+    with pytest.raises(SystemExit) as excinfo:
+        streamlink_cli.main.main()
+    assert excinfo.value.code == 1
+
+    out, err = capsys.readouterr()
+    assert parse_output(out) == [
+        {
+            "url": "https://redirect/",
+            "error": "Can't prompt for the required arguments of the plugin plugin while reading URLs from stdin",
+        },
+    ]
+    assert err == ""
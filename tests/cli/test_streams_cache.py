@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import freezegun
+import pytest
+
+from streamlink.stream.ffmpegmux import MuxedStream
+from streamlink.stream.http import HTTPStream
+from streamlink_cli.streams_cache import StreamsCache
+
+
+if TYPE_CHECKING:
+    from streamlink import Streamlink
+
+
+# 2024-01-01T00:00:00Z
+NOW = 1704067200
+
+
+@pytest.fixture()
+def frozen_time():
+    with freezegun.freeze_time("2024-01-01T00:00:00Z") as frozen_time:
+        yield frozen_time
+
+
+@pytest.fixture()
+def plugin():
+    return Mock(module="plugin", url="https://plugin/channel", streams_ttl=None)
+
+
+@pytest.fixture()
+def streams_cache():
+    return StreamsCache(600)
+
+
+class TestStreamsCache:
+    def test_ttl(
+        self,
+        frozen_time: freezegun.api.FrozenDateTimeFactory,
+        session: Streamlink,
+        plugin: Mock,
+        streams_cache: StreamsCache,
+    ):
+        streams = {"live": HTTPStream(session, "https://host/stream")}
+        assert streams_cache.get(plugin) is None
+
+        streams_cache.set(plugin, streams)
+        assert streams_cache.get(plugin) is streams
+        assert streams_cache.get(Mock(module="plugin", url="https://plugin/other")) is None
+        assert streams_cache.get(Mock(module="other", url="https://plugin/channel")) is None
+
+        frozen_time.tick(599)
+        assert streams_cache.get(plugin) is streams
+        frozen_time.tick(1)
+        assert streams_cache.get(plugin) is None
+
+    def test_plugin_ttl(
+        self,
+        frozen_time: freezegun.api.FrozenDateTimeFactory,
+        session: Streamlink,
+        plugin: Mock,
+        streams_cache: StreamsCache,
+    ):
+        plugin.streams_ttl = 60
+        streams = {"live": HTTPStream(session, "https://host/stream")}
+        streams_cache.set(plugin, streams)
+        frozen_time.tick(59)
+        assert streams_cache.get(plugin) is streams
+        frozen_time.tick(1)
+        assert streams_cache.get(plugin) is None
+
+    def test_url_expires(
+        self,
+        frozen_time: freezegun.api.FrozenDateTimeFactory,
+        session: Streamlink,
+        plugin: Mock,
+        streams_cache: StreamsCache,
+    ):
+        streams = {
+            "live": MuxedStream(
+                session,
+                HTTPStream(session, "https://host/video", headers={"Referer": f"https://host/?expires={NOW + 60}"}),
+                HTTPStream(session, f"https://host/audio?expires={NOW + 300}"),
+            ),
+            "other": HTTPStream(session, f"https://host/other?Expires={NOW + 400}"),
+        }
+        streams_cache.set(plugin, streams)
+        frozen_time.tick(269)
+        assert streams_cache.get(plugin) is streams
+        frozen_time.tick(1)
+        assert streams_cache.get(plugin) is None
+
+    def test_url_expired(self, frozen_time: freezegun.api.FrozenDateTimeFactory, session: Streamlink, plugin: Mock):
+        streams_cache = StreamsCache(600)
+        streams_cache.set(plugin, {"live": HTTPStream(session, "https://host/stream")})
+        streams_cache.set(plugin, {"live": HTTPStream(session, f"https://host/stream?exp={NOW + 30}")})
+        assert streams_cache.get(plugin) is None
+
+    def test_no_streams(self, session: Streamlink, plugin: Mock, streams_cache: StreamsCache):
+        streams_cache.set(plugin, {"live": HTTPStream(session, "https://host/stream")})
+        streams_cache.set(plugin, {})
+        assert streams_cache.get(plugin) is None
+
+    def test_invalidate(self, session: Streamlink, plugin: Mock, streams_cache: StreamsCache):
+        streams_cache.invalidate(plugin)
+        streams_cache.set(plugin, {"live": HTTPStream(session, "https://host/stream")})
+        streams_cache.invalidate(plugin)
+        assert streams_cache.get(plugin) is None
@@ -8,12 +8,22 @@ from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, Mock, call, patch
 from urllib.parse import parse_qsl, urlparse
 
+import freezegun
 import pytest
 
+from streamlink.cache import Cache
 from streamlink.exceptions import NoStreamsError, PluginError
 from streamlink.options import Options
 from streamlink.plugin.api import useragents
-from streamlink.plugins.twitch import Twitch, TwitchAPI, TwitchHLSStream, TwitchHLSStreamReader, TwitchHLSStreamWriter
+from streamlink.plugins.twitch import (
+    Twitch,
+    TwitchAPI,
+    TwitchClientIntegrity,
+    TwitchHLSStream,
+    TwitchHLSStreamReader,
+    TwitchHLSStreamWriter,
+)
+from streamlink.stream.hls import HLSStream
 from tests.mixins.stream_hls import EventedHLSStreamWriter, Playlist, Segment as _Segment, Tag, TestMixinStreamHLS
 from tests.plugins import PluginCanHandleUrl
 from tests.resources import text
@@ -1008,6 +1018,121 @@ class TestTwitchAPIAccessToken:
         assert "Client-Integrity" not in headers
 
 
+class TestTwitchClientIntegrityToken:
+    # 2024-01-01T00:00:00Z
+    NOW = 1704067200
+
+    @pytest.fixture(autouse=True)
+    def frozen_time(self):
+        with freezegun.freeze_time("2024-01-01T00:00:00Z") as frozen_time:
+            yield frozen_time
+
+    @pytest.fixture()
+    def acquire(self, monkeypatch: pytest.MonkeyPatch):
+        acquire = Mock(return_value=("new-token", self.NOW + 3600))
+        monkeypatch.setattr(TwitchClientIntegrity, "acquire", acquire)
+
+        return acquire
+
+    @pytest.fixture()
+    def plugin(self, request: pytest.FixtureRequest, session: Streamlink):
+        plugin = Twitch(session, "https://twitch.tv/channelname", Options(getattr(request, "param", {})))
+        plugin.cache = Cache("plugin-cache.json", disabled=True)
+
+        return plugin
+
+    def set_cached_token(self, plugin: Twitch, expires: float):
+        plugin.cache.set(
+            Twitch._CACHE_KEY_CLIENT_INTEGRITY,
+            {"token": ["cached-device-id", "cached-token"], "expires": expires},
+            expires_at=datetime.fromtimestamp(expires, tz=timezone.utc),
+        )
+
+    def test_acquire(self, plugin: Twitch, acquire: Mock):
+        device_id, token = plugin._client_integrity_token("channelname")
+        assert token == "new-token"
+        assert acquire.call_count == 1
+        assert acquire.call_args.args[3] == device_id
+        assert plugin.cache.get(Twitch._CACHE_KEY_CLIENT_INTEGRITY) == {
+            "token": [device_id, "new-token"],
+            "expires": self.NOW + 3600,
+        }
+
+    def test_cached(self, plugin: Twitch, acquire: Mock):
+        self.set_cached_token(plugin, self.NOW + 3600)
+        assert plugin._client_integrity_token("channelname") == ("cached-device-id", "cached-token")
+        assert acquire.call_count == 0
+
+    def test_old_cache_format(self, plugin: Twitch, acquire: Mock):
+        plugin.cache.set(
+            Twitch._CACHE_KEY_CLIENT_INTEGRITY,
+            ["cached-device-id", "cached-token"],
+            expires_at=datetime.fromtimestamp(self.NOW + 3600, tz=timezone.utc),
+        )
+        device_id, token = plugin._client_integrity_token("channelname")
+        assert device_id != "cached-device-id"
+        assert token == "new-token"
+        assert acquire.call_count == 1
+        assert plugin.cache.get(Twitch._CACHE_KEY_CLIENT_INTEGRITY) == {
+            "token": [device_id, "new-token"],
+            "expires": self.NOW + 3600,
+        }
+
+    @pytest.mark.parametrize("plugin", [{"purge-client-integrity": True}], indirect=True)
+    def test_purge_option(self, plugin: Twitch, acquire: Mock):
+        self.set_cached_token(plugin, self.NOW + 3600)
+        device_id, token = plugin._client_integrity_token("channelname")
+        assert device_id != "cached-device-id"
+        assert token == "new-token"
+        assert acquire.call_count == 1
+
+    @pytest.mark.parametrize("plugin", [{"force-client-integrity": True}], indirect=True)
+    def test_purge_on_rejection(self, requests_mock: rm.Mocker, plugin: Twitch, acquire: Mock):
+        self.set_cached_token(plugin, self.NOW + 3600)
+        mock = requests_mock.post(
+            "https://gql.twitch.tv/gql",
+            status_code=401,
+            json={"errors": [{"message": "failed integrity check"}]},
+        )
+
+        with pytest.raises(PluginError, match=r"^Error: failed integrity check$"):
+            plugin._access_token(True, "channelname")
+        assert mock.call_count == 1
+        assert mock.last_request._request.headers["Client-Integrity"] == "cached-token"  # type: ignore[union-attr, ty:unresolved-attribute]
+        assert acquire.call_count == 0
+        assert plugin.cache.get(Twitch._CACHE_KEY_CLIENT_INTEGRITY) is None
+        assert plugin._client_integrity is None
+
+    @pytest.mark.parametrize("plugin", [{"force-client-integrity": True}], indirect=True)
+    def test_keep_on_success(self, requests_mock: rm.Mocker, plugin: Twitch, acquire: Mock):
+        self.set_cached_token(plugin, self.NOW + 3600)
+        requests_mock.post(
+            "https://gql.twitch.tv/gql",
+            json={"data": {"streamPlaybackAccessToken": {"value": '{"channel":"foo"}', "signature": "sig"}}},
+        )
+
+        assert plugin._access_token(True, "channelname") == ("sig", '{"channel":"foo"}', [])
+        assert plugin.cache.get(Twitch._CACHE_KEY_CLIENT_INTEGRITY) is not None
+
+    def test_background_refresh_on_open(self, monkeypatch: pytest.MonkeyPatch, plugin: Twitch, acquire: Mock):
+        mock_open = Mock()
+        monkeypatch.setattr(HLSStream, "open", mock_open)
+        self.set_cached_token(plugin, self.NOW + 60)
+
+        # don't refresh the expiring token in the background while resolving streams
+        assert plugin._client_integrity_token("channelname") == ("cached-device-id", "cached-token")
+        assert plugin._client_integrity is not None
+        assert plugin._client_integrity._thread is None
+        assert acquire.call_count == 0
+
+        # only refresh it once the stream actually gets opened
+        stream = TwitchHLSStream(plugin.session, "http://mocked/path/master.m3u8", client_integrity=plugin._client_integrity)
+        assert stream.open() is mock_open.return_value
+        plugin._client_integrity.wait()
+        assert acquire.call_count == 1
+        assert plugin.cache.get(Twitch._CACHE_KEY_CLIENT_INTEGRITY)["token"][1] == "new-token"
+
+
 class TestTwitchHLSMultivariantResponse:
     @pytest.fixture()
     def plugin(self, request: pytest.FixtureRequest, requests_mock: rm.Mocker, session: Streamlink):
@@ -19,6 +19,9 @@ from urllib3.response import HTTPResponse
 
 from streamlink.exceptions import PluginError, StreamlinkDeprecationWarning
 from streamlink.session.http import (
+    DNSCache,
+    HTTPCircuitBreaker,
+    HTTPCircuitOpenError,
     HTTPSession,
     SSLContextAdapter,
     TLSNoDHAdapter,
@@ -35,6 +38,7 @@ if TYPE_CHECKING:
 
 
 _original_allowed_gai_family = urllib3.util.connection.allowed_gai_family
+_original_create_connection = urllib3.util.connection.create_connection
 
 
 class TestUrllib3Overrides:
@@ -215,8 +219,10 @@ class TestHTTPSession:
 
     def test_read_timeout(self, monkeypatch: pytest.MonkeyPatch):
         mock_sleep = Mock()
+        mock_uniform = Mock(side_effect=lambda a, b: (a + b) / 2)
         mock_request = Mock(side_effect=requests.Timeout)
         monkeypatch.setattr("streamlink.session.http.time.sleep", mock_sleep)
+        monkeypatch.setattr("streamlink.session.http.random.uniform", mock_uniform)
         monkeypatch.setattr("streamlink.session.http.Session.request", mock_request)
 
         session = HTTPSession()
@@ -246,12 +252,72 @@ class TestHTTPSession:
                 json=None,
             ),
         ]
+        # decorrelated jitter
+        assert mock_uniform.call_args_list == [
+            call(2, 6),
+            call(2, 12),
+            call(2, 15),
+        ]
         assert mock_sleep.call_args_list == [
-            call(2),
             call(4),
             call(5),
+            call(5),
         ]
 
+    def test_circuit_breaker(self, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch, requests_mock: rm.Mocker):
+        monkeypatch.setattr("streamlink.session.http.time.sleep", Mock())
+        session = HTTPSession()
+        session.circuit_breaker = HTTPCircuitBreaker(threshold=3, reset_timeout=10.0)
+        mock_a = requests_mock.get("http://host-a/", [{"status_code": 404}, {"status_code": 503}])
+        mock_b = requests_mock.get("http://host-b/", text="ok")
+
+        with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+            # client errors don't count as failures
+            with pytest.raises(PluginError):
+                session.get("http://host-a/")
+            assert caplog.records == []
+
+            # retries stop once the failure threshold has been reached
+            with pytest.raises(PluginError, match=r"\(Too many failed requests to host-a\)$"):
+                session.get("http://host-a/", retries=5)
+            assert mock_a.call_count == 4
+            assert [(record.name, record.levelname, record.message) for record in caplog.records] == [
+                ("streamlink.session.http", "warning", "Rejecting requests to host-a for 10.0s after 3 failed requests"),
+            ]
+
+            with pytest.raises(PluginError, match=r"\(Too many failed requests to host-a\)$") as cm:
+                session.get("http://host-a/", retries=5)
+            assert isinstance(getattr(cm.value, "err", None), HTTPCircuitOpenError)
+            assert mock_a.call_count == 4
+
+            assert session.get("http://host-b/").text == "ok"
+            assert mock_b.call_count == 1
+
+            frozen_time.tick(10)
+            requests_mock.get("http://host-a/", text="ok")
+            assert session.get("http://host-a/").text == "ok"
+            assert session.circuit_breaker.allow("host-a")
+
+    @pytest.mark.parametrize(
+        ("err", "expected"),
+        [
+            pytest.param(requests.ConnectionError(), True, id="ConnectionError"),
+            pytest.param(requests.ConnectTimeout(), True, id="ConnectTimeout"),
+            pytest.param(requests.ReadTimeout(), True, id="ReadTimeout"),
+            pytest.param(requests.HTTPError(response=Mock(status_code=503)), True, id="HTTPError-5xx"),
+            pytest.param(requests.HTTPError(response=Mock(status_code=404)), False, id="HTTPError-4xx"),
+            pytest.param(requests.HTTPError(), False, id="HTTPError-no-response"),
+            pytest.param(requests.exceptions.InvalidURL(), False, id="InvalidURL"),
+            pytest.param(requests.exceptions.MissingSchema(), False, id="MissingSchema"),
+            pytest.param(requests.exceptions.InvalidSchema(), False, id="InvalidSchema"),
+            pytest.param(requests.TooManyRedirects(), False, id="TooManyRedirects"),
+            pytest.param(HTTPCircuitOpenError("host"), False, id="HTTPCircuitOpenError"),
+            pytest.param(ValueError(), False, id="ValueError"),
+        ],
+    )
+    def test_is_host_failure(self, err: Exception, expected: bool):
+        assert HTTPSession._is_host_failure(err) is expected
+
     @pytest.mark.parametrize("encoding", ["UTF-32BE", "UTF-32LE", "UTF-16BE", "UTF-16LE", "UTF-8"])
     def test_determine_json_encoding(self, recwarn: pytest.WarningsRecorder, encoding: str):
         data = "Hello world, Γειά σου Κόσμε, こんにちは世界".encode(encoding)  # ruff: ignore[ambiguous-unicode-character-string]
@@ -286,6 +352,31 @@ class TestHTTPSession:
 
         assert HTTPSession.json(res) == {"test": "Α and Ω"}  # ruff: ignore[ambiguous-unicode-character-string]
 
+    @pytest.mark.parametrize(
+        ("encoding", "content", "expected"),
+        [
+            pytest.param(None, b'{"test": 1}', bytes, id="no-encoding"),
+            pytest.param("utf-8", b'{"test": 1}', bytes, id="utf-8-ascii"),
+            pytest.param("UTF8", b'{"test": 1}', bytes, id="utf-8-alias"),
+            pytest.param("utf-8", '{"test": "Ω"}'.encode(), str, id="utf-8-non-ascii"),
+            pytest.param("utf-8", '{"test": 1}'.encode("utf-16-le"), str, id="utf-8-nul-bytes"),
+            pytest.param("iso-8859-1", b'{"test": 1}', str, id="other-encoding"),
+            pytest.param("unknown", b'{"test": 1}', str, id="unknown-encoding"),
+        ],
+    )
+    def test_json_content(self, monkeypatch: pytest.MonkeyPatch, encoding: str | None, content: bytes, expected: type):
+        mock_parse_json = Mock(return_value={})
+        monkeypatch.setattr("streamlink.session.http.parse_json", mock_parse_json)
+        monkeypatch.setattr("requests.Response.content", PropertyMock(return_value=content))
+
+        res = requests.Response()
+        res.encoding = encoding
+
+        assert HTTPSession.json(res, name="data") == {}
+        assert mock_parse_json.call_count == 1
+        assert type(mock_parse_json.call_args[0][0]) is expected
+        assert mock_parse_json.call_args[1] == {"name": "data"}
+
     @pytest.mark.parametrize(
         ("content_type", "encoding", "content", "expected"),
         [
@@ -599,6 +690,71 @@ class TestHTTPSession:
         session.set_address_family(family=None)
         assert mock_urllib3_util_connection.allowed_gai_family is _original_allowed_gai_family
 
+    def test_set_dns_cache(self, monkeypatch: pytest.MonkeyPatch):
+        session = HTTPSession()
+        mock_urllib3_util_connection = Mock(create_connection=_original_create_connection)
+        monkeypatch.setattr("streamlink.session.http.urllib3_util_connection", mock_urllib3_util_connection)
+
+        session.set_dns_cache(ttl=60.0)
+        create_connection = mock_urllib3_util_connection.create_connection
+        assert create_connection is not _original_create_connection
+        assert isinstance(create_connection.__self__, DNSCache)
+        assert create_connection.__self__.ttl == 60.0  # ruff: ignore[float-equality-comparison]
+
+        session.set_dns_cache(ttl=0.0)
+        assert mock_urllib3_util_connection.create_connection is _original_create_connection
+
+    def test_prewarm(self, monkeypatch: pytest.MonkeyPatch):
+        mock_thread = Mock()
+        monkeypatch.setattr("streamlink.session.http.Thread", mock_thread)
+        session = HTTPSession()
+
+        session.prewarm(
+            "https://host-a/playlist-1.m3u8",
+            "https://host-a/playlist-2.m3u8",
+            "http://host-a/playlist-3.m3u8",
+            "https://host-b:8443/playlist.m3u8",
+            "file:///playlist.m3u8",
+        )
+        assert [c.kwargs["args"] for c in mock_thread.call_args_list] == [
+            ("https://host-a/playlist-1.m3u8",),
+            ("http://host-a/playlist-3.m3u8",),
+            ("https://host-b:8443/playlist.m3u8",),
+        ]
+        assert all(c.kwargs["daemon"] for c in mock_thread.call_args_list)
+
+    def test_prewarm_connection(self):
+        session = HTTPSession()
+        server = socket.create_server(("127.0.0.1", 0))
+        try:
+            port = server.getsockname()[1]
+            url = f"http://127.0.0.1:{port}/playlist.m3u8"
+
+            # noinspection PyProtectedMember
+            session._prewarm(url)
+            pool = session.adapters["http://"].poolmanager.connection_from_url(url)
+            assert pool.num_connections == 1
+            conn = pool.pool.get_nowait()
+            assert conn.is_connected
+
+            # already established connections don't get established again
+            pool.pool.put_nowait(conn)
+            # noinspection PyProtectedMember
+            session._prewarm(url)
+            assert pool.num_connections == 1
+        finally:
+            server.close()
+            session.close()
+
+    def test_prewarm_proxy(self):
+        session = HTTPSession()
+        session.proxies["http"] = "http://proxy"
+        url = "http://host/playlist.m3u8"
+
+        # noinspection PyProtectedMember
+        session._prewarm(url)
+        assert not session.adapters["http://"].poolmanager.pools.keys()
+
     def test_disable_dh(self):
         session = HTTPSession()
 
@@ -617,6 +773,177 @@ class TestHTTPSession:
         assert not isinstance(session.adapters["https://"], TLSNoDHAdapter)
         assert session.adapters["https://"].poolmanager.connection_pool_kw.get("source_address") == ("0.0.0.0", 0)
 
+    def test_pool_size(self):
+        session = HTTPSession()
+        session.adapters["https://"].poolmanager.connection_from_url("https://host")
+        assert session.adapters["https://"].poolmanager.pools.keys()
+
+        session.set_pool_size(maxsize=22, block=True)
+        assert session.pool_maxsize == 22
+        assert session.pool_block is True
+        for prefix in ("http://", "https://"):
+            adapter = session.adapters[prefix]
+            assert adapter.poolmanager.connection_pool_kw["maxsize"] == 22
+            assert adapter.poolmanager.connection_pool_kw["block"] is True
+            assert not adapter.poolmanager.pools.keys()
+            assert adapter.proxy_manager_for("http://proxy").connection_pool_kw["maxsize"] == 22
+
+        pool = session.adapters["https://"].poolmanager.connection_from_url("https://host")
+        assert pool.pool.maxsize == 22
+        assert pool.block is True
+
+        # adapters mounted afterwards
+        session.disable_dh(disable=True)
+        assert session.adapters["https://"].poolmanager.connection_pool_kw["maxsize"] == 22
+        session.mount("foo://", HTTPAdapter())
+        assert session.adapters["foo://"].poolmanager.connection_pool_kw["maxsize"] == 22
+
+    def test_fork(self):
+        session = HTTPSession()
+        session.headers["Authorization"] = "secret"
+        session.cookies.set("foo", "bar")
+        session.params["foo"] = "bar"
+        session.proxies["https"] = "https://proxy"
+        session.hooks["response"].append(Mock())
+
+        forked = session.fork()
+        assert isinstance(forked, HTTPSession)
+        assert forked is not session
+        assert forked.timeout == session.timeout
+        assert forked.circuit_breaker is session.circuit_breaker
+        assert forked.response_cache is session.response_cache
+        assert forked.adapters == session.adapters
+        assert forked.adapters is not session.adapters
+        assert forked.adapters["https://"] is session.adapters["https://"]
+
+        forked.headers["Authorization"] = "other"
+        forked.headers["Referer"] = "https://host"
+        forked.cookies.set("foo", "baz")
+        forked.params["foo"] = "baz"
+        forked.proxies["https"] = "https://other-proxy"
+        forked.hooks["response"].append(Mock())
+        forked.mount("foo://", HTTPAdapter())
+        assert session.headers["Authorization"] == "secret"
+        assert "Referer" not in session.headers
+        assert session.cookies.get("foo") == "bar"
+        assert forked.cookies.get("foo") == "baz"
+        assert session.params == {"foo": "bar"}
+        assert session.proxies == {"https": "https://proxy"}
+        assert len(session.hooks["response"]) == 1
+        assert len(forked.hooks["response"]) == 2
+        assert "foo://" not in session.adapters
+
+    def test_pool_stats(self):
+        with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+            session = HTTPSession()
+            assert session.pool_stats() == {}
+
+            pool_a = session.adapters["https://"].poolmanager.connection_from_url("https://host-a")
+            pool_b = session.adapters["http://"].poolmanager.connection_from_url("http://host-b:8080")
+            pool_c = session.adapters["http://"].poolmanager.connection_from_url("http://host-c")
+            pool_a.num_connections, pool_a.num_requests = 4, 100
+            pool_b.num_connections, pool_b.num_requests = 2, 2
+            frozen_time.tick(120)
+
+            stats = session.pool_stats()
+
+        assert stats == {
+            "https://host-a:443": (4, 100, 2.0),
+            "http://host-b:8080": (2, 2, 1.0),
+            "http://host-c:80": (0, 0, 0.0),
+        }
+        assert stats["https://host-a:443"].reuse_ratio == pytest.approx(0.96)
+        assert stats["http://host-b:8080"].reuse_ratio == pytest.approx(0.0)
+        assert stats["http://host-c:80"].reuse_ratio == pytest.approx(0.0)
+        assert pool_c.num_requests == 0
+
+
+class TestHTTPCircuitBreaker:
+    def test_circuit_breaker(self):
+        circuit_breaker = HTTPCircuitBreaker(threshold=2, reset_timeout=5.0)
+        with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+            circuit_breaker.record_failure("host")
+            assert circuit_breaker.allow("host")
+            circuit_breaker.record_success("host")
+            circuit_breaker.record_failure("host")
+            assert circuit_breaker.allow("host")
+            circuit_breaker.record_failure("host")
+            assert not circuit_breaker.allow("host")
+            assert circuit_breaker.allow("other-host")
+            with pytest.raises(HTTPCircuitOpenError, match=r"^Too many failed requests to host$"):
+                circuit_breaker.check("host")
+
+            frozen_time.tick(5)
+            assert circuit_breaker.allow("host")
+            circuit_breaker.check("host")
+
+            # a single failure after the reset timeout rejects requests again
+            circuit_breaker.record_failure("host")
+            assert not circuit_breaker.allow("host")
+
+            frozen_time.tick(5)
+            circuit_breaker.record_success("host")
+            circuit_breaker.record_failure("host")
+            assert circuit_breaker.allow("host")
+
+
+class TestDNSCache:
+    @pytest.fixture()
+    def getaddrinfo(self, monkeypatch: pytest.MonkeyPatch):
+        mock = Mock(
+            return_value=[
+                (AF_INET, socket.SOCK_STREAM, 6, "", ("1.1.1.1", 80)),
+                (AF_INET, socket.SOCK_STREAM, 6, "", ("2.2.2.2", 80)),
+            ],
+        )
+        monkeypatch.setattr("streamlink.session.http.socket.getaddrinfo", mock)
+
+        return mock
+
+    @pytest.fixture()
+    def create_connection(self, monkeypatch: pytest.MonkeyPatch):
+        mock = Mock()
+        monkeypatch.setattr("streamlink.session.http._original_create_connection", mock)
+
+        return mock
+
+    def test_getaddrinfo(self, getaddrinfo: Mock):
+        dnscache = DNSCache(ttl=10.0)
+        with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+            assert dnscache.getaddrinfo("host", 80, AF_INET) is getaddrinfo.return_value
+            assert dnscache.getaddrinfo("host", 80, AF_INET) is getaddrinfo.return_value
+            assert getaddrinfo.call_args_list == [call("host", 80, AF_INET, socket.SOCK_STREAM)]
+
+            dnscache.getaddrinfo("host", 443, AF_INET)
+            dnscache.getaddrinfo("host", 80, AF_INET6)
+            assert len(getaddrinfo.call_args_list) == 3
+
+            frozen_time.tick(10)
+            dnscache.getaddrinfo("host", 80, AF_INET)
+            assert len(getaddrinfo.call_args_list) == 4
+
+    def test_create_connection(self, monkeypatch: pytest.MonkeyPatch, getaddrinfo: Mock, create_connection: Mock):
+        monkeypatch.setattr("streamlink.session.http.urllib3_util_connection.allowed_gai_family", Mock(return_value=AF_INET))
+        sock = Mock()
+        create_connection.side_effect = [OSError("1"), sock]
+        dnscache = DNSCache(ttl=10.0)
+
+        assert dnscache.create_connection(("host", 80), 5.0, socket_options=None) is sock
+        assert create_connection.call_args_list == [
+            call(("1.1.1.1", 80), 5.0, socket_options=None),
+            call(("2.2.2.2", 80), 5.0, socket_options=None),
+        ]
+
+        # failed connections to all addresses remove the cached addresses
+        create_connection.side_effect = OSError("2")
+        with pytest.raises(OSError, match=r"^2$"):
+            dnscache.create_connection(("host", 80))
+        assert len(getaddrinfo.call_args_list) == 1
+
+        create_connection.side_effect = None
+        dnscache.create_connection(("host", 80))
+        assert len(getaddrinfo.call_args_list) == 2
+
 
 class TestHTTPCookies:
     def test_invalid_file(self, tmp_path: Path):
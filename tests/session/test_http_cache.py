@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock, call
+
+import freezegun
+import pytest
+from requests import Request, Response
+
+from streamlink.exceptions import PluginError
+from streamlink.session.http import HTTPSession
+from streamlink.session.http_cache import HTTPResponseCache
+
+
+if TYPE_CHECKING:
+    import requests_mock as rm
+
+
+def response(headers: dict[str, str] | None = None, content: bytes = b"content") -> Response:
+    res = Response()
+    res.url = "https://host/path"
+    res.status_code = 200
+    res.reason = "OK"
+    res.headers.update(headers or {})
+    res.encoding = "utf-8"
+    res._content = content
+
+    return res
+
+
+@pytest.fixture()
+def storage(monkeypatch: pytest.MonkeyPatch):
+    mock_cache = Mock(return_value=Mock(get=Mock(return_value=None)))
+    monkeypatch.setattr("streamlink.session.http_cache.Cache", mock_cache)
+
+    return mock_cache
+
+
+class TestHTTPResponseCache:
+    def test_get_key(self):
+        def key(*args, **kwargs):
+            return HTTPResponseCache.get_key(Request(*args, **kwargs).prepare())
+
+        assert key("GET", "https://host/path") == key("GET", "https://host/path")
+        assert key("GET", "https://host/path", params={"a": "b"}) == key("GET", "https://host/path?a=b")
+        assert key("GET", "https://host/path") != key("POST", "https://host/path")
+        assert key("GET", "https://host/path") != key("GET", "https://host/other")
+        assert key("POST", "https://host/path", data={"a": "b"}) != key("POST", "https://host/path", data={"a": "c"})
+        assert key("POST", "https://host/path", json={"a": "b"}) == key("POST", "https://host/path", json={"a": "b"})
+
+        assert key("GET", "https://host/path", headers={"User-Agent": "foo"}) == key("GET", "https://host/path")
+        assert key("GET", "https://host/path", headers={"Authorization": "a"}) != key("GET", "https://host/path")
+        assert key("GET", "https://host/path", headers={"Authorization": "a"}) != key(
+            "GET",
+            "https://host/path",
+            headers={"Authorization": "b"},
+        )
+        assert key("GET", "https://host/path", headers={"X-Api-Key": "a"}) != key("GET", "https://host/path")
+        assert key("GET", "https://host/path", cookies={"a": "b"}) != key("GET", "https://host/path")
+        assert key("GET", "https://host/path", auth=("user", "pass")) != key("GET", "https://host/path")
+
+    @pytest.mark.parametrize(
+        ("ttl", "headers", "expected"),
+        [
+            pytest.param(60, {"Cache-Control": "no-store"}, 60.0, id="fixed-ttl"),
+            pytest.param(-1, {}, 0.0, id="fixed-ttl-negative"),
+            pytest.param(True, {}, 0.0, id="no-headers"),
+            pytest.param(True, {"Cache-Control": "public, max-age=300"}, 300.0, id="max-age"),
+            pytest.param(True, {"Cache-Control": "max-age=300", "Age": "100"}, 200.0, id="max-age-age"),
+            pytest.param(True, {"Cache-Control": 'max-age="300"'}, 300.0, id="max-age-quoted"),
+            pytest.param(True, {"Cache-Control": "max-age=foo"}, 0.0, id="max-age-invalid"),
+            pytest.param(True, {"Cache-Control": "no-cache, max-age=300"}, 0.0, id="no-cache"),
+            pytest.param(True, {"Cache-Control": "no-store, max-age=300"}, 0.0, id="no-store"),
+            pytest.param(
+                True,
+                {"Cache-Control": "max-age=300", "Expires": "Sat, 01 Jan 2000 01:00:00 GMT"},
+                300.0,
+                id="max-age-precedence",
+            ),
+            pytest.param(
+                True,
+                {"Date": "Sat, 01 Jan 2000 00:00:00 GMT", "Expires": "Sat, 01 Jan 2000 00:10:00 GMT"},
+                600.0,
+                id="expires-date",
+            ),
+            pytest.param(True, {"Expires": "Sat, 01 Jan 2000 00:01:00 GMT"}, 60.0, id="expires"),
+            pytest.param(True, {"Expires": "Fri, 31 Dec 1999 23:59:00 GMT"}, 0.0, id="expires-past"),
+            pytest.param(True, {"Expires": "0"}, 0.0, id="expires-invalid"),
+        ],
+    )
+    def test_get_ttl(self, ttl: bool | float, headers: dict, expected: float):
+        with freezegun.freeze_time("2000-01-01T00:00:00Z"):
+            assert HTTPResponseCache.get_ttl(response(headers), ttl) == pytest.approx(expected)
+
+    def test_memory(self):
+        cache = HTTPResponseCache(maxsize=2)
+        with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+            cache.set("uncacheable", response(), ttl=True)
+            assert cache.get("uncacheable") is None
+
+            cache.set("key", response({"Foo": "Bar"}), ttl=60)
+            res = cache.get("key")
+            assert res is not None
+            assert res is not cache.get("key")
+            assert res.url == "https://host/path"
+            assert res.status_code == 200
+            assert res.reason == "OK"
+            assert res.headers["foo"] == "Bar"
+            assert res.encoding == "utf-8"
+            assert res.content == b"content"
+            assert res.text == "content"
+
+            frozen_time.tick(60)
+            assert cache.get("key") is None
+
+            cache.set("a", response(), ttl=60)
+            cache.set("b", response(), ttl=60)
+            cache.set("c", response(), ttl=60)
+            assert cache.get("a") is None
+            assert cache.get("b") is not None
+            assert cache.get("c") is not None
+
+    def test_storage(self, storage: Mock):
+        cache = HTTPResponseCache(filename="responses.json")
+        assert storage.call_args_list == [call(filename="responses.json", key_prefix="response")]
+
+        cache.set("key", response(), ttl=60)
+        assert storage.return_value.set.call_args_list == [
+            call(
+                "key",
+                {
+                    "url": "https://host/path",
+                    "status_code": 200,
+                    "reason": "OK",
+                    "headers": [],
+                    "encoding": "utf-8",
+                    "content": "Y29udGVudA==",
+                },
+                expires=60.0,
+            ),
+        ]
+
+        # restored from storage in a new cache instance
+        storage.return_value.get.return_value = storage.return_value.set.call_args_list[0].args[1]
+        res = HTTPResponseCache(filename="responses.json").get("key")
+        assert res is not None
+        assert res.content == b"content"
+
+
+class TestHTTPSessionResponseCache:
+    def test_request(self, requests_mock: rm.Mocker):
+        session = HTTPSession()
+        mock = requests_mock.get("https://host/path", [{"text": "one"}, {"text": "two"}, {"text": "three"}])
+
+        assert session.get("https://host/path", cache=60).text == "one"
+        assert session.get("https://host/path", params={"foo": "bar"}, cache=60).text == "two"
+        assert session.get("https://host/path", cache=60).text == "one"
+        assert session.get("https://host/path", params={"foo": "bar"}, cache=60).text == "two"
+        assert session.get("https://host/path", stream=True, cache=60).text == "three"
+        assert session.get("https://host/path").text == "three"
+        assert mock.call_count == 4
+
+    def test_request_errors(self, requests_mock: rm.Mocker):
+        session = HTTPSession()
+        mock = requests_mock.get("https://host/path", [{"status_code": 500}, {"text": "ok"}])
+
+        with pytest.raises(PluginError, match=r"500 Server Error"):
+            session.get("https://host/path", cache=60)
+        assert session.get("https://host/path", cache=60).text == "ok"
+        assert session.get("https://host/path", cache=60).text == "ok"
+        assert mock.call_count == 2
+
+    def test_request_credentials(self, requests_mock: rm.Mocker):
+        session = HTTPSession()
+        mock = requests_mock.get("https://host/path", [{"text": "one"}, {"text": "two"}, {"text": "three"}, {"text": "four"}])
+
+        assert session.get("https://host/path", headers={"Authorization": "Bearer a"}, cache=60).text == "one"
+        assert session.get("https://host/path", headers={"Authorization": "Bearer b"}, cache=60).text == "two"
+        assert session.get("https://host/path", headers={"Authorization": "Bearer a"}, cache=60).text == "one"
+        assert session.get("https://host/path", cookies={"session": "a"}, cache=60).text == "three"
+        session.cookies.set("session", "b")
+        assert session.get("https://host/path", cache=60).text == "four"
+        assert session.get("https://host/path", cookies={"session": "a"}, cache=60).text == "three"
+        assert mock.call_count == 4
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"raise_for_status": False}, id="raise_for_status"),
+            pytest.param({"acceptable_status": [404]}, id="acceptable_status"),
+        ],
+    )
+    def test_request_error_status(self, requests_mock: rm.Mocker, kwargs: dict):
+        session = HTTPSession()
+        mock = requests_mock.get(
+            "https://host/path",
+            [
+                {"status_code": 404, "text": "not found", "headers": {"Cache-Control": "max-age=60"}},
+                {"text": "ok"},
+            ],
+        )
+
+        res = session.get("https://host/path", cache=True, **kwargs)
+        assert res.status_code == 404
+        assert res.text == "not found"
+        assert session.get("https://host/path", cache=60, **kwargs).text == "ok"
+        assert session.get("https://host/path", cache=60, **kwargs).text == "ok"
+        assert mock.call_count == 2
+
+    def test_request_headers(self, requests_mock: rm.Mocker):
+        session = HTTPSession()
+        mock = requests_mock.get(
+            "https://host/path",
+            [
+                {"text": "one", "headers": {"Cache-Control": "no-cache"}},
+                {"text": "two", "headers": {"Cache-Control": "max-age=60"}},
+                {"text": "three"},
+            ],
+        )
+
+        assert session.get("https://host/path", cache=True).text == "one"
+        assert session.get("https://host/path", cache=True).text == "two"
+        assert session.get("https://host/path", cache=True).text == "two"
+        assert mock.call_count == 2
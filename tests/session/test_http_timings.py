@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+from unittest.mock import ANY, Mock, call
+
+import freezegun
+import pytest
+import requests
+import urllib3
+from urllib3.connection import HTTPConnection
+
+from streamlink.session.http import DNSCache, HTTPSession
+from streamlink.session.http_timings import (
+    HTTPTimings,
+    HTTPTimingsAggregator,
+    HTTPTimingsJSONSink,
+    HTTPTimingsLogSink,
+    HTTPTimingsRecorder,
+    record_timing,
+)
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import requests_mock as rm
+
+
+def timings(purpose: str = "api", url: str = "https://host/path", **kwargs) -> HTTPTimings:
+    return HTTPTimings(
+        **{
+            "purpose": purpose,
+            "method": "GET",
+            "url": url,
+            "status_code": 200,
+            "dns": None,
+            "connect": None,
+            "tls": None,
+            "ttfb": 0.1,
+            "transfer": 0.2,
+            "total": 0.3,
+            **kwargs,
+        },
+    )
+
+
+@pytest.fixture()
+def frozen_time():
+    with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+        yield frozen_time
+
+
+class TestHTTPTimingsRecorder:
+    def test_record_timing(self, frozen_time: freezegun.api.FrozenDateTimeFactory):
+        sink = Mock()
+
+        with record_timing("dns"):
+            frozen_time.tick(1)
+
+        with HTTPTimingsRecorder([sink], "key", "get", "https://host/path"):
+            assert HTTPTimingsRecorder.current() is not None
+            with record_timing("tls"):
+                frozen_time.tick(0.5)
+            with record_timing("tls"):
+                frozen_time.tick(0.25)
+            frozen_time.tick(0.25)
+
+        assert HTTPTimingsRecorder.current() is None
+        assert sink.call_args_list == [
+            call(
+                HTTPTimings(
+                    purpose="key",
+                    method="GET",
+                    url="https://host/path",
+                    status_code=None,
+                    dns=None,
+                    connect=None,
+                    tls=pytest.approx(0.75),
+                    ttfb=None,
+                    transfer=None,
+                    total=pytest.approx(1.0),
+                ),
+            ),
+        ]
+
+    def test_no_sinks(self):
+        with HTTPTimingsRecorder([], "api", "GET", "https://host/path"):
+            assert HTTPTimingsRecorder.current() is None
+
+    def test_error(self):
+        sink = Mock()
+        with pytest.raises(ValueError, match=r"^failure$"):
+            with HTTPTimingsRecorder([sink], "api", "GET", "https://host/path"):
+                raise ValueError("failure")
+
+        assert sink.call_args_list == [call(timings(status_code=None, ttfb=None, transfer=None, total=ANY, error="failure"))]
+
+    def test_connection_hooks(self, monkeypatch: pytest.MonkeyPatch, frozen_time: freezegun.api.FrozenDateTimeFactory):
+        dnscache = DNSCache(ttl=60.0)
+
+        def new_conn(conn):
+            dnscache.getaddrinfo("host", 443, 0)
+            frozen_time.tick(0.2)
+
+        monkeypatch.setattr("socket.getaddrinfo", Mock(side_effect=lambda *_: frozen_time.tick(0.1)))
+        monkeypatch.setattr("streamlink.session.http._original_new_conn", Mock(side_effect=new_conn))
+        monkeypatch.setattr(
+            "streamlink.session.http._original_ssl_wrap_socket_and_match_hostname",
+            Mock(side_effect=lambda *_, **__: frozen_time.tick(0.3)),
+        )
+
+        sink = Mock()
+        with HTTPTimingsRecorder([sink], "segment", "GET", "https://host/path"):
+            HTTPConnection("host")._new_conn()
+            urllib3.connection._ssl_wrap_socket_and_match_hostname()
+            # cached addresses
+            HTTPConnection("host")._new_conn()
+
+        assert sink.call_args_list == [
+            call(
+                timings(
+                    purpose="segment",
+                    status_code=None,
+                    dns=pytest.approx(0.1),
+                    connect=pytest.approx(0.4),
+                    tls=pytest.approx(0.3),
+                    ttfb=None,
+                    transfer=None,
+                    total=pytest.approx(0.8),
+                ),
+            ),
+        ]
+
+
+class TestHTTPSessionTimings:
+    def test_request(self, requests_mock: rm.Mocker):
+        session = HTTPSession()
+        sink = Mock()
+        session.timings_sinks.append(sink)
+        requests_mock.get("https://host/path", [{"exc": requests.exceptions.ConnectTimeout("timeout")}, {"text": "ok"}])
+
+        res = session.get("https://host/path", purpose="playlist", retries=1, retry_backoff=0, retry_max_backoff=0)
+        assert res.text == "ok"
+        assert session.get("https://host/path", stream=True).text == "ok"
+        assert sink.call_args_list == [
+            call(timings("playlist", status_code=None, ttfb=None, transfer=None, total=ANY, error="timeout")),
+            call(timings("playlist", ttfb=ANY, transfer=ANY, total=ANY)),
+            call(timings("api", ttfb=ANY, transfer=None, total=ANY)),
+        ]
+
+
+class TestSinks:
+    def test_log(self, caplog: pytest.LogCaptureFixture):
+        caplog.set_level("debug", "streamlink")
+        sink = HTTPTimingsLogSink()
+        sink(timings())
+        sink(timings(status_code=None, dns=0.001, connect=0.0125, tls=0.05, ttfb=None, transfer=None, error="timeout"))
+        assert [(record.name, record.levelname, record.message) for record in caplog.records] == [
+            (
+                "streamlink.session.http_timings",
+                "debug",
+                "GET https://host/path (api, 200): dns=-, connect=-, tls=-, ttfb=100.0ms, transfer=200.0ms, total=300.0ms",
+            ),
+            (
+                "streamlink.session.http_timings",
+                "debug",
+                "GET https://host/path (api, timeout): "
+                + "dns=1.0ms, connect=12.5ms, tls=50.0ms, ttfb=-, transfer=-, total=300.0ms",
+            ),
+        ]
+
+    def test_json(self, tmp_path: Path, frozen_time: freezegun.api.FrozenDateTimeFactory):
+        file = tmp_path / "timings.jsonl"
+        sink = HTTPTimingsJSONSink(file)
+        sink(timings())
+        sink(timings("segment"))
+        assert [json.loads(line) for line in file.read_text().splitlines()] == [
+            {"time": 946684800.0, **timings()._asdict()},
+            {"time": 946684800.0, **timings("segment")._asdict()},
+        ]
+
+    def test_json_error(self, caplog: pytest.LogCaptureFixture, tmp_path: Path):
+        sink = HTTPTimingsJSONSink(tmp_path)
+        sink(timings())
+        assert [(record.name, record.levelname) for record in caplog.records] == [
+            ("streamlink.session.http_timings", "error"),
+        ]
+        assert caplog.records[0].message.startswith("Failed to write HTTP request timings: ")
+
+    def test_aggregator(self):
+        sink = HTTPTimingsAggregator()
+        sink(timings(connect=0.1, ttfb=0.1, total=0.4))
+        sink(timings(ttfb=0.3, total=0.2))
+        sink(timings("segment", url="https://cdn/segment", status_code=None, ttfb=None, transfer=None, error="timeout"))
+        assert sink.summary() == {
+            ("api", "host"): {
+                "requests": 2,
+                "errors": 0,
+                "dns": None,
+                "connect": (pytest.approx(0.1), pytest.approx(0.1)),
+                "tls": None,
+                "ttfb": (pytest.approx(0.2), pytest.approx(0.3)),
+                "transfer": (pytest.approx(0.2), pytest.approx(0.2)),
+                "total": (pytest.approx(0.3), pytest.approx(0.4)),
+            },
+            ("segment", "cdn"): {
+                "requests": 1,
+                "errors": 1,
+                "dns": None,
+                "connect": None,
+                "tls": None,
+                "ttfb": None,
+                "transfer": None,
+                "total": (pytest.approx(0.3), pytest.approx(0.3)),
+            },
+        }
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from inspect import currentframe, getframeinfo
+from pathlib import Path
 from socket import AF_INET, AF_INET6
 from unittest.mock import Mock, call
 
@@ -9,7 +10,10 @@ import pytest
 
 from streamlink.exceptions import StreamlinkDeprecationWarning
 from streamlink.session import Streamlink
+from streamlink.session.http import HTTPCircuitBreaker
+from streamlink.session.http_timings import HTTPTimingsJSONSink, HTTPTimingsLogSink
 from streamlink.session.options import StreamlinkOptions
+from streamlink.utils.ratelimit import TokenBucket
 
 
 class TestOptionsDocumentation:
@@ -181,6 +185,94 @@ def test_options_http_disable_dh(monkeypatch: pytest.MonkeyPatch, session: Strea
     assert not session.get_option("http-disable-dh")
 
 
+def test_options_http_dns_cache_ttl(monkeypatch: pytest.MonkeyPatch, session: Streamlink):
+    mock = Mock()
+    monkeypatch.setattr(session.http, "set_dns_cache", mock)
+
+    assert session.get_option("http-dns-cache-ttl") == 0.0  # ruff: ignore[float-equality-comparison]
+
+    session.set_option("http-dns-cache-ttl", 60.0)
+    assert mock.call_args_list.pop() == call(ttl=60.0)
+    assert session.get_option("http-dns-cache-ttl") == 60.0  # ruff: ignore[float-equality-comparison]
+
+    session.set_option("http-dns-cache-ttl", 0.0)
+    assert mock.call_args_list.pop() == call(ttl=0.0)
+
+
+def test_options_http_circuit_breaker(session: Streamlink):
+    assert session.http.circuit_breaker is None
+    assert not session.get_option("http-circuit-breaker")
+
+    session.set_option("http-circuit-breaker", True)
+    assert isinstance(session.http.circuit_breaker, HTTPCircuitBreaker)
+    assert session.get_option("http-circuit-breaker")
+
+    session.set_option("http-circuit-breaker", False)
+    assert session.http.circuit_breaker is None
+    assert not session.get_option("http-circuit-breaker")
+
+
+def test_options_http_response_cache_persistent(monkeypatch: pytest.MonkeyPatch, session: Streamlink):
+    mock_cache = Mock()
+    monkeypatch.setattr("streamlink.session.http_cache.Cache", mock_cache)
+
+    assert not session.get_option("http-response-cache-persistent")
+    response_cache = session.http.response_cache
+
+    session.set_option("http-response-cache-persistent", True)
+    assert session.http.response_cache is not response_cache
+    assert mock_cache.call_args_list == [call(filename="http-responses.json", key_prefix="response")]
+    assert session.get_option("http-response-cache-persistent")
+
+
+def test_options_http_timings(session: Streamlink):
+    assert session.http.timings_sinks == []
+
+    session.set_option("http-timings-log", True)
+    session.set_option("http-timings-log", True)
+    session.set_option("http-timings-file", "timings.jsonl")
+    sinks = session.http.timings_sinks
+    assert [type(sink) for sink in sinks] == [HTTPTimingsLogSink, HTTPTimingsJSONSink]
+    assert sinks[1].filename == Path("timings.jsonl")
+    assert session.get_option("http-timings-log")
+    assert session.get_option("http-timings-file") == "timings.jsonl"
+
+    session.set_option("http-timings-log", False)
+    session.set_option("http-timings-file", None)
+    assert session.http.timings_sinks == []
+
+
+def test_options_stream_bandwidth_limit(session: Streamlink):
+    assert session.http.bandwidth_limiter is None
+    assert session.get_option("stream-bandwidth-limit") == 0
+
+    session.set_option("stream-bandwidth-limit", 1024)
+    assert isinstance(session.http.bandwidth_limiter, TokenBucket)
+    assert session.http.bandwidth_limiter.rate == pytest.approx(1024.0)
+    assert session.get_option("stream-bandwidth-limit") == 1024
+
+    session.set_option("stream-bandwidth-limit", 0)
+    assert session.http.bandwidth_limiter is None
+    assert session.get_option("stream-bandwidth-limit") == 0
+
+
+@pytest.mark.parametrize(
+    ("threads", "expected"),
+    [
+        pytest.param(1, 10, id="default-minimum"),
+        pytest.param(4, 10, id="default-exact"),
+        pytest.param(10, 22, id="increased"),
+    ],
+)
+def test_options_stream_segment_threads(monkeypatch: pytest.MonkeyPatch, session: Streamlink, threads: int, expected: int):
+    mock = Mock()
+    monkeypatch.setattr(session.http, "set_pool_size", mock)
+
+    session.set_option("stream-segment-threads", threads)
+    assert mock.call_args_list == [call(expected)]
+    assert session.get_option("stream-segment-threads") == threads
+
+
 class TestOptionsHttpProxy:
     @pytest.fixture()
     def _no_deprecation(self, recwarn: pytest.WarningsRecorder):
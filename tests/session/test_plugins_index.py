@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import importlib
+import pkgutil
+import re
+from typing import TYPE_CHECKING
+
+import pytest
+
+import tests.plugins
+from streamlink.plugin.plugin import NO_PRIORITY, NORMAL_PRIORITY, Matcher, Matchers
+from streamlink.session.plugins import StreamlinkPlugins
+from streamlink.session.plugins_index import MatchersIndex, get_pattern_hosts
+from tests.plugins import PluginCanHandleUrl
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from streamlink.session import Streamlink
+
+
+@pytest.mark.parametrize(
+    ("pattern", "flags", "expected"),
+    [
+        pytest.param(r"https?://(?:www\.)?example\.com/", 0, {"example.com"}, id="optional-subdomain"),
+        pytest.param(r"^https://Example\.COM(?:/|$)", 0, {"example.com"}, id="lowercase"),
+        pytest.param(r"http://(?:[\w-]+\.)+example\.com(?:\?|#|$)", 0, {"example.com"}, id="subdomains"),
+        pytest.param(r"https?://(?:foo|bar)\.example\.com/", 0, {"example.com"}, id="subdomain-alternation"),
+        pytest.param(r"https?://(?:example\.com|(?:www\.)?example\.net)/", 0, {"example.com", "example.net"}, id="alternation"),
+        pytest.param(r"https?://example\.(?:com|net)/", 0, {"example.com", "example.net"}, id="tld-alternation"),
+        pytest.param(
+            r"""
+                https?://(?:www\.)?example\.com
+                /(?P<channel>\w+)
+            """,
+            re.VERBOSE,
+            {"example.com"},
+            id="verbose",
+        ),
+        pytest.param(r"https?://(?:www\.)?example\.com", 0, None, id="no-terminator"),
+        pytest.param(r"https?://(?:www\.)?example\.com/?", 0, None, id="optional-terminator"),
+        pytest.param(r"https?://(?:www\.)?example\.com:\d+/", 0, None, id="port"),
+        pytest.param(r"https?://[^/]+\.example\.com/", 0, None, id="negated-set"),
+        pytest.param(r"https?://.+example\.com/", 0, None, id="any"),
+        pytest.param(r"https?://(?:www)?example\.com/", 0, None, id="no-domain-boundary"),
+        pytest.param(r"https?://(?:clips\.example\.com|example\.net/clip)/", 0, None, id="terminator-in-alternation"),
+        pytest.param(r"https?://(?:(?!foo\.)\w+\.)?example\.com/", 0, None, id="lookahead"),
+        pytest.param(r"hls://(?P<url>\S+)", 0, None, id="other-scheme"),
+        pytest.param(r"(?P<url>[^/]+/\S+\.m3u8)", 0, None, id="no-scheme"),
+    ],
+)
+def test_get_pattern_hosts(pattern: str, flags: int, expected: set[str] | None):
+    hosts = get_pattern_hosts(pattern, flags)
+    assert hosts == (None if expected is None else frozenset(expected))
+
+
+class TestMatchersIndex:
+    @pytest.fixture()
+    def index(self):
+        return MatchersIndex([
+            ("foo", Matchers(Matcher(re.compile(r"https?://(?:www\.)?foo\.com/"), NORMAL_PRIORITY))),
+            ("bar", Matchers(Matcher(re.compile(r"https?://(?:[\w-]+\.)?bar\.foo\.com/"), NORMAL_PRIORITY))),
+            ("baz", Matchers(Matcher(re.compile(r"https?://baz\.com"), NORMAL_PRIORITY))),
+        ])
+
+    def test_index(self, index: MatchersIndex):
+        assert index.hosts == {"foo.com": [0], "bar.foo.com": [1]}
+        assert index.fallback == [2]
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            pytest.param("https://foo.com/", ["foo", "baz"], id="host"),
+            pytest.param("https://WWW.FOO.COM:443/", ["foo", "baz"], id="subdomain"),
+            pytest.param("https://a.bar.foo.com/", ["foo", "bar", "baz"], id="parent-domains"),
+            pytest.param("https://baz.com/", ["baz"], id="fallback"),
+            pytest.param("https://[invalid/", ["foo", "bar", "baz"], id="invalid-url"),
+            pytest.param("foo.com/path", ["foo", "bar", "baz"], id="no-host"),
+            pytest.param("https://fóo.com/", ["foo", "bar", "baz"], id="non-ascii"),
+        ],
+    )
+    def test_candidates(self, index: MatchersIndex, url: str, expected: list[str]):
+        assert [name for name, matcher in index.candidates(url)] == expected
+
+
+def _plugin_test_data() -> tuple[dict[str, Matchers], list[str]]:
+    matchers: dict[str, Matchers] = {}
+    urls: list[str] = []
+    for _finder, name, _ispkg in pkgutil.iter_modules(tests.plugins.__path__):
+        if not name.startswith("test_"):
+            continue
+        module = importlib.import_module(f"tests.plugins.{name}")
+        for obj in vars(module).values():
+            if isinstance(obj, type) and issubclass(obj, PluginCanHandleUrl) and obj is not PluginCanHandleUrl:
+                matchers[obj.__plugin__.__module__.split(".")[-1]] = obj.__plugin__.matchers
+                urls.extend(obj.urls_unnamed())
+                urls.extend(url for _name, url in obj.urls_named())
+                urls.extend(obj.urls_negative())
+
+    return matchers, urls
+
+
+def test_builtin_plugins_equivalence():
+    plugins = StreamlinkPlugins(builtin=False)
+    plugins._matchers, urls = _plugin_test_data()
+    assert len(urls) > 1000
+
+    def scan(items: Iterable[tuple[str, Matcher]], url: str) -> str | None:
+        match: str | None = None
+        priority = NO_PRIORITY
+        for name, matcher in items:
+            if matcher.priority > priority and matcher.pattern.match(url) is not None:
+                match = name
+                priority = matcher.priority
+
+        return match
+
+    index = plugins._get_index()
+    for url in urls:
+        for variant in url, url.upper(), url.replace("://", "://evil.com/"), url.replace("/", ".evil.com/", 3):
+            assert scan(index.candidates(variant), variant) == scan(index.entries, variant), variant
+
+
+def test_invalidation(session: Streamlink):
+    plugins = session.plugins
+    index = plugins._get_index()
+    assert plugins._get_index() is index
+
+    plugins._matchers["new"] = Matchers()
+    assert plugins._get_index() is not index
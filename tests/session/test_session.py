@@ -2,13 +2,14 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
+from threading import Barrier
 from typing import TYPE_CHECKING
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
 import pytest
 
 import tests.plugin
-from streamlink.exceptions import NoPluginError, StreamlinkDeprecationWarning
+from streamlink.exceptions import NoPluginError, PluginError, StreamlinkDeprecationWarning
 from streamlink.options import Options
 from streamlink.plugin import Plugin, pluginmatcher
 from streamlink.stream.hls import HLSStream
@@ -213,3 +214,129 @@ class TestStreams:
         assert "vod" in streams
         assert "vod_alt" in streams
         assert "vod_alt2" in streams
+
+
+class TestStreamsMany:
+    @pytest.fixture(autouse=True)
+    def _load_plugins(self, session: Streamlink):
+        session.plugins.load_path(PATH_TESTPLUGINS)
+
+    def test_streams_many(self, session: Streamlink):
+        urls = ["http://test.se/channel", "http://test.se/fromoptions", "http://invalid"]
+        options = Mock(return_value=Options({"streamurl": "http://foo/"}))
+        results = {result.url: result for result in session.streams_many(urls, options=options, stream_types=["hls", "http"])}
+        assert sorted(results) == sorted(urls)
+        assert options.call_args_list == [
+            call("testplugin", session.plugins["testplugin"]),
+            call("testplugin", session.plugins["testplugin"]),
+        ]
+
+        channel = results["http://test.se/channel"]
+        assert isinstance(channel.plugin, session.plugins["testplugin"])
+        assert channel.error is None
+        assert channel.streams
+        assert isinstance(channel.streams["480p"], HLSStream)
+
+        fromoptions = results["http://test.se/fromoptions"]
+        assert fromoptions.error is None
+        assert fromoptions.streams
+        assert fromoptions.streams["fromoptions"].url == "http://foo/"
+
+        invalid = results["http://invalid"]
+        assert invalid.plugin is None
+        assert invalid.streams is None
+        assert isinstance(invalid.error, NoPluginError)
+
+    def test_error(self, session: Streamlink):
+        @pluginmatcher(re.compile(r"https://error"))
+        class ErrorPlugin(Plugin):
+            def _get_streams(self):
+                raise PluginError("failure")
+
+        session.plugins.update({"error": ErrorPlugin})
+        result, *rest = session.streams_many(["https://error"], options=Options({"foo": "bar"}))
+        assert rest == []
+        assert isinstance(result.plugin, ErrorPlugin)
+        assert result.plugin.options.get("foo") == "bar"
+        assert result.streams is None
+        assert isinstance(result.error, PluginError)
+        assert str(result.error) == "failure"
+
+    @pytest.mark.parametrize("concurrency", [1, 3])
+    def test_concurrency(self, session: Streamlink, concurrency: int):
+        barrier = Barrier(concurrency, timeout=5)
+
+        @pluginmatcher(re.compile(r"https://concurrent/(?P<id>\d+)"))
+        class ConcurrentPlugin(Plugin):
+            def _get_streams(self):
+                # resolves once all workers are resolving at the same time, and raises if there are fewer workers
+                barrier.wait()
+                return {"live": HTTPStream(self.session, self.url)}
+
+        session.plugins.update({"concurrent": ConcurrentPlugin})
+        urls = [f"https://concurrent/{num}" for num in range(concurrency * 2)]
+        results = list(session.streams_many(urls, concurrency=concurrency))
+        assert sorted(result.url for result in results) == sorted(urls)
+        assert [result.error for result in results] == [None] * len(urls)
+
+    def test_isolated_state(self, session: Streamlink):
+        barrier = Barrier(2, timeout=5)
+        session.http.headers["User-Agent"] = "streamlink"
+        session.set_option("stream-segment-attempts", 4)
+
+        @pluginmatcher(re.compile(r"https://isolated/(?P<name>\w+)"))
+        class IsolatedPlugin(Plugin):
+            def _get_streams(self):
+                barrier.wait()
+                if self.match["name"] == "a":
+                    self.session.http.headers.update({"Authorization": "secret-a", "Referer": "https://isolated/a"})
+                    self.session.http.cookies.set("cookie", "a")
+                    self.session.set_option("http-query-params", {"a": "1"})
+                    self.session.set_option("stream-segment-attempts", 5)
+                # wait until plugin A has modified its session before plugin B creates its stream
+                barrier.wait()
+
+                return {"live": HTTPStream(self.session, self.url)}
+
+        session.plugins.update({"isolated": IsolatedPlugin})
+        results = {result.url: result for result in session.streams_many(["https://isolated/a", "https://isolated/b"])}
+        result_a = results["https://isolated/a"]
+        result_b = results["https://isolated/b"]
+        assert result_a.error is None
+        assert result_b.error is None
+
+        assert result_a.plugin.session is not session
+        assert result_b.plugin.session is not result_a.plugin.session
+        assert result_a.plugin.session.http is not session.http
+        assert result_b.plugin.session.http is not result_a.plugin.session.http
+        # connection pools are shared
+        assert result_a.plugin.session.http.adapters["https://"] is session.http.adapters["https://"]
+        assert result_b.plugin.session.http.adapters["https://"] is session.http.adapters["https://"]
+
+        json_a = result_a.streams["live"].__json__()
+        json_b = result_b.streams["live"].__json__()
+        assert json_a["url"] == "https://isolated/a?a=1"
+        assert json_a["headers"]["User-Agent"] == "streamlink"
+        assert json_a["headers"]["Authorization"] == "secret-a"
+        assert json_a["headers"]["Referer"] == "https://isolated/a"
+        assert json_a["headers"]["Cookie"] == "cookie=a"
+        assert json_b["url"] == "https://isolated/b"
+        assert json_b["headers"]["User-Agent"] == "streamlink"
+        assert "Authorization" not in json_b["headers"]
+        assert "Referer" not in json_b["headers"]
+        assert "Cookie" not in json_b["headers"]
+
+        assert result_a.plugin.session.get_option("stream-segment-attempts") == 5
+        assert result_b.plugin.session.get_option("stream-segment-attempts") == 4
+        assert result_b.plugin.session.get_option("http-query-params") == {}
+
+        # the original session remains unmodified
+        assert "Authorization" not in session.http.headers
+        assert "Referer" not in session.http.headers
+        assert not session.http.cookies
+        assert session.http.params == {}
+        assert session.get_option("stream-segment-attempts") == 4
+
+    def test_invalid_concurrency(self, session: Streamlink):
+        with pytest.raises(ValueError, match=r"^concurrency must be a positive integer$"):
+            next(session.streams_many([], concurrency=0))
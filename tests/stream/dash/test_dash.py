@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from contextlib import nullcontext
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 from unittest.mock import ANY, Mock, call
 
@@ -9,8 +9,8 @@ import freezegun
 import pytest
 from lxml.etree import ParseError
 
-from streamlink.exceptions import PluginError
-from streamlink.stream.dash import MPD, DASHSegment, DASHStream, DASHStreamWorker, MPDParsingError
+from streamlink.exceptions import PluginError, StreamError
+from streamlink.stream.dash import MPD, DASHSegment, DASHStream, DASHStreamWorker, DASHStreamWriter, MPDParsingError
 from streamlink.stream.dash.dash import log
 from streamlink.utils.parse import parse_xml as original_parse_xml
 from tests.resources import text, xml
@@ -447,6 +447,159 @@ class TestDASHStreamOpen:
         assert mock_reader_audio.open.call_count == 1
         assert muxer.call_args_list == [call(session, mock_reader_video, mock_reader_audio, copyts=True)]
 
+    @pytest.mark.parametrize(
+        ("session", "mime_type", "expected"),
+        [
+            pytest.param({"mux-fmp4": False}, "audio/mp4", False, id="disabled"),
+            pytest.param({"mux-fmp4": True}, "audio/mp4", True, id="enabled"),
+            pytest.param({"mux-fmp4": True}, "audio/webm", False, id="enabled-unsupported-mime-type"),
+        ],
+        indirect=["session"],
+    )
+    def test_stream_open_video_audio_fmp4(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        session: Streamlink,
+        muxer: Mock,
+        reader: Mock,
+        mime_type: str,
+        expected: bool,
+    ):
+        fmp4muxer = Mock()
+        monkeypatch.setattr("streamlink.stream.dash.dash.FMP4Muxer", fmp4muxer)
+
+        rep_video = Mock(ident=(None, None, "1"), mimeType="video/mp4")
+        rep_audio = Mock(ident=(None, None, "2"), mimeType=mime_type, lang="en")
+
+        mock_reader_video = Mock()
+        mock_reader_audio = Mock()
+        readers = {rep_video: mock_reader_video, rep_audio: mock_reader_audio}
+        reader.side_effect = lambda _stream, _representation, _timestamp, *_, **__: readers[_representation]
+
+        stream = DASHStream(session, Mock(), rep_video, rep_audio)
+        stream.open()
+
+        assert mock_reader_video.open.call_count == 1
+        assert mock_reader_audio.open.call_count == 1
+        if expected:
+            assert fmp4muxer.call_args_list == [call(session, mock_reader_video, mock_reader_audio)]
+            assert muxer.call_args_list == []
+        else:
+            assert fmp4muxer.call_args_list == []
+            assert muxer.call_args_list == [call(session, mock_reader_video, mock_reader_audio, copyts=True)]
+
+
+class TestDASHStreamWriter:
+    @pytest.fixture()
+    def stream(self, monkeypatch: pytest.MonkeyPatch, session: Streamlink):
+        monkeypatch.setattr(session.http, "get", Mock())
+
+        return DASHStream(session, Mock(), headers={"foo": "bar"}, params={"baz": "qux"})
+
+    @pytest.fixture()
+    def writer(self, session: Streamlink, stream: DASHStream):
+        reader = Mock(session=session, stream=stream, mime_type="video/mp4")
+        writer = DASHStreamWriter(reader)
+        yield writer
+        writer.executor.shutdown()
+
+    def test_fetch_request_args(self, session: Streamlink, stream: DASHStream, writer: DASHStreamWriter):
+        segments = [
+            DASHSegment(uri="http://test/init", num=-1, duration=0.0, init=True, byterange=(0, 100)),
+            DASHSegment(uri="http://test/segment1", num=1, duration=2.0, byterange=(100, None)),
+            DASHSegment(uri="http://test/segment2", num=2, duration=2.0),
+        ]
+        for segment in segments:
+            writer.fetch(segment)
+
+        assert session.http.get.call_args_list == [
+            call(
+                "http://test/init",
+                purpose="segment",
+                timeout=writer.timeout,
+                exception=ANY,
+                headers={"foo": "bar", "Range": "bytes=0-99"},
+                retries=writer.retries,
+                params={"baz": "qux"},
+            ),
+            call(
+                "http://test/segment1",
+                purpose="segment",
+                timeout=writer.timeout,
+                exception=ANY,
+                headers={"foo": "bar", "Range": "bytes=100-"},
+                retries=writer.retries,
+                params={"baz": "qux"},
+            ),
+            call(
+                "http://test/segment2",
+                purpose="segment",
+                timeout=writer.timeout,
+                exception=ANY,
+                headers={"foo": "bar"},
+                retries=writer.retries,
+                params={"baz": "qux"},
+            ),
+        ]
+        assert stream.args == {"headers": {"foo": "bar"}, "params": {"baz": "qux"}}
+
+    def test_fetch_mirrors(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        session: Streamlink,
+        writer: DASHStreamWriter,
+    ):
+        res_fast = Mock(elapsed=timedelta(seconds=0.1))
+        res_slow = Mock(elapsed=timedelta(seconds=0.5))
+        session.http.get.side_effect = [
+            StreamError("one"),
+            res_fast,
+            res_fast,
+            StreamError("two"),
+            res_slow,
+            StreamError("three"),
+            StreamError("four"),
+            StreamError("five"),
+        ]
+
+        def fetch(num: int):
+            segment = DASHSegment(
+                uri="http://one/segment",
+                mirrors=("http://two/segment", "http://three/segment"),
+                num=num,
+                duration=2.0,
+            )
+            return writer.fetch(segment)
+
+        # fails over to the next mirror
+        assert fetch(1) is res_fast
+        # steered to the fastest mirror
+        assert fetch(2) is res_fast
+        # fails over to the next fastest mirror
+        assert fetch(3) is res_slow
+        # fails over to the unhealthy origin last, with retries
+        assert fetch(4) is None
+
+        assert [(c.args[0], c.kwargs["retries"]) for c in session.http.get.call_args_list] == [
+            ("http://one/segment", 0),
+            ("http://two/segment", 0),
+            ("http://two/segment", 0),
+            ("http://two/segment", 0),
+            ("http://three/segment", 0),
+            ("http://two/segment", 0),
+            ("http://three/segment", 0),
+            ("http://one/segment", writer.retries),
+        ]
+        assert [
+            (record.name, record.levelname, record.message) for record in caplog.records if record.levelname != "debug"
+        ] == [
+            ("streamlink.stream.dash", "warning", "video/mp4 segment 1: failed (one), trying mirror http://two/segment"),
+            ("streamlink.stream.dash", "warning", "video/mp4 segment 3: failed (two), trying mirror http://three/segment"),
+            ("streamlink.stream.dash", "warning", "video/mp4 segment 4: failed (three), trying mirror http://three/segment"),
+            ("streamlink.stream.dash", "warning", "video/mp4 segment 4: failed (four), trying mirror http://one/segment"),
+            ("streamlink.stream.dash", "error", "video/mp4 segment 4: failed (five)"),
+        ]
+
 
 class TestDASHStreamWorker:
     @pytest.fixture()
@@ -515,6 +668,7 @@ class TestDASHStreamWorker:
             session=session,
             stream=stream,
             ident=(None, None, "1"),
+            period_start=stream.mpd.periods[0].availabilityStartTime,
             timestamp=timestamp,
         )
 
@@ -667,6 +821,129 @@ class TestDASHStreamWorker:
         assert mock_wait.call_args_list == [call(5)]
         assert worker._wait.is_set()
 
+    def test_period_transition(self, caplog: pytest.LogCaptureFixture, session: Streamlink):
+        caplog.set_level("INFO", "streamlink")
+
+        with freezegun.freeze_time("2000-01-01T00:00:50Z"):
+            with xml("dash/test_period_transition.mpd") as mpd_xml:
+                mpd = MPD(mpd_xml, base_url="http://test/", url="http://test/manifest.mpd")
+
+            reader = Mock(
+                session=session,
+                stream=DASHStream(session, mpd),
+                ident=("p0", "0", "video-1080"),
+                period_start=mpd.periods[0].availabilityStartTime,
+                mime_type="video/mp4",
+                timestamp=datetime.now(timezone.utc),
+            )
+            worker = DASHStreamWorker(reader)
+            segments = self._next_segments(worker, self._iter_segments(worker.iter_segments()), 12)
+
+        assert [segment.uri for segment in segments] == [
+            "http://test/video-1080/init.m4s",
+            *(f"http://test/video-1080/{num}.m4s" for num in range(23, 31)),
+            "http://test/ad-video-1080/init.m4s",
+            "http://test/ad-video-1080/1.m4s",
+            "http://test/ad-video-1080/2.m4s",
+        ]
+        assert reader.ident == ("p1", "0", "ad-video-1080")
+        assert [(record.name, record.levelname, record.message) for record in caplog.records] == [
+            (
+                "streamlink.stream.dash",
+                "info",
+                "video/mp4 period transition: ('p0', '0', 'video-1080') -> ('p1', '0', 'ad-video-1080')",
+            ),
+        ]
+
+    @pytest.mark.parametrize(
+        ("period_ids", "video", "audio"),
+        [
+            pytest.param(True, ("p0", "0", "video-1080"), ("p0", "1", "audio-en"), id="period-ids"),
+            pytest.param(False, (None, "0", "video-1080"), (None, "1", "audio-en"), id="no-period-ids"),
+        ],
+    )
+    def test_period_transition_live(self, session: Streamlink, period_ids: bool, video: tuple, audio: tuple):
+        with text("dash/test_period_transition.mpd") as fd:
+            manifest = fd.read()
+        if not period_ids:
+            manifest = manifest.replace(' id="p0"', "").replace(' id="p1"', "")
+
+        with freezegun.freeze_time("2000-01-01T00:00:56Z") as frozen_time:
+            mpd = MPD(original_parse_xml(manifest, ignore_ns=True), base_url="http://test/", url="http://test/manifest.mpd")
+            timestamp = datetime.now(timezone.utc)
+
+            workers = {}
+            segment_iters = {}
+            for ident in video, audio:
+                reader = Mock(
+                    session=session,
+                    stream=DASHStream(session, mpd),
+                    ident=ident,
+                    period_start=mpd.periods[0].availabilityStartTime,
+                    mime_type="video/mp4" if ident == video else "audio/mp4",
+                    timestamp=timestamp,
+                )
+                workers[ident] = DASHStreamWorker(reader)
+                segment_iters[ident] = self._iter_segments(workers[ident].iter_segments())
+
+            # the segments of the first period
+            segments = {ident: self._next_segments(workers[ident], segment_iters[ident], 6) for ident in (video, audio)}
+
+            # the workers reach the period transition after the second period has already started
+            frozen_time.tick(24)
+            for ident in video, audio:
+                segments[ident] += self._next_segments(workers[ident], segment_iters[ident], 4)
+
+        # both workers use the same timeline and start the new period at its first segment instead of its live edge
+        assert [segment.uri for segment in segments[video]] == [
+            "http://test/video-1080/init.m4s",
+            *(f"http://test/video-1080/{num}.m4s" for num in range(26, 31)),
+            "http://test/ad-video-1080/init.m4s",
+            *(f"http://test/ad-video-1080/{num}.m4s" for num in range(1, 4)),
+        ]
+        assert [segment.uri for segment in segments[audio]] == [
+            "http://test/audio-en/init.m4s",
+            *(f"http://test/audio-en/{num}.m4s" for num in range(26, 31)),
+            "http://test/ad-audio/init.m4s",
+            *(f"http://test/ad-audio/{num}.m4s" for num in range(1, 4)),
+        ]
+        assert [segment.available_at for segment in segments[video]] == [segment.available_at for segment in segments[audio]]
+        assert workers[video].reader.ident == (mpd.periods[1].id, "0", "ad-video-1080")
+        assert workers[video].reader.period_start == mpd.periods[1].availabilityStartTime
+        assert workers[audio].reader.ident == (mpd.periods[1].id, "1", "ad-audio")
+        assert workers[audio].reader.period_start == mpd.periods[1].availabilityStartTime
+
+    def test_period_transition_reload(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+        worker: DASHStreamWorker,
+        reader: Mock,
+        representation: Mock,
+        mpd: Mock,
+    ):
+        caplog.set_level("INFO", "streamlink")
+
+        new_representation = Mock(ident=("p1", "0", "1"))
+        new_representation.segments.return_value = [DASHSegment(uri="init_segment", num=-1, duration=0.0)]
+        new_mpd = Mock(get_representation=Mock(return_value=None))
+        monkeypatch.setattr("streamlink.stream.dash.dash.MPD", lambda *args, **kwargs: new_mpd)
+        mock_get_next = Mock(return_value=new_representation)
+        monkeypatch.setattr(worker, "get_next_period_representation", mock_get_next)
+        reader.mime_type = "video/mp4"
+
+        assert worker.reload()
+        assert worker.mpd is new_mpd
+        assert reader.ident == ("p1", "0", "1")
+        assert mock_get_next.call_args_list == [call(new_mpd, representation)]
+        assert [(record.name, record.levelname, record.message) for record in caplog.records] == [
+            (
+                "streamlink.stream.dash",
+                "info",
+                "video/mp4 period transition: (None, None, '1') -> ('p1', '0', '1')",
+            ),
+        ]
+
     @pytest.mark.parametrize(
         ("stream", "session"),
         [
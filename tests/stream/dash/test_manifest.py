@@ -8,8 +8,9 @@ from freezegun import freeze_time
 from lxml.etree import iselement
 
 from streamlink.stream.dash.manifest import MPD, DASHSegment, MPDParsers, MPDParsingError, Representation
+from streamlink.utils.parse import parse_xml
 from streamlink.utils.times import fromtimestamp
-from tests.resources import xml
+from tests.resources import text, xml
 
 
 EPOCH_START = fromtimestamp(0)
@@ -428,6 +429,16 @@ class TestMPDParser:
             ("http://test/video/1015000.mp4", 11, 1.0, datetime.datetime(2018, 1, 1, 13, 0, 5, tzinfo=UTC)),
         ]
 
+    def test_dynamic_timeline_timestamp(self):
+        with xml("dash/test_dynamic_timeline_continued_p1.mpd") as mpd_xml:
+            mpd = MPD(mpd_xml, base_url="http://test/", url="http://test/manifest.mpd")
+            # e.g. the start of a new period: include the segments before the suggestedPresentationDelay
+            representation = mpd.periods[0].adaptationSets[0].representations[0]
+            timestamp = datetime.datetime(2018, 1, 1, 12, 59, 53, tzinfo=UTC)
+            segments = [segment.num for segment in representation.segments(init=False, timestamp=timestamp)]
+
+        assert segments == [5, 6, 7, 8, 9, 10, 11]
+
     def test_tsegment_t_is_none_1895(self):
         """
         Verify the fix for https://github.com/streamlink/streamlink/issues/1895
@@ -700,6 +711,30 @@ class TestMPDParser:
             ],
         ]
 
+    def test_baseurl_mirrors(self):
+        with xml("dash/test_baseurl_mirrors.mpd") as mpd_xml:
+            mpd = MPD(mpd_xml, base_url="https://foo/", url="https://test/manifest.mpd")
+
+        video, audio = (adaptationset.representations[0] for adaptationset in mpd.periods[0].adaptationSets)
+        assert mpd.base_urls == ["https://cdn1/", "https://cdn2/"]
+        assert video.base_urls == ["https://cdn1/period/", "https://cdn2/period/"]
+        assert audio.base_urls == ["https://cdn3/audio/", "https://cdn1/period/audio/", "https://cdn2/period/audio/"]
+
+        assert [(segment.uri, segment.mirrors) for segment in itertools.islice(video.segments(), 2)] == [
+            ("https://cdn1/period/init_video.m4s", ("https://cdn2/period/init_video.m4s",)),
+            ("https://cdn1/period/media_video-1.m4s", ("https://cdn2/period/media_video-1.m4s",)),
+        ]
+        assert [(segment.uri, segment.mirrors) for segment in itertools.islice(audio.segments(), 2)] == [
+            (
+                "https://cdn3/audio/init_audio.m4s",
+                ("https://cdn1/period/audio/init_audio.m4s", "https://cdn2/period/audio/init_audio.m4s"),
+            ),
+            (
+                "https://cdn3/audio/media_audio-1.m4s",
+                ("https://cdn1/period/audio/media_audio-1.m4s", "https://cdn2/period/audio/media_audio-1.m4s"),
+            ),
+        ]
+
     @pytest.mark.parametrize(
         ("base_url", "node_base_url", "raises"),
         [
@@ -878,6 +913,52 @@ class TestMPDParser:
         assert getattr(mpd.get_representation(("period-0", None, "video1")), "mimeType", None) == "video/mp4"
         assert getattr(mpd.get_representation(("period-0", None, "video2")), "mimeType", None) == "video/mp4"
 
+    def test_get_equivalent_representation(self):
+        with xml("dash/test_period_transition.mpd") as mpd_xml:
+            mpd = MPD(mpd_xml, base_url="http://test/", url="http://test/manifest.mpd")
+
+        p0, p1 = mpd.periods
+
+        def get_equivalent(ident):
+            representation = mpd.get_representation(ident)
+            assert representation
+            equivalent = p1.get_equivalent_representation(representation)
+            return equivalent.ident if equivalent else None
+
+        assert get_equivalent(("p0", "0", "video-1080")) == ("p1", "0", "ad-video-1080")
+        assert get_equivalent(("p0", "0", "video-720")) == ("p1", "0", "ad-video-540")
+        assert get_equivalent(("p0", "1", "audio-en")) == ("p1", "1", "ad-audio")
+        assert get_equivalent(("p0", "2", "audio-de")) == ("p1", "1", "ad-audio")
+        assert p0.get_equivalent_representation(Mock(mimeType="text/vtt", lang=None)) is None
+
+    def test_period_without_id(self):
+        with text("dash/test_period_transition.mpd") as fd:
+            manifest = fd.read().replace(' id="p0"', "").replace(' id="p1"', "")
+        mpd = MPD(parse_xml(manifest, ignore_ns=True), base_url="http://test/", url="http://test/manifest.mpd")
+        other = MPD(parse_xml(manifest, ignore_ns=True), base_url="http://test/", url="http://test/manifest.mpd")
+
+        p0, p1 = mpd.periods
+        assert p0.is_same_period(other.periods[0])
+        assert p1.is_same_period(other.periods[1])
+        assert not p0.is_same_period(p1)
+
+        assert getattr(mpd.get_representation((None, "1", "ad-audio")), "period", None) is p1
+        assert getattr(mpd.get_representation((None, "0", "video-1080")), "period", None) is p0
+        assert (
+            getattr(mpd.get_representation((None, "0", "video-1080"), period_start=p0.availabilityStartTime), "period", None)
+            is p0
+        )
+        assert mpd.get_representation((None, "0", "video-1080"), period_start=p1.availabilityStartTime) is None
+
+    def test_start_number(self):
+        with xml("dash/test_period_transition.mpd") as mpd_xml:
+            mpd = MPD(mpd_xml, base_url="http://test/", url="http://test/manifest.mpd")
+        with xml("dash/test_dynamic_segment_list_p1.mpd") as mpd_xml:
+            mpd_segment_list = MPD(mpd_xml, base_url="http://test/", url="http://test/manifest.mpd")
+
+        assert mpd.periods[0].adaptationSets[0].representations[0].start_number == 1
+        assert mpd_segment_list.periods[0].adaptationSets[0].representations[0].start_number == 5
+
     def test_attribute_namespaces(self):
         with xml("dash/test_attribute_namespaces.mpd") as mpd_xml:
             mpd = MPD(mpd_xml, base_url="http://test/", url="http://test/manifest.mpd")
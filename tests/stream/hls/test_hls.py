@@ -3,10 +3,11 @@ from __future__ import annotations
 import itertools
 import logging
 import os
+import time
 import unittest
 from contextlib import nullcontext
 from datetime import datetime, timedelta, timezone
-from threading import Event
+from threading import Barrier, Event, Lock
 from typing import TYPE_CHECKING, NamedTuple
 from unittest.mock import Mock, call, patch
 
@@ -45,6 +46,10 @@ ONE_SECOND = timedelta(seconds=1.0)
 does_not_raise = nullcontext()
 
 
+def log_messages(method: Mock) -> list[str]:
+    return [args[0] % args[1:] for args, _kwargs in method.call_args_list]
+
+
 class EncryptedBase:
     content: bytes
     content_plain: bytes
@@ -150,6 +155,35 @@ class TestHLSVariantPlaylist:
         assert stream.multivariant is not None
         assert stream.multivariant.uri == f"{base}/multivariant.m3u8"
 
+    @pytest.mark.parametrize(
+        ("prewarm", "expected"),
+        [
+            pytest.param(False, [], id="disabled"),
+            pytest.param(
+                True,
+                [call("http://mocked/path/720p/playlist.m3u8", "http://mocked/path/1080p/playlist.m3u8")],
+                id="enabled",
+            ),
+        ],
+    )
+    def test_prewarm(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        requests_mock: rm.Mocker,
+        session: Streamlink,
+        prewarm: bool,
+        expected: list,
+    ):
+        mock_prewarm = Mock()
+        monkeypatch.setattr(session.http, "prewarm", mock_prewarm)
+        session.set_option("http-prewarm", prewarm)
+        with text("hls/test_simple_multivariant.m3u8") as fd:
+            requests_mock.get("http://mocked/path/multivariant.m3u8", text=fd.read())
+
+        streams = HLSStream.parse_variant_playlist(session, "http://mocked/path/multivariant.m3u8")
+        assert list(streams.keys()) == ["720p", "1080p (source)"]
+        assert mock_prewarm.call_args_list == expected
+
     @pytest.mark.parametrize("streams", [{"multivariant": "hls/test_multivariant_twitch_usher_v2.m3u8"}], indirect=True)
     def test_framerate(self, streams: dict[str, HLSStream]):
         assert sorted(streams.keys()) == ["1080p60", "160k", "160p", "360p", "480p", "720p60"]
@@ -232,6 +266,153 @@ class TestHLSVariantPlaylist:
     def test_check_streams(self, streams: dict[str, HLSStream], expected: list[str]):
         assert sorted(streams.keys()) == expected
 
+    @pytest.fixture()
+    def fetch_playlist(self, monkeypatch: pytest.MonkeyPatch, requests_mock: rm.Mocker):
+        with text("hls/test_simple_multivariant.m3u8") as fd:
+            requests_mock.get("http://mocked/path/multivariant.m3u8", text=fd.read())
+        with text("hls/test_simple_media.m3u8") as fd:
+            media_playlist = fd.read()
+            requests_mock.get("http://mocked/path/720p/playlist.m3u8", text=media_playlist)
+            requests_mock.get("http://mocked/path/1080p/playlist.m3u8", text=media_playlist)
+
+        # requests_mock serializes requests, so media playlist requests need to be intercepted beforehand
+        callback = Mock()
+        orig_fetch_playlist = HLSStream._fetch_playlist.__func__  # type: ignore[attr-defined]
+
+        def fetch_playlist(cls, session: Streamlink, url: str, **request_args):
+            if url != "http://mocked/path/multivariant.m3u8":
+                callback(url)
+            return orig_fetch_playlist(cls, session, url, **request_args)
+
+        monkeypatch.setattr(HLSStream, "_fetch_playlist", classmethod(fetch_playlist))
+
+        return callback
+
+    def test_check_streams_concurrent(self, session: Streamlink, fetch_playlist: Mock):
+        # both media playlist requests need to be made at the same time
+        barrier = Barrier(2, timeout=5)
+        fetch_playlist.side_effect = lambda _url: barrier.wait()
+
+        streams = HLSStream.parse_variant_playlist(session, "http://mocked/path/multivariant.m3u8", check_streams=True)
+        assert list(streams.keys()) == ["720p", "1080p (source)"]
+
+    def test_check_streams_max_workers(self, monkeypatch: pytest.MonkeyPatch, session: Streamlink, fetch_playlist: Mock):
+        monkeypatch.setattr(HLSStream, "CHECK_STREAMS_MAX_WORKERS", 1)
+        lock = Lock()
+        active = []
+        concurrency = []
+
+        def callback(_url):
+            with lock:
+                active.append(1)
+                concurrency.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+
+        fetch_playlist.side_effect = callback
+
+        streams = HLSStream.parse_variant_playlist(session, "http://mocked/path/multivariant.m3u8", check_streams=True)
+        assert list(streams.keys()) == ["720p", "1080p (source)"]
+        assert concurrency == [1, 1]
+
+    def test_check_streams_deadline(self, session: Streamlink, fetch_playlist: Mock):
+        session.set_option("http-timeout", 0.2)
+        event = Event()
+
+        def callback(url: str):
+            if url == "http://mocked/path/1080p/playlist.m3u8":
+                event.wait(5)
+
+        fetch_playlist.side_effect = callback
+
+        try:
+            streams = HLSStream.parse_variant_playlist(session, "http://mocked/path/multivariant.m3u8", check_streams=True)
+        finally:
+            event.set()
+        assert list(streams.keys()) == ["720p"]
+
+    @pytest.mark.parametrize(
+        ("failures", "expected_streams", "expected_requests"),
+        [
+            pytest.param(
+                set(),
+                ["720p", "720p_alt", "720p_alt2"],
+                [
+                    # concurrent checks in any order
+                    {"http://mocked/path/a.m3u8", "http://mocked/path/b.m3u8", "http://mocked/path/c.m3u8"},
+                ],
+                id="all-valid",
+            ),
+            pytest.param(
+                {"http://mocked/path/a.m3u8"},
+                ["720p", "720p_alt", "720p_alt2"],
+                [
+                    {"http://mocked/path/a.m3u8", "http://mocked/path/b.m3u8", "http://mocked/path/c.m3u8"},
+                    # the fourth stream doesn't get dropped anymore and gets checked on its own
+                    {"http://mocked/path/d.m3u8"},
+                ],
+                id="failure",
+            ),
+        ],
+    )
+    def test_check_streams_dropped(
+        self,
+        requests_mock: rm.Mocker,
+        session: Streamlink,
+        fetch_playlist: Mock,
+        failures: set[str],
+        expected_streams: list[str],
+        expected_requests: list[set[str]],
+    ):
+        requests_mock.get(
+            "http://mocked/path/multivariant.m3u8",
+            text="\n".join([
+                "#EXTM3U",
+                # streams without a name don't get checked
+                "#EXT-X-STREAM-INF:PROGRAM-ID=1",
+                "unnamed.m3u8",
+                *(
+                    line
+                    for uri in ("a.m3u8", "b.m3u8", "c.m3u8", "d.m3u8")
+                    for line in ("#EXT-X-STREAM-INF:PROGRAM-ID=1,RESOLUTION=1280x720", uri)
+                ),
+            ]),
+        )
+        with text("hls/test_simple_media.m3u8") as fd:
+            media_playlist = fd.read()
+        for uri in ("unnamed.m3u8", "a.m3u8", "b.m3u8", "c.m3u8", "d.m3u8"):
+            url = f"http://mocked/path/{uri}"
+            requests_mock.get(url, status_code=404 if url in failures else 200, text=media_playlist)
+
+        streams = HLSStream.parse_variant_playlist(session, "http://mocked/path/multivariant.m3u8", check_streams=True)
+        assert list(streams.keys()) == expected_streams
+
+        urls = [c.args[0] for c in fetch_playlist.call_args_list]
+        requests = []
+        for expected in expected_requests:
+            requests.append(set(urls[: len(expected)]))
+            urls = urls[len(expected) :]
+        assert requests == expected_requests
+        assert urls == []
+
+    def test_check_streams_no_retries(self, monkeypatch: pytest.MonkeyPatch, requests_mock: rm.Mocker, session: Streamlink):
+        with text("hls/test_simple_multivariant.m3u8") as fd:
+            requests_mock.get("http://mocked/path/multivariant.m3u8", text=fd.read())
+        requests_mock.get("http://mocked/path/720p/playlist.m3u8", status_code=500)
+        requests_mock.get("http://mocked/path/1080p/playlist.m3u8", status_code=500)
+        mock_get = Mock(wraps=session.http.get)
+        monkeypatch.setattr(session.http, "get", mock_get)
+
+        streams = HLSStream.parse_variant_playlist(session, "http://mocked/path/multivariant.m3u8", check_streams=True)
+        assert streams == {}
+        assert sorted((c.args[0], c.kwargs.get("retries")) for c in mock_get.call_args_list) == [
+            ("http://mocked/path/1080p/playlist.m3u8", 0),
+            ("http://mocked/path/720p/playlist.m3u8", 0),
+            ("http://mocked/path/multivariant.m3u8", None),
+        ]
+        assert requests_mock.call_count == 3
+
 
 class EventedWorkerHLSStreamReader(HLSStreamReader):
     __worker__ = EventedHLSStreamWorker
@@ -280,6 +461,23 @@ class TestHLSStream(TestMixinStreamHLS, unittest.TestCase):
 
         assert self.await_read(read_all=True) == self.content(segments), "Stream ends and read-all handshake doesn't time out"
 
+    def test_bandwidth_limit(self):
+        with patch("streamlink.utils.ratelimit.TokenBucket.consume", return_value=True) as mock_consume:
+            segments = self.subject(
+                [Playlist(0, [Segment(0), Segment(1)], end=True)],
+                options={"stream-bandwidth-limit": 1000, "stream-bandwidth-limit-per-stream": 100},
+            )
+            assert self.await_read(read_all=True) == self.content(segments)
+
+        writer = self.thread.reader.writer
+        assert [limiter.rate for limiter in writer._bandwidth_limiters] == [100.0, 1000.0]
+        assert writer._bandwidth_limiters[1] is self.session.http.bandwidth_limiter
+        assert mock_consume.call_args_list == [
+            call(len(segment.content), priority=False, abort=writer._wait)
+            for segment in segments.values()
+            for _limiter in range(2)
+        ]
+
     @patch("streamlink.stream.segmented.segmented.log")
     def test_duration(self, mock_log: Mock):
         segments = self.subject(
@@ -302,7 +500,7 @@ class TestHLSStream(TestMixinStreamHLS, unittest.TestCase):
         assert data == self.content(segments, cond=lambda s: 0 <= s.num < 3), "Respects the duration"
         assert all(self.called(s) for s in segments.values() if 0 <= s.num < 3), "Downloads first, second and third segment"
         assert not any(self.called(s) for s in segments.values() if s.num >= 3), "Skips other segments"
-        assert mock_log.info.call_args_list == [call("Stopping stream early after 5.00s")]
+        assert log_messages(mock_log.info) == ["Stopping stream early after 5.00s"]
 
     @patch("streamlink.stream.segmented.segmented.log")
     def test_offset_and_duration(self, mock_log: Mock):
@@ -326,7 +524,7 @@ class TestHLSStream(TestMixinStreamHLS, unittest.TestCase):
         assert data == self.content(segments, cond=lambda s: 0 < s.num < 3), "Respects the offset and duration"
         assert all(self.called(s) for s in segments.values() if 0 < s.num < 3), "Downloads second and third segment"
         assert not any(self.called(s) for s in segments.values() if 0 > s.num > 3), "Skips other segments"
-        assert mock_log.info.call_args_list == [call("Stopping stream early after 1.00s")]
+        assert log_messages(mock_log.info) == ["Stopping stream early after 1.00s"]
 
     def test_map(self):
         discontinuity = Tag("EXT-X-DISCONTINUITY")
@@ -380,9 +578,9 @@ class TestCheckSequenceGap(TestMixinStreamHLS, unittest.TestCase):
         data = self.await_read(read_all=True)
         assert data == self.content(segments)
         assert all(self.called(s) for s in segments.values())
-        assert mock_log.warning.call_args_list == [
-            call("Sequence gap of 1 segment at position 4. This is unsupported and will result in incoherent output data."),
-            call("Sequence gap of 1 segment at position 7. This is unsupported and will result in incoherent output data."),
+        assert log_messages(mock_log.warning) == [
+            "Sequence gap of 1 segment at position 4. This is unsupported and will result in incoherent output data.",
+            "Sequence gap of 1 segment at position 7. This is unsupported and will result in incoherent output data.",
         ]
 
     @patch("streamlink.stream.segmented.segmented.log")
@@ -397,9 +595,9 @@ class TestCheckSequenceGap(TestMixinStreamHLS, unittest.TestCase):
         data = self.await_read(read_all=True)
         assert data == self.content(segments)
         assert all(self.called(s) for s in segments.values())
-        assert mock_log.warning.call_args_list == [
-            call("Sequence gap of 2 segments at position 4. This is unsupported and will result in incoherent output data."),
-            call("Sequence gap of 2 segments at position 8. This is unsupported and will result in incoherent output data."),
+        assert log_messages(mock_log.warning) == [
+            "Sequence gap of 2 segments at position 4. This is unsupported and will result in incoherent output data.",
+            "Sequence gap of 2 segments at position 8. This is unsupported and will result in incoherent output data.",
         ]
 
 
@@ -480,7 +678,7 @@ class TestHLSStreamWorker(TestMixinStreamHLS, unittest.TestCase):
             self.await_read(read_all=True)
             self.await_close(1)
 
-            assert mock_log.warning.call_args_list == [call("No new segments for more than 15.00s. Stopping...")]
+            assert log_messages(mock_log.warning) == ["No new segments for more than 15.00s. Stopping..."]
 
     def test_queue_deadline_reached_ignored(self) -> None:
         segments = self.subject(
@@ -583,7 +781,7 @@ class TestHLSStreamWorker(TestMixinStreamHLS, unittest.TestCase):
             self.close()
             self.await_close()
 
-            assert mock_log.warning.call_args_list == [call("No new segments for more than 5.00s. Stopping...")]
+            assert log_messages(mock_log.warning) == ["No new segments for more than 5.00s. Stopping..."]
 
     def test_playlist_reload_offset(self) -> None:
         segments = self.subject(
@@ -884,8 +1082,8 @@ class TestHLSStreamByterange(TestMixinStreamHLS, unittest.TestCase):
         self.await_write(2 - 1)
         self.thread.close()
 
-        assert mock_log.error.call_args_list == [
-            call("Failed to fetch segment 0: Missing BYTERANGE offset"),
+        assert log_messages(mock_log.error) == [
+            "Failed to fetch segment 0: Missing BYTERANGE offset",
         ]
         assert not self.called(Segment(0))
 
@@ -908,8 +1106,8 @@ class TestHLSStreamByterange(TestMixinStreamHLS, unittest.TestCase):
         self.await_write(3 - 1)
         self.thread.close()
 
-        assert mock_log.error.call_args_list == [
-            call("Failed to fetch map for segment 1: Missing BYTERANGE offset"),
+        assert log_messages(mock_log.error) == [
+            "Failed to fetch map for segment 1: Missing BYTERANGE offset",
         ]
         assert not self.called(map1)
 
@@ -933,8 +1131,8 @@ class TestHLSStreamByterange(TestMixinStreamHLS, unittest.TestCase):
         self.await_write(4 - 1)
         self.thread.close()
 
-        assert mock_log.error.call_args_list == [
-            call("Failed to fetch segment 2: Missing BYTERANGE offset"),
+        assert log_messages(mock_log.error) == [
+            "Failed to fetch segment 2: Missing BYTERANGE offset",
         ]
         assert self.mocks[self.url(Segment(0))].last_request._request.headers["Range"] == "bytes=0-2"
         assert not self.called(Segment(2))
@@ -977,6 +1175,31 @@ class TestHLSStreamByterange(TestMixinStreamHLS, unittest.TestCase):
         assert self.mocks[self.url(s4)].last_request._request.headers["Range"] == "bytes=13-29"
         assert self.mocks[self.url(s5)].last_request._request.headers["Range"] == "bytes=30-48"
 
+    def test_request_headers(self):
+        s1, s2 = Segment(0), Segment(1)
+        self.subject(
+            [
+                Playlist(
+                    0,
+                    [
+                        Tag("EXT-X-BYTERANGE", "5@3"),
+                        s1,
+                        s2,
+                    ],
+                    end=True,
+                ),
+            ],
+            streamoptions={"headers": {"foo": "bar"}},
+        )
+
+        self.await_write(2)
+        self.await_read(read_all=True)
+        assert self.mocks[self.url(s1)].last_request._request.headers["foo"] == "bar"
+        assert self.mocks[self.url(s1)].last_request._request.headers["Range"] == "bytes=3-7"
+        assert self.mocks[self.url(s2)].last_request._request.headers["foo"] == "bar"
+        assert "Range" not in self.mocks[self.url(s2)].last_request._request.headers
+        assert self.thread.reader.request_params["headers"] == {"foo": "bar"}
+
 
 @patch("streamlink.stream.hls.hls.HLSStreamWorker.wait", Mock(return_value=True))
 class TestHLSStreamEncrypted(TestMixinStreamHLS, unittest.TestCase):
@@ -1021,8 +1244,8 @@ class TestHLSStreamEncrypted(TestMixinStreamHLS, unittest.TestCase):
         self.await_close()
 
         assert b"".join(self.thread.data) == b""
-        assert mock_log.error.mock_calls == [
-            call("Failed to create decryptor: Unable to decrypt cipher INVALID"),
+        assert log_messages(mock_log.error) == [
+            "Failed to create decryptor: Unable to decrypt cipher INVALID",
         ]
 
     @patch("streamlink.stream.hls.hls.log")
@@ -1038,8 +1261,8 @@ class TestHLSStreamEncrypted(TestMixinStreamHLS, unittest.TestCase):
         self.await_close()
 
         assert b"".join(self.thread.data) == b""
-        assert mock_log.error.mock_calls == [
-            call("Failed to create decryptor: Missing URI for decryption key"),
+        assert log_messages(mock_log.error) == [
+            "Failed to create decryptor: Missing URI for decryption key",
         ]
 
     @patch("streamlink.stream.hls.hls.log")
@@ -1055,8 +1278,8 @@ class TestHLSStreamEncrypted(TestMixinStreamHLS, unittest.TestCase):
         self.await_close()
 
         assert b"".join(self.thread.data) == b""
-        assert mock_log.error.mock_calls == [
-            call("Failed to create decryptor: Unable to find connection adapter for key URI: foo://bar/baz"),
+        assert log_messages(mock_log.error) == [
+            "Failed to create decryptor: Unable to find connection adapter for key URI: foo://bar/baz",
         ]
 
     def test_hls_encrypted_aes128(self):
@@ -1242,8 +1465,8 @@ class TestHLSStreamEncrypted(TestMixinStreamHLS, unittest.TestCase):
         self.await_close()
 
         assert data == self.content([segments[1]], prop="content_plain")
-        assert mock_log.error.mock_calls == [
-            call("Error while decrypting segment 0: Data must be padded to 16 byte boundary in CBC mode"),
+        assert log_messages(mock_log.error) == [
+            "Error while decrypting segment 0: Data must be padded to 16 byte boundary in CBC mode",
         ]
 
     @patch("streamlink.stream.hls.hls.log")
@@ -1270,7 +1493,7 @@ class TestHLSStreamEncrypted(TestMixinStreamHLS, unittest.TestCase):
         self.await_close()
 
         assert data == self.content([segments[1]], prop="content_plain")
-        assert mock_log.error.mock_calls == [call("Error while decrypting segment 0: Padding is incorrect.")]
+        assert log_messages(mock_log.error) == ["Error while decrypting segment 0: Padding is incorrect."]
 
     @patch("streamlink.stream.hls.hls.log")
     def test_hls_encrypted_aes128_incorrect_padding_content(self, mock_log: Mock):
@@ -1296,7 +1519,7 @@ class TestHLSStreamEncrypted(TestMixinStreamHLS, unittest.TestCase):
         self.await_close()
 
         assert data == self.content([segments[1]], prop="content_plain")
-        assert mock_log.error.mock_calls == [call("Error while decrypting segment 0: PKCS#7 padding is incorrect.")]
+        assert log_messages(mock_log.error) == ["Error while decrypting segment 0: PKCS#7 padding is incorrect."]
 
     def test_hls_encrypted_switch_methods(self):
         aesKey1, aesIv1, key_aes128_1 = self.gen_key()
@@ -1387,8 +1610,8 @@ class TestHlsInsecureSchemeMedia(TestMixinStreamHLS, unittest.TestCase):
         self.subject([Playlist(0, [Segment(0), FileSegment(1)], end=True)])
 
         assert self.await_read(read_all=True) == b"", "Rejects the entire playlist"
-        assert mock_log.error.call_args_list == [
-            call("Prevented access to insecure resource in playlist: base_scheme='http' scheme='file'"),
+        assert log_messages(mock_log.error) == [
+            "Prevented access to insecure resource in playlist: base_scheme='http' scheme='file'",
         ]
 
     @patch("streamlink.stream.hls.hls.log")
@@ -1397,8 +1620,8 @@ class TestHlsInsecureSchemeMedia(TestMixinStreamHLS, unittest.TestCase):
         self.subject([Playlist(0, [map0, Segment(0)], end=True)])
 
         assert self.await_read(read_all=True) == b"", "Rejects the entire playlist"
-        assert mock_log.error.call_args_list == [
-            call("Prevented access to insecure resource in playlist: base_scheme='http' scheme='file'"),
+        assert log_messages(mock_log.error) == [
+            "Prevented access to insecure resource in playlist: base_scheme='http' scheme='file'",
         ]
 
     @patch("streamlink.stream.hls.hls.log")
@@ -1407,8 +1630,8 @@ class TestHlsInsecureSchemeMedia(TestMixinStreamHLS, unittest.TestCase):
         self.subject([Playlist(0, [key, Segment(0)], end=True)])
 
         assert self.await_read(read_all=True) == b"", "Rejects the entire playlist"
-        assert mock_log.error.call_args_list == [
-            call("Prevented access to insecure resource in playlist: base_scheme='http' scheme='file'"),
+        assert log_messages(mock_log.error) == [
+            "Prevented access to insecure resource in playlist: base_scheme='http' scheme='file'",
         ]
 
     @patch("streamlink.stream.hls.hls.log")
@@ -1462,8 +1685,8 @@ class TestHlsInsecureSchemeMedia(TestMixinStreamHLS, unittest.TestCase):
         self.subject([SecurePlaylist(0, [InsecureSegment(0)], end=True)])
 
         assert self.await_read(read_all=True) == b"", "Rejects the entire playlist"
-        assert mock_log.error.call_args_list == [
-            call("Prevented access to insecure resource in playlist: base_scheme='https' scheme='http'"),
+        assert log_messages(mock_log.error) == [
+            "Prevented access to insecure resource in playlist: base_scheme='https' scheme='http'",
         ]
 
 
@@ -1647,8 +1870,8 @@ class TestHlsReloadTime(TestMixinStreamHLS, unittest.TestCase):
     def test_number_error(self, mock_log: Mock):
         time = self.subject([Playlist(0, self.segments, end=True, targetduration=4)], reload_time="foo")
         assert time == 4, "invalid number values set the reload time to the playlist's targetduration"
-        assert mock_log.error.call_args_list == [
-            call("Failed parsing hls-playlist-reload-time value: could not convert string to float: 'foo'"),
+        assert log_messages(mock_log.error) == [
+            "Failed parsing hls-playlist-reload-time value: could not convert string to float: 'foo'",
         ]
 
     def test_no_target_duration(self):
@@ -1680,7 +1903,7 @@ class TestHlsPlaylistParseErrors(TestMixinStreamHLS, unittest.TestCase):
         self.await_close()
         assert self.thread.reader.buffer.closed, "Closes the stream on initial playlist parsing error"
         assert mock_log.debug.mock_calls == [call("Reloading playlist")]
-        assert mock_log.error.mock_calls == [call("Missing #EXTM3U header")]
+        assert log_messages(mock_log.error) == ["Missing #EXTM3U header"]
 
     def test_reload(self, mock_log):
         segments = self.subject([
@@ -1694,9 +1917,9 @@ class TestHlsPlaylistParseErrors(TestMixinStreamHLS, unittest.TestCase):
         assert data == self.content(segments)
         self.close()
         self.await_close()
-        assert mock_log.warning.mock_calls == [
-            call("Reloading failed: Missing #EXTM3U header"),
-            call("Reloading failed: Missing #EXTM3U header"),
+        assert log_messages(mock_log.warning) == [
+            "Reloading failed: Missing #EXTM3U header",
+            "Reloading failed: Missing #EXTM3U header",
         ]
 
     @patch("streamlink.stream.hls.hls.parse_m3u8", Mock(return_value=FakePlaylist(is_master=True)))
@@ -1706,8 +1929,8 @@ class TestHlsPlaylistParseErrors(TestMixinStreamHLS, unittest.TestCase):
         self.await_close()
         assert self.thread.reader.buffer.closed, "Closes the stream on initial playlist parsing error"
         assert mock_log.debug.mock_calls == [call("Reloading playlist")]
-        assert mock_log.error.mock_calls == [
-            call(f"Attempted to play a variant playlist, use 'hls://{self.stream.url}' instead"),
+        assert log_messages(mock_log.error) == [
+            f"Attempted to play a variant playlist, use 'hls://{self.stream.url}' instead",
         ]
 
     @patch("streamlink.stream.hls.hls.parse_m3u8", Mock(return_value=FakePlaylist(iframes_only=True)))
@@ -1717,7 +1940,7 @@ class TestHlsPlaylistParseErrors(TestMixinStreamHLS, unittest.TestCase):
         self.await_close()
         assert self.thread.reader.buffer.closed, "Closes the stream on initial playlist parsing error"
         assert mock_log.debug.mock_calls == [call("Reloading playlist")]
-        assert mock_log.error.mock_calls == [call("Streams containing I-frames only are not playable")]
+        assert log_messages(mock_log.error) == ["Streams containing I-frames only are not playable"]
 
 
 class TestHlsExtAudio:
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import subprocess
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import Mock, call
 
 import pytest
 
 from streamlink.stream.ffmpegmux import FFMPEGMuxer, FFmpegVersionOutput
+from streamlink.utils.named_pipe import AnonymousPipePosix, NamedPipe
 
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from streamlink import Streamlink
 
 
@@ -21,6 +24,15 @@ def _resolve_command_cache_clear():
     FFMPEGMuxer._resolve_command.cache_clear()
 
 
+@pytest.fixture(autouse=True)
+def cache(monkeypatch: pytest.MonkeyPatch):
+    data = {}
+    cache = Mock(get=Mock(side_effect=data.get), set=Mock(side_effect=lambda key, value, **_: data.update({key: value})))
+    monkeypatch.setattr("streamlink.stream.ffmpegmux.Cache", Mock(return_value=cache))
+
+    return cache
+
+
 @pytest.fixture(autouse=True)
 def _logger(caplog: pytest.LogCaptureFixture):
     caplog.set_level(1, "streamlink")
@@ -186,6 +198,100 @@ class TestCommand:
             ("ffmpegmux", "warning", "Muxing streams is unsupported! Only a subset of the available streams can be returned!"),
         ]
 
+    def test_validate_cache(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+        tmp_path: Path,
+        session: Streamlink,
+        cache: Mock,
+    ):
+        session.options.update({"ffmpeg-no-validation": False})
+
+        class MyFFmpegVersionOutput(FFmpegVersionOutput):
+            def run(self, *_, **__):
+                self.onstdout(0, "ffmpeg version 0.0.0 suffix")
+                self.onstdout(1, "foo")
+                return True
+
+        executable = tmp_path / "ffmpeg"
+        executable.write_bytes(b"1")
+        mock_versionoutput = Mock(side_effect=MyFFmpegVersionOutput)
+        monkeypatch.setattr("streamlink.stream.ffmpegmux.which", Mock(return_value=str(executable)))
+        monkeypatch.setattr("streamlink.stream.ffmpegmux.FFmpegVersionOutput", mock_versionoutput)
+        stat = executable.stat()
+        key = f"{executable}:{stat.st_mtime_ns}:{stat.st_size}"
+
+        assert FFMPEGMuxer.command(session) == str(executable)
+        assert mock_versionoutput.call_count == 1
+        assert cache.set.call_args_list == [
+            call(key, {"version": "0.0.0", "output": ["ffmpeg version 0.0.0 suffix", "foo"]}, expires=60 * 60 * 24 * 30),
+        ]
+
+        caplog.records.clear()
+        FFMPEGMuxer._resolve_command.cache_clear()
+        FFMPEGMuxer.FFMPEG_VERSION = None
+        assert FFMPEGMuxer.command(session) == str(executable)
+        assert FFMPEGMuxer.FFMPEG_VERSION == "0.0.0"
+        assert mock_versionoutput.call_count == 1
+        assert [(record.module, record.levelname, record.message) for record in caplog.records] == [
+            ("ffmpegmux", "trace", f"Using cached FFmpeg version output of {executable}"),
+            ("ffmpegmux", "debug", "ffmpeg version 0.0.0 suffix"),
+            ("ffmpegmux", "debug", " foo"),
+        ]
+
+        # a changed executable invalidates the cached version output
+        caplog.records.clear()
+        FFMPEGMuxer._resolve_command.cache_clear()
+        executable.write_bytes(b"12")
+        assert FFMPEGMuxer.command(session) == str(executable)
+        assert mock_versionoutput.call_count == 2
+        assert cache.set.call_count == 2
+
+    @pytest.mark.parametrize(
+        "cached",
+        [
+            pytest.param("0.0.0", id="string"),
+            pytest.param({}, id="empty"),
+            pytest.param({"version": "0.0.0"}, id="missing-output"),
+            pytest.param({"output": ["ffmpeg version 0.0.0"]}, id="missing-version"),
+            pytest.param({"version": None, "output": []}, id="invalid-version"),
+            pytest.param({"version": "0.0.0", "output": "ffmpeg version 0.0.0"}, id="invalid-output"),
+            pytest.param({"version": "0.0.0", "output": [None]}, id="invalid-output-line"),
+        ],
+    )
+    def test_validate_cache_invalid(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        session: Streamlink,
+        cache: Mock,
+        cached: Any,
+    ):
+        session.options.update({"ffmpeg-no-validation": False})
+
+        class MyFFmpegVersionOutput(FFmpegVersionOutput):
+            def run(self, *_, **__):
+                self.onstdout(0, "ffmpeg version 1.2.3 suffix")
+                return True
+
+        executable = tmp_path / "ffmpeg"
+        executable.write_bytes(b"1")
+        mock_versionoutput = Mock(side_effect=MyFFmpegVersionOutput)
+        monkeypatch.setattr("streamlink.stream.ffmpegmux.which", Mock(return_value=str(executable)))
+        monkeypatch.setattr("streamlink.stream.ffmpegmux.FFmpegVersionOutput", mock_versionoutput)
+        stat = executable.stat()
+        key = f"{executable}:{stat.st_mtime_ns}:{stat.st_size}"
+        cache.set(key, cached)
+        cache.set.reset_mock()
+
+        assert FFMPEGMuxer.command(session) == str(executable)
+        assert FFMPEGMuxer.FFMPEG_VERSION == "1.2.3"
+        assert mock_versionoutput.call_count == 1
+        assert cache.set.call_args_list == [
+            call(key, {"version": "1.2.3", "output": ["ffmpeg version 1.2.3 suffix"]}, expires=60 * 60 * 24 * 30),
+        ]
+
 
 class TestFFmpegVersionOutput:
     @pytest.fixture()
@@ -646,3 +752,66 @@ class TestOpen:
 
         streamio.close()
         assert file.close.call_count == 1
+
+    @pytest.mark.linux_only()
+    def test_anonymous_pipes(self, session: Streamlink, popen: Mock):
+        streams = [Mock(read=Mock(return_value=b"")), Mock(read=Mock(return_value=b""))]
+        streamio = FFMPEGMuxer(session, *streams)
+        pipes = streamio.pipes
+        assert all(isinstance(pipe, AnonymousPipePosix) for pipe in pipes)
+        fds = [pipe.fd_read for pipe in pipes]
+
+        streamio.open()
+        assert popen.call_args_list == [
+            call(
+                [
+                    "ffmpeg",
+                    *self.FFMPEG_ARGS_DEFAULT_BASE,
+                    *self.FFMPEG_ARGS_DEFAULT_LOGLEVEL,
+                    *["-i", f"/dev/fd/{fds[0]}", "-i", f"/dev/fd/{fds[1]}"],
+                    *self.FFMPEG_ARGS_DEFAULT_CODECS,
+                    *self.FFMPEG_ARGS_DEFAULT_FORMAT,
+                    *self.FFMPEG_ARGS_DEFAULT_OUTPUT,
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                pass_fds=fds,
+            ),
+        ]
+        assert [pipe.fd_read for pipe in pipes] == [None, None]
+
+        streamio.close()
+        assert [pipe.fd_write for pipe in pipes] == [None, None]
+
+    @pytest.mark.posix_only()
+    def test_named_pipes(self, monkeypatch: pytest.MonkeyPatch, session: Streamlink, popen: Mock):
+        monkeypatch.setattr("streamlink.stream.ffmpegmux.AnonymousPipe", None)
+        streams = [Mock(read=Mock(return_value=b""))]
+        streamio = FFMPEGMuxer(session, *streams)
+        pipe = streamio.pipes[0]
+        assert isinstance(pipe, NamedPipe)
+
+        streamio.open()
+        assert popen.call_args_list == [
+            call(
+                [
+                    "ffmpeg",
+                    *self.FFMPEG_ARGS_DEFAULT_BASE,
+                    *self.FFMPEG_ARGS_DEFAULT_LOGLEVEL,
+                    *["-i", str(pipe.path)],
+                    *self.FFMPEG_ARGS_DEFAULT_CODECS,
+                    *self.FFMPEG_ARGS_DEFAULT_FORMAT,
+                    *self.FFMPEG_ARGS_DEFAULT_OUTPUT,
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            ),
+        ]
+
+        # read from the named pipe like ffmpeg, so that the copy thread can open it and terminate
+        with pipe.path.open("rb") as fd:
+            assert fd.read() == b""
+
+        streamio.close()
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import re
+import struct
+from io import BytesIO
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import freezegun
+import pytest
+
+from streamlink.stream.dash import MPD, DASHStream
+from streamlink.stream.fmp4mux import FMP4Muxer, iter_boxes
+from streamlink.stream.stream import StreamIO
+from tests.resources import xml
+
+
+if TYPE_CHECKING:
+    import requests_mock as rm
+
+    from streamlink import Streamlink
+
+
+def box(boxtype: bytes, *payload: bytes) -> bytes:
+    data = b"".join(payload)
+    return struct.pack(">I4s", 8 + len(data), boxtype) + data
+
+
+def fullbox(boxtype: bytes, version: int, *payload: bytes) -> bytes:
+    return box(boxtype, struct.pack(">B3x", version), *payload)
+
+
+def init(track_id: int, timescale: int, handler: bytes) -> bytes:
+    return b"".join([
+        box(b"ftyp", b"iso6", struct.pack(">I", 0), b"iso6dash"),
+        box(
+            b"moov",
+            fullbox(b"mvhd", 0, bytes(92), struct.pack(">I", track_id + 1)),
+            box(
+                b"trak",
+                fullbox(b"tkhd", 0, struct.pack(">III", 0, 0, track_id), bytes(68)),
+                box(
+                    b"mdia",
+                    fullbox(b"mdhd", 0, struct.pack(">III", 0, 0, timescale), bytes(8)),
+                    fullbox(b"hdlr", 0, bytes(4), handler, bytes(13)),
+                ),
+            ),
+            box(
+                b"mvex",
+                fullbox(b"trex", 0, struct.pack(">IIIII", track_id, 1, 0, 0, 0)),
+            ),
+        ),
+    ])
+
+
+def fragment(sequence: int, track_id: int, decode_time: int, data: bytes) -> bytes:
+    return b"".join([
+        box(b"styp", b"msdh", struct.pack(">I", 0)),
+        box(
+            b"moof",
+            fullbox(b"mfhd", 0, struct.pack(">I", sequence)),
+            box(
+                b"traf",
+                fullbox(b"tfhd", 0, struct.pack(">I", track_id)),
+                fullbox(b"tfdt", 1, struct.pack(">Q", decode_time)),
+            ),
+        ),
+        box(b"mdat", data),
+    ])
+
+
+class FakeStreamIO(StreamIO):
+    def __init__(self, data: bytes):
+        super().__init__()
+        self.data = BytesIO(data)
+
+    def read(self, size=-1):
+        # return small chunks, so that box data needs to be read in multiple calls
+        return self.data.read(min(size, 5))
+
+
+def parse(data: bytes) -> list:
+    def children(start, end):
+        items = []
+        for boxtype, _start, payload, box_end in iter_boxes(data, start, end):
+            if boxtype in (b"moov", b"trak", b"mdia", b"mvex", b"moof", b"traf"):
+                items.append((boxtype, children(payload, box_end)))
+            elif boxtype in (b"tkhd", b"trex", b"tfhd", b"mfhd"):
+                # version 0 boxes with the track_ID or sequence_number field at offset 12 or 4
+                offset = 12 if boxtype == b"tkhd" else 4
+                items.append((boxtype, struct.unpack_from(">I", data, payload + offset)[0]))
+            elif boxtype == b"mvhd":
+                items.append((boxtype, struct.unpack_from(">I", data, box_end - 4)[0]))
+            elif boxtype == b"mdat":
+                items.append((boxtype, data[payload:box_end]))
+            else:
+                items.append(boxtype)
+        return items
+
+    return children(0, len(data))
+
+
+@pytest.fixture()
+def session(session: Streamlink):
+    session.set_option("stream-timeout", 1)
+
+    return session
+
+
+def test_mux(session: Streamlink):
+    video = FakeStreamIO(
+        init(1, 90000, b"vide")
+        + fragment(1, 1, 0, b"video1")
+        + fragment(2, 1, 180000, b"video2")
+        + fragment(3, 1, 360000, b"video3"),
+    )
+    audio = FakeStreamIO(
+        init(1, 48000, b"soun") + fragment(7, 1, 48000, b"audio1") + fragment(8, 1, 144000, b"audio2"),
+    )
+
+    muxer = FMP4Muxer(session, video, audio).open()
+    output = b""
+    while data := muxer.read(8192):
+        output += data
+    muxer.close()
+
+    assert parse(output) == [
+        b"ftyp",
+        (
+            b"moov",
+            [
+                (b"mvhd", 3),
+                (b"trak", [(b"tkhd", 1), (b"mdia", [b"mdhd", b"hdlr"])]),
+                (b"trak", [(b"tkhd", 2), (b"mdia", [b"mdhd", b"hdlr"])]),
+                (b"mvex", [(b"trex", 1), (b"trex", 2)]),
+            ],
+        ),
+        (b"moof", [(b"mfhd", 1), (b"traf", [(b"tfhd", 1), b"tfdt"])]),
+        (b"mdat", b"video1"),
+        (b"moof", [(b"mfhd", 2), (b"traf", [(b"tfhd", 2), b"tfdt"])]),
+        (b"mdat", b"audio1"),
+        (b"moof", [(b"mfhd", 3), (b"traf", [(b"tfhd", 1), b"tfdt"])]),
+        (b"mdat", b"video2"),
+        (b"moof", [(b"mfhd", 4), (b"traf", [(b"tfhd", 2), b"tfdt"])]),
+        (b"mdat", b"audio2"),
+        (b"moof", [(b"mfhd", 5), (b"traf", [(b"tfhd", 1), b"tfdt"])]),
+        (b"mdat", b"video3"),
+    ]
+
+
+def test_changed_init(caplog: pytest.LogCaptureFixture, session: Streamlink):
+    caplog.set_level(1, "streamlink")
+
+    # both substreams change their initialization section and reset their decode times, e.g. after a DASH period transition
+    video = FakeStreamIO(
+        init(1, 90000, b"vide")
+        + fragment(1, 1, 0, b"video1")
+        + fragment(2, 1, 180000, b"video2")
+        + init(2, 90000, b"vide")
+        + fragment(1, 2, 0, b"video3")
+        + fragment(2, 2, 180000, b"video4"),
+    )
+    audio = FakeStreamIO(
+        init(1, 48000, b"soun")
+        + fragment(1, 1, 48000, b"audio1")
+        + fragment(2, 1, 144000, b"audio2")
+        + init(3, 44100, b"soun")
+        + fragment(1, 3, 44100, b"audio3"),
+    )
+
+    muxer = FMP4Muxer(session, video, audio).open()
+    output = b""
+    while data := muxer.read(8192):
+        output += data
+    muxer.close()
+
+    moov = (
+        b"moov",
+        [
+            (b"mvhd", 3),
+            (b"trak", [(b"tkhd", 1), (b"mdia", [b"mdhd", b"hdlr"])]),
+            (b"trak", [(b"tkhd", 2), (b"mdia", [b"mdhd", b"hdlr"])]),
+            (b"mvex", [(b"trex", 1), (b"trex", 2)]),
+        ],
+    )
+    assert parse(output) == [
+        b"ftyp",
+        moov,
+        (b"moof", [(b"mfhd", 1), (b"traf", [(b"tfhd", 1), b"tfdt"])]),
+        (b"mdat", b"video1"),
+        (b"moof", [(b"mfhd", 2), (b"traf", [(b"tfhd", 2), b"tfdt"])]),
+        (b"mdat", b"audio1"),
+        (b"moof", [(b"mfhd", 3), (b"traf", [(b"tfhd", 1), b"tfdt"])]),
+        (b"mdat", b"video2"),
+        (b"moof", [(b"mfhd", 4), (b"traf", [(b"tfhd", 2), b"tfdt"])]),
+        (b"mdat", b"audio2"),
+        # all fragments of the previous initialization sections have been written: write the new merged one
+        b"ftyp",
+        moov,
+        (b"moof", [(b"mfhd", 5), (b"traf", [(b"tfhd", 1), b"tfdt"])]),
+        (b"mdat", b"video3"),
+        (b"moof", [(b"mfhd", 6), (b"traf", [(b"tfhd", 2), b"tfdt"])]),
+        (b"mdat", b"audio3"),
+        (b"moof", [(b"mfhd", 7), (b"traf", [(b"tfhd", 1), b"tfdt"])]),
+        (b"mdat", b"video4"),
+    ]
+    assert [
+        (record.name, record.levelname, record.message)
+        for record in caplog.records
+        if record.name == "streamlink.stream.fmp4mux" and record.levelname != "debug"
+    ] == [
+        ("streamlink.stream.fmp4mux", "info", "Encountered a changed initialization section in substream 0"),
+        ("streamlink.stream.fmp4mux", "info", "Encountered a changed initialization section in substream 1"),
+    ]
+    assert [track.timescales for track in muxer.tracks] == [{2: 90000}, {3: 44100}]
+
+
+@pytest.mark.parametrize(
+    ("video", "error"),
+    [
+        pytest.param(b"", "Missing initialization section in substream 0", id="missing-init"),
+        pytest.param(
+            init(1, 90000, b"vide")[:-4],
+            "Error while muxing fMP4 streams: Unexpected end of substream 0",
+            id="truncated",
+        ),
+    ],
+)
+def test_error(caplog: pytest.LogCaptureFixture, session: Streamlink, video: bytes, error: str):
+    muxer = FMP4Muxer(session, FakeStreamIO(video), FakeStreamIO(init(1, 48000, b"soun"))).open()
+    assert muxer.read(8192) == b""
+    muxer.close()
+
+    assert [(record.name, record.levelname, record.message) for record in caplog.records] == [
+        ("streamlink.stream.fmp4mux", "error", error),
+    ]
+
+
+def test_dash_period_transition(monkeypatch: pytest.MonkeyPatch, requests_mock: rm.Mocker, session: Streamlink):
+    session.set_option("mux-fmp4", True)
+    monkeypatch.setattr("streamlink.stream.dash.dash.DASHStreamWriter.wait", Mock(return_value=True))
+
+    inits = {
+        "video-1080": init(1, 90000, b"vide"),
+        "audio-en": init(1, 48000, b"soun"),
+        "ad-video-1080": init(2, 90000, b"vide"),
+        "ad-audio": init(3, 44100, b"soun"),
+    }
+    track_ids = {"video-1080": 1, "audio-en": 1, "ad-video-1080": 2, "ad-audio": 3}
+    timescales = {"video-1080": 90000, "audio-en": 48000, "ad-video-1080": 90000, "ad-audio": 44100}
+
+    def get_segment(request: rm.request._RequestObjectProxy, context: rm.response._Context) -> bytes:
+        rep, name = request.path.strip("/").split("/")
+        if name == "init.m4s":
+            return inits[rep]
+        num = int(name.removesuffix(".m4s"))
+        return fragment(num, track_ids[rep], (num - 1) * 2 * timescales[rep], f"{rep}/{num}".encode())
+
+    requests_mock.get(re.compile(r"http://test/.+\.m4s"), content=get_segment)
+
+    with freezegun.freeze_time("2000-01-01T00:00:56Z"):
+        with xml("dash/test_period_transition.mpd") as mpd_xml:
+            mpd = MPD(mpd_xml, base_url="http://test/", url="http://test/manifest.mpd")
+        stream = DASHStream(
+            session,
+            mpd,
+            mpd.get_representation(("p0", "0", "video-1080")),
+            mpd.get_representation(("p0", "1", "audio-en")),
+        )
+
+        streamio = stream.open()
+        assert isinstance(streamio, FMP4Muxer)
+        output = b""
+        try:
+            while output.count(b"ad-video-1080/2") == 0 and (data := streamio.read(8192)):
+                output += data
+        finally:
+            streamio.close()
+
+    items = parse(output)
+    # a new merged initialization section gets written between the last fragment of the first period
+    # and the first fragment of the second period
+    idx = items.index(b"ftyp", 1)
+    assert [item[1] for item in items[:idx] if isinstance(item, tuple) and item[0] == b"mdat"][-2:] == [
+        b"video-1080/30",
+        b"audio-en/30",
+    ]
+    assert items[idx + 1][0] == b"moov"
+    assert [item[1] for item in items[idx:] if isinstance(item, tuple) and item[0] == b"mdat"][:2] == [
+        b"ad-video-1080/1",
+        b"ad-audio/1",
+    ]
+    assert items.count(b"ftyp") == 2
@@ -1,5 +1,6 @@
 import pytest
 
+from streamlink.stream.segmented.mirrors import MirrorSelector, OriginStats
 from streamlink.stream.segmented.segment import Segment
 from streamlink.stream.segmented.segmented import log
 
@@ -38,3 +39,37 @@ def test_logger_name():
 def test_segment_serialization(data: dict, expected: str):
     segment = Segment(**data)
     assert repr(segment) == expected
+
+
+class TestMirrorSelector:
+    def test_order(self):
+        selector = MirrorSelector()
+        urls = ["https://a/segment", "https://b/segment", "https://c/segment", "https://d/segment"]
+        assert selector.order(urls) == urls
+
+        selector.record_success("https://b/other", 0.5)
+        selector.record_success("https://c/other", 0.2)
+        selector.record_failure("https://a/other")
+        assert selector.order(urls) == ["https://c/segment", "https://b/segment", "https://d/segment", "https://a/segment"]
+
+        # recovers after successful requests
+        selector.record_success("https://a/other", 0.1)
+        selector.record_success("https://a/other", 0.1)
+        assert selector.order(urls) == ["https://a/segment", "https://c/segment", "https://b/segment", "https://d/segment"]
+
+        # gets unhealthy after failed requests
+        selector.record_failure("https://c/other")
+        selector.record_failure("https://c/other")
+        assert selector.order(urls) == ["https://a/segment", "https://b/segment", "https://d/segment", "https://c/segment"]
+
+    def test_stats(self):
+        selector = MirrorSelector(smoothing=0.5)
+        assert selector.stats("https://host/path") is None
+
+        selector.record_success("https://host/one", 1.0)
+        assert selector.stats("https://host/path") == OriginStats(latency=1.0, error_rate=0.0)
+
+        selector.record_success("https://host/two", 2.0)
+        selector.record_failure("https://host/three")
+        assert selector.stats("https://host/path") == OriginStats(latency=1.5, error_rate=0.5)
+        assert selector.stats("http://host/path") is None
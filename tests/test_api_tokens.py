@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import freezegun
+import pytest
+
+from streamlink.cache import Cache
+from streamlink.plugin.api.tokens import CachedToken
+
+
+@pytest.fixture(autouse=True)
+def caplog(caplog: pytest.LogCaptureFixture):
+    caplog.set_level(1, "streamlink")
+    return caplog
+
+
+@pytest.fixture()
+def frozen_time():
+    with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+        yield frozen_time
+
+
+@pytest.fixture()
+def cache():
+    return Cache("cache.json", disabled=True)
+
+
+@pytest.fixture()
+def acquire(frozen_time: freezegun.api.FrozenDateTimeFactory):
+    tokens = iter(["token-1", "token-2", "token-3"])
+
+    def _acquire():
+        return next(tokens), frozen_time.time_to_freeze.timestamp() + 3600
+
+    return Mock(side_effect=_acquire)
+
+
+@pytest.fixture()
+def cached_token(cache: Cache, acquire: Mock):
+    cached_token = CachedToken(cache, "key", acquire, refresh_before=300, name="foo token")
+    yield cached_token
+    cached_token.wait()
+
+
+class TestCachedToken:
+    def test_get(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        frozen_time: freezegun.api.FrozenDateTimeFactory,
+        cache: Cache,
+        acquire: Mock,
+        cached_token: CachedToken,
+    ):
+        assert cached_token.get() == "token-1"
+        assert acquire.call_count == 1
+        assert cache.get("key") == {"token": "token-1", "expires": 946688400.0}
+
+        frozen_time.tick(3000)
+        assert cached_token.get() == "token-1"
+        cached_token.wait()
+        assert acquire.call_count == 1
+        assert cached_token._thread is None
+
+        # expires in less than 300s: refresh in the background and return the still valid token
+        frozen_time.tick(301)
+        assert cached_token.get() == "token-1"
+        cached_token.wait()
+        assert acquire.call_count == 2
+        assert cache.get("key") == {"token": "token-2", "expires": 946691701.0}
+        assert cached_token.get() == "token-2"
+
+        assert [(record.name, record.levelname, record.message) for record in caplog.records] == [
+            ("streamlink.plugin.api.tokens", "info", "Using cached foo token"),
+            ("streamlink.plugin.api.tokens", "info", "Using cached foo token"),
+            ("streamlink.plugin.api.tokens", "debug", "Refreshing foo token in the background"),
+            ("streamlink.plugin.api.tokens", "info", "Using cached foo token"),
+        ]
+
+    def test_expired(self, frozen_time: freezegun.api.FrozenDateTimeFactory, acquire: Mock, cached_token: CachedToken):
+        assert cached_token.get() == "token-1"
+        frozen_time.tick(3600)
+        assert cached_token.get() == "token-2"
+        assert acquire.call_count == 2
+        assert cached_token._thread is None
+
+    def test_refresh_if_expiring(
+        self,
+        frozen_time: freezegun.api.FrozenDateTimeFactory,
+        cache: Cache,
+        acquire: Mock,
+        cached_token: CachedToken,
+    ):
+        cached_token.refresh_if_expiring()
+        assert acquire.call_count == 0
+        assert cached_token._thread is None
+
+        assert cached_token.get() == "token-1"
+        cached_token.refresh_if_expiring()
+        assert cached_token._thread is None
+
+        frozen_time.tick(3301)
+        assert cached_token.get(background_refresh=False) == "token-1"
+        assert acquire.call_count == 1
+        assert cached_token._thread is None
+
+        cached_token.refresh_if_expiring()
+        cached_token.wait()
+        assert acquire.call_count == 2
+        assert cache.get("key") == {"token": "token-2", "expires": 946691701.0}
+
+    def test_refreshed_by_other_process(
+        self,
+        frozen_time: freezegun.api.FrozenDateTimeFactory,
+        cache: Cache,
+        acquire: Mock,
+        cached_token: CachedToken,
+    ):
+        assert cached_token.get() == "token-1"
+        frozen_time.tick(3400)
+        cache.set("key", {"token": "other", "expires": 946692000.0}, 3600)
+        cached_token._task_refresh()
+        assert acquire.call_count == 1
+        assert cached_token.get() == "other"
+
+    def test_purge(self, cache: Cache, acquire: Mock, cached_token: CachedToken):
+        assert cached_token.get() == "token-1"
+        cached_token.purge()
+        assert cache.get("key") is None
+        assert cached_token.get() == "token-2"
+        assert acquire.call_count == 2
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param(["device-id", "token"], id="list"),
+            pytest.param({"token": "token"}, id="no-expires"),
+            pytest.param({"token": "token", "expires": "123"}, id="invalid-expires"),
+        ],
+    )
+    def test_invalid_cache_data(self, cache: Cache, acquire: Mock, cached_token: CachedToken, value):
+        cache.set("key", value)
+        assert cached_token.get() == "token-1"
+        assert acquire.call_count == 1
+
+    def test_acquire_failure(self, caplog: pytest.LogCaptureFixture, cache: Cache, cached_token: CachedToken):
+        cached_token.acquire = Mock(return_value=None)
+        assert cached_token.get() is None
+        assert cache.get("key") is None
+
+        cache.set("key", {"token": "token", "expires": 946684800.0 + 100}, 100)
+        assert cached_token.get() == "token"
+        cached_token.wait()
+        assert cached_token.acquire.call_count == 2
+
+        cached_token.acquire = Mock(side_effect=ValueError("foo"))
+        cached_token._refresh_in_background()
+        cached_token.wait()
+        assert [(record.levelname, record.message) for record in caplog.records if record.levelname != "debug"] == [
+            ("info", "Using cached foo token"),
+            ("warning", "Failed refreshing foo token"),
+            ("error", "Failed refreshing foo token: foo"),
+        ]
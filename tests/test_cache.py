@@ -547,3 +547,113 @@ class TestIO:
             assert not cache.filename.exists()
 
         assert [(record.name, record.levelname, record.message) for record in caplog.records] == []
+
+
+class TestSQLiteStorage:
+    @pytest.fixture()
+    def sqlite_cache(self, cache_dir: Path):
+        cache = Cache("cache.json", storage="sqlite")
+        assert cache._sqlite
+        assert cache._sqlite.filename == cache_dir / "cache.sqlite3"
+        yield cache
+        cache._sqlite.close()
+
+    def test_getter_setter(self, sqlite_cache: Cache, cache_dir: Path):
+        assert sqlite_cache.get("missing-value") is None
+        assert sqlite_cache.get("missing-value", default="default") == "default"
+        assert not (cache_dir / "cache.json").exists()
+        assert (cache_dir / "cache.sqlite3").exists()
+
+        sqlite_cache.set("value", {"foo": ["bar"]})
+        sqlite_cache.set("value", {"foo": ["baz"]})
+        assert sqlite_cache.get("value") == {"foo": ["baz"]}
+        assert not sqlite_cache._cache
+        assert not sqlite_cache._dirty
+
+    def test_prefix(self, cache_dir: Path, sqlite_cache: Cache):
+        cache_prefixed = Cache("cache.json", key_prefix="test", storage="sqlite")
+        sqlite_cache.set("key", "unprefixed")
+        cache_prefixed.set("key", "prefixed")
+        cache_prefixed.set("other", "other")
+        assert sqlite_cache.get("key") == "unprefixed"
+        assert sqlite_cache.get("test:key") == "prefixed"
+        assert cache_prefixed.get("key") == "prefixed"
+        assert cache_prefixed.get_all() == {"key": "prefixed", "other": "other"}
+        assert sqlite_cache.get_all() == {"key": "unprefixed", "test:key": "prefixed", "test:other": "other"}
+
+    def test_expiration(self, sqlite_cache: Cache):
+        with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+            sqlite_cache.set("key", "value", expires=20)
+            sqlite_cache.set("past", "value", expires=-20)
+            sqlite_cache.set("overflow", "value", expires_at=Mock(timestamp=Mock(side_effect=OverflowError)))
+            assert sqlite_cache.get("key") == "value"
+            assert sqlite_cache.get("past") is None
+            assert sqlite_cache.get("overflow") is None
+            assert sqlite_cache.get_all() == {"key": "value"}
+
+            frozen_time.tick(timedelta(seconds=20))
+            assert sqlite_cache.get("key") is None
+            assert sqlite_cache.get_all() == {}
+
+            # expired entries get removed when writing
+            sqlite_cache.set("new", "value")
+            assert sqlite_cache._sqlite
+            rows = sqlite_cache._sqlite._connect().execute("SELECT key FROM cache").fetchall()
+            assert rows == [("new",)]
+
+    def test_concurrent_writers(self, sqlite_cache: Cache):
+        other = Cache("cache.json", storage="sqlite")
+        assert sqlite_cache.get("foo") is None
+        assert other.get("bar") is None
+
+        sqlite_cache.set("foo", "foo")
+        other.set("bar", "bar")
+        assert sqlite_cache.get_all() == {"foo": "foo", "bar": "bar"}
+        assert other.get_all() == {"foo": "foo", "bar": "bar"}
+
+    def test_migrate(self, cache_dir: Path):
+        with freezegun.freeze_time("2000-01-01T00:00:00Z"):
+            (cache_dir / "cache.json").write_text(
+                json.dumps({
+                    "foo": {"value": "foo", "expires": 946684801},
+                    "bar": {"value": "bar", "expires": 946684799},
+                    "invalid": "invalid",
+                }),
+            )
+            cache = Cache("cache.json", storage="sqlite")
+            assert cache.get_all() == {"foo": "foo"}
+
+            # only import the JSON file's entries when creating the database
+            cache.set("foo", "new")
+            assert cache._sqlite
+            cache._sqlite.close()
+            cache = Cache("cache.json", storage="sqlite")
+            assert cache.get_all() == {"foo": "new"}
+
+    def test_disabled(self, cache_dir: Path):
+        cache = Cache("cache.json", disabled=True, storage="sqlite")
+        assert cache._sqlite is None
+        cache.set("foo", "bar")
+        assert cache.get("foo") == "bar"
+        assert not (cache_dir / "cache.sqlite3").exists()
+
+    def test_error(self, caplog: pytest.LogCaptureFixture, cache_dir: Path):
+        (cache_dir / "cache.sqlite3").mkdir()
+        cache = Cache("cache.json", storage="sqlite")
+        assert cache.get("foo", "default") == "default"
+        assert cache.get_all() == {}
+        cache.set("foo", "bar")
+        records = [record for record in caplog.records if record.levelname != "trace"]
+        assert [(record.name, record.levelname, record.message) for record in records] == [
+            (
+                "streamlink.cache",
+                "warning",
+                "Failed reading from cache database, continuing without cache: unable to open database file",
+            ),
+            (
+                "streamlink.cache",
+                "warning",
+                "Failed reading from cache database, continuing without cache: unable to open database file",
+            ),
+            ("streamlink.cache", "error", "Error while writing to cache database: unable to open database file"),
+        ]
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from typing import NamedTuple
+
+import pytest
+
+
+# Modules which are slow to import and which are not required by short-lived invocations,
+# e.g. `streamlink --can-handle-url URL`, or `streamlink --json URL` with plugins that don't use them
+LAZY_MODULES = (
+    "Crypto",
+    "Cryptodome",
+    "isodate",
+    "lxml",
+    "trio",
+    "trio_websocket",
+    "websocket",
+    "streamlink.plugin.api.websocket",
+    "streamlink.webbrowser",
+)
+
+# The maximum self-time of a single module of the streamlink and streamlink_cli packages, in microseconds.
+# The budget is generous in order to not fail on slow CI runners and is supposed to catch expensive module-level code.
+BUDGET_MODULE = 50_000
+
+# Modules which are excluded from the budget
+BUDGET_IGNORE = (
+    # gets the version string from git in editable installs
+    "streamlink._version",
+)
+
+_re_importtime = re.compile(r"^import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\|(?P<indent>\s+)(?P<name>\S+)$")
+
+
+class ImportTime(NamedTuple):
+    name: str
+    self: int
+    cumulative: int
+
+
+def importtime(code: str) -> list[ImportTime]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    return [
+        ImportTime(match["name"], int(match["self"]), int(match["cumulative"]))
+        for match in map(_re_importtime.match, proc.stderr.splitlines())
+        if match
+    ]
+
+
+def is_module(name: str, modules: tuple[str, ...]) -> bool:
+    return any(name == module or name.startswith(f"{module}.") for module in modules)
+
+
+@pytest.fixture(scope="module", params=[
+    pytest.param("import streamlink_cli.main", id="cli"),
+    pytest.param(
+        "from streamlink import Streamlink; Streamlink(plugins_builtin=False)",
+        id="session",
+    ),
+    pytest.param(
+        "import streamlink.stream.hls, streamlink.stream.http, streamlink.plugin.api.validate",
+        id="streams",
+    ),
+])  # fmt: skip
+def imports(request: pytest.FixtureRequest) -> list[ImportTime]:
+    # compile bytecode first
+    importtime(request.param)
+
+    return importtime(request.param)
+
+
+def test_lazy_imports(imports: list[ImportTime]):
+    assert imports
+    assert [item.name for item in imports if is_module(item.name, LAZY_MODULES)] == []
+
+
+def test_budget(imports: list[ImportTime]):
+    assert [
+        (item.name, item.self)
+        for item in imports
+        if is_module(item.name, ("streamlink", "streamlink_cli"))
+        and not is_module(item.name, BUDGET_IGNORE)
+        and item.self > BUDGET_MODULE
+    ] == []
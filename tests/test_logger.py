@@ -67,8 +67,9 @@ def log(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch, output:
     logger.capturewarnings(False)
 
     if handler:
-        handler.close()
-        fakeroot.removeHandler(handler)
+        for roothandler in list(fakeroot.handlers):
+            roothandler.close()
+            fakeroot.removeHandler(roothandler)
     assert not fakeroot.handlers
 
 
@@ -255,6 +256,11 @@ class TestLogging:
         assert list(log.iter(level, iterator())) == ["foo", "bar"]
         assert getvalue(output) == expected
 
+    def test_iter_disabled(self, log: StreamlinkLogger):
+        iterator = iter(["foo", "bar"])
+        log.setLevel(logger.INFO)
+        assert log.iter(logger.DEBUG, iterator) is iterator
+
     @pytest.mark.parametrize(
         "log",
         [
@@ -380,6 +386,35 @@ class TestLogging:
         assert not out
         assert not err
 
+    @pytest.mark.parametrize("log", [{"queue": True}], indirect=True)
+    def test_queue(self, log: StreamlinkLogger, output: TextIOWrapper):
+        assert len(log.handlers) == 1
+        queuehandler = log.handlers[0]
+        assert isinstance(queuehandler, logger.QueueHandler)
+        assert queuehandler.listener is not None
+
+        log.setLevel("info")
+        items = ["foo"]
+        log.info("items: %r", items)
+        items.append("bar")
+        log.debug("debug")
+        try:
+            raise ValueError("error")
+        except ValueError:
+            log.exception("failure")
+
+        queuehandler.close()
+        assert queuehandler.listener is None
+        queuehandler.close()
+
+        lines = getvalue(output).splitlines()
+        assert lines[:3] == [
+            "[test][info] items: ['foo']",
+            "[test][error] failure",
+            "Traceback (most recent call last):",
+        ]
+        assert lines[-1] == "ValueError: error"
+
     def test_logfile(self, logfile: Path, log: StreamlinkLogger, output: TextIOWrapper):
         log.setLevel("info")
         log.info("Hello world, Γειά σου Κόσμε, こんにちは世界")  # ruff: ignore[ambiguous-unicode-character-string]
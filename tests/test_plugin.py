@@ -94,7 +94,9 @@ class TestPlugin:
         assert isinstance(plugin.logger, StreamlinkLogger)
         assert plugin.logger.name == logger
 
-        assert mock_cache.call_args_list == [call(filename="plugin-cache.json", key_prefix=module, disabled=False)]
+        assert mock_cache.call_args_list == [
+            call(filename="plugin-cache.json", key_prefix=module, disabled=False, storage="json"),
+        ]
         assert plugin.cache == mock_cache()
 
         assert mock_load_cookies.call_args_list == [call()]
@@ -122,6 +124,19 @@ class TestPlugin:
         plugin = FakePlugin(session, "https://mocked")
         assert plugin.cache._disabled is expected
 
+    @pytest.mark.parametrize(
+        ("session", "expected"),
+        [
+            pytest.param({}, False, id="default"),
+            pytest.param({"plugin-cache-storage": "json"}, False, id="json"),
+            pytest.param({"plugin-cache-storage": "sqlite"}, True, id="sqlite"),
+        ],
+        indirect=["session"],
+    )
+    def test_cache_storage(self, session: Streamlink, expected: bool):
+        plugin = FakePlugin(session, "https://mocked")
+        assert (plugin.cache._sqlite is not None) is expected
+
 
 class TestPluginMatcher:
     # noinspection PyUnusedLocal
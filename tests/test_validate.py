@@ -3,7 +3,7 @@ from textwrap import dedent
 from typing import Any
 
 import pytest
-from lxml.etree import Element, tostring as etree_tostring
+from lxml.etree import Element, iselement, tostring as etree_tostring
 
 import streamlink.validate as validate
 from streamlink.exceptions import PluginError
@@ -11,6 +11,9 @@ from streamlink.exceptions import PluginError
 # noinspection PyProtectedMember
 from streamlink.validate._exception import ValidationError  # ruff: ignore[import-private-name]
 
+# noinspection PyProtectedMember
+from streamlink.validate._validate import compile_schema  # ruff: ignore[import-private-name]
+
 
 def assert_validationerror(exception: Exception, expected: str, regex: bool = False):
     exceptionstr = str(exception)
@@ -1628,6 +1631,150 @@ class TestParseQsdValidator:
         )
 
 
+class TestCompile:
+    class Obj:
+        def __init__(self, **kwargs):
+            self.__dict__.update(kwargs)
+
+    @staticmethod
+    def _result(schema, value):
+        try:
+            result = schema(value)
+        except Exception as err:
+            return type(err), str(err)
+        if isinstance(result, re.Match):
+            return re.Match, result.group(0)
+        if isinstance(result, TestCompile.Obj):
+            return TestCompile.Obj, result.__dict__
+        if iselement(result):
+            return Element, etree_tostring(result)
+        return result
+
+    @pytest.mark.parametrize(
+        ("schema", "values"),
+        [
+            pytest.param("foo", ["foo", "bar"], id="equality"),
+            pytest.param(int, [1, "1", True], id="type"),
+            pytest.param([int, str], [[1, "2"], [1, None], (1,), []], id="list"),
+            pytest.param((int,), [(1, 2), [1], ("1",)], id="tuple"),
+            pytest.param({"foo", 1}, [{"foo"}, {1, 2}], id="set"),
+            pytest.param(
+                {"foo": int, validate.optional("bar"): str, "baz": validate.any(None, [int])},
+                [
+                    {"foo": 1, "baz": None},
+                    {"foo": 1, "bar": "2", "baz": [3], "qux": 4},
+                    {"foo": 1, "bar": 2, "baz": None},
+                    {"bar": "2", "baz": None},
+                    {"foo": 1, "baz": ["3"]},
+                    None,
+                ],
+                id="dict",
+            ),
+            pytest.param(
+                {"foo": int, validate.transform(str.upper): validate.any(int, str)},
+                [{"foo": 1, "bar": "baz"}, {"foo": 1, "bar": None}, {"foo": 1, 2: 3}],
+                id="dict-keys",
+            ),
+            pytest.param(lambda value: value > 1, [2, 1], id="callable"),
+            pytest.param(re.compile(r"foo"), ["foo", "bar", b"foo", 1], id="pattern"),
+            pytest.param(
+                validate.all(str, validate.transform(str.upper), validate.transform(str.replace, "A", "B"), "BBC"),
+                ["abc", "abd", 1],
+                id="all",
+            ),
+            pytest.param(validate.all(), [1], id="all-empty"),
+            pytest.param(validate.any(int, str, validate.all(float, lambda v: v > 1)), [1, "1", 2.0, 0.0], id="any"),
+            pytest.param(validate.none_or_all(int, lambda v: v > 1), [None, 2, 1, "2"], id="none_or_all"),
+            pytest.param(validate.list(1, str), [[1, "2"], [2, 3], [1], (1, "2")], id="list-schema"),
+            pytest.param(validate.regex(re.compile(r"(\d+)")), ["a123b", "abc", b"123", 1], id="regex"),
+            pytest.param(validate.regex(re.compile(r"\d"), method="findall"), ["a1b2", "ab"], id="regex-findall"),
+            pytest.param(validate.transform(int), ["123", "foo"], id="transform"),
+            pytest.param(validate.transform("foo"), [1], id="transform-not-callable"),
+            pytest.param(validate.get("foo", default="bar"), [{"foo": 1}, {}, None], id="get"),
+            pytest.param(
+                validate.get(("foo", 0, "bar")),
+                [{"foo": [{"bar": 1}]}, {"foo": [{}]}, {"foo": []}, {"foo": None}],
+                id="get-nested",
+            ),
+            pytest.param(
+                validate.get(("foo", "bar"), strict=True),
+                [{("foo", "bar"): 1}, {"foo": {"bar": 1}}],
+                id="get-strict",
+            ),
+            pytest.param(
+                validate.union_get("foo", ("bar", "baz")),
+                [{"foo": 1, "bar": {"baz": 2}}, {"bar": 1}],
+                id="union_get",
+            ),
+            pytest.param(
+                validate.union({"foo": int, validate.optional("bar"): str}),
+                [1, "1", None],
+                id="union-dict",
+            ),
+            pytest.param(validate.union([int, validate.transform(str)]), [1, "1"], id="union-list"),
+            pytest.param(validate.union("foo"), [1], id="union-invalid"),
+            pytest.param(validate.attr({"foo": int}), [Obj(foo=1, bar=2), Obj(foo="1"), Obj(bar=2)], id="attr"),
+            pytest.param(
+                validate.xml_element(tag="foo", attrib={"bar": str}, text=validate.transform(str.upper)),
+                [Element("foo", {"bar": "baz"}), Element("foo", {"bar": "baz"}), Element("foo"), Element("bar"), None],
+                id="xml_element",
+            ),
+            pytest.param(
+                validate.all(validate.xml_find("./foo"), validate.get("bar")),
+                [Element("root"), None],
+                id="xml_find",
+            ),
+        ],
+    )
+    def test_equivalence(self, schema, values: list):
+        compiled = compile_schema(schema)
+        for value in values:
+            expected = self._result(lambda val: validate.validate(schema, val), value)
+            assert self._result(compiled, value) == expected, value
+
+    def test_xml_element_children(self):
+        root = Element("root")
+        root.append(Element("foo", {"bar": "baz"}))
+        schema = validate.all(validate.xml_find("./foo"), validate.get("bar"))
+        assert compile_schema(schema)(root) == "baz"
+
+    def test_custom_registration(self):
+        class CustomDict(dict):
+            pass
+
+        @validate.validate.register
+        def validate_customdict(schema: CustomDict, value):
+            return "custom"
+
+        schema = validate.any(CustomDict(foo=int))
+        assert validate.validate(schema, {}) == "custom"
+        assert compile_schema(schema)({}) == "custom"
+
+    def test_schema(self):
+        subschema = validate.Schema({"foo": str}, validate.get("foo"))
+        schema = validate.Schema(subschema, validate.transform(str.upper))
+        assert schema._compiled is None
+        assert schema.compile() is schema
+        compiled = schema._compiled
+        assert compiled is not None
+        assert schema.compile()._compiled is compiled
+        assert schema.validate({"foo": "bar"}) == "BAR"
+        with pytest.raises(PluginError) as cm:
+            schema.validate({"foo": 1}, name="data")
+        assert_validationerror(
+            cm.value,
+            """
+                Unable to validate data: ValidationError(dict):
+                  Unable to validate value of key 'foo'
+                  Context(type):
+                    Type of 1 should be str, but is int
+            """,
+        )
+
+        assert subschema.compile() is subschema
+        assert compile_schema(validate.all(subschema)) is subschema._compiled
+
+
 class TestValidationError:
     def test_subclass(self):
         assert issubclass(ValidationError, ValueError)
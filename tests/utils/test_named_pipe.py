@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import os
 import threading
 from typing import TYPE_CHECKING
 from unittest.mock import Mock, call
 
 import pytest
 
-from streamlink.utils.named_pipe import NamedPipe, NamedPipePosix, NamedPipeWindows
+from streamlink.utils.named_pipe import AnonymousPipePosix, NamedPipe, NamedPipePosix, NamedPipeWindows
 
 
 try:
@@ -14,6 +15,11 @@ try:
 except ImportError:
     pass
 
+try:
+    import fcntl
+except ImportError:
+    pass
+
 
 if TYPE_CHECKING:
     from streamlink.utils.named_pipe import NamedPipeBase
@@ -144,6 +150,59 @@ class TestNamedPipePosix:
         assert reader.data == b"foobar"
 
 
+@pytest.mark.posix_only()
+class TestAnonymousPipePosix:
+    def test_create(self):
+        pipe = AnonymousPipePosix()
+        assert pipe.fd_read is not None
+        assert pipe.fd_write is not None
+        assert str(pipe.path) == f"/dev/fd/{pipe.fd_read}"
+        assert not os.get_inheritable(pipe.fd_read)
+        pipe.close()
+        assert pipe.fd_read is None
+        assert pipe.fd_write is None
+        # closing twice doesn't raise
+        pipe.close()
+
+    @pytest.mark.linux_only()
+    def test_pipe_size(self):
+        pipe = AnonymousPipePosix()
+        assert fcntl.fcntl(pipe.fd_write, fcntl.F_GETPIPE_SZ) >= AnonymousPipePosix.pipe_size
+        pipe.close()
+
+    def test_anonymous_pipe(self):
+        pipe = AnonymousPipePosix()
+        data = b""
+
+        def read():
+            nonlocal data
+            while chunk := os.read(fd_read, 8192):
+                data += chunk
+
+        # simulate passing the read end to a child process
+        fd_read = os.dup(pipe.fd_read)  # type: ignore[arg-type]
+        pipe.close_read()
+        assert pipe.fd_read is None
+
+        reader = threading.Thread(target=read, daemon=True)
+        reader.start()
+        pipe.open()
+        assert pipe.write(b"foo" * 100000) == 300000
+        assert pipe.write(b"bar") == 3
+        pipe.close()
+        reader.join(4)
+        os.close(fd_read)
+        assert not reader.is_alive()
+        assert data == b"foo" * 100000 + b"bar"
+
+    def test_write_error(self):
+        pipe = AnonymousPipePosix()
+        pipe.close_read()
+        with pytest.raises(BrokenPipeError):
+            pipe.write(b"foo")
+        pipe.close()
+
+
 @pytest.mark.windows_only()
 class TestNamedPipeWindows:
     def test_export(self):
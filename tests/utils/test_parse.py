@@ -1,10 +1,77 @@
+import json
+from unittest.mock import Mock
+
 import pytest
 from lxml.etree import Element
 
+import streamlink.utils.parse
 from streamlink.exceptions import PluginError
 from streamlink.plugin.api import validate
 from streamlink.plugin.api.validate import xml_element
-from streamlink.utils.parse import parse_html, parse_json, parse_qsd, parse_xml
+from streamlink.utils.parse import json_loads, parse_html, parse_json, parse_qsd, parse_xml
+
+
+class TestJSONLoads:
+    @pytest.fixture(params=["orjson", "json"])
+    def backend(self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+        if request.param == "orjson":
+            orjson = pytest.importorskip("orjson")
+            mock = Mock(side_effect=orjson.loads)
+        else:
+            mock = None
+        monkeypatch.setattr(streamlink.utils.parse, "_orjson_loads", mock)
+
+        return mock
+
+    @staticmethod
+    def _result(data, loads, *args, **kwargs):
+        try:
+            result = loads(data, *args, **kwargs)
+        except Exception as err:
+            return type(err), str(err)
+        # compare the types of numbers and NaN values
+        return repr(result)
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pytest.param('{"foo": [1, -2, 3.5, -0.0, 1e-7, true, false, null, "bar"]}', id="types"),
+            pytest.param('{"foo": "\\u0041 \\ud83d\\ude00 \\n \\u0000"}', id="escapes"),
+            pytest.param('{"foo": "Α and Ω 😀"}', id="unicode"),  # ruff: ignore[ambiguous-unicode-character-string]
+            pytest.param('{"foo": 1, "foo": 2}', id="duplicate-keys"),
+            pytest.param(" [1] ", id="whitespace"),
+            pytest.param("18446744073709551615", id="uint64"),
+            pytest.param("18446744073709551616", id="bigint"),
+            pytest.param("-9223372036854775809", id="bigint-negative"),
+            pytest.param('"12345678901234567890"', id="digits-string"),
+            pytest.param("1e400", id="inf"),
+            pytest.param("[NaN, Infinity, -Infinity]", id="nan"),
+            pytest.param('"\\ud800"', id="lone-surrogate"),
+            pytest.param("", id="empty"),
+            pytest.param("[1, 2", id="invalid"),
+            pytest.param("[1] [2]", id="extra-data"),
+            pytest.param('"\x01"', id="control-character"),
+            pytest.param("\ufeff{}", id="bom-str"),
+            pytest.param(b"\xef\xbb\xbf{}", id="bom-bytes"),
+            pytest.param('{"foo": "Α and Ω"}'.encode("utf-16"), id="utf-16"),  # ruff: ignore[ambiguous-unicode-character-string]
+            pytest.param('{"foo": "Α and Ω"}'.encode("utf-32-le"), id="utf-32-le"),  # ruff: ignore[ambiguous-unicode-character-string]
+            pytest.param(b'{"foo": "\xff"}', id="invalid-utf-8"),
+            pytest.param(bytearray(b'{"foo": 1}'), id="bytearray"),
+            pytest.param(123, id="invalid-type"),
+        ],
+    )
+    def test_parity(self, backend: Mock | None, data):
+        assert self._result(data, json_loads) == self._result(data, json.loads)
+
+    def test_backend(self, backend: Mock | None):
+        assert json_loads(b'{"foo": 1}') == {"foo": 1}
+        if backend is not None:
+            assert backend.call_args_list == [((b'{"foo": 1}',),)]
+
+    def test_arguments(self, backend: Mock | None):
+        assert json_loads('{"foo": 1.5}', parse_float=str) == {"foo": "1.5"}
+        if backend is not None:
+            assert backend.call_count == 0
 
 
 class TestUtilsParse:
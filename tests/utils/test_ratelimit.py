@@ -0,0 +1,76 @@
+from threading import Event
+from unittest.mock import Mock, call
+
+import freezegun
+import pytest
+
+from streamlink.utils.ratelimit import TokenBucket
+
+
+@pytest.fixture()
+def frozen_time():
+    with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+        yield frozen_time
+
+
+@pytest.fixture()
+def bucket(frozen_time: freezegun.api.FrozenDateTimeFactory):
+    bucket = TokenBucket(1000)
+    bucket._cond.wait = Mock(side_effect=frozen_time.tick)
+
+    return bucket
+
+
+class TestTokenBucket:
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError, match=r"^rate must be greater than zero$"):
+            TokenBucket(0)
+
+    def test_consume(self, bucket: TokenBucket):
+        assert bucket.capacity == pytest.approx(1000.0)
+        assert bucket.consume(600)
+        assert bucket.consume(400)
+        assert bucket._cond.wait.call_args_list == []
+
+        assert bucket.consume(200)
+        assert bucket._cond.wait.call_args_list == [call(pytest.approx(0.2))]
+
+    def test_consume_large(self, bucket: TokenBucket):
+        assert bucket.consume(3000)
+        assert bucket._cond.wait.call_args_list == []
+
+        # the debt of the previous consumer needs to be paid off first
+        assert bucket.consume(500)
+        assert bucket._cond.wait.call_args_list == [call(0.5), call(0.5), call(0.5), call(0.5), call(pytest.approx(0.5))]
+
+    def test_refill_capacity(self, bucket: TokenBucket, frozen_time: freezegun.api.FrozenDateTimeFactory):
+        assert bucket.consume(1000)
+        frozen_time.tick(10)
+        assert bucket.consume(1000)
+        assert bucket.consume(500)
+        assert bucket._cond.wait.call_args_list == [call(0.5)]
+
+    def test_priority(self, bucket: TokenBucket):
+        bucket._waiting_priority = 1
+
+        def wait(timeout):
+            bucket._waiting_priority = 0
+
+        bucket._cond.wait.side_effect = wait
+        assert bucket.consume(100)
+        assert bucket._cond.wait.call_args_list == [call(0.5)]
+
+        bucket._cond.wait.reset_mock()
+        bucket._waiting_priority = 1
+        assert bucket.consume(100, priority=True)
+        assert bucket._cond.wait.call_args_list == []
+        assert bucket._waiting_priority == 1
+
+    def test_abort(self, bucket: TokenBucket):
+        abort = Event()
+        assert bucket.consume(1000, abort=abort)
+
+        bucket._cond.wait.side_effect = lambda timeout: abort.set()
+        assert not bucket.consume(1000, abort=abort)
+        assert bucket._cond.wait.call_args_list == [call(0.5)]
+        assert bucket._tokens == pytest.approx(0.0)
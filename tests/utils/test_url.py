@@ -1,8 +1,19 @@
+from __future__ import annotations
+
 from urllib.parse import quote
 
 import pytest
 
-from streamlink.utils.url import absolute_url, is_insecure_scheme, prepend_www, update_qsd, update_scheme, url_concat, url_equal
+from streamlink.utils.url import (
+    absolute_url,
+    is_insecure_scheme,
+    prepend_www,
+    update_qsd,
+    update_scheme,
+    url_concat,
+    url_equal,
+    url_expires,
+)
 
 
 @pytest.mark.parametrize(
@@ -166,3 +177,20 @@ def test_update_qsd():
         "urlencode - regular quote with reserved slash"  # fmt: skip
     assert update_qsd("http://test.se", {"foo": "/ "}, safe="", quote_via=quote) == "http://test.se?foo=%2F%20", \
         "urlencode - regular quote without reserved slash"  # fmt: skip
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        pytest.param("https://test.se/playlist.m3u8", None, id="no-query-string"),
+        pytest.param("https://test.se/playlist.m3u8?foo=1700000000", None, id="unknown-param"),
+        pytest.param("https://test.se/playlist.m3u8?Expires=1700000000&Signature=abc", 1700000000, id="expires"),
+        pytest.param("https://test.se/playlist.m3u8?expire=1700000000&exp=1600000000", 1600000000, id="earliest"),
+        pytest.param("https://test.se/playlist.m3u8?expiry=1700000000123", 1700000000.123, id="milliseconds"),
+        pytest.param("https://test.se/playlist.m3u8?exp=3600", None, id="duration"),
+        pytest.param("https://test.se/playlist.m3u8?expires=abc", None, id="invalid"),
+        pytest.param("https://test.se/playlist.m3u8?hdnts=st%3D1600000000~exp%3D1700000000~acl%3D%2F*", 1700000000, id="token"),
+    ],
+)
+def test_url_expires(url: str, expected: float | None):
+    assert url_expires(url) == expected
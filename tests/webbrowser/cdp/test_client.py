@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from contextlib import nullcontext
+from threading import current_thread, main_thread
 from typing import TYPE_CHECKING, TypeAlias, cast
 from unittest.mock import ANY, AsyncMock, Mock, call
 
@@ -9,7 +10,7 @@ import trio
 from trio.testing import wait_all_tasks_blocked
 
 from streamlink.compat import ExceptionGroup
-from streamlink.webbrowser.cdp.client import CDPClient, CDPClientSession, RequestPausedHandler
+from streamlink.webbrowser.cdp.client import CDPClient, CDPClientSession, RequestPausedHandler, ResourceFilter
 from streamlink.webbrowser.cdp.connection import CDPConnection, CDPSession
 from streamlink.webbrowser.cdp.devtools.fetch import RequestPaused
 from streamlink.webbrowser.cdp.devtools.target import SessionID, TargetID
@@ -99,7 +100,15 @@ class TestLaunch:
         [
             pytest.param(
                 {},
-                dict(executable=None, timeout=20.0, cdp_host=None, cdp_port=None, cdp_timeout=2.0, headless=False),
+                dict(
+                    executable=None,
+                    timeout=20.0,
+                    cdp_host=None,
+                    cdp_port=None,
+                    cdp_timeout=2.0,
+                    headless=False,
+                    persistent=False,
+                ),
                 id="Default options",
             ),
             pytest.param(
@@ -110,8 +119,17 @@ class TestLaunch:
                     "webbrowser-cdp-port": 1234,
                     "webbrowser-cdp-timeout": 12.34,
                     "webbrowser-headless": True,
+                    "webbrowser-persistent": True,
                 },
-                dict(executable="foo", timeout=123.45, cdp_host="::1", cdp_port=1234, cdp_timeout=12.34, headless=True),
+                dict(
+                    executable="foo",
+                    timeout=123.45,
+                    cdp_host="::1",
+                    cdp_port=1234,
+                    cdp_timeout=12.34,
+                    headless=True,
+                    persistent=True,
+                ),
                 id="Custom options",
             ),
         ],
@@ -184,6 +202,111 @@ class TestRun:
         ]
 
 
+class TestRunPersistent:
+    @pytest.fixture()
+    def persistent_webbrowser_get(self, monkeypatch: pytest.MonkeyPatch):
+        mock_persistent_webbrowser = Mock(
+            webbrowser=Mock(TIMEOUT=10),
+            start=Mock(return_value="ws://localhost:1234/fake"),
+        )
+        mock_get = Mock(return_value=mock_persistent_webbrowser)
+        monkeypatch.setattr("streamlink.webbrowser.cdp.client.PersistentChromiumWebbrowser.get", mock_get)
+        return mock_get
+
+    @pytest.fixture()
+    def persistent_webbrowser(self, persistent_webbrowser_get: Mock):
+        return persistent_webbrowser_get.return_value
+
+    @pytest.fixture()
+    async def cdp_client(
+        self,
+        session: Streamlink,
+        chromium_webbrowser: Mock,
+        persistent_webbrowser: Mock,
+        websocket_connection: FakeWebsocketConnection,
+    ):
+        async with CDPClient.run(session, cdp_host="::1", headless=True, persistent=True) as cdp_client:
+            yield cdp_client
+
+    @pytest.mark.trio()
+    async def test_no_session(
+        self,
+        chromium_webbrowser: Mock,
+        persistent_webbrowser: Mock,
+        cdp_client: CDPClient,
+        websocket_connection: FakeWebsocketConnection,
+    ):
+        assert isinstance(cdp_client, CDPClient)
+        assert isinstance(cdp_client.cdp_connection, CDPConnection)
+        assert isinstance(cdp_client.nursery, trio.Nursery)
+        assert cdp_client.headless
+        assert cdp_client.persistent
+        assert not chromium_webbrowser.launch.called
+        assert persistent_webbrowser.start.call_args_list == [call(timeout=10)]
+        assert websocket_connection.sent == []
+
+    @pytest.mark.trio()
+    async def test_start_worker_thread(
+        self,
+        session: Streamlink,
+        chromium_webbrowser: Mock,
+        persistent_webbrowser: Mock,
+        websocket_connection: FakeWebsocketConnection,
+    ):
+        threads = []
+
+        def start(timeout: float):
+            threads.append(current_thread())
+            return "ws://localhost:1234/fake"
+
+        persistent_webbrowser.start.side_effect = start
+        async with CDPClient.run(session, persistent=True):
+            pass
+        assert len(threads) == 1
+        assert threads[0] is not main_thread()
+
+    def test_launch(
+        self,
+        session: Streamlink,
+        persistent_webbrowser_get: Mock,
+        persistent_webbrowser: Mock,
+        websocket_connection: FakeWebsocketConnection,
+    ):
+        runner = AsyncMock(return_value=True)
+        assert CDPClient.launch(session, runner, cdp_port=1234, timeout=5.0, persistent=True)
+        assert runner.call_args[0][0].persistent
+        assert persistent_webbrowser_get.call_args_list == [call(executable=None, host=None, port=1234, headless=False)]
+        assert persistent_webbrowser.start.call_args_list == [call(timeout=5.0)]
+
+    @pytest.mark.trio()
+    async def test_session(self, cdp_client: CDPClient, websocket_connection: FakeWebsocketConnection):
+        client_session = None
+
+        async def new_session():
+            nonlocal client_session
+            async with cdp_client.session() as client_session:
+                pass
+
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(new_session)
+            for message in (
+                """{"id":0,"result":{"browserContextId":"abc"}}""",
+                """{"id":1,"result":{"targetId":"01234"}}""",
+                """{"id":2,"result":{"sessionId":"56789"}}""",
+                """{"id":3,"result":{}}""",
+            ):
+                await wait_all_tasks_blocked()
+                nursery.start_soon(websocket_connection.sender.send, message)
+
+        assert isinstance(client_session, CDPClientSession)
+        assert websocket_connection.sent == [
+            """{"id":0,"method":"Target.createBrowserContext","params":{"disposeOnDetach":true}}""",
+            """{"id":1,"method":"Target.createTarget","params":{"browserContextId":"abc","url":""}}""",
+            """{"id":2,"method":"Target.attachToTarget","params":{"flatten":true,"targetId":"01234"}}""",
+            """{"id":3,"method":"Target.disposeBrowserContext","params":{"browserContextId":"abc"}}""",
+        ]
+
+
 class TestEvaluate:
     @pytest.mark.trio()
     async def test_success(self, cdp_client_session: CDPClientSession, websocket_connection: FakeWebsocketConnection):
@@ -416,6 +539,46 @@ class TestRequestPausedHandler:
         assert request_handler.matches(request) is matches
 
 
+class TestResourceFilter:
+    @pytest.mark.parametrize(
+        ("resource_filter", "url", "resource_type", "response_status_code", "blocks"),
+        [
+            pytest.param(ResourceFilter(), "http://localhost/", "Document", None, False, id="default-document"),
+            pytest.param(ResourceFilter(), "http://localhost/", "Script", None, False, id="default-script"),
+            pytest.param(ResourceFilter(), "http://localhost/", "Image", None, True, id="default-image"),
+            pytest.param(ResourceFilter(), "http://localhost/", "Font", None, True, id="default-font"),
+            pytest.param(ResourceFilter(), "http://localhost/", "Image", 200, False, id="default-image-response"),
+            pytest.param(ResourceFilter(resource_types=()), "http://localhost/", "Image", None, False, id="no-resource-types"),
+            pytest.param(ResourceFilter(hosts=["foo.com"]), "http://foo.com/", "Script", None, False, id="host"),
+            pytest.param(ResourceFilter(hosts=["foo.com"]), "http://a.b.foo.com/", "Script", None, False, id="subdomain"),
+            pytest.param(ResourceFilter(hosts=["foo.com"]), "http://barfoo.com/", "Script", None, True, id="other-host"),
+            pytest.param(ResourceFilter(hosts=["foo.com"]), "http://foo.com/", "Image", None, True, id="host-image"),
+        ],
+    )
+    def test_blocks(
+        self,
+        resource_filter: ResourceFilter,
+        url: str,
+        resource_type: str,
+        response_status_code: int | None,
+        blocks: bool,
+    ):
+        request = RequestPaused.from_json({
+            "requestId": "request-1",
+            "frameId": "frame-1",
+            "request": {
+                "url": url,
+                "method": "GET",
+                "headers": {},
+                "initialPriority": "VeryHigh",
+                "referrerPolicy": "strict-origin-when-cross-origin",
+            },
+            "resourceType": resource_type,
+            **({} if response_status_code is None else {"responseStatusCode": response_status_code}),
+        })
+        assert resource_filter.blocks(request) is blocks
+
+
 class TestNavigate:
     @pytest.mark.trio()
     async def test_detach(self, cdp_client_session: CDPClientSession, websocket_connection: FakeWebsocketConnection):
@@ -674,6 +837,37 @@ class TestNavigate:
             """{"id":4,"result":{},"sessionId":"56789"}""",
         )
 
+    @pytest.mark.trio()
+    async def test_fetch_enable_resource_filter(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        cdp_client_session: CDPClientSession,
+        websocket_connection: FakeWebsocketConnection,
+        nursery: trio.Nursery,
+    ):
+        mock_on_fetch_request_paused = AsyncMock()
+        monkeypatch.setattr(cdp_client_session, "_on_fetch_request_paused", mock_on_fetch_request_paused)
+        cdp_client_session._resource_filter = ResourceFilter()
+        cdp_client_session.add_request_handler(async_handler(), url_pattern="http://foo")
+
+        async def navigate():
+            async with cdp_client_session.navigate("https://foo"):
+                pass
+
+        nursery.start_soon(navigate)
+        for result in "{}", "{}", """{"frameId":"frame-id-1"}""", "{}", "{}":
+            await wait_all_tasks_blocked()
+            await websocket_connection.sender.send(
+                f"""{{"id":{len(websocket_connection.sent) - 1},"result":{result},"sessionId":"56789"}}""",
+            )
+
+        assert mock_on_fetch_request_paused.called
+        assert websocket_connection.sent[0] == (
+            """{"id":0,"method":"Fetch.enable","params":{"handleAuthRequests":true,"patterns":["""
+            + """{"requestStage":"Request","urlPattern":"*"},{"requestStage":"Response","urlPattern":"http://foo"}"""
+            + """]},"sessionId":"56789"}"""
+        )
+
 
 class TestRequestMethods:
     @pytest.fixture()
@@ -998,6 +1192,109 @@ class TestOnFetchRequestPaused:
         assert mock_fail_request.call_args_list == []
         assert mock_continue_request.call_args_list == []
 
+    @pytest.mark.trio()
+    async def test_resource_filter(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        cdp_client_session: CDPClientSession,
+        websocket_connection: FakeWebsocketConnection,
+        nursery: trio.Nursery,
+    ):
+        cdp_client_session._resource_filter = ResourceFilter()
+
+        mock_fail_request = AsyncMock()
+        mock_continue_request = AsyncMock()
+        monkeypatch.setattr(cdp_client_session, "fail_request", mock_fail_request)
+        monkeypatch.setattr(cdp_client_session, "continue_request", mock_continue_request)
+
+        handler = async_handler()
+        cdp_client_session.add_request_handler(handler, on_request=True)
+
+        nursery.start_soon(cdp_client_session._on_fetch_request_paused)
+        await wait_all_tasks_blocked()
+
+        for request_id, resource_type in ("request-1", "Image"), ("request-2", "Script"):
+            # language=json
+            await websocket_connection.sender.send(f"""
+                {{
+                    "method": "Fetch.requestPaused",
+                    "params": {{
+                        "requestId": "{request_id}",
+                        "frameId": "frame-1",
+                        "request": {{
+                            "url": "http://foo/",
+                            "method": "GET",
+                            "headers": {{}},
+                            "initialPriority": "VeryHigh",
+                            "referrerPolicy": "strict-origin-when-cross-origin"
+                        }},
+                        "resourceType": "{resource_type}"
+                    }},
+                    "sessionId": "56789"
+                }}
+            """)
+            await wait_all_tasks_blocked()
+
+        assert [c[0][1].request_id for c in handler.call_args_list] == ["request-2"]
+        assert [c[0][0].request_id for c in mock_fail_request.call_args_list] == ["request-1"]
+        assert [c[0][0].request_id for c in mock_continue_request.call_args_list] == ["request-2"]
+
+    @pytest.mark.trio()
+    async def test_resource_filter_unhandled_fail(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        cdp_client_session: CDPClientSession,
+        websocket_connection: FakeWebsocketConnection,
+        nursery: trio.Nursery,
+    ):
+        cdp_client_session._fail_unhandled = True
+        cdp_client_session._resource_filter = ResourceFilter()
+
+        mock_fail_request = AsyncMock()
+        mock_continue_request = AsyncMock()
+        monkeypatch.setattr(cdp_client_session, "fail_request", mock_fail_request)
+        monkeypatch.setattr(cdp_client_session, "continue_request", mock_continue_request)
+
+        handler = async_handler()
+        cdp_client_session.add_request_handler(handler, url_pattern="http://foo/")
+
+        nursery.start_soon(cdp_client_session._on_fetch_request_paused)
+        await wait_all_tasks_blocked()
+
+        for request_id, url, resource_type, response in [
+            # blocked by the resource filter
+            ("request-1", "http://foo/", "Image", ""),
+            # only paused by the resource filter's request pattern: continued
+            ("request-2", "http://foo/", "Script", ""),
+            ("request-3", "http://bar/", "Document", ""),
+            # paused by the response handler's pattern, but not handled: failed
+            ("request-4", "http://foo/", "Script", ', "responseStatusCode": 200'),
+        ]:
+            # language=json
+            await websocket_connection.sender.send(f"""
+                {{
+                    "method": "Fetch.requestPaused",
+                    "params": {{
+                        "requestId": "{request_id}",
+                        "frameId": "frame-1",
+                        "request": {{
+                            "url": "{url}",
+                            "method": "GET",
+                            "headers": {{}},
+                            "initialPriority": "VeryHigh",
+                            "referrerPolicy": "strict-origin-when-cross-origin"
+                        }},
+                        "resourceType": "{resource_type}"{response}
+                    }},
+                    "sessionId": "56789"
+                }}
+            """)
+            await wait_all_tasks_blocked()
+
+        assert [c[0][1].request_id for c in handler.call_args_list] == ["request-4"]
+        assert [c[0][0].request_id for c in mock_fail_request.call_args_list] == ["request-1", "request-4"]
+        assert [c[0][0].request_id for c in mock_continue_request.call_args_list] == ["request-2", "request-3"]
+
 
 class TestCookies:
     @pytest.fixture(autouse=True)
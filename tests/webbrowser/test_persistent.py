@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from streamlink.webbrowser.chromium import ChromiumWebbrowser
+from streamlink.webbrowser.exceptions import WebbrowserError
+from streamlink.webbrowser.persistent import PersistentChromiumWebbrowser
+
+
+# dummy web browser process, which writes the DevToolsActivePort file to the user data dir and then idles
+SCRIPT_SUCCESS = """
+import sys, time, pathlib
+args = dict(arg[2:].split("=", 1) for arg in sys.argv[1:] if "=" in arg)
+pathlib.Path(args["user-data-dir"], "DevToolsActivePort").write_text("1234\\n/devtools/browser/abc\\n")
+time.sleep(60)
+"""
+SCRIPT_EXIT = "import sys; sys.exit(1)"
+SCRIPT_IDLE = "import time; time.sleep(60)"
+
+
+@pytest.fixture()
+def persistent(request: pytest.FixtureRequest):
+    params = getattr(request, "param", {})
+    webbrowser = ChromiumWebbrowser(host=params.get("host"))
+    webbrowser.executable = sys.executable
+    webbrowser.arguments = ["-c", params.get("script", SCRIPT_SUCCESS)]
+    persistent = PersistentChromiumWebbrowser(webbrowser, headless=params.get("headless", False))
+    try:
+        yield persistent
+    finally:
+        persistent.stop()
+
+
+class TestGet:
+    @pytest.fixture(autouse=True)
+    def instances(self, monkeypatch: pytest.MonkeyPatch):
+        instances = {}
+        monkeypatch.setattr(PersistentChromiumWebbrowser, "_instances", instances)
+        return instances
+
+    @pytest.fixture(autouse=True)
+    def atexit_register(self, monkeypatch: pytest.MonkeyPatch):
+        atexit_register = Mock()
+        monkeypatch.setattr("streamlink.webbrowser.persistent.atexit.register", atexit_register)
+        return atexit_register
+
+    def test_get(self, monkeypatch: pytest.MonkeyPatch, instances: dict, atexit_register: Mock):
+        mock_stop = Mock()
+        monkeypatch.setattr(PersistentChromiumWebbrowser, "stop", mock_stop)
+
+        first = PersistentChromiumWebbrowser.get(host="::1", headless=True)
+        assert isinstance(first, PersistentChromiumWebbrowser)
+        assert first.webbrowser.host == "::1"
+        assert first.webbrowser.port is None
+        assert first.headless
+        assert PersistentChromiumWebbrowser.get(host="::1", headless=True) is first
+        assert PersistentChromiumWebbrowser.get(host="::1", headless=False) is not first
+        assert len(instances) == 2
+        assert atexit_register.call_count == 1
+
+        PersistentChromiumWebbrowser.stop_all()
+        assert instances == {}
+        assert mock_stop.call_count == 2
+
+
+class TestStart:
+    @pytest.mark.parametrize(
+        ("persistent", "expected"),
+        [
+            pytest.param({}, "ws://127.0.0.1:1234/devtools/browser/abc", id="default"),
+            pytest.param({"host": "::1"}, "ws://[::1]:1234/devtools/browser/abc", id="ipv6"),
+        ],
+        indirect=["persistent"],
+    )
+    def test_start_stop(self, caplog: pytest.LogCaptureFixture, persistent: PersistentChromiumWebbrowser, expected: str):
+        assert persistent.start() == expected
+        process = persistent.process
+        assert process is not None
+        assert process.poll() is None
+        assert persistent._user_data_dir is not None
+        user_data_dir = Path(persistent._user_data_dir.name)
+        assert "--headless=new" not in process.args
+        assert f"--user-data-dir={user_data_dir}" in process.args
+        assert "--remote-debugging-port=0" in process.args
+
+        # reuses the running process
+        assert persistent.start() == expected
+        assert persistent.process is process
+
+        persistent.stop()
+        assert process.poll() is not None
+        assert persistent.process is None
+        assert persistent.websocket_url is None
+        assert not user_data_dir.exists()
+        assert [(record.name, record.levelname, record.msg) for record in caplog.records] == [
+            (
+                "streamlink.webbrowser.persistent",
+                "info",
+                f"Launching persistent web browser: {sys.executable} (headless=False)",
+            ),
+            (
+                "streamlink.webbrowser.persistent",
+                "debug",
+                "Waiting for persistent web browser process to terminate",
+            ),
+        ]
+
+    def test_restart(self, caplog: pytest.LogCaptureFixture, persistent: PersistentChromiumWebbrowser):
+        persistent.start()
+        process = persistent.process
+        assert process is not None
+        process.kill()
+        process.wait()
+        caplog.records.clear()
+
+        assert persistent.start() == "ws://127.0.0.1:1234/devtools/browser/abc"
+        assert persistent.process is not process
+        assert [(record.name, record.levelname, record.msg) for record in caplog.records] == [
+            (
+                "streamlink.webbrowser.persistent",
+                "warning",
+                f"Persistent web browser process has ended (exit code {process.returncode}), restarting",
+            ),
+            (
+                "streamlink.webbrowser.persistent",
+                "info",
+                f"Launching persistent web browser: {sys.executable} (headless=False)",
+            ),
+        ]
+
+    @pytest.mark.parametrize("persistent", [{"script": SCRIPT_EXIT}], indirect=True)
+    def test_ended_early(self, persistent: PersistentChromiumWebbrowser):
+        with pytest.raises(WebbrowserError, match=r"^Persistent web browser process ended early$"):
+            persistent.start()
+        assert persistent.process is None
+        assert persistent._user_data_dir is None
+
+    @pytest.mark.parametrize("persistent", [{"script": SCRIPT_IDLE, "headless": True}], indirect=True)
+    def test_timeout(self, monkeypatch: pytest.MonkeyPatch, persistent: PersistentChromiumWebbrowser):
+        processes = []
+        stop = PersistentChromiumWebbrowser._stop
+
+        def fake_stop(self: PersistentChromiumWebbrowser):
+            processes.append(self.process)
+            stop(self)
+
+        monkeypatch.setattr(PersistentChromiumWebbrowser, "_stop", fake_stop)
+        with pytest.raises(WebbrowserError, match=r"^Launching the persistent web browser has timed out$"):
+            persistent.start(timeout=0.2)
+        assert persistent.process is None
+        assert len(processes) == 1
+        assert processes[0].poll() is not None
+        assert "--headless=new" in processes[0].args